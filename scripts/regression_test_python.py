@@ -351,6 +351,115 @@ class PandasAnalyzerBenchmark:
         return result
 
 
+class ArrowUDFBenchmark:
+    def __init__(self, column_count, rows):
+        self.column_count = column_count
+        self.rows = rows
+        self.initialize_connection()
+        self.generate()
+
+    def initialize_connection(self):
+        self.con = duckdb.connect()
+        if not threads:
+            return
+        print_msg(f'Limiting threads to {threads}')
+        self.con.execute(f"SET threads={threads}")
+
+    def generate(self):
+        columns = ", ".join([f"i + {x} AS c{x}" for x in range(self.column_count)])
+        self.con.execute(f"CREATE TABLE udf_input AS SELECT {columns} FROM range({self.rows}) t(i)")
+
+        def first_column(*args):
+            return args[0]
+
+        self.con.create_function(
+            'first_column', first_column, [duckdb.typing.BIGINT] * self.column_count, duckdb.typing.BIGINT, type='arrow'
+        )
+
+    def benchmark(self, benchmark_name) -> BenchmarkResult:
+        arguments = ", ".join([f"c{x}" for x in range(self.column_count)])
+        result = BenchmarkResult(benchmark_name)
+        for _ in range(nruns):
+            duration = 0.0
+            start = time.time()
+            res = self.con.execute(f"SELECT sum(first_column({arguments})) FROM udf_input").fetchall()
+            end = time.time()
+            duration = float(end - start)
+            del res
+            padding = " " * len(str(nruns))
+            print_msg(f"T{padding}: {duration}s")
+            result.add(duration)
+        return result
+
+
+class WideResultBenchmark:
+    def __init__(self, column_count, rows):
+        self.column_count = column_count
+        self.rows = rows
+        self.initialize_connection()
+        self.generate()
+
+    def initialize_connection(self):
+        self.con = duckdb.connect()
+        if not threads:
+            return
+        print_msg(f'Limiting threads to {threads}')
+        self.con.execute(f"SET threads={threads}")
+
+    def generate(self):
+        columns = ", ".join([f"(i + {x})::DOUBLE AS c{x}" for x in range(self.column_count)])
+        self.con.execute(f"CREATE TABLE wide_result AS SELECT {columns} FROM range({self.rows}) t(i)")
+
+    def benchmark(self, benchmark_name, parallel) -> BenchmarkResult:
+        self.con.execute(f"SET python_parallel_numpy_conversion={parallel}")
+        result = BenchmarkResult(benchmark_name)
+        for _ in range(nruns):
+            duration = 0.0
+            start = time.time()
+            res = self.con.execute("SELECT * FROM wide_result").df()
+            end = time.time()
+            duration = float(end - start)
+            del res
+            padding = " " * len(str(nruns))
+            print_msg(f"T{padding}: {duration}s")
+            result.add(duration)
+        return result
+
+
+class PandasStringScanBenchmark:
+    def __init__(self, rows):
+        self.rows = rows
+        self.initialize_connection()
+        self.generate()
+
+    def initialize_connection(self):
+        self.con = duckdb.connect()
+        if not threads:
+            return
+        print_msg(f'Limiting threads to {threads}')
+        self.con.execute(f"SET threads={threads}")
+
+    def generate(self):
+        strings = [f"string_{i % 1000}" for i in range(self.rows)]
+        self.object_df = pd.DataFrame({'s': pd.Series(strings, dtype=object)})
+        self.arrow_df = pd.DataFrame({'s': pd.Series(strings, dtype='string[pyarrow]')})
+
+    def benchmark(self, benchmark_name, dtype) -> BenchmarkResult:
+        df = self.object_df if dtype == 'object' else self.arrow_df
+        result = BenchmarkResult(benchmark_name)
+        for _ in range(nruns):
+            duration = 0.0
+            start = time.time()
+            res = self.con.execute("SELECT count(DISTINCT s) FROM df").fetchall()
+            end = time.time()
+            duration = float(end - start)
+            del res
+            padding = " " * len(str(nruns))
+            print_msg(f"T{padding}: {duration}s")
+            result.add(duration)
+        return result
+
+
 def test_arrow_dictionaries_scan():
     DICT_SIZE = 26 * 1000
     print_msg(f"Generating a unique dictionary of size {DICT_SIZE}")
@@ -377,6 +486,34 @@ def test_pandas_analyze():
     result.write()
 
 
+def test_arrow_udf():
+    ROWS = 10000000
+    for column_count in [1, 5, 20]:
+        test = ArrowUDFBenchmark(column_count, ROWS)
+        benchmark_name = f"arrow_udf_{column_count}_columns"
+        result = test.benchmark(benchmark_name)
+        result.write()
+
+
+def test_pandas_string_scan():
+    ROWS = 10000000
+    test = PandasStringScanBenchmark(ROWS)
+    for dtype in ['object', 'string[pyarrow]']:
+        benchmark_name = f"pandas_string_scan_{dtype}"
+        result = test.benchmark(benchmark_name, dtype)
+        result.write()
+
+
+def test_wide_result_df():
+    ROWS = 1000000
+    COLUMNS = 200
+    test = WideResultBenchmark(COLUMNS, ROWS)
+    for parallel in [False, True]:
+        benchmark_name = f"wide_result_df_{COLUMNS}_columns" + ("_parallel" if parallel else "")
+        result = test.benchmark(benchmark_name, parallel)
+        result.write()
+
+
 def test_call_and_select_statements():
     test = SelectAndCallBenchmark()
     queries = {
@@ -393,6 +530,9 @@ def main():
     test_arrow_dictionaries_scan()
     test_loading_pandas_df_many_times()
     test_pandas_analyze()
+    test_arrow_udf()
+    test_wide_result_df()
+    test_pandas_string_scan()
     test_call_and_select_statements()
 
     close_result()
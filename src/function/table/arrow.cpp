@@ -12,6 +12,12 @@
 #include "duckdb/function/table_function.hpp"
 #include "duckdb/parser/parsed_data/create_table_function_info.hpp"
 #include "duckdb/parser/tableref/table_function_ref.hpp"
+#include "duckdb/planner/expression/bound_columnref_expression.hpp"
+#include "duckdb/planner/expression/bound_comparison_expression.hpp"
+#include "duckdb/planner/expression/bound_operator_expression.hpp"
+#include "duckdb/planner/expression/bound_reference_expression.hpp"
+#include "duckdb/planner/expression_iterator.hpp"
+#include "duckdb/planner/operator/logical_get.hpp"
 #include "utf8proc_wrapper.hpp"
 #include "duckdb/common/arrow/schema_metadata.hpp"
 
@@ -394,6 +400,9 @@ unique_ptr<ArrowArrayStreamWrapper> ProduceArrowScan(const ArrowScanFunctionData
 		}
 	}
 	parameters.filters = filters;
+	if (!function.filter_expressions.empty()) {
+		parameters.filter_expressions = &function.filter_expressions;
+	}
 	return function.scanner_producer(function.stream_factory_ptr, parameters);
 }
 
@@ -555,6 +564,76 @@ bool ArrowTableFunction::ArrowPushdownType(const LogicalType &type) {
 	}
 }
 
+//! Whether the filter is a comparison of a column with a constant, which is pushed down as a table filter instead
+static bool IsTableFilterCandidate(const Expression &filter) {
+	switch (filter.type) {
+	case ExpressionType::COMPARE_EQUAL:
+	case ExpressionType::COMPARE_LESSTHAN:
+	case ExpressionType::COMPARE_GREATERTHAN:
+	case ExpressionType::COMPARE_LESSTHANOREQUALTO:
+	case ExpressionType::COMPARE_GREATERTHANOREQUALTO: {
+		auto &comparison = filter.Cast<BoundComparisonExpression>();
+		auto left_is_column = comparison.left->type == ExpressionType::BOUND_COLUMN_REF;
+		auto right_is_column = comparison.right->type == ExpressionType::BOUND_COLUMN_REF;
+		return (left_is_column && comparison.right->IsFoldable()) || (right_is_column && comparison.left->IsFoldable());
+	}
+	case ExpressionType::OPERATOR_IS_NULL:
+	case ExpressionType::OPERATOR_IS_NOT_NULL: {
+		auto &op = filter.Cast<BoundOperatorExpression>();
+		return op.children[0]->type == ExpressionType::BOUND_COLUMN_REF;
+	}
+	default:
+		return false;
+	}
+}
+
+//! Replace the column references of the expression by references to the column in the Arrow schema
+static bool ReplaceColumnReferences(unique_ptr<Expression> &expr, const LogicalGet &get,
+                                    const ArrowScanFunctionData &bind_data) {
+	if (expr->type == ExpressionType::BOUND_COLUMN_REF) {
+		auto &colref = expr->Cast<BoundColumnRefExpression>();
+		if (colref.binding.table_index != get.table_index) {
+			return false;
+		}
+		auto column_id = get.GetColumnIds()[colref.binding.column_index];
+		if (column_id == COLUMN_IDENTIFIER_ROW_ID) {
+			return false;
+		}
+		auto &schema = *bind_data.schema_root.arrow_schema.children[column_id];
+		expr = make_uniq<BoundReferenceExpression>(schema.name, colref.return_type, column_id);
+		return true;
+	}
+	bool can_push = true;
+	ExpressionIterator::EnumerateChildren(*expr, [&](unique_ptr<Expression> &child) {
+		if (!ReplaceColumnReferences(child, get, bind_data)) {
+			can_push = false;
+		}
+	});
+	return can_push;
+}
+
+void ArrowTableFunction::ArrowPushdownComplexFilter(ClientContext &context, LogicalGet &get, FunctionData *bind_data_p,
+                                                    vector<unique_ptr<Expression>> &filters) {
+	auto &bind_data = bind_data_p->Cast<ArrowScanFunctionData>();
+	for (auto &filter : filters) {
+		if (IsTableFilterCandidate(*filter) || filter->IsVolatile()) {
+			continue;
+		}
+		// the filters are kept in the plan, the producer receives a copy that references the Arrow schema
+		auto copy = filter->Copy();
+		if (!ReplaceColumnReferences(copy, get, bind_data)) {
+			continue;
+		}
+		bool duplicate = false;
+		for (auto &existing : bind_data.filter_expressions) {
+			duplicate = duplicate || existing->Equals(*copy);
+		}
+		if (!duplicate) {
+			bind_data.filter_expressions.push_back(std::move(copy));
+		}
+	}
+}
+
 void ArrowTableFunction::RegisterFunction(BuiltinFunctions &set) {
 	TableFunction arrow("arrow_scan", {LogicalType::POINTER, LogicalType::POINTER, LogicalType::POINTER},
 	                    ArrowScanFunction, ArrowScanBind, ArrowScanInitGlobal, ArrowScanInitLocal);
@@ -564,6 +643,7 @@ void ArrowTableFunction::RegisterFunction(BuiltinFunctions &set) {
 	arrow.filter_pushdown = true;
 	arrow.filter_prune = true;
 	arrow.supports_pushdown_type = ArrowPushdownType;
+	arrow.pushdown_complex_filter = ArrowPushdownComplexFilter;
 	set.AddFunction(arrow);
 
 	TableFunction arrow_dumb("arrow_scan_dumb", {LogicalType::POINTER, LogicalType::POINTER, LogicalType::POINTER},
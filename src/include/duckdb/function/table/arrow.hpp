@@ -17,6 +17,7 @@
 #include "duckdb/common/unordered_map.hpp"
 #include "duckdb/function/built_in_functions.hpp"
 #include "duckdb/function/table/arrow/arrow_duck_schema.hpp"
+#include "duckdb/planner/expression.hpp"
 
 namespace duckdb {
 
@@ -40,6 +41,10 @@ struct ArrowProjectedColumns {
 struct ArrowStreamParameters {
 	ArrowProjectedColumns projected_columns;
 	TableFilterSet *filters;
+	//! Filters that could not be pushed down as table filters, their column references are BoundReferenceExpressions
+	//! of the column in the Arrow schema. DuckDB still evaluates these after the scan, so producers can use them to
+	//! skip data without having to apply them exactly.
+	optional_ptr<const vector<unique_ptr<Expression>>> filter_expressions;
 };
 
 typedef unique_ptr<ArrowArrayStreamWrapper> (*stream_factory_produce_t)(uintptr_t stream_factory_ptr,
@@ -65,6 +70,8 @@ public:
 	shared_ptr<DependencyItem> dependency;
 	//! Arrow table data
 	ArrowTableType arrow_table;
+	//! The filters that are passed to the producer as filter_expressions
+	vector<unique_ptr<Expression>> filter_expressions;
 };
 
 struct ArrowRunEndEncodingState {
@@ -219,6 +226,9 @@ protected:
 
 	//! Specify if a given type can be pushed-down by the arrow engine
 	static bool ArrowPushdownType(const LogicalType &type);
+	//! Pass the filters that are not pushed down as table filters to the producer
+	static void ArrowPushdownComplexFilter(ClientContext &context, LogicalGet &get, FunctionData *bind_data_p,
+	                                       vector<unique_ptr<Expression>> &filters);
 	//! -----Utility Functions:-----
 	//! Gets Arrow Table's Cardinality
 	static unique_ptr<NodeStatistics> ArrowScanCardinality(ClientContext &context, const FunctionData *bind_data);
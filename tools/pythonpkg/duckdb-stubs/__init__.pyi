@@ -45,8 +45,9 @@ from typing_extensions import Literal
 from typing import Any, ClassVar, Set, Optional, Callable
 from io import StringIO, TextIOBase
 from pathlib import Path
+from concurrent.futures import Executor
 
-from typing import overload, Dict, List, Union
+from typing import overload, Dict, List, Union, Iterator, ContextManager, AsyncIterator
 import pandas
 # stubgen override - unfortunately we need this for version checks
 import sys
@@ -200,6 +201,18 @@ class Statement:
     @property
     def type(self) -> StatementType: ...
 
+class DuckDBPyPreparedStatement:
+    def __init__(self, *args, **kwargs) -> None: ...
+    def execute(self, parameters: object = None) -> DuckDBPyConnection: ...
+    @property
+    def query(self) -> str: ...
+    @property
+    def type(self) -> StatementType: ...
+    @property
+    def parameter_count(self) -> int: ...
+    @property
+    def named_parameters(self) -> Set[str]: ...
+
 class Expression:
     def __init__(self, *args, **kwargs) -> None: ...
     def __neg__(self) -> "Expression": ...
@@ -270,6 +283,8 @@ class DuckDBPyConnection:
     def __enter__(self) -> DuckDBPyConnection: ...
     def __exit__(self, exc_type: object, exc: object, traceback: object) -> None: ...
     def __del__(self) -> None: ...
+    def __iter__(self) -> Iterator[tuple]: ...
+    async def aexecute(self, query: object, parameters: object = None) -> DuckDBPyConnection: ...
     @property
     def description(self) -> Optional[List[Any]]: ...
     @property
@@ -284,7 +299,7 @@ class DuckDBPyConnection:
     def unregister_filesystem(self, name: str) -> None: ...
     def list_filesystems(self) -> list: ...
     def filesystem_is_registered(self, name: str) -> bool: ...
-    def create_function(self, name: str, function: function, parameters: Optional[List[DuckDBPyType]] = None, return_type: Optional[DuckDBPyType] = None, *, type: Optional[PythonUDFType] = PythonUDFType.NATIVE, null_handling: Optional[FunctionNullHandling] = FunctionNullHandling.DEFAULT, exception_handling: Optional[PythonExceptionHandling] = PythonExceptionHandling.DEFAULT, side_effects: bool = False) -> DuckDBPyConnection: ...
+    def create_function(self, name: str, function: function, parameters: Optional[List[DuckDBPyType]] = None, return_type: Optional[DuckDBPyType] = None, *, type: Optional[PythonUDFType] = PythonUDFType.NATIVE, null_handling: Optional[FunctionNullHandling] = FunctionNullHandling.DEFAULT, exception_handling: Optional[PythonExceptionHandling] = PythonExceptionHandling.DEFAULT, side_effects: bool = False, executor: Optional[Executor] = None) -> DuckDBPyConnection: ...
     def remove_function(self, name: str) -> DuckDBPyConnection: ...
     def sqltype(self, type_str: str) -> DuckDBPyType: ...
     def dtype(self, type_str: str) -> DuckDBPyType: ...
@@ -300,6 +315,7 @@ class DuckDBPyConnection:
     def map_type(self, key: DuckDBPyType, value: DuckDBPyType) -> DuckDBPyType: ...
     def duplicate(self) -> DuckDBPyConnection: ...
     def execute(self, query: object, parameters: object = None) -> DuckDBPyConnection: ...
+    def prepare(self, query: object) -> DuckDBPyPreparedStatement: ...
     def executemany(self, query: object, parameters: object = None) -> DuckDBPyConnection: ...
     def close(self) -> None: ...
     def interrupt(self) -> None: ...
@@ -324,6 +340,8 @@ class DuckDBPyConnection:
     def append(self, table_name: str, df: pandas.DataFrame, *, by_name: bool = False) -> DuckDBPyConnection: ...
     def register(self, view_name: str, python_object: object) -> DuckDBPyConnection: ...
     def unregister(self, view_name: str) -> DuckDBPyConnection: ...
+    def replacement_cache_info(self) -> dict: ...
+    def statement_cache_info(self) -> dict: ...
     def table(self, table_name: str) -> DuckDBPyRelation: ...
     def view(self, view_name: str) -> DuckDBPyRelation: ...
     def values(self, values: List[Any]) -> DuckDBPyRelation: ...
@@ -412,9 +430,9 @@ class DuckDBPyRelation:
     def list(self, column: str, groups: str = ..., window_spec: str = ..., projected_columns: str = ...) -> DuckDBPyRelation: ...
 
     def arrow(self, batch_size: int = ...) -> pyarrow.lib.Table: ...
-    def __arrow_c_stream__(self) -> object: ...
+    def __arrow_c_stream__(self, requested_schema: Optional[object] = None) -> object: ...
     def create(self, table_name: str) -> None: ...
-    def create_view(self, view_name: str, replace: bool = ...) -> DuckDBPyRelation: ...
+    def create_view(self, view_name: str, replace: bool = ..., *, temporary: bool = ...) -> DuckDBPyRelation: ...
     def describe(self) -> DuckDBPyRelation: ...
     def df(self, *args, **kwargs) -> pandas.DataFrame: ...
     def distinct(self) -> DuckDBPyRelation: ...
@@ -427,6 +445,7 @@ class DuckDBPyRelation:
     def fetchone(self) -> Optional[tuple]: ...
     def fetchdf(self, *args, **kwargs) -> Any: ...
     def fetch_arrow_reader(self, batch_size: int = ...) -> pyarrow.lib.RecordBatchReader: ...
+    def afetch_record_batches(self, batch_size: int = ...) -> AsyncIterator[pyarrow.lib.RecordBatch]: ...
     def fetch_arrow_table(self, rows_per_batch: int = ...) -> pyarrow.lib.Table: ...
     def filter(self, filter_expr: Union[Expression, str]) -> DuckDBPyRelation: ...
     def insert(self, values: object) -> None: ...
@@ -434,12 +453,12 @@ class DuckDBPyRelation:
     def intersect(self, other_rel: DuckDBPyRelation) -> DuckDBPyRelation: ...
     def join(self, other_rel: DuckDBPyRelation, condition: str, how: str = ...) -> DuckDBPyRelation: ...
     def limit(self, n: int, offset: int = ...) -> DuckDBPyRelation: ...
-    def map(self, map_function: function, schema: Optional[Dict[str, DuckDBPyType]] = None) -> DuckDBPyRelation: ...
+    def map(self, map_function: function, *, schema: Optional[Dict[str, DuckDBPyType]] = None, batch_size: Optional[int] = None, executor: Optional[Executor] = None) -> DuckDBPyRelation: ...
     def order(self, order_expr: str) -> DuckDBPyRelation: ...
     def sort(self, *cols: Expression) -> DuckDBPyRelation: ...
     def project(self, *cols: Union[str, Expression]) -> DuckDBPyRelation: ...
     def select(self, *cols: Union[str, Expression]) -> DuckDBPyRelation: ...
-    def pl(self, rows_per_batch: int = ..., connection: DuckDBPyConnection = ...) -> polars.DataFrame: ...
+    def pl(self, batch_size: int = ..., *, lazy: bool = ...) -> Union[polars.DataFrame, polars.LazyFrame]: ...
     def query(self, virtual_table_name: str, sql_query: str) -> DuckDBPyRelation: ...
     def record_batch(self, batch_size: int = ...) -> pyarrow.lib.RecordBatchReader: ...
     def select_types(self, types: List[Union[str, DuckDBPyType]]) -> DuckDBPyRelation: ...
@@ -470,7 +489,7 @@ class DuckDBPyRelation:
     ) -> None: ...
     def fetch_df_chunk(self, vectors_per_chunk: int = 1, *, date_as_object: bool = False) -> pandas.DataFrame: ...
     def to_table(self, table_name: str) -> None: ...
-    def to_view(self, view_name: str, replace: bool = ...) -> DuckDBPyRelation: ...
+    def to_view(self, view_name: str, replace: bool = ..., *, temporary: bool = ...) -> DuckDBPyRelation: ...
     def torch(self, connection: DuckDBPyConnection = ...) -> dict: ...
     def tf(self, connection: DuckDBPyConnection = ...) -> dict: ...
     def union(self, union_rel: DuckDBPyRelation) -> DuckDBPyRelation: ...
@@ -491,7 +510,9 @@ class DuckDBPyRelation:
             overwrite: Optional[bool] = None,
             per_thread_output: Optional[bool] = None,
             use_tmp_file: Optional[bool] = None,
-            partition_by: Optional[List[str]] = None
+            partition_by: Optional[List[str]] = None,
+            write_partition_columns: Optional[bool] = None,
+            append: Optional[bool] = None
     ) -> None: ...
     def write_parquet(
             self,
@@ -499,9 +520,18 @@ class DuckDBPyRelation:
             compression: Optional[str] = None,
             field_ids: Optional[dict | str] = None,
             row_group_size_bytes: Optional[int | str] = None,
-            row_group_size: Optional[int] = None
+            row_group_size: Optional[int] = None,
+            overwrite: Optional[bool] = None,
+            per_thread_output: Optional[bool] = None,
+            use_tmp_file: Optional[bool] = None,
+            partition_by: Optional[List[str]] = None,
+            write_partition_columns: Optional[bool] = None,
+            append: Optional[bool] = None,
+            row_groups_per_file: Optional[int] = None,
+            file_size_bytes: Optional[int | str] = None
     ) -> None: ...
     def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[tuple]: ...
     @property
     def alias(self) -> str: ...
     @property
@@ -599,6 +629,21 @@ class token_type:
     def __members__(self) -> object: ...
 
 def connect(database: Union[str, Path] = ..., read_only: bool = ..., config: dict = ...) -> DuckDBPyConnection: ...
+
+class PoolTimeoutError(Error): ...
+
+class ConnectionPool:
+    max_size: int
+    timeout: Optional[float]
+    health_check: bool
+    def __init__(self, database: str = ..., *, max_size: int = ..., read_only: bool = ..., config: Optional[Dict[str, Any]] = ..., timeout: Optional[float] = ..., health_check: bool = ...) -> None: ...
+    def acquire(self, timeout: Optional[float] = ...) -> DuckDBPyConnection: ...
+    def release(self, connection: DuckDBPyConnection) -> None: ...
+    def connection(self, timeout: Optional[float] = ...) -> ContextManager[DuckDBPyConnection]: ...
+    def stats(self) -> Dict[str, Any]: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> ConnectionPool: ...
+    def __exit__(self, exc_type: object, exc: object, traceback: object) -> None: ...
 def tokenize(query: str) -> List[Any]: ...
 
 # NOTE: this section is generated by tools/pythonpkg/scripts/generate_connection_wrapper_stubs.py.
@@ -610,7 +655,7 @@ def register_filesystem(filesystem: str, *, connection: DuckDBPyConnection = ...
 def unregister_filesystem(name: str, *, connection: DuckDBPyConnection = ...) -> None: ...
 def list_filesystems(*, connection: DuckDBPyConnection = ...) -> list: ...
 def filesystem_is_registered(name: str, *, connection: DuckDBPyConnection = ...) -> bool: ...
-def create_function(name: str, function: function, parameters: Optional[List[DuckDBPyType]] = None, return_type: Optional[DuckDBPyType] = None, *, type: Optional[PythonUDFType] = PythonUDFType.NATIVE, null_handling: Optional[FunctionNullHandling] = FunctionNullHandling.DEFAULT, exception_handling: Optional[PythonExceptionHandling] = PythonExceptionHandling.DEFAULT, side_effects: bool = False, connection: DuckDBPyConnection = ...) -> DuckDBPyConnection: ...
+def create_function(name: str, function: function, parameters: Optional[List[DuckDBPyType]] = None, return_type: Optional[DuckDBPyType] = None, *, type: Optional[PythonUDFType] = PythonUDFType.NATIVE, null_handling: Optional[FunctionNullHandling] = FunctionNullHandling.DEFAULT, exception_handling: Optional[PythonExceptionHandling] = PythonExceptionHandling.DEFAULT, side_effects: bool = False, executor: Optional[Executor] = None, connection: DuckDBPyConnection = ...) -> DuckDBPyConnection: ...
 def remove_function(name: str, *, connection: DuckDBPyConnection = ...) -> DuckDBPyConnection: ...
 def sqltype(type_str: str, *, connection: DuckDBPyConnection = ...) -> DuckDBPyType: ...
 def dtype(type_str: str, *, connection: DuckDBPyConnection = ...) -> DuckDBPyType: ...
@@ -626,6 +671,7 @@ def row_type(fields: Union[Dict[str, DuckDBPyType], List[str]], *, connection: D
 def map_type(key: DuckDBPyType, value: DuckDBPyType, *, connection: DuckDBPyConnection = ...) -> DuckDBPyType: ...
 def duplicate(*, connection: DuckDBPyConnection = ...) -> DuckDBPyConnection: ...
 def execute(query: object, parameters: object = None, *, connection: DuckDBPyConnection = ...) -> DuckDBPyConnection: ...
+def prepare(query: object, *, connection: DuckDBPyConnection = ...) -> DuckDBPyPreparedStatement: ...
 def executemany(query: object, parameters: object = None, *, connection: DuckDBPyConnection = ...) -> DuckDBPyConnection: ...
 def close(*, connection: DuckDBPyConnection = ...) -> None: ...
 def interrupt(*, connection: DuckDBPyConnection = ...) -> None: ...
@@ -650,6 +696,8 @@ def checkpoint(*, connection: DuckDBPyConnection = ...) -> DuckDBPyConnection: .
 def append(table_name: str, df: pandas.DataFrame, *, by_name: bool = False, connection: DuckDBPyConnection = ...) -> DuckDBPyConnection: ...
 def register(view_name: str, python_object: object, *, connection: DuckDBPyConnection = ...) -> DuckDBPyConnection: ...
 def unregister(view_name: str, *, connection: DuckDBPyConnection = ...) -> DuckDBPyConnection: ...
+def replacement_cache_info(*, connection: DuckDBPyConnection = ...) -> dict: ...
+def statement_cache_info(*, connection: DuckDBPyConnection = ...) -> dict: ...
 def table(table_name: str, *, connection: DuckDBPyConnection = ...) -> DuckDBPyRelation: ...
 def view(view_name: str, *, connection: DuckDBPyConnection = ...) -> DuckDBPyRelation: ...
 def values(values: List[Any], *, connection: DuckDBPyConnection = ...) -> DuckDBPyRelation: ...
@@ -674,7 +722,7 @@ def install_extension(extension: str, *, force_install: bool = False, connection
 def load_extension(extension: str, *, connection: DuckDBPyConnection = ...) -> None: ...
 def project(df: pandas.DataFrame, *args: str, groups: str = "", connection: DuckDBPyConnection = ...) -> DuckDBPyRelation: ...
 def distinct(df: pandas.DataFrame, *, connection: DuckDBPyConnection = ...) -> DuckDBPyRelation: ...
-def write_csv(df: pandas.DataFrame, filename: str, *, sep: Optional[str] = None, na_rep: Optional[str] = None, header: Optional[bool] = None, quotechar: Optional[str] = None, escapechar: Optional[str] = None, date_format: Optional[str] = None, timestamp_format: Optional[str] = None, quoting: Optional[str | int] = None, encoding: Optional[str] = None, compression: Optional[str] = None, overwrite: Optional[bool] = None, per_thread_output: Optional[bool] = None, use_tmp_file: Optional[bool] = None, partition_by: Optional[List[str]] = None, write_partition_columns: Optional[bool] = None, connection: DuckDBPyConnection = ...) -> None: ...
+def write_csv(df: pandas.DataFrame, filename: str, *, sep: Optional[str] = None, na_rep: Optional[str] = None, header: Optional[bool] = None, quotechar: Optional[str] = None, escapechar: Optional[str] = None, date_format: Optional[str] = None, timestamp_format: Optional[str] = None, quoting: Optional[str | int] = None, encoding: Optional[str] = None, compression: Optional[str] = None, overwrite: Optional[bool] = None, per_thread_output: Optional[bool] = None, use_tmp_file: Optional[bool] = None, partition_by: Optional[List[str]] = None, write_partition_columns: Optional[bool] = None, append: Optional[bool] = None, connection: DuckDBPyConnection = ...) -> None: ...
 def aggregate(df: pandas.DataFrame, aggr_expr: str | List[Expression], group_expr: str = "", *, connection: DuckDBPyConnection = ...) -> DuckDBPyRelation: ...
 def alias(df: pandas.DataFrame, alias: str, *, connection: DuckDBPyConnection = ...) -> DuckDBPyRelation: ...
 def filter(df: pandas.DataFrame, filter_expr: str, *, connection: DuckDBPyConnection = ...) -> DuckDBPyRelation: ...
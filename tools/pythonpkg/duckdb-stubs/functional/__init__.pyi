@@ -7,6 +7,7 @@ DEFAULT: FunctionNullHandling
 
 NATIVE: PythonUDFType
 ARROW: PythonUDFType
+NUMPY: PythonUDFType
 
 class FunctionNullHandling:
     DEFAULT: FunctionNullHandling
@@ -23,6 +24,7 @@ class FunctionNullHandling:
 class PythonUDFType:
     NATIVE: PythonUDFType
     ARROW: PythonUDFType
+    NUMPY: PythonUDFType
     def __int__(self) -> int: ...
     def __index__(self) -> int: ...
     @property
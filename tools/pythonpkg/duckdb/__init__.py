@@ -14,6 +14,7 @@ _exported_symbols.extend([
 from .duckdb import (
     DuckDBPyRelation,
     DuckDBPyConnection,
+    DuckDBPyPreparedStatement,
     Statement,
     ExplainType,
     StatementType,
@@ -32,6 +33,7 @@ from .duckdb import (
 _exported_symbols.extend([
     "DuckDBPyRelation",
     "DuckDBPyConnection",
+    "DuckDBPyPreparedStatement",
     "ExplainType",
     "PythonExceptionHandling",
     "Expression",
@@ -80,6 +82,7 @@ from .duckdb import (
 	map_type,
 	duplicate,
 	execute,
+	prepare,
 	executemany,
 	close,
 	interrupt,
@@ -104,6 +107,8 @@ from .duckdb import (
 	append,
 	register,
 	unregister,
+	replacement_cache_info,
+	statement_cache_info,
 	table,
 	view,
 	values,
@@ -163,6 +168,7 @@ _exported_symbols.extend([
 	'map_type',
 	'duplicate',
 	'execute',
+	'prepare',
 	'executemany',
 	'close',
 	'interrupt',
@@ -187,6 +193,8 @@ _exported_symbols.extend([
 	'append',
 	'register',
 	'unregister',
+	'replacement_cache_info',
+	'statement_cache_info',
 	'table',
 	'view',
 	'values',
@@ -290,6 +298,16 @@ _exported_symbols.extend([
     "connect"
 ])
 
+from .connection_pool import (
+    ConnectionPool,
+    PoolTimeoutError
+)
+
+_exported_symbols.extend([
+    "ConnectionPool",
+    "PoolTimeoutError"
+])
+
 # Exceptions
 from .duckdb import (
     Error,
@@ -0,0 +1,238 @@
+import asyncio
+import collections
+import os
+import threading
+from typing import AsyncIterator, Optional
+
+import duckdb
+
+# Time the driver waits when all queries are waiting for DuckDB's own threads, before stepping the queries again.
+# The wait doubles while none of the queries makes progress, up to the maximum, a new query wakes the driver up.
+_MIN_POLL_INTERVAL = 0.0005
+_MAX_POLL_INTERVAL = 0.02
+
+
+class _Job(object):
+    """
+    A query that is driven by the driver thread.
+    'func' is a generator function that is called with the job, it yields True when the query is waiting for
+    DuckDB's threads and False when it made progress, and returns the result of the query.
+    """
+
+    def __init__(self, loop, func, args):
+        self.loop = loop
+        self.future = loop.create_future()
+        self._func = func
+        self._args = args
+        self._generator = None
+        self._lock = threading.Lock()
+        self._started = False
+        self._cancelled = False
+        self._cancel_requested = False
+        self._interrupt = None
+        self._interrupted = False
+
+    def start(self) -> bool:
+        with self._lock:
+            if self._cancelled:
+                return False
+            self._started = True
+        self._generator = self._func(self, *self._args)
+        return True
+
+    def cancel(self) -> bool:
+        """
+        Returns True if the job was cancelled before it started, otherwise the running query is interrupted
+        """
+        with self._lock:
+            if not self._started:
+                self._cancelled = True
+                return True
+            self._cancel_requested = True
+            self._interrupt_if_requested()
+            return False
+
+    def set_interrupt(self, interrupt):
+        with self._lock:
+            self._interrupt = interrupt
+            self._interrupt_if_requested()
+
+    def _interrupt_if_requested(self):
+        if self._cancel_requested and self._interrupt is not None and not self._interrupted:
+            self._interrupted = True
+            self._interrupt()
+
+    def step(self) -> Optional[bool]:
+        """
+        Step the query, returns whether it is waiting or None once it is done
+        """
+        try:
+            return next(self._generator)
+        except StopIteration as e:
+            self._post(self._set_result, e.value)
+        except BaseException as e:
+            self._post(self._set_exception, e)
+        return None
+
+    def _post(self, callback, value):
+        try:
+            self.loop.call_soon_threadsafe(callback, value)
+        except RuntimeError:
+            # the event loop was closed, nobody is waiting for the result anymore
+            pass
+
+    def _set_result(self, value):
+        if not self.future.done():
+            self.future.set_result(value)
+
+    def _set_exception(self, exception):
+        if not self.future.done():
+            self.future.set_exception(exception)
+
+
+class _Driver(object):
+    """
+    A single thread that steps all running queries in turn, DuckDB's own threads execute them
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._queue = collections.deque()
+        self._thread = None
+
+    def submit(self, loop, func, *args) -> _Job:
+        job = _Job(loop, func, args)
+        with self._condition:
+            self._queue.append(job)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="duckdb_async", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return job
+
+    def _reset(self):
+        # the thread does not survive a fork
+        self._condition = threading.Condition()
+        self._queue = collections.deque()
+        self._thread = None
+
+    def _run(self):
+        active = []
+        poll_interval = _MIN_POLL_INTERVAL
+        while True:
+            with self._condition:
+                while not self._queue and not active:
+                    self._condition.wait()
+                while self._queue:
+                    job = self._queue.popleft()
+                    if job.start():
+                        active.append(job)
+            all_waiting = True
+            for job in list(active):
+                waiting = job.step()
+                if waiting is None:
+                    active.remove(job)
+                elif not waiting:
+                    all_waiting = False
+            if not active or not all_waiting:
+                poll_interval = _MIN_POLL_INTERVAL
+                continue
+            with self._condition:
+                if not self._queue:
+                    self._condition.wait(poll_interval)
+            poll_interval = min(poll_interval * 2, _MAX_POLL_INTERVAL)
+
+
+_driver = _Driver()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_driver._reset)
+
+
+async def _run(func, *args):
+    """
+    Run the job on the driver thread, the result is handed to the event loop through its wakeup fd.
+    If the awaiting task is cancelled before the job started it is never started, otherwise the query is interrupted
+    and we wait for it to stop before cancelling.
+    """
+    job = _driver.submit(asyncio.get_running_loop(), func, *args)
+    try:
+        return await asyncio.shield(job.future)
+    except asyncio.CancelledError:
+        if job.cancel():
+            job.future.cancel()
+            raise
+        await asyncio.wait([job.future])
+        if not job.future.cancelled():
+            # the interrupted query raises an InterruptException, which nobody is waiting for anymore
+            job.future.exception()
+        raise
+
+
+def _execute_tasks(execute_task):
+    while True:
+        state = execute_task()
+        if state == "ready":
+            return
+        yield state == "waiting"
+
+
+def _execute(job, connection, query, parameters):
+    pending = connection._pending_query(query, parameters)
+    if pending is None:
+        return None
+    job.set_interrupt(pending.interrupt)
+    yield from _execute_tasks(pending.execute_task)
+    return pending.finish()
+
+
+def _start_relation(job, relation):
+    pending = relation._pending_query()
+    job.set_interrupt(pending.interrupt)
+    yield from _execute_tasks(pending.execute_task)
+    pending.finish()
+    return pending.interrupt
+
+
+def _fetch_record_batch(job, relation, interrupt, batch_size):
+    job.set_interrupt(interrupt)
+    yield from _execute_tasks(relation._execute_stream_task)
+    return relation._fetch_record_batch(batch_size)
+
+
+# The ids of the connections that have an aexecute in progress, their result would be replaced by a second one
+_executing = set()
+_executing_lock = threading.Lock()
+
+
+async def execute(connection, query, parameters=None):
+    """
+    Execute the query without blocking the event loop, returns the connection.
+    The result is stored on the connection, so a connection can only run a single aexecute at a time.
+    """
+    key = id(connection)
+    with _executing_lock:
+        if key in _executing:
+            raise duckdb.InvalidInputException(
+                "The connection is already executing a query with aexecute, use a cursor for every concurrent query"
+            )
+        _executing.add(key)
+    try:
+        return await _run(_execute, connection, query, parameters)
+    finally:
+        with _executing_lock:
+            _executing.discard(key)
+
+
+async def fetch_record_batches(relation, batch_size: int) -> AsyncIterator:
+    """
+    Execute the relation and yield its result as pyarrow RecordBatches, a batch is only produced when it is awaited
+    """
+    interrupt = await _run(_start_relation, relation)
+    try:
+        while True:
+            batch = await _run(_fetch_record_batch, relation, interrupt, batch_size)
+            if batch is None:
+                break
+            yield batch
+    finally:
+        relation.close()
@@ -0,0 +1,186 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from .duckdb import (
+    ConnectionException,
+    DuckDBPyConnection,
+    Error,
+    InvalidInputException,
+    TransactionException,
+    connect,
+)
+
+
+class PoolTimeoutError(Error):
+    """Raised when no connection became available within the timeout"""
+
+
+class ConnectionPool:
+    """
+    A thread-safe pool of connections to a single database
+
+    All connections of the pool are cursors of one connection, so they share the same database instance,
+    including in-memory databases. DuckDB releases the GIL while a query runs, so N threads holding N
+    connections of the pool execute their queries concurrently.
+    """
+
+    def __init__(
+        self,
+        database: str = ':memory:',
+        *,
+        max_size: int = 8,
+        read_only: bool = False,
+        config: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        health_check: bool = True,
+    ):
+        if max_size < 1:
+            raise InvalidInputException("The size of a ConnectionPool must be at least 1")
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check = health_check
+        self._database = connect(database, read_only=read_only, config=config or {})
+        self._condition = threading.Condition()
+        self._idle: List[DuckDBPyConnection] = []
+        self._in_use = set()
+        self._closed = False
+        # metrics
+        self._acquired = 0
+        self._timeouts = 0
+        self._health_check_failures = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    def _check_health(self, connection: DuckDBPyConnection) -> bool:
+        try:
+            connection.execute("SELECT 1").fetchall()
+            return True
+        except Error:
+            return False
+
+    def _reset(self, connection: DuckDBPyConnection) -> bool:
+        # roll back whatever transaction the previous user left open
+        try:
+            connection.rollback()
+        except TransactionException:
+            pass
+        except Error:
+            return False
+        return True
+
+    def acquire(self, timeout: Optional[float] = None) -> DuckDBPyConnection:
+        """
+        Take a connection from the pool, waiting up to 'timeout' seconds for one to be released
+        """
+        if timeout is None:
+            timeout = self.timeout
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise ConnectionException("The ConnectionPool is closed")
+                if self._idle:
+                    connection = self._idle.pop()
+                    break
+                if len(self._in_use) < self.max_size:
+                    connection = None
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(
+                        f"Could not acquire a connection within {timeout} seconds, all {self.max_size} are in use"
+                    )
+                self._condition.wait(remaining)
+            # reserve the slot before creating or checking the connection outside of the lock
+            placeholder = object()
+            self._in_use.add(placeholder)
+            waited = time.monotonic() - start
+            self._wait_time += waited
+            self._max_wait_time = max(self._max_wait_time, waited)
+            self._acquired += 1
+
+        try:
+            if connection is not None and self.health_check and not self._check_health(connection):
+                with self._condition:
+                    self._health_check_failures += 1
+                connection.close()
+                connection = None
+            if connection is None:
+                connection = self._database.cursor()
+        except BaseException:
+            with self._condition:
+                self._in_use.discard(placeholder)
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._in_use.discard(placeholder)
+            self._in_use.add(connection)
+        return connection
+
+    def release(self, connection: DuckDBPyConnection) -> None:
+        """
+        Return a connection that was acquired from this pool
+        """
+        with self._condition:
+            if connection not in self._in_use:
+                raise InvalidInputException("The connection was not acquired from this ConnectionPool")
+        reusable = not self._closed and self._reset(connection)
+        with self._condition:
+            self._in_use.discard(connection)
+            if reusable and not self._closed:
+                self._idle.append(connection)
+            else:
+                connection.close()
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[DuckDBPyConnection]:
+        """
+        Acquire a connection for the duration of the 'with' block
+        """
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the metrics of the pool
+        """
+        with self._condition:
+            return {
+                'max_size': self.max_size,
+                'in_use': len(self._in_use),
+                'idle': len(self._idle),
+                'acquired': self._acquired,
+                'timeouts': self._timeouts,
+                'health_check_failures': self._health_check_failures,
+                'wait_time': self._wait_time,
+                'max_wait_time': self._max_wait_time,
+            }
+
+    def close(self) -> None:
+        """
+        Close the pool and all of its connections, including the ones that are still in use
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            idle = self._idle
+            self._idle = []
+            self._condition.notify_all()
+        for connection in idle:
+            connection.close()
+        self._database.close()
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
@@ -1,7 +1,8 @@
 from .sql import SparkSession, DataFrame
 from .conf import SparkConf
 from .context import SparkContext
+from .storagelevel import StorageLevel
 from ._globals import _NoValue
 from .exception import ContributionsAcceptedError
 
-__all__ = ["SparkSession", "DataFrame", "SparkConf", "SparkContext", "ContributionsAcceptedError"]
+__all__ = ["SparkSession", "DataFrame", "SparkConf", "SparkContext", "StorageLevel", "ContributionsAcceptedError"]
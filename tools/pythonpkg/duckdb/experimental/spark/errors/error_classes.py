@@ -286,6 +286,11 @@ ERROR_CLASSES_JSON = """
       "Pandas UDF should return StructType for <eval_type>, got <return_type>."
     ]
   },
+  "INVALID_SAVE_MODE" : {
+    "message" : [
+      "Unknown save mode: <mode>. Accepted save modes are 'overwrite', 'append', 'ignore', 'error', 'errorifexists', 'default'."
+    ]
+  },
   "INVALID_TIMEOUT_TIMESTAMP" : {
     "message" : [
       "Timeout timestamp (<timestamp>) cannot be earlier than the current watermark (<watermark>)."
@@ -636,6 +641,11 @@ ERROR_CLASSES_JSON = """
       "Only a single trigger is allowed."
     ]
   },
+  "PATH_ALREADY_EXISTS" : {
+    "message" : [
+      "Path <output_path> already exists. Set mode as \\"overwrite\\" to overwrite the existing path."
+    ]
+  },
   "PIPE_FUNCTION_EXITED" : {
     "message" : [
       "Pipe function `<func_name>` exited with error code <error_code>."
@@ -0,0 +1,222 @@
+import os
+import shutil
+import tempfile
+import uuid
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+
+import duckdb
+
+from ..storagelevel import StorageLevel
+
+if TYPE_CHECKING:
+    from .session import SparkSession
+
+
+_MEMORY_UNITS = {
+    'BYTES': 1,
+    'KB': 1000,
+    'MB': 1000**2,
+    'GB': 1000**3,
+    'TB': 1000**4,
+    'PB': 1000**5,
+    'KIB': 1024,
+    'MIB': 1024**2,
+    'GIB': 1024**3,
+    'TIB': 1024**4,
+    'PIB': 1024**5,
+}
+
+
+def _parse_memory_limit(value: str) -> Optional[int]:
+    parts = value.strip().split()
+    if len(parts) != 2 or parts[1].upper() not in _MEMORY_UNITS:
+        return None
+    try:
+        return int(float(parts[0]) * _MEMORY_UNITS[parts[1].upper()])
+    except ValueError:
+        return None
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class _CacheEntry:
+    def __init__(self, view: str, source: str, storage_level: StorageLevel):
+        # the view that the persisted DataFrame reads from, it points to the materialized table or to the source
+        self.view = view
+        # the view of the original relation, used when the DataFrame is not (or no longer) materialized
+        self.source = source
+        self.storage_level = storage_level
+        self.table: Optional[str] = None
+        self.in_memory = False
+        self.size = 0
+
+
+class CacheManager:
+    """
+    Keeps the materialized results of the persisted DataFrames of a session.
+
+    DataFrames that are persisted in memory are materialized into temporary tables. Together they may use at most
+    'spark.memory.storageFraction' of the memory limit, when they use more the least recently used ones are evicted:
+    to a database file on disk if their storage level allows it, otherwise they are recomputed on every use again.
+    """
+
+    def __init__(self, session: "SparkSession"):
+        self._session = session
+        # ordered from the least to the most recently used
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._disk_directory: Optional[str] = None
+        # removes the disk directory when the manager is collected or the interpreter exits without closing it
+        self._remove_disk_directory: Optional[weakref.finalize] = None
+        self._disk_database = f'spark_cache_{uuid.uuid4().hex}'
+
+    @property
+    def _conn(self) -> duckdb.DuckDBPyConnection:
+        return self._session.conn
+
+    def persist(self, relation: duckdb.DuckDBPyRelation, storage_level: StorageLevel) -> str:
+        """
+        Materialize the relation, returns the name of the temporary view that reads the persisted result.
+        The view outlives the cached result, once it is unpersisted the view reads the relation again.
+        """
+        key = uuid.uuid4().hex
+        entry = _CacheEntry(f'spark_cache_{key}', f'spark_cache_source_{key}', storage_level)
+        relation.create_view(entry.source, temporary=True)
+        self._entries[entry.view] = entry
+        try:
+            self._materialize(entry)
+        except BaseException:
+            self.unpersist(entry.view)
+            raise
+        self._evict(entry)
+        return entry.view
+
+    def touch(self, query: str) -> None:
+        """
+        Mark the cached results that the query reads as used, the DataFrames that are derived from a persisted
+        DataFrame read its view as well
+        """
+        for view in [view for view in self._entries if view in query]:
+            self._entries.move_to_end(view)
+
+    @property
+    def has_entries(self) -> bool:
+        return bool(self._entries)
+
+    def is_cached(self, view: str) -> bool:
+        return view in self._entries
+
+    def storage_level(self, view: str) -> StorageLevel:
+        entry = self._entries.get(view)
+        return entry.storage_level if entry else StorageLevel.NONE
+
+    def unpersist(self, view: str) -> None:
+        entry = self._entries.pop(view, None)
+        if entry is None:
+            return
+        # the DataFrames that read the view compute the relation again, only the materialized result is removed
+        table = entry.table
+        self._point_view(entry, None)
+        if table:
+            self._conn.execute(f'DROP TABLE IF EXISTS {table}')
+
+    def clear(self) -> None:
+        for view in list(self._entries):
+            self.unpersist(view)
+
+    def close(self) -> None:
+        """
+        Drop all cached DataFrames and remove the database file of the ones that were stored on disk
+        """
+        try:
+            self.clear()
+            if self._disk_directory is not None:
+                self._conn.execute(f'DETACH DATABASE IF EXISTS {_quote_identifier(self._disk_database)}')
+        finally:
+            if self._remove_disk_directory is not None:
+                self._remove_disk_directory()
+                self._remove_disk_directory = None
+                self._disk_directory = None
+
+    def _memory_budget(self) -> Optional[float]:
+        memory_limit = self._conn.sql("select current_setting('memory_limit')").fetchone()[0]
+        limit = _parse_memory_limit(str(memory_limit))
+        if limit is None:
+            return None
+        return limit * float(self._session.conf.get('spark.memory.storageFraction'))
+
+    def _memory_usage(self) -> int:
+        res = self._conn.sql(
+            "select memory_usage_bytes + temporary_storage_bytes from duckdb_memory() where tag = 'IN_MEMORY_TABLE'"
+        ).fetchone()
+        return int(res[0]) if res else 0
+
+    def _attach_disk_database(self) -> str:
+        if self._disk_directory is None:
+            directory = tempfile.mkdtemp(prefix='duckdb_spark_cache_')
+            self._remove_disk_directory = weakref.finalize(self, shutil.rmtree, directory, ignore_errors=True)
+            path = os.path.join(directory, 'cache.duckdb').replace("'", "''")
+            self._conn.execute(f"ATTACH '{path}' AS {_quote_identifier(self._disk_database)}")
+            self._disk_directory = directory
+        return self._disk_database
+
+    def _point_view(self, entry: _CacheEntry, table: Optional[str]) -> None:
+        source = table if table else _quote_identifier(entry.source)
+        self._conn.execute(
+            f'CREATE OR REPLACE TEMPORARY VIEW {_quote_identifier(entry.view)} AS SELECT * FROM {source}'
+        )
+        entry.table = table
+
+    def _create_table(self, entry: _CacheEntry, source: str, in_memory: bool) -> None:
+        name = _quote_identifier(entry.view + '_data')
+        if in_memory:
+            table = f'temp.main.{name}'
+            before = self._memory_usage()
+            self._conn.execute(f'CREATE TEMPORARY TABLE {name} AS SELECT * FROM {source}')
+            entry.size = max(0, self._memory_usage() - before)
+        else:
+            table = f'{_quote_identifier(self._attach_disk_database())}.main.{name}'
+            self._conn.execute(f'CREATE TABLE {table} AS SELECT * FROM {source}')
+            entry.size = 0
+        entry.in_memory = in_memory
+        self._point_view(entry, table)
+
+    def _materialize(self, entry: _CacheEntry) -> None:
+        level = entry.storage_level
+        if level.useMemory or level.useDisk:
+            self._create_table(entry, _quote_identifier(entry.source), in_memory=level.useMemory)
+        else:
+            self._point_view(entry, None)
+
+    def _spill(self, entry: _CacheEntry) -> None:
+        # the temporary table can be dropped once the view no longer reads it
+        table = entry.table
+        if entry.storage_level.useDisk:
+            self._create_table(entry, table, in_memory=False)
+        else:
+            self._point_view(entry, None)
+            entry.in_memory = False
+            entry.size = 0
+        self._conn.execute(f'DROP TABLE IF EXISTS {table}')
+
+    def _evict(self, added: _CacheEntry) -> None:
+        budget = self._memory_budget()
+        if budget is None:
+            return
+        used = sum(entry.size for entry in self._entries.values() if entry.in_memory)
+        for entry in list(self._entries.values()):
+            if used <= budget:
+                return
+            if entry is added or not entry.in_memory:
+                continue
+            used -= entry.size
+            self._spill(entry)
+        if used > budget and added.in_memory:
+            # the DataFrame does not fit in the share of the memory limit by itself
+            self._spill(added)
+
+
+__all__ = ["CacheManager"]
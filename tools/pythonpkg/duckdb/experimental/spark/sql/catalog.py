@@ -74,5 +74,9 @@ class Catalog:
     def setCurrentDatabase(self, dbName: str) -> None:
         raise NotImplementedError
 
+    def clearCache(self) -> None:
+        """Removes all cached DataFrames of the session."""
+        self._session._cache_manager.clear()
+
 
 __all__ = ["Catalog", "Table", "Column", "Function", "Database"]
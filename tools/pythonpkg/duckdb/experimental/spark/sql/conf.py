@@ -1,23 +1,41 @@
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 from duckdb.experimental.spark._globals import _NoValueType, _NoValue
 from duckdb import DuckDBPyConnection
 
+# The settings that are used by this implementation, with their default values
+_SUPPORTED_SETTINGS: Dict[str, str] = {
+    # the fraction of the memory limit that cached DataFrames can use before they are evicted
+    'spark.memory.storageFraction': '0.5',
+}
+
 
 class RuntimeConfig:
     def __init__(self, connection: DuckDBPyConnection):
         self._connection = connection
+        self._values: Dict[str, str] = {}
+
+    def _check_supported(self, key: str) -> None:
+        if key not in _SUPPORTED_SETTINGS:
+            raise NotImplementedError(f"The setting '{key}' is not supported")
 
     def set(self, key: str, value: str) -> None:
-        raise NotImplementedError
+        self._check_supported(key)
+        self._values[key] = str(value)
 
     def isModifiable(self, key: str) -> bool:
-        raise NotImplementedError
+        return key in _SUPPORTED_SETTINGS
 
     def unset(self, key: str) -> None:
-        raise NotImplementedError
+        self._check_supported(key)
+        self._values.pop(key, None)
 
     def get(self, key: str, default: Union[Optional[str], _NoValueType] = _NoValue) -> str:
-        raise NotImplementedError
+        self._check_supported(key)
+        if key in self._values:
+            return self._values[key]
+        if default is not _NoValue:
+            return default
+        return _SUPPORTED_SETTINGS[key]
 
 
 __all__ = ["RuntimeConfig"]
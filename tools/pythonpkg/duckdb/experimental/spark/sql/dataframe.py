@@ -3,6 +3,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -20,14 +21,17 @@ from ..errors import PySparkTypeError, PySparkValueError, PySparkIndexError
 from ..exception import ContributionsAcceptedError
 from .column import Column
 from .readwriter import DataFrameWriter
+from .streaming import DataStreamWriter
 from .type_utils import duckdb_to_spark_schema
 from .types import Row, StructType
+from ..storagelevel import StorageLevel
 
 if TYPE_CHECKING:
     from pandas.core.frame import DataFrame as PandasDataFrame
 
     from .group import GroupedData, Grouping
     from .session import SparkSession
+    from .streaming import _FileStreamSource
 
 from ..errors import PySparkValueError
 from .functions import _to_column_expr, col
@@ -38,13 +42,17 @@ class DataFrame:
         self.relation = relation
         self.session = session
         self._schema = None
+        # the view of the persisted result, when the DataFrame is cached
+        self._cache_view: Optional[str] = None
         if self.relation is not None:
             self._schema = duckdb_to_spark_schema(self.relation.columns, self.relation.types)
 
     def show(self, **kwargs) -> None:
+        self._touch_cache()
         self.relation.show()
 
     def toPandas(self) -> "PandasDataFrame":
+        self._touch_cache()
         return self.relation.df()
 
     def createOrReplaceTempView(self, name: str) -> None:
@@ -793,6 +801,23 @@ class DataFrame:
     def write(self) -> DataFrameWriter:
         return DataFrameWriter(self)
 
+    @property
+    def writeStream(self) -> DataStreamWriter:
+        return DataStreamWriter(self)
+
+    @property
+    def isStreaming(self) -> bool:
+        """Returns ``True`` if this :class:`DataFrame` reads from a streaming source."""
+        return bool(self._streaming_sources())
+
+    def _streaming_sources(self) -> List["_FileStreamSource"]:
+        sources = self.session._streaming_sources
+        if not sources:
+            return []
+        # the streaming sources are views, find the ones that the plan reads from
+        query = self.relation.sql_query()
+        return [source for view, source in sources.items() if view in query]
+
     def printSchema(self):
         raise ContributionsAcceptedError
 
@@ -1006,6 +1031,7 @@ class DataFrame:
         >>> df.count()
         3
         """
+        self._touch_cache()
         count_rel = self.relation.count("*")
         return int(count_rel.fetchone()[0])
 
@@ -1038,16 +1064,135 @@ class DataFrame:
         return DataFrame(new_rel, self.session)
 
     def collect(self) -> List[Row]:
-        columns = self.relation.columns
-        result = self.relation.fetchall()
+        """Returns all the records as a list of :class:`Row`.
 
-        def construct_row(values, names) -> Row:
-            row = tuple.__new__(Row, list(values))
-            row.__fields__ = list(names)
-            return row
-
-        rows = [construct_row(x, columns) for x in result]
+        The rows are converted chunk by chunk and all of them share the same list of field names.
+        """
+        self._touch_cache()
+        fields = list(self.relation.columns)
+        rows: List[Row] = []
+        while True:
+            chunk = self.relation._fetch_row_chunk(Row, fields, stream=False)
+            if not chunk:
+                break
+            rows.extend(chunk)
         return rows
 
+    def toLocalIterator(self, prefetchPartitions: bool = False) -> Iterator[Row]:
+        """Returns an iterator that contains all of the rows in this :class:`DataFrame`.
+
+        The result is materialized by DuckDB, which can spill it to disk, and converted to rows one chunk at a time,
+        so only the rows of the current chunk are kept in memory. Other queries on the session don't invalidate the
+        materialized result, so the DataFrame can be used while it is iterated.
+
+        Parameters
+        ----------
+        prefetchPartitions : bool, optional
+            Prefetching is not supported, the chunks are only converted when they are needed.
+
+        Returns
+        -------
+        Iterator
+            Iterator of rows.
+
+        Examples
+        --------
+        >>> df = spark.createDataFrame(
+        ...     [(14, "Tom"), (23, "Alice"), (16, "Bob")], ["age", "name"])
+        >>> list(df.toLocalIterator())
+        [Row(age=14, name='Tom'), Row(age=23, name='Alice'), Row(age=16, name='Bob')]
+        """
+        if prefetchPartitions:
+            raise ContributionsAcceptedError("prefetchPartitions is not supported by toLocalIterator")
+        self._touch_cache()
+        fields = list(self.relation.columns)
+        # the iterator executes its own relation, the result of the DataFrame's relation is replaced by other actions
+        return self._iterate_rows(self.relation.select(StarExpression()), fields)
+
+    @staticmethod
+    def _iterate_rows(relation: duckdb.DuckDBPyRelation, fields: List[str]) -> Iterator[Row]:
+        while True:
+            chunk = relation._fetch_row_chunk(Row, fields, stream=False)
+            if not chunk:
+                break
+            yield from chunk
+
+    def _touch_cache(self) -> None:
+        manager = self.session._cache_manager
+        if manager.has_entries:
+            manager.touch(self.relation.sql_query())
+
+    @property
+    def is_cached(self) -> bool:
+        return self._cache_view is not None and self.session._cache_manager.is_cached(self._cache_view)
+
+    @property
+    def storageLevel(self) -> StorageLevel:
+        """Get the :class:`DataFrame`'s current storage level.
+
+        Examples
+        --------
+        >>> df = spark.range(10)
+        >>> df.storageLevel
+        StorageLevel(False, False, False, False, 1)
+        >>> df.cache().storageLevel
+        StorageLevel(True, True, False, True, 1)
+        """
+        if self._cache_view is None:
+            return StorageLevel.NONE
+        return self.session._cache_manager.storage_level(self._cache_view)
+
+    def cache(self) -> "DataFrame":
+        """Persists the :class:`DataFrame` with the default storage level (`MEMORY_AND_DISK_DESER`).
+
+        Returns
+        -------
+        :class:`DataFrame`
+            Cached DataFrame.
+        """
+        return self.persist()
+
+    def persist(self, storageLevel: StorageLevel = StorageLevel.MEMORY_AND_DISK_DESER) -> "DataFrame":
+        """Sets the storage level to persist the contents of the :class:`DataFrame`.
+
+        Unlike Spark the DataFrame is materialized right away, the actions on it and on the DataFrames
+        that are derived from it afterwards read the materialized result. Once it is unpersisted they are
+        computed again.
+
+        Parameters
+        ----------
+        storageLevel : :class:`StorageLevel`
+            Storage level to set for persistence. Default is MEMORY_AND_DISK_DESER.
+
+        Returns
+        -------
+        :class:`DataFrame`
+            Persisted DataFrame.
+        """
+        if self.is_cached:
+            # Spark keeps the storage level that was set first
+            self._touch_cache()
+            return self
+        self._cache_view = self.session._cache_manager.persist(self.relation, storageLevel)
+        self.relation = self.session.conn.view(self._cache_view)
+        return self
+
+    def unpersist(self, blocking: bool = False) -> "DataFrame":
+        """Marks the :class:`DataFrame` as non-persistent, and removes its materialized result.
+
+        Parameters
+        ----------
+        blocking : bool
+            Whether to block until all blocks are deleted, the result is always removed right away.
+
+        Returns
+        -------
+        :class:`DataFrame`
+            Unpersisted DataFrame.
+        """
+        if self._cache_view is not None:
+            self.session._cache_manager.unpersist(self._cache_view)
+        return self
+
 
 __all__ = ["DataFrame"]
@@ -1,10 +1,17 @@
-from typing import TYPE_CHECKING, List, Optional, Union, cast
+import datetime
+import fnmatch
+import os
+import shutil
+import uuid
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union, cast
+
+import duckdb
 
 from ..exception import ContributionsAcceptedError
 from .types import StructType
 
 
-from ..errors import PySparkNotImplementedError, PySparkTypeError
+from ..errors import AnalysisException, PySparkTypeError, PySparkValueError
 
 PrimitiveType = Union[bool, float, int, str]
 OptionalPrimitiveType = Optional[PrimitiveType]
@@ -14,9 +21,203 @@ if TYPE_CHECKING:
     from duckdb.experimental.spark.sql.session import SparkSession
 
 
+_SAVE_MODES = ("overwrite", "append", "ignore", "error", "errorifexists", "default")
+
+# The default number of rows in a Parquet row group written by DuckDB
+_DEFAULT_ROW_GROUP_SIZE = 122880
+
+
+def _path_exists(connection: duckdb.DuckDBPyConnection, path: str) -> bool:
+    if "://" not in path:
+        return os.path.exists(path)
+    # a remote file, or a directory that contains files
+    res = connection.execute(
+        "select 1 from glob(?) union all select 1 from glob(?) limit 1", [path, path.rstrip("/") + "/**"]
+    ).fetchone()
+    return res is not None
+
+
+def _remove_path(path: str) -> bool:
+    if "://" in path or not os.path.exists(path):
+        return False
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    else:
+        os.remove(path)
+    return True
+
+
+def _file_to_directory(connection: duckdb.DuckDBPyConnection, path: str) -> None:
+    """
+    Move a single file that was written before into a directory with the same name, so files can be added to it
+    """
+    if "://" in path:
+        if connection.execute("select 1 from glob(?) limit 1", [path]).fetchone() is not None:
+            raise ContributionsAcceptedError(f"Appending to the remote file '{path}' is not supported")
+        return
+    if not os.path.isfile(path):
+        return
+    moved = f"{path}.{uuid.uuid4().hex}"
+    os.rename(path, moved)
+    os.makedirs(path)
+    os.rename(moved, os.path.join(path, f"part-{uuid.uuid4().hex}-{os.path.basename(path)}"))
+
+
+def _option_to_bool(value: "OptionalPrimitiveType") -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() == "true"
+
+
+def _is_directory(path: str) -> bool:
+    if "://" in path:
+        return path.endswith("/")
+    return os.path.isdir(path)
+
+
+def _is_hidden(path: str, root: Optional[str] = None) -> bool:
+    # like Spark, files that start with an underscore or a dot (such as '_SUCCESS') are not data files,
+    # neither are the files in the directories below 'root' that do (such as '_temporary')
+    path = path.rstrip("/")
+    root = root.rstrip("/") if root is not None else None
+    if root is not None and path.startswith(root + "/"):
+        names = path[len(root) + 1 :].split("/")
+    else:
+        names = [path.rsplit("/", 1)[-1]]
+    return any(name.startswith(("_", ".")) for name in names)
+
+
 class DataFrameWriter:
     def __init__(self, dataframe: "DataFrame"):
         self.dataframe = dataframe
+        self._mode = "errorifexists"
+        self._format: Optional[str] = None
+        self._partition_by: Optional[List[str]] = None
+        # options are case-insensitive, like in Spark
+        self._options: Dict[str, OptionalPrimitiveType] = {}
+
+    def mode(self, saveMode: Optional[str]) -> "DataFrameWriter":
+        """Specifies the behavior when data or table already exists.
+
+        Options include:
+
+        * `append`: Append contents of this :class:`DataFrame` to existing data.
+        * `overwrite`: Overwrite existing data.
+        * `error` or `errorifexists`: Throw an exception if data already exists.
+        * `ignore`: Silently ignore this operation if data already exists.
+        """
+        if saveMode is None:
+            return self
+        mode = saveMode.lower()
+        if mode not in _SAVE_MODES:
+            raise PySparkValueError(error_class="INVALID_SAVE_MODE", message_parameters={"mode": saveMode})
+        self._mode = mode
+        return self
+
+    def format(self, source: str) -> "DataFrameWriter":
+        self._format = source.lower()
+        return self
+
+    def option(self, key: str, value: "OptionalPrimitiveType") -> "DataFrameWriter":
+        self._options[key.lower()] = value
+        return self
+
+    def options(self, **options: "OptionalPrimitiveType") -> "DataFrameWriter":
+        for key, value in options.items():
+            self.option(key, value)
+        return self
+
+    def partitionBy(self, *cols: Union[str, List[str]]) -> "DataFrameWriter":
+        """Partitions the output by the given columns on the file system, in the Hive partitioning layout.
+
+        The partitions are written in parallel by DuckDB's partitioned COPY.
+        """
+        if len(cols) == 1 and isinstance(cols[0], (list, tuple)):
+            cols = cols[0]
+        self._partition_by = [cast(str, col) for col in cols]
+        return self
+
+    def _pop_option(self, key: str) -> "OptionalPrimitiveType":
+        return self._options.pop(key.lower(), None)
+
+    def _check_no_options(self) -> None:
+        for key in self._options:
+            raise ContributionsAcceptedError(f"The '{key}' option is not supported")
+
+    def _file_output_options(self, path: str, directory_output: bool) -> Optional[Dict[str, Any]]:
+        """
+        Apply the save mode to the existing output, returns None when nothing should be written,
+        otherwise the options of the write that belong to the mode
+        """
+        connection = self.dataframe.session.conn
+        exists = _path_exists(connection, path)
+        if self._mode == "ignore":
+            return None if exists else {}
+        if self._mode in ("error", "errorifexists", "default"):
+            if exists:
+                raise AnalysisException(error_class="PATH_ALREADY_EXISTS", message_parameters={"output_path": path})
+            return {}
+        if self._mode == "overwrite":
+            if exists and "://" in path:
+                # a remote path is not removed, the files that are written replace the existing ones
+                if path.rstrip("/") in self.dataframe.relation.sql_query():
+                    raise AnalysisException(message=f"Cannot overwrite the path '{path}' that is also being read from")
+                if directory_output:
+                    return {"overwrite": True}
+            return {}
+        # append, new files are added to the directory, they are named with a uuid
+        _file_to_directory(connection, path)
+        options: Dict[str, Any] = {"append": True}
+        if not directory_output:
+            options["per_thread_output"] = True
+        return options
+
+    def _write_files(self, path: str, directory_output: bool, write: Callable[[str, Dict[str, Any]], None]) -> None:
+        """
+        Write the output to 'path' with 'write', which is called with the path to write to and the options
+        of the save mode.
+        An existing local output is overwritten by writing next to it first, the plan may read the files
+        that are replaced, so they are only removed once the new output is written completely.
+        """
+        mode_options = self._file_output_options(path, directory_output)
+        if mode_options is None:
+            return
+        if self._mode != "overwrite" or "://" in path or not os.path.exists(path):
+            write(path, mode_options)
+            return
+        target = path.rstrip("/\\")
+        tmp = os.path.join(os.path.dirname(target), f".{os.path.basename(target)}.{uuid.uuid4().hex}.tmp")
+        try:
+            write(tmp, mode_options)
+        except BaseException:
+            _remove_path(tmp)
+            raise
+        _remove_path(target)
+        os.rename(tmp, target)
+
+    def save(
+        self,
+        path: Optional[str] = None,
+        format: Optional[str] = None,
+        mode: Optional[str] = None,
+        partitionBy: Union[str, List[str], None] = None,
+        **options: "OptionalPrimitiveType",
+    ) -> None:
+        if format is not None:
+            self.format(format)
+        self.mode(mode)
+        self.options(**options)
+        if partitionBy is not None:
+            self.partitionBy(partitionBy)
+        if path is None:
+            raise ContributionsAcceptedError("Saving without a path is not supported")
+        source = self._format or "parquet"
+        if source == "parquet":
+            self.parquet(path)
+        elif source == "csv":
+            self.csv(path)
+        else:
+            raise ContributionsAcceptedError(f"The '{source}' format is not supported")
 
     def saveAsTable(self, table_name: str) -> None:
         relation = self.dataframe.relation
@@ -29,13 +230,43 @@ class DataFrameWriter:
         partitionBy: Union[str, List[str], None] = None,
         compression: Optional[str] = None,
     ) -> None:
-        relation = self.dataframe.relation
-        if mode:
-            raise NotImplementedError
-        if partitionBy:
-            raise NotImplementedError
+        """Saves the content of the :class:`DataFrame` in Parquet format at the specified path.
 
-        relation.write_parquet(path, compression=compression)
+        Without partition columns a single file is written, unless the mode is `append` or the
+        `maxRecordsPerFile` option is set, then the files are written into the directory at `path`.
+        When appending to a single file that was written before, it is moved into a directory at `path` first.
+        `maxRecordsPerFile` is approximated by the row groups of the files, it can not be combined with `partitionBy`.
+        The `parquet.block.size` option sets the size of a row group in bytes.
+        """
+        relation = self.dataframe.relation
+        self.mode(mode)
+        if partitionBy is not None:
+            self.partitionBy(partitionBy)
+        if compression is None:
+            compression = cast(Optional[str], self._pop_option("compression"))
+        max_records = self._pop_option("maxRecordsPerFile")
+        row_group_size_bytes = self._pop_option("parquet.block.size")
+        self._check_no_options()
+
+        write_options: Dict[str, Any] = {}
+        if self._partition_by:
+            write_options["partition_by"] = self._partition_by
+        if row_group_size_bytes is not None:
+            write_options["row_group_size_bytes"] = int(row_group_size_bytes)
+        if max_records is not None and int(max_records) > 0:
+            if self._partition_by:
+                raise ContributionsAcceptedError("'maxRecordsPerFile' can not be combined with 'partitionBy'")
+            max_records = int(max_records)
+            row_group_size = min(max_records, _DEFAULT_ROW_GROUP_SIZE)
+            write_options["row_group_size"] = row_group_size
+            write_options["row_groups_per_file"] = max(1, max_records // row_group_size)
+
+        directory_output = bool(self._partition_by) or "row_groups_per_file" in write_options
+
+        def write(target: str, mode_options: Dict[str, Any]) -> None:
+            relation.write_parquet(target, compression=compression, **write_options, **mode_options)
+
+        self._write_files(path, directory_output, write)
 
     def csv(
         self,
@@ -58,8 +289,6 @@ class DataFrameWriter:
         emptyValue: Optional[str] = None,
         lineSep: Optional[str] = None,
     ):
-        if mode not in (None, "overwrite"):
-            raise NotImplementedError
         if escapeQuotes:
             raise NotImplementedError
         if ignoreLeadingWhiteSpace:
@@ -72,25 +301,156 @@ class DataFrameWriter:
             raise NotImplementedError
         if lineSep:
             raise NotImplementedError
+        self.mode(mode)
+        if compression is None:
+            compression = cast(Optional[str], self._pop_option("compression"))
+        self._check_no_options()
+
+        write_options: Dict[str, Any] = {}
+        if self._partition_by:
+            write_options["partition_by"] = self._partition_by
         relation = self.dataframe.relation
-        relation.write_csv(
-            path,
-            sep=sep,
-            na_rep=nullValue,
-            quotechar=quote,
-            compression=compression,
-            escapechar=escape,
-            header=header if isinstance(header, bool) else header == "True",
-            encoding=encoding,
-            quoting=quoteAll,
-            date_format=dateFormat,
-            timestamp_format=timestampFormat,
-        )
+
+        def write(target: str, mode_options: Dict[str, Any]) -> None:
+            relation.write_csv(
+                target,
+                sep=sep,
+                na_rep=nullValue,
+                quotechar=quote,
+                compression=compression,
+                escapechar=escape,
+                header=header if isinstance(header, bool) else header == "True",
+                encoding=encoding,
+                quoting=quoteAll,
+                date_format=dateFormat,
+                timestamp_format=timestampFormat,
+                **write_options,
+                **mode_options,
+            )
+
+        self._write_files(path, bool(self._partition_by), write)
 
 
 class DataFrameReader:
-    def __init__(self, session: "SparkSession"):
+    def __init__(self, session: "SparkSession", connection: Optional[duckdb.DuckDBPyConnection] = None):
         self.session = session
+        # the connection that binds the relations that read the files, the one of the session by default
+        self._conn = connection if connection is not None else session.conn
+        self._format: Optional[str] = None
+        self._schema: Optional[Union[StructType, str]] = None
+        # options are case-insensitive, like in Spark
+        self._options: Dict[str, OptionalPrimitiveType] = {}
+
+    def format(self, source: str) -> "DataFrameReader":
+        self._format = source.lower()
+        return self
+
+    def schema(self, schema: Union[StructType, str]) -> "DataFrameReader":
+        self._schema = schema
+        return self
+
+    def option(self, key: str, value: "OptionalPrimitiveType") -> "DataFrameReader":
+        self._options[key.lower()] = value
+        return self
+
+    def options(self, **options: "OptionalPrimitiveType") -> "DataFrameReader":
+        for key, value in options.items():
+            self.option(key, value)
+        return self
+
+    def _merge_options(self, options: Dict[str, "OptionalPrimitiveType"]) -> Dict[str, "OptionalPrimitiveType"]:
+        # the options that are passed to the read method take precedence over the ones set on the reader
+        merged = dict(self._options)
+        for key, value in options.items():
+            if value is not None:
+                merged[key.lower()] = value
+        return merged
+
+    @staticmethod
+    def _check_no_options(options: Dict[str, "OptionalPrimitiveType"]) -> None:
+        for key in options:
+            raise ContributionsAcceptedError(f"The '{key}' option is not supported")
+
+    def _file_source(
+        self, path: Union[str, List[str]], options: Dict[str, "OptionalPrimitiveType"]
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        """
+        Resolve the paths of a file based data source into the files and globs that DuckDB reads,
+        together with the options of DuckDB's multi file reader.
+
+        Directories are read recursively. Partition columns are discovered from the hive partitioned layout
+        (for example 'year=2024/month=01') of the directories that are read, or of all files when 'basePath' is set.
+        Filters on the partition columns are pushed into the scan, which prunes the files before they are read.
+        The generic file source options ('pathGlobFilter', 'recursiveFileLookup', 'modifiedBefore' and 'modifiedAfter')
+        are popped from the options.
+        """
+        if isinstance(path, str):
+            paths = [path]
+        elif isinstance(path, (list, tuple)) and all(isinstance(x, str) for x in path):
+            paths = list(path)
+        else:
+            raise PySparkTypeError(
+                error_class="NOT_STR_OR_LIST_OF_RDD",
+                message_parameters={
+                    "arg_name": "path",
+                    "arg_type": type(path).__name__,
+                },
+            )
+        if not paths:
+            raise PySparkValueError(message="At least one path has to be provided")
+
+        glob_filter = options.pop("pathglobfilter", None)
+        recursive = _option_to_bool(options.pop("recursivefilelookup", False))
+        modified_before = options.pop("modifiedbefore", None)
+        modified_after = options.pop("modifiedafter", None)
+        base_path = options.pop("basepath", None)
+
+        reader_options: Dict[str, Any] = {}
+        if base_path is not None:
+            base = str(base_path).rstrip("/")
+            for p in paths:
+                if p != base and not p.startswith(base + "/"):
+                    raise PySparkValueError(message=f"Wrong basePath {base_path} for the root path: {p}")
+        if recursive:
+            # like Spark, partitions are not inferred when the files are looked up recursively
+            reader_options["hive_partitioning"] = False
+        elif base_path is not None or any(_is_directory(p) for p in paths):
+            reader_options["hive_partitioning"] = True
+
+        roots = [p.rstrip("/") for p in paths if _is_directory(p)]
+        files = [p.rstrip("/") + "/**/" + str(glob_filter or "*") if _is_directory(p) else p for p in paths]
+        if modified_before is None and modified_after is None and glob_filter is None and not roots:
+            return files, reader_options
+
+        # list the files, to skip the hidden ones in the directories and to filter them on their name and
+        # modification time
+        before = datetime.datetime.fromisoformat(str(modified_before)) if modified_before is not None else None
+        after = datetime.datetime.fromisoformat(str(modified_after)) if modified_after is not None else None
+        listed = self._conn.execute("select filename, last_modified from read_blob(?)", [files]).fetchall()
+        files = []
+        for filename, last_modified in listed:
+            root = next((r for r in roots if filename.startswith(r + "/")), None)
+            if _is_hidden(filename, root):
+                continue
+            if glob_filter is not None and not fnmatch.fnmatchcase(filename.rsplit("/", 1)[-1], str(glob_filter)):
+                continue
+            if before is not None and last_modified >= before:
+                continue
+            if after is not None and last_modified <= after:
+                continue
+            files.append(filename)
+        if not files:
+            raise AnalysisException(message=f"No data files found in {', '.join(paths)}")
+        return files, reader_options
+
+    def _apply_schema(self, df: "DataFrame", schema: Optional[Union[StructType, str]]) -> "DataFrame":
+        if not schema:
+            return df
+        if not isinstance(schema, StructType):
+            raise ContributionsAcceptedError
+        types, names = schema.extract_types_and_names()
+        df = df._cast_types(*types)
+        return df.toDF(*names)
 
     def load(
         self,
@@ -101,33 +461,27 @@ class DataFrameReader:
     ) -> "DataFrame":
         from duckdb.experimental.spark.sql.dataframe import DataFrame
 
-        if not isinstance(path, str):
-            raise ImportError
-        if options:
-            raise ContributionsAcceptedError
-
-        rel = None
-        if format:
-            format = format.lower()
-            if format == "csv" or format == "tsv":
-                rel = self.session.conn.read_csv(path)
-            elif format == "json":
-                rel = self.session.conn.read_json(path)
-            elif format == "parquet":
-                rel = self.session.conn.read_parquet(path)
-            else:
-                raise ContributionsAcceptedError
-        else:
-            rel = self.session.conn.sql(f"select * from {path}")
-        df = DataFrame(rel, self.session)
-        if schema:
-            if not isinstance(schema, StructType):
-                raise ContributionsAcceptedError
-            schema = cast(StructType, schema)
-            types, names = schema.extract_types_and_names()
-            df = df._cast_types(types)
-            df = df.toDF(names)
-        raise NotImplementedError
+        if format is not None:
+            self.format(format)
+        if schema is not None:
+            self.schema(schema)
+        self.options(**options)
+        if path is None:
+            raise ContributionsAcceptedError("Loading without a path is not supported")
+
+        if self._format is None:
+            if not isinstance(path, str):
+                return self.parquet(*path)
+            self._check_no_options(self._options)
+            rel = self._conn.sql(f"select * from {path}")
+            return self._apply_schema(DataFrame(rel, self.session), self._schema)
+        if self._format == "csv" or self._format == "tsv":
+            return self.csv(path)
+        if self._format == "json":
+            return self.json(path)
+        if self._format == "parquet":
+            return self.parquet(*([path] if isinstance(path, str) else path))
+        raise ContributionsAcceptedError(f"The '{self._format}' format is not supported")
 
     def csv(
         self,
@@ -166,8 +520,8 @@ class DataFrameReader:
         modifiedAfter: Optional[Union[bool, str]] = None,
         unescapedQuoteHandling: Optional[str] = None,
     ) -> "DataFrame":
-        if not isinstance(path, str):
-            raise NotImplementedError
+        if schema is None:
+            schema = self._schema
         if schema and not isinstance(schema, StructType):
             raise ContributionsAcceptedError
         if comment:
@@ -208,29 +562,48 @@ class DataFrameReader:
             raise ContributionsAcceptedError
         if locale:
             raise ContributionsAcceptedError
-        if pathGlobFilter:
-            raise ContributionsAcceptedError
-        if recursiveFileLookup:
-            raise ContributionsAcceptedError
-        if modifiedBefore:
-            raise ContributionsAcceptedError
-        if modifiedAfter:
-            raise ContributionsAcceptedError
         if unescapedQuoteHandling:
             raise ContributionsAcceptedError
         if lineSep:
             # We have support for custom newline, just needs to be ported to 'read_csv'
             raise NotImplementedError
 
+        options = self._merge_options(
+            {
+                "sep": sep,
+                "encoding": encoding,
+                "quote": quote,
+                "escape": escape,
+                "header": header,
+                "nullValue": nullValue,
+                "dateFormat": dateFormat,
+                "timestampFormat": timestampFormat,
+                "pathGlobFilter": pathGlobFilter,
+                "recursiveFileLookup": recursiveFileLookup,
+                "modifiedBefore": modifiedBefore,
+                "modifiedAfter": modifiedAfter,
+            }
+        )
+        files, reader_options = self._file_source(path, options)
+        header = options.pop("header", None)
+        sep = options.pop("sep", "\t" if self._format == "tsv" else None)
+        encoding = options.pop("encoding", None)
+        quote = options.pop("quote", None)
+        escape = options.pop("escape", None)
+        nullValue = options.pop("nullvalue", None)
+        dateFormat = options.pop("dateformat", None)
+        timestampFormat = options.pop("timestampformat", None)
+        self._check_no_options(options)
+
         dtype = None
         names = None
         if schema:
             schema = cast(StructType, schema)
             dtype, names = schema.extract_types_and_names()
 
-        rel = self.session.conn.read_csv(
-            path,
-            header=header if isinstance(header, bool) else header == "True",
+        rel = self._conn.read_csv(
+            files,
+            header=_option_to_bool(header) if header is not None else False,
             sep=sep,
             dtype=dtype,
             na_values=nullValue,
@@ -239,6 +612,7 @@ class DataFrameReader:
             encoding=encoding,
             date_format=dateFormat,
             timestamp_format=timestampFormat,
+            **reader_options,
         )
         from ..sql.dataframe import DataFrame
 
@@ -248,18 +622,24 @@ class DataFrameReader:
         return df
 
     def parquet(self, *paths: str, **options: "OptionalPrimitiveType") -> "DataFrame":
-        input = list(paths)
-        if len(input) != 1:
-            raise NotImplementedError("Only single paths are supported for now")
-        option_amount = len(options.keys())
-        if option_amount != 0:
-            raise ContributionsAcceptedError("Options are not supported")
-        path = input[0]
-        rel = self.session.conn.read_parquet(path)
+        """
+        Loads Parquet files, returning the result as a :class:`DataFrame`.
+
+        The paths can be files, directories or globs. With the 'mergeSchema' option the schemas of all files
+        are merged by the names of their columns, otherwise the files have to share the same schema.
+        """
+        options = self._merge_options(options)
+        merge_schema = options.pop("mergeschema", None)
+        files, reader_options = self._file_source(list(paths), options)
+        self._check_no_options(options)
+        if merge_schema is not None:
+            reader_options["union_by_name"] = _option_to_bool(merge_schema)
+
+        rel = self._conn.read_parquet(files, **reader_options)
         from ..sql.dataframe import DataFrame
 
         df = DataFrame(rel, self.session)
-        return df
+        return self._apply_schema(df, self._schema)
 
     def json(
         self,
@@ -341,8 +721,10 @@ class DataFrameReader:
         +---+------------+
         """
 
-        if schema is not None:
-            raise ContributionsAcceptedError("The 'schema' option is not supported")
+        if schema is None:
+            schema = self._schema
+        if schema and not isinstance(schema, StructType):
+            raise ContributionsAcceptedError("Only a StructType is supported as the 'schema' of a JSON source")
         if primitivesAsString is not None:
             raise ContributionsAcceptedError(
                 "The 'primitivesAsString' option is not supported"
@@ -403,47 +785,30 @@ class DataFrameReader:
             raise ContributionsAcceptedError("The 'encoding' option is not supported")
         if locale is not None:
             raise ContributionsAcceptedError("The 'locale' option is not supported")
-        if pathGlobFilter is not None:
-            raise ContributionsAcceptedError(
-                "The 'pathGlobFilter' option is not supported"
-            )
-        if recursiveFileLookup is not None:
-            raise ContributionsAcceptedError(
-                "The 'recursiveFileLookup' option is not supported"
-            )
-        if modifiedBefore is not None:
-            raise ContributionsAcceptedError(
-                "The 'modifiedBefore' option is not supported"
-            )
-        if modifiedAfter is not None:
-            raise ContributionsAcceptedError(
-                "The 'modifiedAfter' option is not supported"
-            )
         if allowNonNumericNumbers is not None:
             raise ContributionsAcceptedError(
                 "The 'allowNonNumericNumbers' option is not supported"
             )
 
-        if isinstance(path, str):
-            path = [path]
-        if  isinstance(path, list):
-            if len(path) == 1:
-                rel = self.session.conn.read_json(path[0])
-                from .dataframe import DataFrame
-
-                df = DataFrame(rel, self.session)
-                return df
-            raise PySparkNotImplementedError(
-                message="Only a single path is supported for now"
-            )
-        else:
-            raise PySparkTypeError(
-                error_class="NOT_STR_OR_LIST_OF_RDD",
-                message_parameters={
-                    "arg_name": "path",
-                    "arg_type": type(path).__name__,
-                },
-            )
+        options = self._merge_options(
+            {
+                "pathGlobFilter": pathGlobFilter,
+                "recursiveFileLookup": recursiveFileLookup,
+                "modifiedBefore": modifiedBefore,
+                "modifiedAfter": modifiedAfter,
+            }
+        )
+        files, reader_options = self._file_source(path, options)
+        self._check_no_options(options)
+        if schema:
+            # the fields of the schema are read with their types, the ones that are missing in a record are NULL
+            types, names = cast(StructType, schema).extract_types_and_names()
+            reader_options["columns"] = dict(zip(names, types))
+        rel = self._conn.read_json(files, **reader_options)
+        from .dataframe import DataFrame
+
+        df = DataFrame(rel, self.session)
+        return df
 
 
 __all__ = ["DataFrameWriter", "DataFrameReader"]
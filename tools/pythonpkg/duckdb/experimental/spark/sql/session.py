@@ -1,15 +1,37 @@
-from typing import Optional, List, Any, Union, Iterable, TYPE_CHECKING
-import uuid
+from typing import Optional, List, Any, Union, Iterable, Dict, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .catalog import Catalog
     from pandas.core.frame import DataFrame as PandasDataFrame
+    from .streaming import StreamingQuery, _FileStreamSource
 
 from ..exception import ContributionsAcceptedError
-from .types import StructType, AtomicType, DataType
+from .types import (
+    StructType,
+    AtomicType,
+    DataType,
+    BooleanType,
+    ByteType,
+    ShortType,
+    IntegerType,
+    LongType,
+    FloatType,
+    DoubleType,
+    StringType,
+    BinaryType,
+    DateType,
+    DecimalType,
+    TimestampType,
+    TimestampNTZType,
+    TimestampSecondNTZType,
+    TimestampMilisecondNTZType,
+    TimestampNanosecondNTZType,
+    TimeNTZType,
+)
 from ..conf import SparkConf
 from .dataframe import DataFrame
 from .conf import RuntimeConfig
+from .cache_manager import CacheManager
 from .readwriter import DataFrameReader
 from ..context import SparkContext
 from .udf import UDFRegistration
@@ -44,22 +66,152 @@ def _combine_data_and_schema(data: Iterable[Any], schema: StructType):
     return new_data
 
 
+# The nullable pandas dtypes that DuckDB scans without analyzing the values, NULLs are stored in their mask
+_SCHEMA_DTYPES = {
+    BooleanType: 'boolean',
+    ByteType: 'Int8',
+    ShortType: 'Int16',
+    IntegerType: 'Int32',
+    LongType: 'Int64',
+    FloatType: 'Float32',
+    DoubleType: 'Float64',
+    StringType: 'string',
+}
+
+# The Arrow types of the schema types that pandas has no nullable dtype for, their columns are scanned as Arrow arrays
+_SCHEMA_ARROW_TYPES = {
+    BinaryType: lambda pa, data_type: pa.binary(),
+    DateType: lambda pa, data_type: pa.date32(),
+    DecimalType: lambda pa, data_type: pa.decimal128(data_type.precision, data_type.scale),
+    TimestampType: lambda pa, data_type: pa.timestamp('us', tz='UTC'),
+    TimestampNTZType: lambda pa, data_type: pa.timestamp('us'),
+    TimestampSecondNTZType: lambda pa, data_type: pa.timestamp('s'),
+    TimestampMilisecondNTZType: lambda pa, data_type: pa.timestamp('ms'),
+    TimestampNanosecondNTZType: lambda pa, data_type: pa.timestamp('ns'),
+    TimeNTZType: lambda pa, data_type: pa.time64('us'),
+}
+
+_INFERRED_DTYPES = {
+    frozenset([bool]): 'boolean',
+    frozenset([int]): 'Int64',
+    frozenset([float]): 'Float64',
+    frozenset([int, float]): 'Float64',
+    frozenset([str]): 'string',
+}
+
+
+def _rows_to_columns(data: List[Any], schema: Optional[StructType] = None) -> Optional["PandasDataFrame"]:
+    """
+    Transpose the rows into a pandas DataFrame with one typed column per field, which DuckDB scans column by column.
+    The types of the fields of an atomic 'schema' are used, otherwise the type of a column is inferred from all of its
+    values. Columns of a schema type that pandas has no dtype for, like decimals and timestamps, are stored as Arrow
+    arrays of that type. Columns of other types are stored as object arrays, which DuckDB types by analyzing a sample
+    of them, so they are only used when all of their values have the same type and none of them is NULL.
+    Returns None when pandas is not available or the values can not be scanned as-is.
+    """
+    try:
+        import numpy
+        import pandas
+    except ImportError:
+        return None
+    if not data or not len(data[0]):
+        return None
+
+    def to_object_array(column: Tuple[Any, ...]):
+        try:
+            # the values are stored as-is, sequences are not turned into extra dimensions
+            return numpy.fromiter(column, dtype=object, count=len(column))
+        except ValueError:
+            # object arrays can not be created from an iterator before NumPy 1.23
+            array = numpy.empty(len(column), dtype=object)
+            for i, value in enumerate(column):
+                array[i] = value
+            return array
+
+    def to_arrow_array(column: Tuple[Any, ...], data_type: DataType):
+        to_arrow_type = _SCHEMA_ARROW_TYPES.get(type(data_type))
+        if to_arrow_type is None:
+            return None
+        try:
+            import pyarrow
+
+            array_type = pandas.arrays.ArrowExtensionArray
+        except (ImportError, AttributeError):
+            # Arrow backed pandas arrays were added in pandas 1.5
+            return None
+        try:
+            return array_type(pyarrow.array(column, type=to_arrow_type(pyarrow, data_type)))
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    def to_array(column: Tuple[Any, ...], data_type: Optional[DataType]):
+        if data_type is not None:
+            array = to_arrow_array(column, data_type)
+            if array is not None:
+                return array
+        value_types = set()
+        has_null = False
+        for value in column:
+            if value is None:
+                has_null = True
+            elif isinstance(value, float) and value != value:
+                # NaN would be scanned as NULL, like it is in a pandas DataFrame
+                return None
+            else:
+                value_types.add(type(value))
+        dtype = _SCHEMA_DTYPES.get(type(data_type)) if data_type is not None else None
+        if dtype is None:
+            dtype = _INFERRED_DTYPES.get(frozenset(value_types))
+        if dtype is None:
+            if has_null or len(value_types) > 1:
+                # only a sample of the column is analyzed, which could miss some of the types
+                return None
+            return to_object_array(column)
+        try:
+            return pandas.array(column, dtype=dtype)
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    data_types = None
+    if schema is not None and len(schema.fields) == len(data[0]):
+        data_types = [field.dataType for field in schema]
+    columns = {}
+    for i, column in enumerate(zip(*data)):
+        array = to_array(column, data_types[i] if data_types is not None else None)
+        if array is None:
+            return None
+        columns[f'col{i}'] = array
+    return pandas.DataFrame(columns, copy=False)
+
+
+def _is_atomic_schema(schema: StructType) -> bool:
+    return all(isinstance(field.dataType, AtomicType) for field in schema)
+
+
 class SparkSession:
     def __init__(self, context: SparkContext):
         self.conn = context.connection
         self._context = context
         self._conf = RuntimeConfig(self.conn)
+        self._cache_manager = CacheManager(self)
+        # the views of the streaming sources, and the streaming queries that were started in this session
+        self._streaming_sources: Dict[str, "_FileStreamSource"] = {}
+        self._streaming_queries: List["StreamingQuery"] = []
 
-    def _create_dataframe(self, data: Union[Iterable[Any], "PandasDataFrame"]) -> DataFrame:
+    def _create_dataframe(
+        self,
+        data: Union[Iterable[Any], "PandasDataFrame"],
+        columnar: bool = True,
+        schema: Optional[StructType] = None,
+    ) -> DataFrame:
         try:
             import pandas
             has_pandas = True
         except ImportError:
             has_pandas = False
         if has_pandas and isinstance(data, pandas.DataFrame):
-            unique_name = f'pyspark_pandas_df_{uuid.uuid1()}'
-            self.conn.register(unique_name, data)
-            return DataFrame(self.conn.sql(f'select * from "{unique_name}"'), self)
+            # the relation holds on to the DataFrame, nothing is registered on the connection
+            return DataFrame(self.conn.from_df(data), self)
 
         def verify_tuple_integrity(tuples):
             if len(tuples) <= 1:
@@ -83,6 +235,10 @@ class SparkSession:
             data = list(data)
         verify_tuple_integrity(data)
 
+        columns = _rows_to_columns(data, schema) if columnar else None
+        if columns is not None:
+            return DataFrame(self.conn.from_df(columns), self)
+
         def construct_query(tuples) -> str:
             def construct_values_list(row, start_param_idx):
                 parameter_count = len(row)
@@ -167,11 +323,19 @@ class SparkSession:
             is_empty = True
             data = [tuple(None for _ in names)]
 
+        # the single row of NULLs of an empty DataFrame is not worth scanning column by column
+        columnar = not is_empty
+        atomic_schema = None
         if schema and isinstance(schema, StructType):
-            # Transform the data into Values to combine the data+schema
-            data = _combine_data_and_schema(data, schema)
+            if _is_atomic_schema(schema):
+                # atomic values are scanned with the types of the schema where possible, and cast to it afterwards
+                atomic_schema = schema
+            else:
+                # Nested values are converted with the schema
+                data = _combine_data_and_schema(data, schema)
+                columnar = False
 
-        df = self._create_dataframe(data)
+        df = self._create_dataframe(data, columnar, atomic_schema)
         if is_empty:
             rel = df.relation
             # Add impossible where clause
@@ -212,6 +376,11 @@ class SparkSession:
         return DataFrame(relation, self)
 
     def stop(self) -> None:
+        for query in self._streaming_queries:
+            query.stop()
+        for source in list(self._streaming_sources.values()):
+            source.close()
+        self._cache_manager.close()
         self._context.stop()
 
     def table(self, tableName: str) -> DataFrame:
@@ -1,4 +1,16 @@
-from typing import TYPE_CHECKING, Optional, Union
+import fnmatch
+import json
+import os
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union, cast
+
+import duckdb
+
+from ..errors import AnalysisException, PySparkValueError, StreamingQueryException
+from ..exception import ContributionsAcceptedError
+from .readwriter import DataFrameReader, _is_directory, _is_hidden
 from .types import StructType
 
 if TYPE_CHECKING:
@@ -8,30 +20,732 @@ if TYPE_CHECKING:
 PrimitiveType = Union[bool, float, int, str]
 OptionalPrimitiveType = Optional[PrimitiveType]
 
+_SOURCE_FORMATS = ("parquet", "csv", "json")
+
+# The time to wait before a query that uses the default trigger looks for new files again, when it found none
+_IDLE_INTERVAL = 0.1
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _parse_interval(interval: str) -> float:
+    """
+    Parse a processing time interval such as '5 seconds' or '1 minute' into seconds
+    """
+    units = {"millisecond": 0.001, "second": 1, "minute": 60, "hour": 3600, "day": 86400}
+    parts = interval.strip().lower().split()
+    seconds = None
+    try:
+        if len(parts) == 1:
+            seconds = float(parts[0]) / 1000
+        elif len(parts) == 2 and parts[1].rstrip("s") in units:
+            seconds = float(parts[0]) * units[parts[1].rstrip("s")]
+    except ValueError:
+        pass
+    if seconds is None:
+        raise PySparkValueError(message=f"Invalid processing time interval: '{interval}'")
+    if seconds < 0:
+        raise PySparkValueError(
+            error_class="VALUE_NOT_POSITIVE",
+            message_parameters={"arg_name": "processingTime", "arg_value": interval},
+        )
+    return seconds
+
+
+def _has_aggregate(connection: duckdb.DuckDBPyConnection, query: str, views: Set[str]) -> bool:
+    """
+    Whether a SELECT of the parsed query that reads one of the streaming source views groups its rows:
+    it has a GROUP BY, a DISTINCT or calls an aggregate function.
+    The SELECTs that only read static tables, such as scalar subqueries, may aggregate.
+    """
+    serialized = json.loads(connection.execute("select json_serialize_sql(?)", [query]).fetchone()[0])
+    if serialized.get("error"):
+        raise AnalysisException(
+            message=f"The plan of the streaming query can not be analyzed: {serialized.get('error_message')}"
+        )
+    aggregates = {
+        name
+        for (name,) in connection.execute(
+            "select distinct function_name from duckdb_functions() where function_type = 'aggregate'"
+        ).fetchall()
+    }
+
+    select_nodes: List[Dict[str, Any]] = []
+    ctes: List[Dict[str, Any]] = []
+
+    def collect(node: Any) -> None:
+        if isinstance(node, list):
+            for child in node:
+                collect(child)
+            return
+        if not isinstance(node, dict):
+            return
+        if node.get("type") == "SELECT_NODE":
+            select_nodes.append(node)
+        if isinstance(node.get("cte_map"), dict):
+            ctes.extend(node["cte_map"].get("map", []))
+        for child in node.values():
+            collect(child)
+
+    streams = set(views)
+
+    def reads_stream(node: Any) -> bool:
+        if isinstance(node, list):
+            return any(reads_stream(child) for child in node)
+        if not isinstance(node, dict):
+            return False
+        if node.get("type") == "BASE_TABLE" and node.get("table_name") in streams:
+            return True
+        return any(reads_stream(child) for child in node.values())
+
+    def calls_aggregate(expression: Any) -> bool:
+        if isinstance(expression, list):
+            return any(calls_aggregate(child) for child in expression)
+        if not isinstance(expression, dict):
+            return False
+        if expression.get("class") in ("SUBQUERY", "WINDOW"):
+            # a subquery is a SELECT of its own, a window function does not group the rows
+            return False
+        if expression.get("class") == "FUNCTION" and expression.get("function_name") in aggregates:
+            return True
+        return any(calls_aggregate(child) for child in expression.values())
+
+    collect(serialized)
+    # the common table expressions that read a streaming source are streaming sources as well
+    changed = True
+    while changed:
+        changed = False
+        for cte in ctes:
+            if cte.get("key") not in streams and reads_stream(cte.get("value")):
+                streams.add(cte["key"])
+                changed = True
+
+    for node in select_nodes:
+        if not reads_stream(node.get("from_table")):
+            continue
+        if node.get("group_expressions"):
+            return True
+        if any(modifier.get("type") == "DISTINCT_MODIFIER" for modifier in node.get("modifiers", [])):
+            return True
+        if calls_aggregate(node.get("select_list")) or calls_aggregate(node.get("having")):
+            return True
+    return False
+
+
+def _write_json(path: str, content: Dict[str, Any]) -> None:
+    # write a temporary file first, so the log never contains a partially written file
+    tmp = os.path.join(os.path.dirname(path), "." + os.path.basename(path) + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(content, f)
+    os.replace(tmp, path)
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+class _FileStreamSource:
+    """
+    A streaming source that reads the files of a directory (or glob) that have not been processed yet.
+
+    The streaming DataFrame reads from a temporary view, which points to the files of the current micro batch
+    while it is processed, and to an empty relation with the schema of the source otherwise.
+    The micro batches that run in the background create the view on their own connection.
+    """
+
+    def __init__(
+        self,
+        session: "SparkSession",
+        path: str,
+        format: str,
+        schema: Optional[StructType],
+        options: Dict[str, "OptionalPrimitiveType"],
+    ):
+        self._session = session
+        self._path = path
+        self._format = format
+        self._options = dict(options)
+        max_files = self._options.pop("maxfilespertrigger", None)
+        self.max_files_per_trigger = int(max_files) if max_files is not None else None
+        self._glob_filter = self._options.pop("pathglobfilter", None)
+        if _is_directory(path) and "basepath" not in self._options:
+            # discover the partition columns of the files in the directory
+            self._options["basepath"] = path
+        self.view = f"spark_stream_source_{uuid.uuid4().hex}"
+
+        if schema is None:
+            files = self.list_files(self._conn)
+            if not files:
+                raise AnalysisException(
+                    message="Schema must be specified when creating a streaming source DataFrame. "
+                    "If some files already exist in the directory, then depending on the file format you may be "
+                    "able to create a static DataFrame on that directory with 'spark.read.load(directory)' "
+                    "and infer schema from it."
+                )
+            schema = self._read(self._conn, files).schema
+        self.schema = cast(StructType, schema)
+        self.point_to(self._conn, [])
+
+    @property
+    def _conn(self) -> duckdb.DuckDBPyConnection:
+        return self._session.conn
+
+    def list_files(self, connection: duckdb.DuckDBPyConnection) -> List[str]:
+        """
+        List the files of the source with the connection, ordered by their modification time
+        """
+        pattern = self._path.rstrip("/") + "/**/*" if _is_directory(self._path) else self._path
+        listed = connection.execute(
+            "select filename from read_blob(?) order by last_modified, filename", [pattern]
+        ).fetchall()
+        files = []
+        for (filename,) in listed:
+            if _is_hidden(filename, self._path if _is_directory(self._path) else None):
+                continue
+            if self._glob_filter is not None:
+                if not fnmatch.fnmatchcase(filename.rsplit("/", 1)[-1], str(self._glob_filter)):
+                    continue
+            files.append(filename)
+        return files
+
+    def new_files(self, connection: duckdb.DuckDBPyConnection, processed: Set[str], limit: bool = True) -> List[str]:
+        files = [f for f in self.list_files(connection) if f not in processed]
+        if limit and self.max_files_per_trigger is not None:
+            files = files[: self.max_files_per_trigger]
+        return files
+
+    def _read(
+        self, connection: duckdb.DuckDBPyConnection, files: List[str], schema: Optional[StructType] = None
+    ) -> "DataFrame":
+        reader = DataFrameReader(self._session, connection).options(**self._options)
+        if self._format == "csv" and schema is not None:
+            # without a header the columns of a csv file are matched to the schema by position
+            reader.schema(schema)
+        return reader.load(files, format=self._format)
+
+    def point_to(self, connection: duckdb.DuckDBPyConnection, files: List[str]) -> None:
+        """
+        Point the temporary view of the source on the connection to the given files
+        """
+        types, names = self.schema.extract_types_and_names()
+        columns = [f"CAST({_quote_identifier(n)} AS {t}) AS {_quote_identifier(n)}" for t, n in zip(types, names)]
+        if files:
+            relation = self._read(connection, files, self.schema).relation.project(", ".join(columns))
+        else:
+            empty = [f"CAST(NULL AS {t}) AS {_quote_identifier(n)}" for t, n in zip(types, names)]
+            relation = connection.sql(f"select {', '.join(empty)} where false")
+        # the relation is bound on the connection, the temporary view is only visible to it
+        relation.create_view(self.view, replace=True, temporary=True)
+
+    def close(self) -> None:
+        """
+        Drop the view of the source, the streaming DataFrames that read it can no longer be used afterwards
+        """
+        self._session._streaming_sources.pop(self.view, None)
+        self._conn.execute(f"DROP VIEW IF EXISTS temp.main.{_quote_identifier(self.view)}")
+
+
+class _Checkpoint:
+    """
+    The checkpoint of a streaming query, in the layout that Spark uses:
+
+    * `metadata`: the id of the query.
+    * `offsets/<batch id>`: the files of a micro batch, written before the batch is processed.
+    * `commits/<batch id>`: written once the output of the micro batch is committed to the sink.
+
+    A batch that has offsets but no commit was interrupted, it is processed again with the same files on restart.
+    """
+
+    def __init__(self, location: str):
+        self._offsets = os.path.join(location, "offsets")
+        self._commits = os.path.join(location, "commits")
+        os.makedirs(self._offsets, exist_ok=True)
+        os.makedirs(self._commits, exist_ok=True)
+        metadata = os.path.join(location, "metadata")
+        if not os.path.exists(metadata):
+            _write_json(metadata, {"id": str(uuid.uuid4())})
+        self.id = _read_json(metadata)["id"]
+
+    @staticmethod
+    def _batch_ids(directory: str) -> List[int]:
+        return sorted(int(name) for name in os.listdir(directory) if name.isdigit())
+
+    def processed_files(self) -> Set[str]:
+        files: Set[str] = set()
+        for batch_id in self._batch_ids(self._offsets):
+            files.update(_read_json(os.path.join(self._offsets, str(batch_id)))["files"])
+        return files
+
+    def uncommitted_batch(self) -> Optional[Tuple[int, List[str]]]:
+        batch_ids = self._batch_ids(self._offsets)
+        if not batch_ids or os.path.exists(os.path.join(self._commits, str(batch_ids[-1]))):
+            return None
+        batch_id = batch_ids[-1]
+        return batch_id, _read_json(os.path.join(self._offsets, str(batch_id)))["files"]
+
+    def add_batch(self, files: List[str]) -> int:
+        batch_ids = self._batch_ids(self._offsets)
+        batch_id = batch_ids[-1] + 1 if batch_ids else 0
+        _write_json(os.path.join(self._offsets, str(batch_id)), {"batchId": batch_id, "files": files})
+        return batch_id
+
+    def commit(self, batch_id: int) -> None:
+        _write_json(os.path.join(self._commits, str(batch_id)), {"batchId": batch_id})
+
+
+class _TableSink:
+    """
+    Appends the micro batches to a DuckDB table.
+
+    The rows of a batch are inserted in the same transaction that records the batch as committed in a
+    bookkeeping table next to the table, so a batch that is processed again after a failure is not added twice.
+    """
+
+    def __init__(self, table_name: str):
+        self._table_name = table_name
+        prefix = table_name.rsplit(".", 1)[0] + "." if "." in table_name else ""
+        self._commits = prefix + "__spark_streaming_commits"
+        self._view = f"spark_stream_batch_{uuid.uuid4().hex}"
+
+    def add_batch(
+        self, conn: duckdb.DuckDBPyConnection, query_id: str, batch_id: int, relation: duckdb.DuckDBPyRelation
+    ) -> None:
+        # the relation belongs to the connection, the temporary view is only visible to it
+        relation.create_view(self._view, replace=True, temporary=True)
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {self._commits} (query_id VARCHAR, batch_id BIGINT)")
+            committed = conn.execute(
+                f"select count(*) from {self._commits} where query_id = ? and batch_id = ?", [query_id, batch_id]
+            ).fetchone()[0]
+            if not committed:
+                conn.execute(f"CREATE TABLE IF NOT EXISTS {self._table_name} AS SELECT * FROM {self._view} LIMIT 0")
+                conn.execute(f"INSERT INTO {self._table_name} SELECT * FROM {self._view}")
+                conn.execute(f"INSERT INTO {self._commits} VALUES (?, ?)", [query_id, batch_id])
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.execute(f"DROP VIEW IF EXISTS temp.main.{self._view}")
+
+
+class _ParquetSink:
+    """
+    Writes every micro batch to its own Parquet file in a directory.
+
+    The file of a batch is named after the batch id and is renamed into place once it is written completely,
+    so a batch that is processed again after a failure replaces its own output.
+    """
+
+    def __init__(self, path: str, compression: Optional[str]):
+        if "://" in path:
+            raise ContributionsAcceptedError("Streaming into a remote path is not supported")
+        self._path = path
+        self._compression = compression
+
+    def add_batch(
+        self, conn: duckdb.DuckDBPyConnection, query_id: str, batch_id: int, relation: duckdb.DuckDBPyRelation
+    ) -> None:
+        os.makedirs(self._path, exist_ok=True)
+        name = f"part-{batch_id:05d}-{query_id}.parquet"
+        tmp = os.path.join(self._path, f".{name}.tmp")
+        relation.write_parquet(tmp, compression=self._compression)
+        os.replace(tmp, os.path.join(self._path, name))
+
+
+class StreamingQuery:
+    """
+    A query that processes the new files of its source in micro batches, and appends the result of every
+    batch to its sink.
+
+    With the `once` and `availableNow` triggers the available files are processed before :meth:`start` returns.
+    Otherwise the micro batches run in a background thread, on a cursor of the connection of the session.
+    """
+
+    def __init__(
+        self,
+        dataframe: "DataFrame",
+        source: _FileStreamSource,
+        sink: Union[_TableSink, _ParquetSink],
+        checkpoint: _Checkpoint,
+        name: Optional[str],
+    ):
+        self._dataframe = dataframe
+        self._source = source
+        self._sink = sink
+        self._checkpoint = checkpoint
+        self._name = name
+        self._run_id = str(uuid.uuid4())
+        # held while a micro batch is processed
+        self._lock = threading.RLock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._exception: Optional[StreamingQueryException] = None
+        self._progress: List[Dict[str, Any]] = []
+
+    @property
+    def id(self) -> str:
+        return self._checkpoint.id
+
+    @property
+    def runId(self) -> str:
+        return self._run_id
+
+    @property
+    def name(self) -> Optional[str]:
+        return self._name
+
+    @property
+    def isActive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def lastProgress(self) -> Optional[Dict[str, Any]]:
+        return self._progress[-1] if self._progress else None
+
+    @property
+    def recentProgress(self) -> List[Dict[str, Any]]:
+        return list(self._progress)
+
+    def exception(self) -> Optional[StreamingQueryException]:
+        return self._exception
+
+    def _run_batch(
+        self, connection: duckdb.DuckDBPyConnection, relation: duckdb.DuckDBPyRelation, limit: bool = True
+    ) -> bool:
+        """
+        Process the next micro batch on the connection, the relation is the plan of the query on that connection.
+        Returns False when there were no new files.
+        """
+        with self._lock:
+            pending = self._checkpoint.uncommitted_batch()
+            if pending is not None:
+                batch_id, files = pending
+            else:
+                files = self._source.new_files(connection, self._checkpoint.processed_files(), limit)
+                if not files:
+                    return False
+                batch_id = self._checkpoint.add_batch(files)
+            start = time.time()
+            self._source.point_to(connection, files)
+            try:
+                self._sink.add_batch(connection, self.id, batch_id, relation)
+            finally:
+                self._source.point_to(connection, [])
+            self._checkpoint.commit(batch_id)
+            self._progress.append(
+                {
+                    "id": self.id,
+                    "runId": self._run_id,
+                    "name": self._name,
+                    "batchId": batch_id,
+                    "numInputFiles": len(files),
+                    "durationMs": int((time.time() - start) * 1000),
+                }
+            )
+            return True
+
+    def _run_available(self, limit: bool = True) -> None:
+        conn = self._dataframe.session.conn
+        while not self._stopped.is_set() and self._run_batch(conn, self._dataframe.relation, limit):
+            pass
+
+    def _run(self, interval: float) -> None:
+        cursor = self._dataframe.session.conn.cursor()
+        try:
+            self._source.point_to(cursor, [])
+            relation = cursor.sql(self._dataframe.relation.sql_query())
+            while not self._stopped.is_set():
+                start = time.time()
+                processed = self._run_batch(cursor, relation)
+                wait = interval - (time.time() - start)
+                if not processed:
+                    wait = max(wait, _IDLE_INTERVAL)
+                if wait > 0:
+                    self._stopped.wait(wait)
+        except Exception as e:
+            self._exception = StreamingQueryException(message=str(e))
+            self._exception.__cause__ = e
+        finally:
+            cursor.close()
+
+    def _start(self, trigger: Dict[str, Any]) -> None:
+        if trigger.get("once"):
+            # a single batch of all new files
+            self._run_batch(self._dataframe.session.conn, self._dataframe.relation, limit=False)
+            return
+        if trigger.get("availableNow"):
+            self._run_available()
+            return
+        self._thread = threading.Thread(
+            target=self._run, args=(trigger.get("processingTime", 0.0),), name=self._name or self._run_id, daemon=True
+        )
+        self._thread.start()
+
+    def awaitTermination(self, timeout: Optional[int] = None) -> Optional[bool]:
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self._exception is not None:
+            raise self._exception
+        if timeout is not None:
+            return not self.isActive
+        return None
+
+    def processAllAvailable(self) -> None:
+        """
+        Block until all the files that are available in the source are processed and committed to the sink
+        """
+        if self._exception is not None:
+            raise self._exception
+        self._run_available()
+
+    def stop(self) -> None:
+        """
+        Stop the query, the streaming DataFrame can start a new query from the same checkpoint afterwards
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
 
 class DataStreamWriter:
     def __init__(self, dataframe: "DataFrame"):
         self.dataframe = dataframe
+        self._format: Optional[str] = None
+        self._output_mode = "append"
+        self._partition_by: Optional[List[str]] = None
+        self._query_name: Optional[str] = None
+        self._trigger: Dict[str, Any] = {}
+        # options are case-insensitive, like in Spark
+        self._options: Dict[str, OptionalPrimitiveType] = {}
+
+    def outputMode(self, outputMode: str) -> "DataStreamWriter":
+        """
+        Only the `append` output mode is supported, the result of every micro batch is appended to the sink.
+        """
+        if outputMode.lower() != "append":
+            raise ContributionsAcceptedError(f"The '{outputMode}' output mode is not supported")
+        self._output_mode = outputMode.lower()
+        return self
+
+    def format(self, source: str) -> "DataStreamWriter":
+        self._format = source.lower()
+        return self
+
+    def option(self, key: str, value: "OptionalPrimitiveType") -> "DataStreamWriter":
+        self._options[key.lower()] = value
+        return self
+
+    def options(self, **options: "OptionalPrimitiveType") -> "DataStreamWriter":
+        for key, value in options.items():
+            self.option(key, value)
+        return self
 
-    def toTable(self, table_name: str) -> None:
-        # Should we register the dataframe or create a table from the contents?
-        raise NotImplementedError
+    def partitionBy(self, *cols: Union[str, List[str]]) -> "DataStreamWriter":
+        if len(cols) == 1 and isinstance(cols[0], (list, tuple)):
+            cols = cols[0]
+        self._partition_by = [cast(str, col) for col in cols]
+        return self
+
+    def queryName(self, queryName: str) -> "DataStreamWriter":
+        self._query_name = queryName
+        return self
+
+    def trigger(
+        self,
+        *,
+        processingTime: Optional[str] = None,
+        once: Optional[bool] = None,
+        continuous: Optional[str] = None,
+        availableNow: Optional[bool] = None,
+    ) -> "DataStreamWriter":
+        if continuous is not None:
+            raise ContributionsAcceptedError("Continuous triggers are not supported")
+        set_triggers = [arg for arg in (processingTime, once, availableNow) if arg is not None]
+        if len(set_triggers) != 1:
+            raise PySparkValueError(
+                error_class="ONLY_ALLOW_SINGLE_TRIGGER",
+                message_parameters={},
+            )
+        if processingTime is not None:
+            self._trigger = {"processingTime": _parse_interval(processingTime)}
+        elif once:
+            self._trigger = {"once": True}
+        elif availableNow:
+            self._trigger = {"availableNow": True}
+        return self
+
+    def _apply(
+        self,
+        format: Optional[str],
+        outputMode: Optional[str],
+        partitionBy: Union[str, List[str], None],
+        queryName: Optional[str],
+        options: Dict[str, "OptionalPrimitiveType"],
+    ) -> None:
+        if format is not None:
+            self.format(format)
+        if outputMode is not None:
+            self.outputMode(outputMode)
+        if partitionBy is not None:
+            self.partitionBy(partitionBy)
+        if queryName is not None:
+            self.queryName(queryName)
+        self.options(**options)
+        if self._partition_by:
+            raise ContributionsAcceptedError("Partitioning the output of a streaming query is not supported")
+
+    def _source(self) -> _FileStreamSource:
+        sources = self.dataframe._streaming_sources()
+        if not sources:
+            raise AnalysisException(message="'writeStream' can be called only on streaming Dataset/DataFrame")
+        if len(sources) > 1:
+            raise ContributionsAcceptedError("Streaming queries with more than one streaming source are not supported")
+        return sources[0]
+
+    def _start(
+        self, sink: Union[_TableSink, _ParquetSink], options: Dict[str, "OptionalPrimitiveType"]
+    ) -> StreamingQuery:
+        source = self._source()
+        session = self.dataframe.session
+        if _has_aggregate(session.conn, self.dataframe.relation.sql_query(), {source.view}):
+            raise AnalysisException(
+                message="Append output mode not supported when there are streaming aggregations on streaming "
+                "DataFrames/DataSets without watermark"
+            )
+        location = options.pop("checkpointlocation", None)
+        if location is None:
+            raise AnalysisException(
+                message="checkpointLocation must be specified either through option(\"checkpointLocation\", ...)"
+            )
+        for key in options:
+            raise ContributionsAcceptedError(f"The '{key}' option is not supported")
+        query = StreamingQuery(self.dataframe, source, sink, _Checkpoint(str(location)), self._query_name)
+        session._streaming_queries.append(query)
+        query._start(self._trigger)
+        return query
+
+    def start(
+        self,
+        path: Optional[str] = None,
+        format: Optional[str] = None,
+        outputMode: Optional[str] = None,
+        partitionBy: Union[str, List[str], None] = None,
+        queryName: Optional[str] = None,
+        **options: "OptionalPrimitiveType",
+    ) -> StreamingQuery:
+        """
+        Start a streaming query that appends the micro batches as Parquet files to the directory at `path`.
+        """
+        self._apply(format, outputMode, partitionBy, queryName, options)
+        if path is None:
+            path = cast(Optional[str], self._options.get("path"))
+        if path is None:
+            raise ContributionsAcceptedError("Streaming into a sink without a path is not supported")
+        if (self._format or "parquet") != "parquet":
+            raise ContributionsAcceptedError(f"The '{self._format}' sink is not supported")
+        options = dict(self._options)
+        options.pop("path", None)
+        compression = cast(Optional[str], options.pop("compression", None))
+        return self._start(_ParquetSink(path, compression), options)
+
+    def toTable(
+        self,
+        tableName: str,
+        format: Optional[str] = None,
+        outputMode: Optional[str] = None,
+        partitionBy: Union[str, List[str], None] = None,
+        queryName: Optional[str] = None,
+        **options: "OptionalPrimitiveType",
+    ) -> StreamingQuery:
+        """
+        Start a streaming query that appends the micro batches to the DuckDB table `tableName`,
+        the table is created from the schema of the first batch when it does not exist.
+        """
+        self._apply(format, outputMode, partitionBy, queryName, options)
+        if self._format is not None and self._format != "duckdb":
+            raise ContributionsAcceptedError(f"The '{self._format}' table format is not supported")
+        return self._start(_TableSink(tableName), dict(self._options))
 
 
 class DataStreamReader:
     def __init__(self, session: "SparkSession"):
         self.session = session
+        self._format: Optional[str] = None
+        self._schema: Optional[StructType] = None
+        # options are case-insensitive, like in Spark
+        self._options: Dict[str, OptionalPrimitiveType] = {}
+
+    def format(self, source: str) -> "DataStreamReader":
+        self._format = source.lower()
+        return self
+
+    def schema(self, schema: Union[StructType, str]) -> "DataStreamReader":
+        if not isinstance(schema, StructType):
+            raise ContributionsAcceptedError("Only a StructType schema is supported")
+        self._schema = schema
+        return self
+
+    def option(self, key: str, value: "OptionalPrimitiveType") -> "DataStreamReader":
+        self._options[key.lower()] = value
+        return self
+
+    def options(self, **options: "OptionalPrimitiveType") -> "DataStreamReader":
+        for key, value in options.items():
+            self.option(key, value)
+        return self
 
     def load(
         self,
         path: Optional[str] = None,
         format: Optional[str] = None,
         schema: Union[StructType, str, None] = None,
-        **options: OptionalPrimitiveType
+        **options: OptionalPrimitiveType,
     ) -> "DataFrame":
+        """
+        Create a streaming DataFrame over the files of a directory, new files are picked up by the micro
+        batches of the streaming query that is started with :attr:`DataFrame.writeStream`.
+
+        The schema is inferred from the existing files when it is not specified.
+        The `maxFilesPerTrigger` option limits the number of files in a micro batch.
+        """
         from duckdb.experimental.spark.sql.dataframe import DataFrame
 
-        raise NotImplementedError
+        if format is not None:
+            self.format(format)
+        if schema is not None:
+            self.schema(schema)
+        self.options(**options)
+        if path is None:
+            path = cast(Optional[str], self._options.get("path"))
+        if not isinstance(path, str):
+            raise ContributionsAcceptedError("Only streaming from a single path is supported")
+        source_format = self._format or "parquet"
+        if source_format not in _SOURCE_FORMATS:
+            raise ContributionsAcceptedError(f"The '{source_format}' streaming source is not supported")
+
+        options = dict(self._options)
+        options.pop("path", None)
+        source = _FileStreamSource(self.session, path, source_format, self._schema, options)
+        self.session._streaming_sources[source.view] = source
+        return DataFrame(self.session.conn.view(source.view), self.session)
+
+    def parquet(self, path: str, **options: "OptionalPrimitiveType") -> "DataFrame":
+        return self.load(path, format="parquet", **options)
+
+    def csv(
+        self, path: str, schema: Union[StructType, str, None] = None, **options: "OptionalPrimitiveType"
+    ) -> "DataFrame":
+        return self.load(path, format="csv", schema=schema, **options)
+
+    def json(
+        self, path: str, schema: Union[StructType, str, None] = None, **options: "OptionalPrimitiveType"
+    ) -> "DataFrame":
+        return self.load(path, format="json", schema=schema, **options)
 
 
-__all__ = ["DataStreamReader", "DataStreamWriter"]
+__all__ = ["DataStreamReader", "DataStreamWriter", "StreamingQuery"]
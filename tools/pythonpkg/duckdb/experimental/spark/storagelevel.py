@@ -0,0 +1,78 @@
+from typing import ClassVar
+
+
+class StorageLevel:
+    """
+    Flags for controlling the storage of a cached DataFrame.
+
+    Levels that use memory keep the materialized DataFrame in a temporary table, which counts towards the share
+    of the memory limit that is reserved for caching. Levels that use disk keep it in a database file in a
+    temporary directory, or move it there when it is evicted from memory.
+    Serialization, off-heap storage and replication have no meaning for DuckDB and are ignored.
+    """
+
+    NONE: ClassVar["StorageLevel"]
+    DISK_ONLY: ClassVar["StorageLevel"]
+    DISK_ONLY_2: ClassVar["StorageLevel"]
+    DISK_ONLY_3: ClassVar["StorageLevel"]
+    MEMORY_ONLY: ClassVar["StorageLevel"]
+    MEMORY_ONLY_2: ClassVar["StorageLevel"]
+    MEMORY_AND_DISK: ClassVar["StorageLevel"]
+    MEMORY_AND_DISK_2: ClassVar["StorageLevel"]
+    OFF_HEAP: ClassVar["StorageLevel"]
+    MEMORY_AND_DISK_DESER: ClassVar["StorageLevel"]
+
+    def __init__(
+        self, useDisk: bool, useMemory: bool, useOffHeap: bool, deserialized: bool, replication: int = 1
+    ) -> None:
+        self.useDisk = useDisk
+        self.useMemory = useMemory
+        self.useOffHeap = useOffHeap
+        self.deserialized = deserialized
+        self.replication = replication
+
+    def __repr__(self) -> str:
+        return "StorageLevel(%s, %s, %s, %s, %s)" % (
+            self.useDisk,
+            self.useMemory,
+            self.useOffHeap,
+            self.deserialized,
+            self.replication,
+        )
+
+    def __str__(self) -> str:
+        result = ""
+        result += "Disk " if self.useDisk else ""
+        result += "Memory " if self.useMemory else ""
+        result += "OffHeap " if self.useOffHeap else ""
+        result += "Deserialized " if self.deserialized else "Serialized "
+        result += "%sx Replicated" % self.replication
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StorageLevel):
+            return NotImplemented
+        return (
+            self.useDisk == other.useDisk
+            and self.useMemory == other.useMemory
+            and self.useOffHeap == other.useOffHeap
+            and self.deserialized == other.deserialized
+            and self.replication == other.replication
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.useDisk, self.useMemory, self.useOffHeap, self.deserialized, self.replication))
+
+
+StorageLevel.NONE = StorageLevel(False, False, False, False)
+StorageLevel.DISK_ONLY = StorageLevel(True, False, False, False)
+StorageLevel.DISK_ONLY_2 = StorageLevel(True, False, False, False, 2)
+StorageLevel.DISK_ONLY_3 = StorageLevel(True, False, False, False, 3)
+StorageLevel.MEMORY_ONLY = StorageLevel(False, True, False, False)
+StorageLevel.MEMORY_ONLY_2 = StorageLevel(False, True, False, False, 2)
+StorageLevel.MEMORY_AND_DISK = StorageLevel(True, True, False, False)
+StorageLevel.MEMORY_AND_DISK_2 = StorageLevel(True, True, False, False, 2)
+StorageLevel.OFF_HEAP = StorageLevel(True, True, True, False, 1)
+StorageLevel.MEMORY_AND_DISK_DESER = StorageLevel(True, True, False, True)
+
+__all__ = ["StorageLevel"]
@@ -4,7 +4,8 @@ from duckdb.duckdb.functional import (
 	SPECIAL,
 	DEFAULT,
 	NATIVE,
-	ARROW
+	ARROW,
+	NUMPY
 )
 
 __all__ = [
@@ -13,5 +14,6 @@ __all__ = [
 	"SPECIAL",
 	"DEFAULT",
 	"NATIVE",
-	"ARROW"
+	"ARROW",
+	"NUMPY"
 ]
@@ -0,0 +1,96 @@
+from typing import Iterator, List, Optional
+
+
+def _polars_version():
+    import polars as pl
+
+    return tuple(int(part) for part in pl.__version__.split('.')[:2] if part.isdigit())
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def collect_streaming(lazy_frame):
+    """
+    Collect a polars LazyFrame using the streaming engine, this is used to scan a LazyFrame from DuckDB
+    """
+    if _polars_version() >= (1, 23):
+        return lazy_frame.collect(engine="streaming")
+    return lazy_frame.collect(streaming=True)
+
+
+def _collect_batches(lazy_frame, batch_size: int) -> Iterator["pl.DataFrame"]:
+    if hasattr(lazy_frame, "collect_batches"):
+        # the streaming engine produces the batches while they are consumed
+        yield from lazy_frame.collect_batches()
+        return
+    yield from collect_streaming(lazy_frame).iter_slices(batch_size)
+
+
+def record_batch_reader(lazy_frame, batch_size: int = 1000000):
+    """
+    Create a pyarrow RecordBatchReader over the result of a polars LazyFrame, this is used to scan a LazyFrame from DuckDB
+
+    The first batch is produced eagerly, so errors in the plan of the LazyFrame are raised by this function.
+    """
+    import pyarrow as pa
+
+    tables = (frame.to_arrow() for frame in _collect_batches(lazy_frame, batch_size))
+    first = next(tables, None)
+    if first is None:
+        # collecting an empty LazyFrame only resolves its schema
+        first = lazy_frame.limit(0).collect().to_arrow()
+
+    def batches() -> Iterator["pa.RecordBatch"]:
+        yield from first.to_batches()
+        for table in tables:
+            yield from table.to_batches()
+
+    return pa.RecordBatchReader.from_batches(first.schema, batches())
+
+
+def duckdb_source(relation, batch_size: int):
+    """
+    Create a polars LazyFrame that streams the result of a DuckDB relation
+
+    The columns, row limit and batch size requested by polars are pushed into the relation,
+    predicates are applied by polars on every batch.
+    """
+    import polars as pl
+    from .duckdb import ColumnExpression
+
+    try:
+        from polars.io.plugins import register_io_source
+    except ImportError:
+        # this version of polars can not stream from a python source
+        return pl.from_arrow(relation.arrow(batch_size)).lazy()
+
+    schema = pl.from_arrow(relation.limit(0).arrow()).schema
+
+    def source_generator(
+        with_columns: Optional[List[str]],
+        predicate: Optional["pl.Expr"],
+        n_rows: Optional[int],
+        batch_size_hint: Optional[int],
+    ) -> Iterator["pl.DataFrame"]:
+        source = relation
+        if with_columns:
+            source = source.select(*[ColumnExpression(_quote_identifier(column)) for column in with_columns])
+        if n_rows is not None and predicate is None:
+            source = source.limit(n_rows)
+        remaining = n_rows
+        reader = source.fetch_arrow_reader(batch_size_hint or batch_size)
+        for record_batch in reader:
+            df = pl.from_arrow(record_batch)
+            if predicate is not None:
+                df = df.filter(predicate)
+            if remaining is not None:
+                # the limit applies to the filtered rows
+                df = df.head(remaining)
+                remaining -= len(df)
+            yield df
+            if remaining == 0:
+                break
+
+    return register_io_source(source_generator, schema=schema)
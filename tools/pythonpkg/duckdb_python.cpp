@@ -7,6 +7,8 @@
 #include "duckdb_python/python_objects.hpp"
 #include "duckdb_python/pyconnection/pyconnection.hpp"
 #include "duckdb_python/pystatement.hpp"
+#include "duckdb_python/pyprepared_statement.hpp"
+#include "duckdb_python/pypending_query.hpp"
 #include "duckdb_python/pyrelation.hpp"
 #include "duckdb_python/expression/pyexpression.hpp"
 #include "duckdb_python/pyresult.hpp"
@@ -127,18 +129,19 @@ static void InitializeConnectionMethods(py::module_ &m) {
 	       const shared_ptr<DuckDBPyType> &return_type = nullptr, PythonUDFType type = PythonUDFType::NATIVE,
 	       FunctionNullHandling null_handling = FunctionNullHandling::DEFAULT_NULL_HANDLING,
 	       PythonExceptionHandling exception_handling = PythonExceptionHandling::FORWARD_ERROR,
-	       bool side_effects = false, shared_ptr<DuckDBPyConnection> conn = nullptr) {
+	       bool side_effects = false, const py::object &executor = py::none(),
+	       shared_ptr<DuckDBPyConnection> conn = nullptr) {
 		    if (!conn) {
 			    conn = DuckDBPyConnection::DefaultConnection();
 		    }
 		    return conn->RegisterScalarUDF(name, udf, arguments, return_type, type, null_handling, exception_handling,
-		                                   side_effects);
+		                                   side_effects, executor);
 	    },
 	    "Create a DuckDB function out of the passing in Python function so it can be used in queries", py::arg("name"),
 	    py::arg("function"), py::arg("parameters") = py::none(), py::arg("return_type") = py::none(), py::kw_only(),
 	    py::arg("type") = PythonUDFType::NATIVE, py::arg("null_handling") = FunctionNullHandling::DEFAULT_NULL_HANDLING,
 	    py::arg("exception_handling") = PythonExceptionHandling::FORWARD_ERROR, py::arg("side_effects") = false,
-	    py::arg("connection") = py::none());
+	    py::arg("executor") = py::none(), py::arg("connection") = py::none());
 	m.def(
 	    "remove_function",
 	    [](const string &name, shared_ptr<DuckDBPyConnection> conn = nullptr) {
@@ -289,6 +292,16 @@ static void InitializeConnectionMethods(py::module_ &m) {
 	    },
 	    "Execute the given SQL query, optionally using prepared statements with parameters set", py::arg("query"),
 	    py::arg("parameters") = py::none(), py::kw_only(), py::arg("connection") = py::none());
+	m.def(
+	    "prepare",
+	    [](const py::object &query, shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->Prepare(query);
+	    },
+	    "Prepare the given SQL query so it can be executed repeatedly with different parameters", py::arg("query"),
+	    py::kw_only(), py::arg("connection") = py::none());
 	m.def(
 	    "executemany",
 	    [](const py::object &query, py::object params = py::list(), shared_ptr<DuckDBPyConnection> conn = nullptr) {
@@ -522,6 +535,26 @@ static void InitializeConnectionMethods(py::module_ &m) {
 		    return conn->UnregisterPythonObject(name);
 	    },
 	    "Unregister the view name", py::arg("view_name"), py::kw_only(), py::arg("connection") = py::none());
+	m.def(
+	    "replacement_cache_info",
+	    [](shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->ReplacementCacheInfo();
+	    },
+	    "Get the number of hits, misses and entries of the cache of replacement scans of Python objects", py::kw_only(),
+	    py::arg("connection") = py::none());
+	m.def(
+	    "statement_cache_info",
+	    [](shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->StatementCacheInfo();
+	    },
+	    "Get the number of hits, misses and entries and the size of the cache of prepared statements", py::kw_only(),
+	    py::arg("connection") = py::none());
 	m.def(
 	    "table",
 	    [](const string &tname, shared_ptr<DuckDBPyConnection> conn = nullptr) {
@@ -853,13 +886,13 @@ static void InitializeConnectionMethods(py::module_ &m) {
 	       const py::object &compression = py::none(), const py::object &overwrite = py::none(),
 	       const py::object &per_thread_output = py::none(), const py::object &use_tmp_file = py::none(),
 	       const py::object &partition_by = py::none(), const py::object &write_partition_columns = py::none(),
-	       shared_ptr<DuckDBPyConnection> conn = nullptr) {
+	       const py::object &append = py::none(), shared_ptr<DuckDBPyConnection> conn = nullptr) {
 		    if (!conn) {
 			    conn = DuckDBPyConnection::DefaultConnection();
 		    }
 		    conn->FromDF(df)->ToCSV(filename, sep, na_rep, header, quotechar, escapechar, date_format, timestamp_format,
 		                            quoting, encoding, compression, overwrite, per_thread_output, use_tmp_file,
-		                            partition_by, write_partition_columns);
+		                            partition_by, write_partition_columns, append);
 	    },
 	    "Write the relation object to a CSV file in 'file_name'", py::arg("df"), py::arg("filename"), py::kw_only(),
 	    py::arg("sep") = py::none(), py::arg("na_rep") = py::none(), py::arg("header") = py::none(),
@@ -868,7 +901,7 @@ static void InitializeConnectionMethods(py::module_ &m) {
 	    py::arg("compression") = py::none(), py::arg("overwrite") = py::none(),
 	    py::arg("per_thread_output") = py::none(), py::arg("use_tmp_file") = py::none(),
 	    py::arg("partition_by") = py::none(), py::arg("write_partition_columns") = py::none(),
-	    py::arg("connection") = py::none());
+	    py::arg("append") = py::none(), py::arg("connection") = py::none());
 	m.def(
 	    "aggregate",
 	    [](const PandasDataFrame &df, const py::object &expr, const string &groups = "",
@@ -1062,6 +1095,8 @@ PYBIND11_MODULE(DUCKDB_PYTHON_LIB_NAME, m) { // NOLINT
 	DuckDBPyFunctional::Initialize(m);
 	DuckDBPyExpression::Initialize(m);
 	DuckDBPyStatement::Initialize(m);
+	DuckDBPyPreparedStatement::Initialize(m);
+	DuckDBPyPendingQuery::Initialize(m);
 	DuckDBPyRelation::Initialize(m);
 	DuckDBPyConnection::Initialize(m);
 	PythonObject::Initialize();
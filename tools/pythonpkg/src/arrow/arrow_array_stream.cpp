@@ -8,10 +8,18 @@
 #include "duckdb/planner/filter/constant_filter.hpp"
 #include "duckdb/planner/filter/struct_filter.hpp"
 #include "duckdb/planner/table_filter.hpp"
+#include "duckdb/planner/expression/bound_comparison_expression.hpp"
+#include "duckdb/planner/expression/bound_conjunction_expression.hpp"
+#include "duckdb/planner/expression/bound_constant_expression.hpp"
+#include "duckdb/planner/expression/bound_function_expression.hpp"
+#include "duckdb/planner/expression/bound_operator_expression.hpp"
+#include "duckdb/planner/expression/bound_reference_expression.hpp"
 
+#include "duckdb_python/pybind11/dataframe.hpp"
 #include "duckdb_python/pyconnection/pyconnection.hpp"
 #include "duckdb_python/pyrelation.hpp"
 #include "duckdb_python/pyresult.hpp"
+#include "duckdb_python/python_objects.hpp"
 #include "duckdb/function/table/arrow.hpp"
 
 namespace duckdb {
@@ -46,22 +54,174 @@ py::object PythonTableArrowArrayStreamFactory::ProduceScanner(py::object &arrow_
 	auto &filter_to_col = parameters.projected_columns.filter_to_col;
 	bool has_filter = filters && !filters->filters.empty();
 	py::list projection_list = py::cast(column_list);
+	py::object filter;
 	if (has_filter) {
-		auto filter = TransformFilter(*filters, parameters.projected_columns.projection_map, filter_to_col,
-		                              client_properties, arrow_table);
-		if (column_list.empty()) {
-			return arrow_scanner(arrow_obj_handle, py::arg("filter") = filter);
+		filter = TransformFilter(*filters, parameters.projected_columns.projection_map, filter_to_col,
+		                         client_properties, arrow_table);
+	}
+	auto create_scanner = [&](const py::object &scanner_filter) {
+		if (scanner_filter) {
+			if (column_list.empty()) {
+				return arrow_scanner(arrow_obj_handle, py::arg("filter") = scanner_filter);
+			} else {
+				return arrow_scanner(arrow_obj_handle, py::arg("columns") = projection_list,
+				                     py::arg("filter") = scanner_filter);
+			}
 		} else {
-			return arrow_scanner(arrow_obj_handle, py::arg("columns") = projection_list, py::arg("filter") = filter);
+			if (column_list.empty()) {
+				return arrow_scanner(arrow_obj_handle);
+			} else {
+				return arrow_scanner(arrow_obj_handle, py::arg("columns") = projection_list);
+			}
 		}
+	};
+
+	if (parameters.filter_expressions) {
+		// these filters are applied by DuckDB as well, they are only pushed down to skip data
+		auto schema = arrow_obj_handle.attr("schema");
+		py::object expression_filter = filter;
+		for (auto &expression : *parameters.filter_expressions) {
+			auto child_filter = TransformFilterExpression(*expression, arrow_table, schema, client_properties, false);
+			if (!child_filter) {
+				continue;
+			}
+			expression_filter = expression_filter ? expression_filter.attr("__and__")(child_filter) : child_filter;
+		}
+		if (expression_filter && !expression_filter.is(filter)) {
+			try {
+				return create_scanner(expression_filter);
+			} catch (py::error_already_set &) {
+				// pyarrow could not bind the filters against the schema, scan without them
+			}
+		}
+	}
+	return create_scanner(filter);
+}
+static bool PolarsSupportsConstant(const LogicalType &type) {
+	switch (type.id()) {
+	case LogicalTypeId::BOOLEAN:
+	case LogicalTypeId::TINYINT:
+	case LogicalTypeId::SMALLINT:
+	case LogicalTypeId::INTEGER:
+	case LogicalTypeId::BIGINT:
+	case LogicalTypeId::UTINYINT:
+	case LogicalTypeId::USMALLINT:
+	case LogicalTypeId::UINTEGER:
+	case LogicalTypeId::UBIGINT:
+	case LogicalTypeId::VARCHAR:
+	case LogicalTypeId::DATE:
+	case LogicalTypeId::TIMESTAMP:
+		return true;
+	default:
+		// floating point comparisons differ in their handling of NaN
+		return false;
+	}
+}
+
+//! Transform a table filter into a Polars expression, returns nullptr if the filter can not be transformed
+static py::object TransformPolarsFilter(const TableFilter &filter, const py::object &column,
+                                        const ClientProperties &client_properties) {
+	switch (filter.filter_type) {
+	case TableFilterType::CONSTANT_COMPARISON: {
+		auto &constant_filter = filter.Cast<ConstantFilter>();
+		auto &constant = constant_filter.constant;
+		if (constant.IsNull() || !PolarsSupportsConstant(constant.type())) {
+			return py::object();
+		}
+		auto polars_constant = py::module_::import("polars").attr("lit")(
+		    PythonObject::FromValue(constant, constant.type(), client_properties));
+		switch (constant_filter.comparison_type) {
+		case ExpressionType::COMPARE_EQUAL:
+			return column.attr("__eq__")(polars_constant);
+		case ExpressionType::COMPARE_LESSTHAN:
+			return column.attr("__lt__")(polars_constant);
+		case ExpressionType::COMPARE_GREATERTHAN:
+			return column.attr("__gt__")(polars_constant);
+		case ExpressionType::COMPARE_LESSTHANOREQUALTO:
+			return column.attr("__le__")(polars_constant);
+		case ExpressionType::COMPARE_GREATERTHANOREQUALTO:
+			return column.attr("__ge__")(polars_constant);
+		default:
+			return py::object();
+		}
+	}
+	case TableFilterType::IS_NULL:
+		return column.attr("is_null")();
+	case TableFilterType::IS_NOT_NULL:
+		return column.attr("is_not_null")();
+	case TableFilterType::CONJUNCTION_OR: {
+		auto &or_filter = filter.Cast<ConjunctionOrFilter>();
+		py::object expression;
+		for (auto &child_filter : or_filter.child_filters) {
+			auto child_expression = TransformPolarsFilter(*child_filter, column, client_properties);
+			if (!child_expression) {
+				return py::object();
+			}
+			expression = expression ? expression.attr("__or__")(child_expression) : child_expression;
+		}
+		return expression;
+	}
+	case TableFilterType::CONJUNCTION_AND: {
+		// the filters are applied again after collecting, so we can skip children we can not transform
+		auto &and_filter = filter.Cast<ConjunctionAndFilter>();
+		py::object expression;
+		for (auto &child_filter : and_filter.child_filters) {
+			auto child_expression = TransformPolarsFilter(*child_filter, column, client_properties);
+			if (!child_expression) {
+				continue;
+			}
+			expression = expression ? expression.attr("__and__")(child_expression) : child_expression;
+		}
+		return expression;
+	}
+	case TableFilterType::STRUCT_EXTRACT: {
+		auto &struct_filter = filter.Cast<StructFilter>();
+		auto child_column = column.attr("struct").attr("field")(struct_filter.child_name);
+		return TransformPolarsFilter(*struct_filter.child_filter, child_column, client_properties);
+	}
+	default:
+		return py::object();
+	}
+}
+
+py::object PythonTableArrowArrayStreamFactory::ProduceLazyFrameReader(py::handle lazy_frame_handle,
+                                                                      ArrowStreamParameters &parameters,
+                                                                      const ClientProperties &client_properties) {
+	auto polars = py::module_::import("polars");
+	auto record_batch_reader = py::module_::import("duckdb.polars_io").attr("record_batch_reader");
+
+	auto lazy_frame = py::reinterpret_borrow<py::object>(lazy_frame_handle);
+	auto &column_list = parameters.projected_columns.columns;
+	if (column_list.empty()) {
+		// only the number of rows is needed
+		lazy_frame = lazy_frame.attr("select")(polars.attr("first")());
 	} else {
-		if (column_list.empty()) {
-			return arrow_scanner(arrow_obj_handle);
-		} else {
-			return arrow_scanner(arrow_obj_handle, py::arg("columns") = projection_list);
+		lazy_frame = lazy_frame.attr("select")(py::cast(column_list));
+	}
+
+	py::object predicate;
+	auto filters = parameters.filters;
+	if (filters) {
+		auto &columns = parameters.projected_columns.projection_map;
+		for (auto &entry : filters->filters) {
+			auto column = polars.attr("col")(columns[entry.first]);
+			auto expression = TransformPolarsFilter(*entry.second, column, client_properties);
+			if (!expression) {
+				continue;
+			}
+			predicate = predicate ? predicate.attr("__and__")(expression) : expression;
+		}
+	}
+	if (predicate) {
+		try {
+			return record_batch_reader(lazy_frame.attr("filter")(predicate));
+		} catch (py::error_already_set &) {
+			// Polars could not apply the filters to the LazyFrame, they are still applied on the scanned batches
 		}
 	}
+	return record_batch_reader(lazy_frame);
 }
+
 unique_ptr<ArrowArrayStreamWrapper> PythonTableArrowArrayStreamFactory::Produce(uintptr_t factory_ptr,
                                                                                 ArrowStreamParameters &parameters) {
 	py::gil_scoped_acquire acquire;
@@ -82,6 +242,15 @@ unique_ptr<ArrowArrayStreamWrapper> PythonTableArrowArrayStreamFactory::Produce(
 		return res;
 	}
 
+	py::object lazy_frame_reader;
+	if (arrow_object_type == PyArrowObjectType::Invalid && PolarsDataFrame::IsLazyFrame(arrow_obj_handle)) {
+		// Push the projection and filters into the plan of the LazyFrame, its result is then streamed as record
+		// batches that are scanned like any other RecordBatchReader
+		lazy_frame_reader = ProduceLazyFrameReader(arrow_obj_handle, parameters, factory->client_properties);
+		arrow_obj_handle = lazy_frame_reader;
+		arrow_object_type = PyArrowObjectType::RecordBatchReader;
+	}
+
 	auto &import_cache = *DuckDBPyConnection::ImportCache();
 	py::object scanner;
 	py::object arrow_batch_scanner = import_cache.pyarrow.dataset.Scanner().attr("from_batches");
@@ -133,6 +302,15 @@ void PythonTableArrowArrayStreamFactory::GetSchemaInternal(py::handle arrow_obj_
 		return;
 	}
 
+	if (PolarsDataFrame::IsLazyFrame(arrow_obj_handle)) {
+		// collecting an empty LazyFrame only resolves its schema
+		auto empty_table = arrow_obj_handle.attr("limit")(0).attr("collect")().attr("to_arrow")();
+		auto obj_schema = empty_table.attr("schema");
+		auto export_to_c = obj_schema.attr("_export_to_c");
+		export_to_c(reinterpret_cast<uint64_t>(&schema.arrow_schema));
+		return;
+	}
+
 	auto table_class = py::module::import("pyarrow").attr("Table");
 	if (py::isinstance(arrow_obj_handle, table_class)) {
 		auto obj_schema = arrow_obj_handle.attr("schema");
@@ -383,6 +561,222 @@ py::object TransformFilterRecursive(TableFilter *filter, vector<string> &column_
 	}
 }
 
+//! A (nested) column referenced by a filter expression
+struct ArrowFilterField {
+	vector<string> path;
+	optional_ptr<const ArrowType> arrow_type;
+	//! The pyarrow type of the field
+	py::object type;
+};
+
+static bool TryTransformField(const Expression &expr, const ArrowTableType &arrow_table, const py::object &schema,
+                              ArrowFilterField &result) {
+	if (expr.type == ExpressionType::BOUND_REF) {
+		auto &ref = expr.Cast<BoundReferenceExpression>();
+		auto &columns = arrow_table.GetColumns();
+		auto entry = columns.find(ref.index);
+		if (entry == columns.end()) {
+			return false;
+		}
+		result.path = {ref.alias};
+		result.arrow_type = entry->second.get();
+		result.type = schema.attr("field")(ref.alias).attr("type");
+		return true;
+	}
+	if (expr.expression_class != ExpressionClass::BOUND_FUNCTION) {
+		return false;
+	}
+	auto &function = expr.Cast<BoundFunctionExpression>();
+	if (function.function.name != "struct_extract" || function.children.size() != 2 ||
+	    function.children[1]->type != ExpressionType::VALUE_CONSTANT) {
+		return false;
+	}
+	if (!TryTransformField(*function.children[0], arrow_table, schema, result)) {
+		return false;
+	}
+	auto &struct_type = function.children[0]->return_type;
+	auto &key = function.children[1]->Cast<BoundConstantExpression>().value;
+	if (struct_type.id() != LogicalTypeId::STRUCT || result.arrow_type->GetDuckType().id() != LogicalTypeId::STRUCT ||
+	    key.type().id() != LogicalTypeId::VARCHAR || key.IsNull()) {
+		return false;
+	}
+	auto &child_types = StructType::GetChildTypes(struct_type);
+	for (idx_t child_idx = 0; child_idx < child_types.size(); child_idx++) {
+		if (!StringUtil::CIEquals(child_types[child_idx].first, StringValue::Get(key))) {
+			continue;
+		}
+		auto &struct_info = result.arrow_type->GetTypeInfo<ArrowStructInfo>();
+		result.path.push_back(child_types[child_idx].first);
+		result.arrow_type = &struct_info.GetChild(child_idx);
+		result.type = result.type[py::int_(child_idx)].attr("type");
+		return true;
+	}
+	return false;
+}
+
+static py::object TransformField(const ArrowFilterField &field) {
+	auto &import_cache = *DuckDBPyConnection::ImportCache();
+	return import_cache.pyarrow.dataset().attr("field")(py::tuple(py::cast(field.path)));
+}
+
+static py::object TransformConstant(const Expression &expr, const ArrowFilterField &field,
+                                    const string &timezone_config) {
+	if (expr.type != ExpressionType::VALUE_CONSTANT) {
+		return py::object();
+	}
+	auto value = expr.Cast<BoundConstantExpression>().value;
+	if (value.IsNull() || value.type().InternalType() == PhysicalType::INT128) {
+		return py::object();
+	}
+	try {
+		return GetScalar(value, timezone_config, *field.arrow_type);
+	} catch (NotImplementedException &) {
+		return py::object();
+	}
+}
+
+//! Transform a filter expression into an Arrow Expression, returns nullptr if it can not be transformed.
+//! Unless 'exact' is set, the result may select more rows than the filter, as DuckDB still applies the filter.
+static py::object TransformFilterExpressionRecursive(const Expression &expr, const ArrowTableType &arrow_table,
+                                                     const py::object &schema,
+                                                     const ClientProperties &client_properties, bool exact) {
+	switch (expr.GetExpressionClass()) {
+	case ExpressionClass::BOUND_COMPARISON: {
+		auto &comparison = expr.Cast<BoundComparisonExpression>();
+		const char *comparison_function;
+		switch (expr.type) {
+		case ExpressionType::COMPARE_EQUAL:
+			comparison_function = "__eq__";
+			break;
+		case ExpressionType::COMPARE_NOTEQUAL:
+			comparison_function = "__ne__";
+			break;
+		case ExpressionType::COMPARE_LESSTHAN:
+			comparison_function = "__lt__";
+			break;
+		case ExpressionType::COMPARE_GREATERTHAN:
+			comparison_function = "__gt__";
+			break;
+		case ExpressionType::COMPARE_LESSTHANOREQUALTO:
+			comparison_function = "__le__";
+			break;
+		case ExpressionType::COMPARE_GREATERTHANOREQUALTO:
+			comparison_function = "__ge__";
+			break;
+		default:
+			return py::object();
+		}
+		ArrowFilterField left_field;
+		ArrowFilterField right_field;
+		bool left_is_field = TryTransformField(*comparison.left, arrow_table, schema, left_field);
+		bool right_is_field = TryTransformField(*comparison.right, arrow_table, schema, right_field);
+		if (!left_is_field && !right_is_field) {
+			return py::object();
+		}
+		auto left = left_is_field ? TransformField(left_field)
+		                          : TransformConstant(*comparison.left, right_field, client_properties.time_zone);
+		auto right = right_is_field ? TransformField(right_field)
+		                            : TransformConstant(*comparison.right, left_field, client_properties.time_zone);
+		if (!left || !right) {
+			return py::object();
+		}
+		return left.attr(comparison_function)(right);
+	}
+	case ExpressionClass::BOUND_OPERATOR: {
+		auto &op = expr.Cast<BoundOperatorExpression>();
+		switch (expr.type) {
+		case ExpressionType::OPERATOR_IS_NULL:
+		case ExpressionType::OPERATOR_IS_NOT_NULL: {
+			ArrowFilterField field;
+			if (!TryTransformField(*op.children[0], arrow_table, schema, field)) {
+				return py::object();
+			}
+			auto is_null = expr.type == ExpressionType::OPERATOR_IS_NULL;
+			return TransformField(field).attr(is_null ? "is_null" : "is_valid")();
+		}
+		case ExpressionType::COMPARE_IN:
+		case ExpressionType::COMPARE_NOT_IN: {
+			ArrowFilterField field;
+			if (!TryTransformField(*op.children[0], arrow_table, schema, field)) {
+				return py::object();
+			}
+			auto not_in = expr.type == ExpressionType::COMPARE_NOT_IN;
+			py::list values;
+			for (idx_t i = 1; i < op.children.size(); i++) {
+				if (op.children[i]->type != ExpressionType::VALUE_CONSTANT) {
+					return py::object();
+				}
+				auto &value = op.children[i]->Cast<BoundConstantExpression>().value;
+				if (value.IsNull()) {
+					if (not_in) {
+						// NOT IN with a NULL never holds
+						return py::object();
+					}
+					continue;
+				}
+				values.append(PythonObject::FromValue(value, value.type(), client_properties));
+			}
+			// the value set has to have the type of the field, dictionaries are matched on their values
+			auto value_type = field.type;
+			if (py::module_::import("pyarrow.types").attr("is_dictionary")(value_type).cast<bool>()) {
+				value_type = value_type.attr("value_type");
+			}
+			auto value_set = py::module_::import("pyarrow").attr("array")(values, py::arg("type") = value_type);
+			auto is_in = TransformField(field).attr("isin")(value_set);
+			return not_in ? is_in.attr("__invert__")() : is_in;
+		}
+		case ExpressionType::OPERATOR_NOT: {
+			auto child =
+			    TransformFilterExpressionRecursive(*op.children[0], arrow_table, schema, client_properties, true);
+			if (!child) {
+				return py::object();
+			}
+			return child.attr("__invert__")();
+		}
+		default:
+			return py::object();
+		}
+	}
+	case ExpressionClass::BOUND_CONJUNCTION: {
+		auto &conjunction = expr.Cast<BoundConjunctionExpression>();
+		auto is_and = expr.type == ExpressionType::CONJUNCTION_AND;
+		py::object result;
+		for (auto &child : conjunction.children) {
+			auto child_expression =
+			    TransformFilterExpressionRecursive(*child, arrow_table, schema, client_properties, exact);
+			if (!child_expression) {
+				if (is_and && !exact) {
+					// leaving out a child of an AND only selects more rows
+					continue;
+				}
+				return py::object();
+			}
+			if (!result) {
+				result = child_expression;
+			} else {
+				result = result.attr(is_and ? "__and__" : "__or__")(child_expression);
+			}
+		}
+		return result;
+	}
+	default:
+		return py::object();
+	}
+}
+
+py::object PythonTableArrowArrayStreamFactory::TransformFilterExpression(const Expression &expression,
+                                                                         const ArrowTableType &arrow_table,
+                                                                         const py::object &schema,
+                                                                         const ClientProperties &client_properties,
+                                                                         bool exact) {
+	try {
+		return TransformFilterExpressionRecursive(expression, arrow_table, schema, client_properties, exact);
+	} catch (py::error_already_set &) {
+		// the filter is only used to skip data, if pyarrow can't represent it the data is filtered by DuckDB
+		return py::object();
+	}
+}
+
 py::object PythonTableArrowArrayStreamFactory::TransformFilter(TableFilterSet &filter_collection,
                                                                std::unordered_map<idx_t, string> &columns,
                                                                unordered_map<idx_t, idx_t> filter_to_col,
@@ -396,6 +790,7 @@ py::object PythonTableArrowArrayStreamFactory::TransformFilter(TableFilterSet &f
 	vector<string> column_ref;
 	column_ref.push_back(columns[it->first]);
 	py::object expression = TransformFilterRecursive(it->second.get(), column_ref, config.time_zone, **arrow_type);
+	it++;
 	while (it != filters_map->end()) {
 		arrow_type = &arrow_table.GetColumns().at(filter_to_col.at(it->first));
 		column_ref.clear();
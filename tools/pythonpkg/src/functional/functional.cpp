@@ -9,6 +9,7 @@ void DuckDBPyFunctional::Initialize(py::module_ &parent) {
 	py::enum_<duckdb::PythonUDFType>(m, "PythonUDFType")
 	    .value("NATIVE", duckdb::PythonUDFType::NATIVE)
 	    .value("ARROW", duckdb::PythonUDFType::ARROW)
+	    .value("NUMPY", duckdb::PythonUDFType::NUMPY)
 	    .export_values();
 
 	py::enum_<duckdb::FunctionNullHandling>(m, "FunctionNullHandling")
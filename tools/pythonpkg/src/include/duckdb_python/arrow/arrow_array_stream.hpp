@@ -69,7 +69,7 @@ public:
 	static void GetSchemaInternal(py::handle arrow_object, ArrowSchemaWrapper &schema);
 	static void GetSchema(uintptr_t factory_ptr, ArrowSchemaWrapper &schema);
 
-	//! Arrow Object (i.e., Scanner, Record Batch Reader, Table, Dataset)
+	//! Arrow Object (i.e., Scanner, Record Batch Reader, Table, Dataset) or Polars LazyFrame
 	PyObject *arrow_object;
 
 	const ClientProperties client_properties;
@@ -80,6 +80,16 @@ private:
 	                                  unordered_map<idx_t, idx_t> filter_to_col,
 	                                  const ClientProperties &client_properties, const ArrowTableType &arrow_table);
 
+	//! We transform a filter expression to an Arrow Expression Object, or nullptr if it is not supported
+	static py::object TransformFilterExpression(const Expression &expression, const ArrowTableType &arrow_table,
+	                                            const py::object &schema, const ClientProperties &client_properties,
+	                                            bool exact);
+
+	//! Streams the result of a Polars LazyFrame as an Arrow RecordBatchReader, with the projection and filters pushed
+	//! into its plan
+	static py::object ProduceLazyFrameReader(py::handle lazy_frame, ArrowStreamParameters &parameters,
+	                                         const ClientProperties &client_properties);
+
 	static py::object ProduceScanner(py::object &arrow_scanner, py::handle &arrow_obj_handle,
 	                                 ArrowStreamParameters &parameters, const ClientProperties &client_properties);
 };
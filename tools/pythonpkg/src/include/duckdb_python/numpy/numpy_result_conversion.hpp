@@ -20,8 +20,19 @@ public:
 	                      const ClientProperties &client_properties, bool pandas = false);
 
 	void Append(DataChunk &chunk);
+	//! Append all the rows of the collection, converting the columns in parallel on the task scheduler
+	void Append(ColumnDataCollection &collection, ClientContext &context);
+	//! Append the given columns of the collection, starting at 'offset'
+	void AppendColumns(ColumnDataCollection &collection, const vector<column_t> &column_ids, idx_t offset);
+	//! Append a collection that consists of a single chunk, the fixed-width columns without NULLs become views over
+	//! the chunk instead of copies. The data of the collection is moved into the arrays. Returns false if the
+	//! collection can not be appended this way
+	bool AppendZeroCopy(ColumnDataCollection &collection);
 
 	py::object ToArray(idx_t col_idx) {
+		if (views[col_idx]) {
+			return views[col_idx];
+		}
 		return owned_data[col_idx].ToArray();
 	}
 	bool ToPandas() const {
@@ -33,6 +44,8 @@ private:
 
 private:
 	vector<ArrayWrapper> owned_data;
+	//! The columns that are views over the result instead of copies
+	vector<py::object> views;
 	idx_t count;
 	idx_t capacity;
 	bool pandas;
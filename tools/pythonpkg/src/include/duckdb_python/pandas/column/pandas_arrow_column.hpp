@@ -0,0 +1,24 @@
+#pragma once
+
+#include "duckdb_python/pandas/pandas_column.hpp"
+#include "duckdb_python/pybind11/pybind_wrapper.hpp"
+#include "duckdb/common/arrow/arrow_wrapper.hpp"
+
+namespace duckdb {
+
+//! A column that is backed by an Arrow string array (i.e. pandas' string[pyarrow]), scanned without the GIL
+class PandasArrowColumn : public PandasColumn {
+public:
+	PandasArrowColumn() : PandasColumn(PandasColumnBackend::ARROW), large_offsets(false) {
+	}
+
+public:
+	//! The exported chunks of the ChunkedArray
+	vector<unique_ptr<ArrowArrayWrapper>> chunks;
+	//! The row at which each of the chunks starts
+	vector<idx_t> chunk_offsets;
+	//! Whether the strings have 64-bit offsets (large_string)
+	bool large_offsets;
+};
+
+} // namespace duckdb
@@ -10,6 +10,7 @@
 
 #include "duckdb/common/types.hpp"
 #include "duckdb/main/config.hpp"
+#include "duckdb/main/client_context_state.hpp"
 #include "duckdb_python/pybind11/pybind_wrapper.hpp"
 #include "duckdb_python/pybind11/gil_wrapper.hpp"
 #include "duckdb_python/numpy/numpy_type.hpp"
@@ -17,6 +18,25 @@
 
 namespace duckdb {
 
+struct PandasAnalyzedColumn;
+
+//! Connection-level cache of the analyzed types of pandas object columns, only accessed while holding the GIL
+class PandasAnalyzerCache : public ClientContextState {
+public:
+	static constexpr const char *NAME = "pandas_analyzer_cache";
+	static constexpr idx_t MAX_ENTRIES = 64;
+
+public:
+	~PandasAnalyzerCache() override;
+	static shared_ptr<PandasAnalyzerCache> Get(const ClientContext &context);
+	//! Drop the entries whose sampled objects are no longer referenced outside of the cache
+	void Evict();
+
+public:
+	//! The most recently analyzed columns
+	vector<unique_ptr<PandasAnalyzedColumn>> entries;
+};
+
 class PandasAnalyzer {
 public:
 	explicit PandasAnalyzer(const ClientContext &context) {
@@ -26,6 +46,16 @@ public:
 		auto lookup_result = context.TryGetCurrentSetting("pandas_analyze_sample", result);
 		D_ASSERT((bool)lookup_result);
 		sample_size = result.GetValue<uint64_t>();
+
+		lookup_result = context.TryGetCurrentSetting("pandas_analyze_early_exit", result);
+		D_ASSERT((bool)lookup_result);
+		early_exit = result.GetValue<uint64_t>();
+
+		lookup_result = context.TryGetCurrentSetting("pandas_analyze_cache", result);
+		D_ASSERT((bool)lookup_result);
+		if (result.GetValue<bool>()) {
+			cache = PandasAnalyzerCache::Get(context);
+		}
 	}
 
 public:
@@ -39,11 +69,18 @@ public:
 	}
 
 private:
-	LogicalType InnerAnalyze(py::object column, bool &can_convert, idx_t increment);
+	LogicalType InnerAnalyze(py::object column, bool &can_convert, idx_t increment,
+	                         vector<std::pair<idx_t, py::object>> *samples = nullptr);
+	bool AnalyzeInternal(py::object column, bool &can_convert, LogicalType &type,
+	                     vector<std::pair<idx_t, py::object>> *samples);
 	uint64_t GetSampleIncrement(idx_t rows);
 
 private:
 	uint64_t sample_size;
+	//! Stop sampling once this many consecutive values did not change the type (0 to take the full sample)
+	uint64_t early_exit;
+	//! The results of previous analyses of the connection, if columns that are analyzed again reuse them
+	shared_ptr<PandasAnalyzerCache> cache;
 	//! Holds the gil to allow python object creation/destruction
 	PythonGILWrapper gil;
 	//! The resulting analyzed type
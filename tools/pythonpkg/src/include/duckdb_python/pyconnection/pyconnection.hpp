@@ -25,6 +25,7 @@
 #include "duckdb_python/pybind11/conversions/python_udf_type_enum.hpp"
 #include "duckdb_python/pybind11/conversions/python_csv_line_terminator_enum.hpp"
 #include "duckdb/common/shared_ptr.hpp"
+#include "duckdb/common/atomic.hpp"
 
 namespace duckdb {
 struct BoundParameterData;
@@ -32,6 +33,8 @@ struct BoundParameterData;
 enum class PythonEnvironmentType { NORMAL, INTERACTIVE, JUPYTER };
 
 struct DuckDBPyRelation;
+struct DuckDBPyPreparedStatement;
+struct DuckDBPyPendingQuery;
 
 class RegisteredArrow : public RegisteredObject {
 
@@ -41,6 +44,21 @@ public:
 	unique_ptr<PythonTableArrowArrayStreamFactory> arrow_factory;
 };
 
+//! Counts the statements of a connection that can change which catalog entries the names in a query refer to (i.e.
+//! creating a temporary view that shadows a table), the statement cache is cleared when it changes
+class PythonCatalogVersion : public ClientContextState {
+public:
+	static constexpr const char *NAME = "python_catalog_version";
+
+public:
+	static shared_ptr<PythonCatalogVersion> Get(ClientContext &context);
+	//! Record that the statement is executed, if it can change the entries the names in a query refer to
+	static void StatementExecuted(ClientContext &context, StatementType type);
+
+public:
+	atomic<idx_t> version {0};
+};
+
 struct ConnectionGuard {
 public:
 	ConnectionGuard() {
@@ -135,9 +153,45 @@ private:
 		vector<weak_ptr<DuckDBPyConnection>> cursors;
 	};
 
+	//! LRU cache of the prepared statements of the queries executed on this connection, keyed on the search path and
+	//! the query text
+	class StatementCache {
+	public:
+		StatementCache() {
+		}
+
+	public:
+		//! The entries are cleared when the catalog version of the connection changed
+		shared_ptr<PreparedStatement> Lookup(const string &key, idx_t catalog_version);
+		void Insert(const string &key, shared_ptr<PreparedStatement> statement, idx_t capacity, idx_t catalog_version);
+		void Clear();
+		idx_t Size();
+
+	public:
+		atomic<idx_t> hits {0};
+		atomic<idx_t> misses {0};
+
+	private:
+		struct Entry {
+			shared_ptr<PreparedStatement> statement;
+			//! The time the entry was last used, used to evict the least recently used entry
+			idx_t last_used;
+		};
+
+		//! Clear the entries if they were prepared before the catalog version changed
+		void CheckCatalogVersion(idx_t catalog_version);
+
+	private:
+		mutex lock;
+		unordered_map<string, Entry> entries;
+		idx_t clock = 0;
+		idx_t catalog_version = 0;
+	};
+
 public:
 	ConnectionGuard con;
 	Cursors cursors;
+	StatementCache statement_cache;
 	std::mutex py_connection_lock;
 	//! MemoryFileSystem used to temporarily store file-like objects for reading
 	shared_ptr<ModifiedMemoryFileSystem> internal_object_filesystem;
@@ -201,7 +255,7 @@ public:
 	                  const shared_ptr<DuckDBPyType> &return_type = nullptr, PythonUDFType type = PythonUDFType::NATIVE,
 	                  FunctionNullHandling null_handling = FunctionNullHandling::DEFAULT_NULL_HANDLING,
 	                  PythonExceptionHandling exception_handling = PythonExceptionHandling::FORWARD_ERROR,
-	                  bool side_effects = false);
+	                  bool side_effects = false, const py::object &executor = py::none());
 
 	shared_ptr<DuckDBPyConnection> UnregisterUDF(const string &name);
 
@@ -210,6 +264,12 @@ public:
 	void ExecuteImmediately(vector<unique_ptr<SQLStatement>> statements);
 	unique_ptr<PreparedStatement> PrepareQuery(unique_ptr<SQLStatement> statement);
 	unique_ptr<QueryResult> ExecuteInternal(PreparedStatement &prep, py::object params = py::list());
+	//! Execute the prepared statement and set the result of the connection
+	shared_ptr<DuckDBPyConnection> ExecutePrepared(PreparedStatement &prep, py::object params = py::list());
+	//! Prepare the last statement of the query (using the statement cache), executing the preceding statements
+	shared_ptr<PreparedStatement> PrepareStatement(const py::object &query);
+	//! Set the result of the connection
+	void SetQueryResult(unique_ptr<QueryResult> result);
 
 	shared_ptr<DuckDBPyConnection> Execute(const py::object &query, py::object params = py::list());
 	shared_ptr<DuckDBPyConnection> ExecuteFromString(const string &query);
@@ -255,6 +315,9 @@ public:
 	unordered_set<string> GetTableNames(const string &query);
 
 	shared_ptr<DuckDBPyConnection> UnregisterPythonObject(const string &name);
+	py::dict ReplacementCacheInfo();
+	py::dict StatementCacheInfo();
+	unique_ptr<DuckDBPyPreparedStatement> Prepare(const py::object &query);
 
 	shared_ptr<DuckDBPyConnection> Begin();
 
@@ -280,6 +343,14 @@ public:
 	// these should be functions on the result but well
 	Optional<py::tuple> FetchOne();
 
+	py::object Iterate();
+
+	//! Returns a coroutine that executes the query without blocking the event loop, interrupting the query when it is
+	//! cancelled
+	py::object ExecuteAsync(const py::object &query, py::object params = py::list());
+	//! Start executing the query, the result is set on the connection once the pending query is finished
+	unique_ptr<DuckDBPyPendingQuery> PendingQuery(const py::object &query, py::object params = py::list());
+
 	py::list FetchMany(idx_t size);
 
 	py::list FetchAll();
@@ -324,11 +395,15 @@ private:
 	PathLike GetPathLike(const py::object &object);
 	unique_lock<std::mutex> AcquireConnectionLock();
 	ScalarFunction CreateScalarUDF(const string &name, const py::function &udf, const py::object &parameters,
-	                               const shared_ptr<DuckDBPyType> &return_type, bool vectorized,
+	                               const shared_ptr<DuckDBPyType> &return_type, PythonUDFType type,
 	                               FunctionNullHandling null_handling, PythonExceptionHandling exception_handling,
-	                               bool side_effects);
+	                               bool side_effects, const py::object &executor);
 	void RegisterArrowObject(const py::object &arrow_object, const string &name);
 	vector<unique_ptr<SQLStatement>> GetStatements(const py::object &query);
+	//! The maximum number of prepared statements cached by the statement cache, 0 if it is disabled
+	idx_t StatementCacheCapacity();
+	unique_ptr<QueryResult> ExecuteManyVectorized(const SQLStatement &statement, PreparedStatement &prep,
+	                                              const py::object &params);
 
 	static PythonEnvironmentType environment;
 	static void DetectEnvironment();
@@ -5,6 +5,10 @@
 #include "duckdb_python/pybind11/pybind_wrapper.hpp"
 #include "duckdb_python/pybind11/gil_wrapper.hpp"
 #include "duckdb/common/vector.hpp"
+#include "duckdb/common/mutex.hpp"
+#include <condition_variable>
+#include "duckdb/common/optional_idx.hpp"
+#include "duckdb/common/unordered_map.hpp"
 
 namespace duckdb {
 
@@ -30,14 +34,68 @@ public:
 	}
 };
 
+class AsyncFileSystem : public py::object {
+public:
+	using py::object::object;
+
+public:
+	static bool check_(const py::handle &object) {
+		return py::isinstance(object, py::module::import("fsspec.asyn").attr("AsyncFileSystem"));
+	}
+};
+
+//! A range read that is batched with the range reads of other threads into a single cat_ranges call
+struct PythonRangeRequest {
+	string path;
+	idx_t start;
+	idx_t nr_bytes;
+	data_ptr_t buffer;
+	//! The number of bytes that were read into the buffer
+	idx_t read = 0;
+	//! Set once the batch the request was part of has been read
+	bool done = false;
+	string error;
+};
+
+//! A block of a file that was read through a Python filesystem
+struct PythonFileBlock {
+	unsafe_unique_array<data_t> data;
+	//! The number of bytes in the block, smaller than the block size for the last block of the file
+	idx_t size;
+	//! The time the block was last read, used to evict the least recently used block
+	idx_t last_used;
+};
+
 class PythonFileHandle : public FileHandle {
 public:
-	PythonFileHandle(FileSystem &file_system, const string &path, const py::object &handle);
+	PythonFileHandle(FileSystem &file_system, const string &path, const py::object &handle, bool read_only,
+	                 idx_t block_size, idx_t readahead);
 	~PythonFileHandle() override;
 	void Close() override;
 
 	static const py::object &GetHandle(const FileHandle &handle);
 
+public:
+	//! Whether the file was opened for reading only, in which case its size and modification time are cached
+	bool read_only;
+	//! The size of the cached blocks, or 0 if reads are not cached
+	idx_t block_size;
+	//! The number of blocks that are read ahead after a block that was not cached yet
+	idx_t readahead;
+	//! The cached blocks, indexed by block number
+	unordered_map<idx_t, PythonFileBlock> blocks;
+	//! Logical clock used to track the usage of the blocks
+	idx_t block_clock = 0;
+	//! The position of the handle when reads are cached, the position of the Python file is not kept in sync
+	idx_t position = 0;
+	optional_idx file_size;
+	bool has_last_modified = false;
+	time_t last_modified = 0;
+	mutex lock;
+
+public:
+	idx_t MaxCachedBlocks() const;
+
 private:
 	py::object handle;
 };
@@ -45,12 +103,30 @@ class PythonFilesystem : public FileSystem {
 private:
 	const vector<string> protocols;
 	AbstractFileSystem filesystem;
+	//! Whether range reads of all threads are batched into cat_ranges calls (only for async filesystems)
+	const bool batch_reads;
+	mutex batch_lock;
+	std::condition_variable batch_cv;
+	//! Whether a thread is currently reading a batch
+	bool batch_in_flight = false;
+	vector<PythonRangeRequest *> pending_requests;
+
 	std::string DecodeFlags(FileOpenFlags flags);
 	bool Exists(const string &filename, const char *func_name) const;
+	//! Read a range of the file through the block cache of the handle
+	void ReadCached(PythonFileHandle &handle, data_ptr_t buffer, idx_t nr_bytes, idx_t location);
+	//! Add the data read for [start_block, end_block) to the block cache of the handle
+	void AddBlocks(PythonFileHandle &handle, idx_t start_block, idx_t end_block, const_data_ptr_t data, idx_t size);
+	//! Read a range of the file with a single Python call, returns the number of bytes read
+	idx_t ReadRange(PythonFileHandle &handle, data_ptr_t buffer, idx_t nr_bytes, idx_t location);
+	//! Queue a range read and wait until it was read as part of a batch
+	idx_t ReadRangeBatched(const string &path, data_ptr_t buffer, idx_t nr_bytes, idx_t location);
+	//! Read a batch of queued range reads with a single cat_ranges call
+	void ReadBatch(const vector<PythonRangeRequest *> &batch);
 
 public:
-	explicit PythonFilesystem(vector<string> protocols, AbstractFileSystem filesystem)
-	    : protocols(std::move(protocols)), filesystem(std::move(filesystem)) {
+	explicit PythonFilesystem(vector<string> protocols, AbstractFileSystem filesystem, bool batch_reads = false)
+	    : protocols(std::move(protocols)), filesystem(std::move(filesystem)), batch_reads(batch_reads) {
 	}
 	~PythonFilesystem() override;
 
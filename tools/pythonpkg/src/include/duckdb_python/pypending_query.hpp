@@ -0,0 +1,56 @@
+//===----------------------------------------------------------------------===//
+//                         DuckDB
+//
+// duckdb_python/pypending_query.hpp
+//
+//
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb_python/pybind11/pybind_wrapper.hpp"
+#include "duckdb.hpp"
+#include "duckdb/main/pending_query_result.hpp"
+
+#include <functional>
+
+namespace duckdb {
+
+//! A query that is executed by stepping through its tasks, which allows a single thread to drive many queries at once
+//! (see duckdb/aio.py)
+struct DuckDBPyPendingQuery {
+public:
+	//! Turns the result of the query into the object that is returned by Finish
+	typedef std::function<py::object(unique_ptr<QueryResult>)> finish_function_t;
+	//! How long tasks are executed for before the GIL is taken again, so other queries can be stepped in between
+	static constexpr idx_t TASK_SLICE_MS = 5;
+
+public:
+	DuckDBPyPendingQuery(shared_ptr<ClientContext> context, unique_ptr<PendingQueryResult> pending, py::object owner,
+	                     optional_ptr<mutex> lock, finish_function_t finish);
+
+public:
+	//! Execute tasks of the query with the GIL released, for at most TASK_SLICE_MS. Returns "ready" once the result is
+	//! available, "pending" if tasks were executed and "waiting" if the query is waiting for tasks that run on other
+	//! threads
+	string ExecuteTask();
+	//! Fetch the result of the query, blocking until it is available
+	py::object Finish();
+	//! Interrupt the query, it finishes with an InterruptException
+	void Interrupt();
+
+public:
+	static void Initialize(py::handle &m);
+
+private:
+	shared_ptr<ClientContext> context;
+	unique_ptr<PendingQueryResult> pending;
+	//! The connection or relation the query was started from, kept alive while the query is pending
+	py::object owner;
+	//! The lock that serializes the use of the connection, if any
+	optional_ptr<mutex> lock;
+	finish_function_t finish;
+	bool ready = false;
+};
+
+} // namespace duckdb
@@ -0,0 +1,39 @@
+//===----------------------------------------------------------------------===//
+//                         DuckDB
+//
+// duckdb_python/pyprepared_statement.hpp
+//
+//
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb_python/pybind11/pybind_wrapper.hpp"
+#include "duckdb.hpp"
+
+namespace duckdb {
+
+struct DuckDBPyConnection;
+
+struct DuckDBPyPreparedStatement {
+public:
+	DuckDBPyPreparedStatement(shared_ptr<DuckDBPyConnection> connection, shared_ptr<PreparedStatement> prepared,
+	                          string query);
+
+public:
+	shared_ptr<DuckDBPyConnection> Execute(py::object params = py::list());
+	const string &Query() const;
+	idx_t ParameterCount() const;
+	py::set NamedParameters() const;
+	StatementType Type() const;
+
+public:
+	static void Initialize(py::handle &m);
+
+private:
+	shared_ptr<DuckDBPyConnection> connection;
+	shared_ptr<PreparedStatement> prepared;
+	string query;
+};
+
+} // namespace duckdb
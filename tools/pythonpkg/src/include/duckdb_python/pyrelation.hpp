@@ -15,6 +15,7 @@
 #include "duckdb_python/numpy/numpy_type.hpp"
 #include "duckdb_python/pybind11/registered_py_object.hpp"
 #include "duckdb_python/pyresult.hpp"
+#include "duckdb_python/pypending_query.hpp"
 #include "duckdb/parser/statement/explain_statement.hpp"
 #include "duckdb_python/pybind11/conversions/explain_enum.hpp"
 #include "duckdb_python/pybind11/conversions/render_mode_enum.hpp"
@@ -174,10 +175,16 @@ public:
 
 	Optional<py::tuple> FetchOne();
 
+	py::object Iterate();
+
+	void EnablePrefetch();
+
 	py::list FetchAll();
 
 	py::list FetchMany(idx_t size);
 
+	py::list FetchRowChunk(const py::object &row_type, const py::object &fields, bool stream, bool prefetch);
+
 	py::dict FetchNumpy();
 
 	py::dict FetchPyTorch();
@@ -192,25 +199,40 @@ public:
 
 	duckdb::pyarrow::Table ToArrowTableInternal(idx_t batch_size, bool to_polars);
 
-	PolarsDataFrame ToPolars(idx_t batch_size);
+	py::object ToPolars(idx_t batch_size, bool lazy);
 
-	py::object ToArrowCapsule();
+	py::object ToArrowCapsule(const py::object &requested_schema = py::none());
 
 	duckdb::pyarrow::RecordBatchReader ToRecordBatch(idx_t batch_size);
 
+	//! Returns an async iterator over the Arrow record batches of the result
+	py::object FetchRecordBatchesAsync(idx_t batch_size);
+	//! Start executing the relation as a stream result, the result is set once the pending query is finished
+	unique_ptr<DuckDBPyPendingQuery> PendingQuery();
+	//! Execute a task of the stream result, see DuckDBPyResult::ExecuteStreamTask
+	string ExecuteStreamTask();
+	//! Fetch the next Arrow Record Batch of the result, None is returned once all rows are fetched
+	py::object FetchRecordBatch(idx_t batch_size);
+
 	unique_ptr<DuckDBPyRelation> Union(DuckDBPyRelation *other);
 
 	unique_ptr<DuckDBPyRelation> Except(DuckDBPyRelation *other);
 
 	unique_ptr<DuckDBPyRelation> Intersect(DuckDBPyRelation *other);
 
-	unique_ptr<DuckDBPyRelation> Map(py::function fun, Optional<py::object> schema);
+	unique_ptr<DuckDBPyRelation> Map(py::function fun, Optional<py::object> schema,
+	                                 const Optional<py::int_> &batch_size = py::none(),
+	                                 py::object executor = py::none());
 
 	unique_ptr<DuckDBPyRelation> Join(DuckDBPyRelation *other, const py::object &condition, const string &type);
 
 	void ToParquet(const string &filename, const py::object &compression = py::none(),
 	               const py::object &field_ids = py::none(), const py::object &row_group_size_bytes = py::none(),
-	               const py::object &row_group_size = py::none());
+	               const py::object &row_group_size = py::none(), const py::object &overwrite = py::none(),
+	               const py::object &per_thread_output = py::none(), const py::object &use_tmp_file = py::none(),
+	               const py::object &partition_by = py::none(), const py::object &write_partition_columns = py::none(),
+	               const py::object &append = py::none(), const py::object &row_groups_per_file = py::none(),
+	               const py::object &file_size_bytes = py::none());
 
 	void ToCSV(const string &filename, const py::object &sep = py::none(), const py::object &na_rep = py::none(),
 	           const py::object &header = py::none(), const py::object &quotechar = py::none(),
@@ -219,10 +241,10 @@ public:
 	           const py::object &encoding = py::none(), const py::object &compression = py::none(),
 	           const py::object &overwrite = py::none(), const py::object &per_thread_output = py::none(),
 	           const py::object &use_tmp_file = py::none(), const py::object &partition_by = py::none(),
-	           const py::object &write_partition_columns = py::none());
+	           const py::object &write_partition_columns = py::none(), const py::object &append = py::none());
 
 	// should this return a rel with the new view?
-	unique_ptr<DuckDBPyRelation> CreateView(const string &view_name, bool replace = true);
+	unique_ptr<DuckDBPyRelation> CreateView(const string &view_name, bool replace = true, bool temporary = false);
 
 	unique_ptr<DuckDBPyRelation> Query(const string &view_name, const string &sql_query);
 
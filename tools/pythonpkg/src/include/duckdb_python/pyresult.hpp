@@ -14,11 +14,15 @@
 #include "duckdb_python/python_objects.hpp"
 #include "duckdb_python/pybind11/dataframe.hpp"
 
+#include <future>
+
 namespace duckdb {
 
+class PrefetchWorker;
+
 struct DuckDBPyResult {
 public:
-	explicit DuckDBPyResult(unique_ptr<QueryResult> result);
+	explicit DuckDBPyResult(unique_ptr<QueryResult> result, const shared_ptr<ClientContext> &context = nullptr);
 	~DuckDBPyResult();
 
 public:
@@ -28,6 +32,9 @@ public:
 
 	py::list Fetchall();
 
+	//! Fetch the rows of the next chunk as instances of 'row_type', an empty list is returned once all rows are fetched
+	py::list FetchRowChunk(const py::object &row_type, const py::object &fields);
+
 	py::dict FetchNumpy();
 
 	py::dict FetchNumpyInternal(bool stream = false, idx_t vectors_per_chunk = 1,
@@ -46,6 +53,8 @@ public:
 	ArrowArrayStream FetchArrowArrayStream(idx_t rows_per_batch = 1000000);
 	duckdb::pyarrow::RecordBatchReader FetchRecordBatchReader(idx_t rows_per_batch = 1000000);
 	py::object FetchArrowCapsule(idx_t rows_per_batch = 1000000);
+	//! Fetch the next Arrow Record Batch of the result, None is returned once all rows are fetched
+	py::object FetchRecordBatch(idx_t rows_per_batch = 1000000);
 
 	static py::list GetDescription(const vector<string> &names, const vector<LogicalType> &types);
 
@@ -55,6 +64,13 @@ public:
 
 	unique_ptr<DataChunk> FetchChunk();
 
+	//! Fetch the next chunk of a stream result in the background while the rows of the current chunk are consumed
+	void EnablePrefetch();
+	//! Execute tasks of a stream result with the GIL released, for at most DuckDBPyPendingQuery::TASK_SLICE_MS. Returns
+	//! "ready" once the next chunk can be fetched, "pending" if tasks were executed and "waiting" if the query is
+	//! waiting for tasks that run on other threads
+	string ExecuteStreamTask();
+
 	const vector<string> &GetNames();
 	const vector<LogicalType> &GetTypes();
 
@@ -72,12 +88,28 @@ private:
 	unique_ptr<DataChunk> FetchNext(QueryResult &result);
 	unique_ptr<DataChunk> FetchNextRaw(QueryResult &result);
 	unique_ptr<NumpyResultConversion> InitializeNumpyConversion(bool pandas = false);
+	bool FetchRows();
+	void StartPrefetch();
+	unique_ptr<DataChunk> WaitForPrefetch();
+	//! Wait for the chunk that is fetched in the background, it is returned to be consumed before the rest of the
+	//! result
+	unique_ptr<DataChunk> TakePrefetch();
 
 private:
-	idx_t chunk_offset = 0;
+	idx_t row_offset = 0;
 
 	unique_ptr<QueryResult> result;
-	unique_ptr<DataChunk> current_chunk;
+	//! The context that produced the result, used to schedule the conversion of materialized results
+	weak_ptr<ClientContext> context;
+	//! The rows of the current chunk, converted to Python tuples
+	py::list current_rows;
+	//! Whether the next chunk should be fetched in the background
+	bool prefetch = false;
+	std::future<unique_ptr<DataChunk>> prefetched_chunk;
+	//! The thread that fetches the chunks in the background, it is shared by the results of the connection
+	shared_ptr<PrefetchWorker> prefetch_worker;
+	//! The scan state of the record batches fetched one at a time
+	unique_ptr<ChunkScanState> record_batch_scan_state;
 	// Holds the categories of Categorical/ENUM types
 	unordered_map<idx_t, py::list> categories;
 	// Holds the categorical type of Categorical/ENUM types
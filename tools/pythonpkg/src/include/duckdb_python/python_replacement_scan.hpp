@@ -5,6 +5,10 @@
 #include "duckdb/parser/tableref.hpp"
 #include "duckdb/function/replacement_scan.hpp"
 #include "duckdb_python/pybind11/pybind_wrapper.hpp"
+#include "duckdb_python/pybind11/registered_py_object.hpp"
+#include "duckdb/common/atomic.hpp"
+#include "duckdb/common/mutex.hpp"
+#include "duckdb/common/unordered_map.hpp"
 
 namespace duckdb {
 
@@ -19,4 +23,47 @@ public:
 	static unique_ptr<TableRef> ReplacementObject(const py::object &entry, const string &name, ClientContext &context);
 };
 
+//! A replacement of a Python object that is reused while the object is unchanged
+struct PythonReplacementCacheEntry {
+	//! A weak reference to the object that was replaced, compared by identity. Its callback evicts the entry once the
+	//! object is deleted, which releases the objects the replacement holds on to
+	unique_ptr<RegisteredObject> object;
+	//! Weak references to the objects whose identity changes when the replaced object is modified
+	unique_ptr<RegisteredObject> version;
+	//! The replacement, without the dependency on the replaced object
+	unique_ptr<TableRef> replacement;
+	//! The time the entry was last used, used to evict the least recently used entry
+	idx_t last_used;
+};
+
+//! Connection-level cache of the replacements of the Python objects that were found by name
+class PythonReplacementCache : public ClientContextState {
+public:
+	static constexpr const char *NAME = "python_replacement_cache";
+	static constexpr idx_t MAX_ENTRIES = 64;
+
+public:
+	~PythonReplacementCache() override;
+	static shared_ptr<PythonReplacementCache> Get(ClientContext &context);
+
+	//! Returns a copy of the cached replacement of the object, or nullptr if it is not cached or was modified
+	unique_ptr<TableRef> Lookup(const string &name, const py::object &entry);
+	//! Cache the replacement of the object, if the object can be cached
+	void Insert(const string &name, const py::object &entry, TableRef &replacement);
+	idx_t Size();
+	//! Drop the entry of the object that was deleted, called by the weak 'reference' to the object
+	void Evict(const string &name, const py::handle &reference);
+
+public:
+	atomic<idx_t> hits {0};
+	atomic<idx_t> misses {0};
+	//! The number of Python objects that were replaced, whether or not the replacement was cached
+	atomic<idx_t> replacements {0};
+
+private:
+	mutex lock;
+	unordered_map<string, PythonReplacementCacheEntry> entries;
+	idx_t clock = 0;
+};
+
 } // namespace duckdb
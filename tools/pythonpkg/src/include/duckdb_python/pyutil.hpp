@@ -53,6 +53,22 @@ struct PyUtil {
 	static Py_UCS4 *PyUnicode4ByteData(py::handle &obj) {
 		return PyUnicode_4BYTE_DATA(obj.ptr());
 	}
+
+	//! Call the function with the given arguments, or submit the call to the executor and wait for its result
+	//! Waiting on the future releases the GIL, which lets other threads dispatch their input in the meantime
+	//! Returns a new reference, or nullptr with the Python error indicator set
+	static PyObject *CallFunction(PyObject *function, PyObject *executor, const py::tuple &arguments) {
+		if (!executor) {
+			return PyObject_CallObject(function, arguments.ptr());
+		}
+		try {
+			auto future = py::handle(executor).attr("submit")(py::handle(function), *arguments);
+			return future.attr("result")().release().ptr();
+		} catch (py::error_already_set &e) {
+			e.restore();
+			return nullptr;
+		}
+	}
 };
 
 } // namespace duckdb
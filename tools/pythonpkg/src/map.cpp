@@ -7,25 +7,56 @@
 #include "duckdb_python/pandas/pandas_scan.hpp"
 #include "duckdb_python/pybind11/dataframe.hpp"
 #include "duckdb_python/pytype.hpp"
+#include "duckdb_python/pyutil.hpp"
 #include "duckdb_python/pybind11/dataframe.hpp"
 
 namespace duckdb {
 
 MapFunction::MapFunction()
-    : TableFunction("python_map_function", {LogicalType::TABLE, LogicalType::POINTER, LogicalType::POINTER}, nullptr,
-                    MapFunctionBind) {
+    : TableFunction(
+          "python_map_function",
+          {LogicalType::TABLE, LogicalType::POINTER, LogicalType::POINTER, LogicalType::POINTER, LogicalType::UBIGINT},
+          nullptr, MapFunctionBind, nullptr, MapFunctionInitLocal) {
 	in_out_function = MapFunctionExec;
+	in_out_function_final = MapFunctionFinal;
 }
 
 struct MapFunctionData : public TableFunctionData {
-	MapFunctionData() : function(nullptr) {
+	MapFunctionData() : function(nullptr), executor(nullptr), batch_size(0) {
 	}
 	PyObject *function;
+	//! The (optional) concurrent.futures.Executor the function calls are submitted to
+	PyObject *executor;
+	//! The minimum amount of rows passed to a single function call, 0 means one call per input chunk
+	idx_t batch_size;
 	vector<LogicalType> in_types, out_types;
 	vector<string> in_names, out_names;
 };
 
-static py::object FunctionCall(NumpyResultConversion &conversion, const vector<string> &names, PyObject *function) {
+struct MapFunctionLocalState : public LocalTableFunctionState {
+public:
+	MapFunctionLocalState() : buffered_count(0), output_count(0), output_offset(0) {
+	}
+	~MapFunctionLocalState() override {
+		py::gil_scoped_acquire acquire;
+		buffer.reset();
+		output_bind_data.clear();
+		output_df = py::none();
+	}
+
+public:
+	//! The input rows that are buffered until the batch is full
+	unique_ptr<NumpyResultConversion> buffer;
+	idx_t buffered_count;
+	//! The result of the last function call, which is emitted one chunk at a time
+	py::object output_df;
+	vector<PandasColumnBindData> output_bind_data;
+	idx_t output_count;
+	idx_t output_offset;
+};
+
+static py::object FunctionCall(NumpyResultConversion &conversion, const vector<string> &names, PyObject *function,
+                               PyObject *executor = nullptr) {
 	py::dict in_numpy_dict;
 	for (idx_t col_idx = 0; col_idx < names.size(); col_idx++) {
 		in_numpy_dict[names[col_idx].c_str()] = conversion.ToArray(col_idx);
@@ -34,7 +65,7 @@ static py::object FunctionCall(NumpyResultConversion &conversion, const vector<s
 	D_ASSERT(in_df.ptr());
 
 	D_ASSERT(function);
-	auto *df_obj = PyObject_CallObject(function, PyTuple_Pack(1, in_df.ptr()));
+	auto df_obj = PyUtil::CallFunction(function, executor, py::make_tuple(in_df));
 	if (!df_obj) {
 		PyErr_PrintEx(1);
 		throw InvalidInputException("Python error. See above for a stack trace.");
@@ -133,6 +164,15 @@ unique_ptr<FunctionData> MapFunction::MapFunctionBind(ClientContext &context, Ta
 	auto &data = *data_uptr;
 	data.function = reinterpret_cast<PyObject *>(input.inputs[1].GetPointer());
 	auto explicit_schema = reinterpret_cast<PyObject *>(input.inputs[2].GetPointer());
+	auto executor = reinterpret_cast<PyObject *>(input.inputs[3].GetPointer());
+	if (executor != Py_None) {
+		if (!py::hasattr(executor, "submit")) {
+			throw InvalidInputException("The 'executor' should be a concurrent.futures.Executor, i.e. provide a "
+			                            "'submit' method returning a Future");
+		}
+		data.executor = executor;
+	}
+	data.batch_size = input.inputs[4].GetValue<uint64_t>();
 
 	data.in_names = input.input_table_names;
 	data.in_types = input.input_table_types;
@@ -157,33 +197,25 @@ static string TypeVectorToString(const vector<LogicalType> &types) {
 	return StringUtil::Join(types, types.size(), ", ", [](const LogicalType &argument) { return argument.ToString(); });
 }
 
-OperatorResultType MapFunction::MapFunctionExec(ExecutionContext &context, TableFunctionInput &data_p, DataChunk &input,
-                                                DataChunk &output) {
-	py::gil_scoped_acquire acquire;
-
-	if (input.size() == 0) {
-		return OperatorResultType::NEED_MORE_INPUT;
-	}
-
-	auto &data = data_p.bind_data->Cast<MapFunctionData>();
-
-	D_ASSERT(input.GetTypes() == data.in_types);
-	NumpyResultConversion conversion(data.in_types, input.size(), context.client.GetClientProperties());
-	conversion.Append(input);
-
-	auto df = FunctionCall(conversion, data.in_names, data.function);
+unique_ptr<LocalTableFunctionState> MapFunction::MapFunctionInitLocal(ExecutionContext &context,
+                                                                      TableFunctionInitInput &input,
+                                                                      GlobalTableFunctionState *global_state) {
+	return make_uniq<MapFunctionLocalState>();
+}
 
+static vector<PandasColumnBindData> BindFunctionResult(ClientContext &context, const MapFunctionData &data,
+                                                       py::handle df, const vector<LogicalType> &output_types) {
 	vector<PandasColumnBindData> pandas_bind_data;
 	vector<LogicalType> pandas_return_types;
 	vector<string> pandas_names;
 
-	Pandas::Bind(context.client, df, pandas_bind_data, pandas_return_types, pandas_names);
-	if (pandas_return_types.size() != output.ColumnCount()) {
-		throw InvalidInputException("Expected %llu columns from UDF, got %llu", output.ColumnCount(),
+	Pandas::Bind(context, df, pandas_bind_data, pandas_return_types, pandas_names);
+	if (pandas_return_types.size() != output_types.size()) {
+		throw InvalidInputException("Expected %llu columns from UDF, got %llu", output_types.size(),
 		                            pandas_return_types.size());
 	}
-	D_ASSERT(output.GetTypes() == data.out_types);
-	if (pandas_return_types != output.GetTypes()) {
+	D_ASSERT(output_types == data.out_types);
+	if (pandas_return_types != output_types) {
 		throw InvalidInputException("UDF column type mismatch, expected [%s], got [%s]",
 		                            TypeVectorToString(data.out_types), TypeVectorToString(pandas_return_types));
 	}
@@ -191,11 +223,93 @@ OperatorResultType MapFunction::MapFunctionExec(ExecutionContext &context, Table
 		throw InvalidInputException("UDF column name mismatch, expected [%s], got [%s]",
 		                            StringUtil::Join(data.out_names, ", "), StringUtil::Join(pandas_names, ", "));
 	}
+	return pandas_bind_data;
+}
 
+static idx_t FunctionResultRowCount(py::handle df) {
 	auto df_columns = py::list(df.attr("columns"));
 	auto get_fun = df.attr("__getitem__");
+	return py::len(get_fun(df_columns[0]));
+}
+
+//! Call the function on the buffered rows, the result is emitted by EmitBufferedOutput
+static void FlushBufferedInput(ClientContext &context, const MapFunctionData &data, MapFunctionLocalState &state,
+                               DataChunk &output) {
+	D_ASSERT(state.buffer && state.buffered_count > 0);
+	auto df = FunctionCall(*state.buffer, data.in_names, data.function, data.executor);
+	state.buffer.reset();
+	state.buffered_count = 0;
+
+	state.output_bind_data = BindFunctionResult(context, data, df, output.GetTypes());
+	state.output_df = std::move(df);
+	state.output_count = FunctionResultRowCount(state.output_df);
+	state.output_offset = 0;
+}
 
-	idx_t row_count = py::len(get_fun(df_columns[0]));
+//! Emit the next chunk of the last function result, returns whether there is more output remaining
+static bool EmitBufferedOutput(MapFunctionLocalState &state, DataChunk &output) {
+	auto remaining = state.output_count - state.output_offset;
+	auto row_count = MinValue<idx_t>(remaining, STANDARD_VECTOR_SIZE);
+	for (idx_t col_idx = 0; col_idx < output.ColumnCount(); col_idx++) {
+		auto &bind_data = state.output_bind_data[col_idx];
+		PandasScanFunction::PandasBackendScanSwitch(bind_data, row_count, state.output_offset, output.data[col_idx]);
+	}
+	output.SetCardinality(row_count);
+	state.output_offset += row_count;
+	if (state.output_offset < state.output_count) {
+		return true;
+	}
+	// The result has been emitted completely
+	// we hold on to the DataFrame until the next call, because the output can reference its arrays
+	state.output_count = 0;
+	state.output_offset = 0;
+	return false;
+}
+
+static OperatorResultType MapFunctionExecBatched(ExecutionContext &context, const MapFunctionData &data,
+                                                 MapFunctionLocalState &state, DataChunk &input, DataChunk &output) {
+	if (state.output_count > 0) {
+		// The input has already been consumed, we are emitting the result of the last function call
+		return EmitBufferedOutput(state, output) ? OperatorResultType::HAVE_MORE_OUTPUT
+		                                         : OperatorResultType::NEED_MORE_INPUT;
+	}
+	if (!state.buffer) {
+		// the buffer grows with the input, a large batch size does not allocate the whole batch up front
+		state.buffer = make_uniq<NumpyResultConversion>(data.in_types, MaxValue<idx_t>(input.size(), 1),
+		                                                context.client.GetClientProperties());
+	}
+	state.buffer->Append(input);
+	state.buffered_count += input.size();
+	if (state.buffered_count < data.batch_size) {
+		return OperatorResultType::NEED_MORE_INPUT;
+	}
+	FlushBufferedInput(context.client, data, state, output);
+	return EmitBufferedOutput(state, output) ? OperatorResultType::HAVE_MORE_OUTPUT
+	                                         : OperatorResultType::NEED_MORE_INPUT;
+}
+
+OperatorResultType MapFunction::MapFunctionExec(ExecutionContext &context, TableFunctionInput &data_p, DataChunk &input,
+                                                DataChunk &output) {
+	py::gil_scoped_acquire acquire;
+
+	auto &data = data_p.bind_data->Cast<MapFunctionData>();
+	auto &state = data_p.local_state->Cast<MapFunctionLocalState>();
+	if (data.batch_size > 0) {
+		return MapFunctionExecBatched(context, data, state, input, output);
+	}
+
+	if (input.size() == 0) {
+		return OperatorResultType::NEED_MORE_INPUT;
+	}
+
+	D_ASSERT(input.GetTypes() == data.in_types);
+	NumpyResultConversion conversion(data.in_types, input.size(), context.client.GetClientProperties());
+	conversion.Append(input);
+
+	auto df = FunctionCall(conversion, data.in_names, data.function, data.executor);
+	auto pandas_bind_data = BindFunctionResult(context.client, data, df, output.GetTypes());
+
+	idx_t row_count = FunctionResultRowCount(df);
 	if (row_count > STANDARD_VECTOR_SIZE) {
 		throw InvalidInputException("UDF returned more than %llu rows, which is not allowed.", STANDARD_VECTOR_SIZE);
 	}
@@ -208,4 +322,21 @@ OperatorResultType MapFunction::MapFunctionExec(ExecutionContext &context, Table
 	return OperatorResultType::NEED_MORE_INPUT;
 }
 
+OperatorFinalizeResultType MapFunction::MapFunctionFinal(ExecutionContext &context, TableFunctionInput &data_p,
+                                                         DataChunk &output) {
+	py::gil_scoped_acquire acquire;
+
+	auto &data = data_p.bind_data->Cast<MapFunctionData>();
+	auto &state = data_p.local_state->Cast<MapFunctionLocalState>();
+	if (state.output_count == 0) {
+		if (state.buffered_count == 0) {
+			return OperatorFinalizeResultType::FINISHED;
+		}
+		// Call the function on the remaining rows that did not fill up a batch
+		FlushBufferedInput(context.client, data, state, output);
+	}
+	return EmitBufferedOutput(state, output) ? OperatorFinalizeResultType::HAVE_MORE_OUTPUT
+	                                         : OperatorFinalizeResultType::FINISHED;
+}
+
 } // namespace duckdb
@@ -1,5 +1,7 @@
 #include "duckdb_python/numpy/array_wrapper.hpp"
 #include "duckdb_python/numpy/numpy_result_conversion.hpp"
+#include "duckdb/common/types/column/column_data_collection.hpp"
+#include "duckdb/parallel/task_executor.hpp"
 
 namespace duckdb {
 
@@ -10,6 +12,7 @@ NumpyResultConversion::NumpyResultConversion(const vector<LogicalType> &types, i
 	for (auto &type : types) {
 		owned_data.emplace_back(type, client_properties, pandas);
 	}
+	views.resize(types.size());
 	Resize(initial_capacity);
 }
 
@@ -28,7 +31,7 @@ void NumpyResultConversion::Resize(idx_t new_capacity) {
 
 void NumpyResultConversion::Append(DataChunk &chunk) {
 	if (count + chunk.size() > capacity) {
-		Resize(capacity * 2);
+		Resize(MaxValue<idx_t>(capacity * 2, count + chunk.size()));
 	}
 	auto chunk_types = chunk.GetTypes();
 	auto source_offset = 0;
@@ -46,4 +49,170 @@ void NumpyResultConversion::Append(DataChunk &chunk) {
 #endif
 }
 
+//! Whether converting a column of this type creates Python objects, which requires holding the GIL
+static bool ConversionRequiresGIL(const LogicalType &type) {
+	switch (type.id()) {
+	case LogicalTypeId::BOOLEAN:
+	case LogicalTypeId::TINYINT:
+	case LogicalTypeId::SMALLINT:
+	case LogicalTypeId::INTEGER:
+	case LogicalTypeId::BIGINT:
+	case LogicalTypeId::UTINYINT:
+	case LogicalTypeId::USMALLINT:
+	case LogicalTypeId::UINTEGER:
+	case LogicalTypeId::UBIGINT:
+	case LogicalTypeId::HUGEINT:
+	case LogicalTypeId::UHUGEINT:
+	case LogicalTypeId::FLOAT:
+	case LogicalTypeId::DOUBLE:
+	case LogicalTypeId::DECIMAL:
+	case LogicalTypeId::TIMESTAMP:
+	case LogicalTypeId::TIMESTAMP_TZ:
+	case LogicalTypeId::TIMESTAMP_SEC:
+	case LogicalTypeId::TIMESTAMP_MS:
+	case LogicalTypeId::TIMESTAMP_NS:
+	case LogicalTypeId::DATE:
+	case LogicalTypeId::INTERVAL:
+	case LogicalTypeId::ENUM:
+		return false;
+	default:
+		return true;
+	}
+}
+
+class NumpyConversionTask : public BaseExecutorTask {
+public:
+	NumpyConversionTask(TaskExecutor &executor, NumpyResultConversion &conversion, ColumnDataCollection &collection,
+	                    column_t column_id, idx_t offset)
+	    : BaseExecutorTask(executor), conversion(conversion), collection(collection), column_id(column_id),
+	      offset(offset) {
+	}
+
+	void ExecuteTask() override {
+		conversion.AppendColumns(collection, {column_id}, offset);
+	}
+
+private:
+	NumpyResultConversion &conversion;
+	ColumnDataCollection &collection;
+	column_t column_id;
+	idx_t offset;
+};
+
+void NumpyResultConversion::AppendColumns(ColumnDataCollection &collection, const vector<column_t> &column_ids,
+                                          idx_t offset) {
+	ColumnDataScanState scan_state;
+	collection.InitializeScan(scan_state, column_ids);
+	DataChunk chunk;
+	collection.InitializeScanChunk(scan_state, chunk);
+	while (collection.Scan(scan_state, chunk)) {
+		for (idx_t i = 0; i < column_ids.size(); i++) {
+			owned_data[column_ids[i]].Append(offset, chunk.data[i], chunk.size());
+		}
+		offset += chunk.size();
+	}
+}
+
+void NumpyResultConversion::Append(ColumnDataCollection &collection, ClientContext &context) {
+	D_ASSERT(collection.ColumnCount() == owned_data.size());
+	auto to_append = collection.Count();
+	if (count + to_append > capacity) {
+		Resize(count + to_append);
+	}
+	// The columns that don't create Python objects are converted by the task scheduler without holding the GIL,
+	// the others are converted by this thread in the meantime
+	TaskExecutor executor(context);
+	vector<column_t> gil_columns;
+	for (idx_t col_idx = 0; col_idx < owned_data.size(); col_idx++) {
+		if (ConversionRequiresGIL(collection.Types()[col_idx])) {
+			gil_columns.push_back(col_idx);
+			continue;
+		}
+		executor.ScheduleTask(make_uniq<NumpyConversionTask>(executor, *this, collection, col_idx, count));
+	}
+	std::exception_ptr error;
+	try {
+		if (!gil_columns.empty()) {
+			AppendColumns(collection, gil_columns, count);
+		}
+	} catch (...) {
+		// the scheduled tasks still reference the conversion, they have to finish before we can throw
+		error = std::current_exception();
+	}
+	{
+		py::gil_scoped_release release;
+		executor.WorkOnTasks();
+	}
+	if (error) {
+		std::rethrow_exception(error);
+	}
+	count += to_append;
+}
+
+//! Whether the NumPy array of this type has the same layout as the DuckDB vector
+static bool IsZeroCopyType(const LogicalType &type) {
+	switch (type.id()) {
+	case LogicalTypeId::BOOLEAN:
+	case LogicalTypeId::TINYINT:
+	case LogicalTypeId::SMALLINT:
+	case LogicalTypeId::INTEGER:
+	case LogicalTypeId::BIGINT:
+	case LogicalTypeId::UTINYINT:
+	case LogicalTypeId::USMALLINT:
+	case LogicalTypeId::UINTEGER:
+	case LogicalTypeId::UBIGINT:
+	case LogicalTypeId::FLOAT:
+	case LogicalTypeId::DOUBLE:
+		return true;
+	default:
+		return false;
+	}
+}
+
+//! The data of a result that is kept alive by the arrays that are views over it
+struct ZeroCopyData {
+	explicit ZeroCopyData(ColumnDataCollection &parent) : collection(parent) {
+	}
+
+	ColumnDataCollection collection;
+	DataChunk chunk;
+};
+
+bool NumpyResultConversion::AppendZeroCopy(ColumnDataCollection &collection) {
+	// Every chunk of a collection is allocated separately, so only a single chunk is contiguous in memory.
+	// Buffer-managed blocks can be evicted, the arrays can only point into collections that are kept in memory
+	if (count != 0 || collection.ChunkCount() != 1 ||
+	    collection.GetAllocatorType() != ColumnDataAllocatorType::IN_MEMORY_ALLOCATOR) {
+		return false;
+	}
+	auto data = make_uniq<ZeroCopyData>(collection);
+	data->collection.Combine(collection);
+	data->collection.InitializeScanChunk(data->chunk);
+	data->collection.FetchChunk(0, data->chunk);
+
+	auto &chunk = data->chunk;
+	auto to_append = chunk.size();
+	if (to_append > capacity) {
+		Resize(to_append);
+	}
+	py::capsule base(data.release(), [](void *ptr) { delete reinterpret_cast<ZeroCopyData *>(ptr); });
+	for (idx_t col_idx = 0; col_idx < owned_data.size(); col_idx++) {
+		auto &input = chunk.data[col_idx];
+		if (IsZeroCopyType(input.GetType()) && input.GetVectorType() == VectorType::FLAT_VECTOR &&
+		    FlatVector::Validity(input).CheckAllValid(to_append)) {
+			auto dtype = py::dtype(RawArrayWrapper::DuckDBToNumpyDtype(input.GetType()));
+			vector<py::ssize_t> shape {py::ssize_t(to_append)};
+			views[col_idx] = py::array(dtype, shape, {}, FlatVector::GetData(input), base);
+			// the memory belongs to DuckDB, the array can not be written to
+			views[col_idx].attr("setflags")(py::arg("write") = false);
+			// release the array that was allocated for the conversion
+			owned_data[col_idx].Initialize(0);
+			continue;
+		}
+		owned_data[col_idx].Append(count, input, to_append);
+	}
+	count += to_append;
+	return true;
+}
+
 } // namespace duckdb
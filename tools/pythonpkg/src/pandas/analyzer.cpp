@@ -461,7 +461,8 @@ uint64_t PandasAnalyzer::GetSampleIncrement(idx_t rows) {
 	return rows / sample;
 }
 
-LogicalType PandasAnalyzer::InnerAnalyze(py::object column, bool &can_convert, idx_t increment) {
+LogicalType PandasAnalyzer::InnerAnalyze(py::object column, bool &can_convert, idx_t increment,
+                                         vector<std::pair<idx_t, py::object>> *samples) {
 	idx_t rows = py::len(column);
 
 	if (rows == 0) {
@@ -480,15 +481,28 @@ LogicalType PandasAnalyzer::InnerAnalyze(py::object column, bool &can_convert, i
 
 	LogicalType item_type = LogicalType::SQLNULL;
 	vector<LogicalType> types;
+	idx_t unchanged = 0;
 	for (idx_t i = 0; i < rows; i += increment) {
 		auto obj = row(i);
+		if (samples) {
+			samples->emplace_back(i, obj);
+		}
 		auto next_item_type = GetItemType(obj, can_convert);
 		types.push_back(next_item_type);
 
+		auto previous_type = item_type;
 		if (!can_convert || !UpgradeType(item_type, next_item_type)) {
 			can_convert = false;
 			return next_item_type;
 		}
+		if (next_item_type.id() == LogicalTypeId::SQLNULL) {
+			// NULLs don't tell us anything about the type
+			continue;
+		}
+		unchanged = item_type == previous_type ? unchanged + 1 : 0;
+		if (early_exit != 0 && unchanged >= early_exit) {
+			break;
+		}
 	}
 
 	if (can_convert && item_type.id() == LogicalTypeId::STRUCT) {
@@ -498,14 +512,152 @@ LogicalType PandasAnalyzer::InnerAnalyze(py::object column, bool &can_convert, i
 	return item_type;
 }
 
+//! The result of analyzing an object column, which is reused as long as the sampled rows hold the same objects
+struct PandasAnalyzedColumn {
+	uintptr_t data;
+	idx_t rows;
+	int64_t stride;
+	uint64_t sample_size;
+	uint64_t early_exit;
+	//! The sampled rows and the objects they held, the references keep the objects (and their addresses) alive
+	vector<std::pair<idx_t, py::object>> samples;
+	bool can_convert;
+	LogicalType type;
+};
+
+PandasAnalyzerCache::~PandasAnalyzerCache() {
+	py::gil_scoped_acquire acquire;
+	entries.clear();
+}
+
+shared_ptr<PandasAnalyzerCache> PandasAnalyzerCache::Get(const ClientContext &context) {
+	return context.registered_state->GetOrCreate<PandasAnalyzerCache>(NAME);
+}
+
+void PandasAnalyzerCache::Evict() {
+	for (idx_t i = entries.size(); i > 0; i--) {
+		for (auto &sample : entries[i - 1]->samples) {
+			if (Py_REFCNT(sample.second.ptr()) == 1) {
+				// the cache holds the last reference, the column no longer exists (or was modified)
+				entries.erase_at(i - 1);
+				break;
+			}
+		}
+	}
+}
+
+static bool SamplesMatch(const py::array &values, const PandasAnalyzedColumn &entry) {
+	auto data = reinterpret_cast<const char *>(values.data());
+	for (auto &sample : entry.samples) {
+		auto object = *reinterpret_cast<PyObject *const *>(data + sample.first * entry.stride);
+		if (object != sample.second.ptr()) {
+			return false;
+		}
+	}
+	return true;
+}
+
+//! Whether the analyzed type of the object can only change when it is replaced by another object
+static bool IsImmutable(py::handle object) {
+	switch (GetPythonObjectType(object)) {
+	case PythonObjectType::None:
+	case PythonObjectType::Integer:
+	case PythonObjectType::Float:
+	case PythonObjectType::Bool:
+	case PythonObjectType::Decimal:
+	case PythonObjectType::Uuid:
+	case PythonObjectType::Datetime:
+	case PythonObjectType::Date:
+	case PythonObjectType::Time:
+	case PythonObjectType::Timedelta:
+	case PythonObjectType::String:
+	case PythonObjectType::Bytes:
+	case PythonObjectType::NdDatetime:
+		return true;
+	default:
+		// containers can be modified in place, which is not visible from the identity of the sampled objects
+		return false;
+	}
+}
+
 bool PandasAnalyzer::Analyze(py::object column) {
 	// Disable analyze
 	if (sample_size == 0) {
 		return false;
 	}
-	bool can_convert = true;
+	py::array values;
+	if (cache) {
+		// The object array of the column, DataFrames return a new Series (and array) object for every lookup so the
+		// identity of the column is its data pointer, the cached result is only used if the sample is unchanged
+		auto array = column.attr("__array__")();
+		if (py::isinstance<py::array>(array)) {
+			values = py::reinterpret_borrow<py::array>(array);
+		}
+	}
+	if (!values || values.ndim() != 1 || values.dtype().kind() != 'O') {
+		bool can_convert = true;
+		LogicalType type;
+		AnalyzeInternal(column, can_convert, type, nullptr);
+		if (can_convert) {
+			analyzed_type = type;
+		}
+		return can_convert;
+	}
+
+	auto &analyzed_columns = cache->entries;
+	auto data = CastPointerToValue(values.data());
+	idx_t rows = NumericCast<idx_t>(values.shape(0));
+	int64_t stride = values.strides(0);
+	for (idx_t i = 0; i < analyzed_columns.size(); i++) {
+		auto &entry = *analyzed_columns[i];
+		if (entry.data != data || entry.rows != rows || entry.stride != stride || entry.sample_size != sample_size ||
+		    entry.early_exit != early_exit) {
+			continue;
+		}
+		if (!SamplesMatch(values, entry)) {
+			// The column was modified, analyze it again
+			analyzed_columns.erase_at(i);
+			break;
+		}
+		if (entry.can_convert) {
+			analyzed_type = entry.type;
+		}
+		return entry.can_convert;
+	}
+
+	auto entry = make_uniq<PandasAnalyzedColumn>();
+	entry->can_convert = true;
+	auto cacheable = AnalyzeInternal(column, entry->can_convert, entry->type, &entry->samples);
+	for (auto &sample : entry->samples) {
+		if (!IsImmutable(sample.second)) {
+			cacheable = false;
+			break;
+		}
+	}
+	if (entry->can_convert) {
+		analyzed_type = entry->type;
+	}
+	auto can_convert = entry->can_convert;
+	if (cacheable) {
+		entry->data = data;
+		entry->rows = rows;
+		entry->stride = stride;
+		entry->sample_size = sample_size;
+		entry->early_exit = early_exit;
+		cache->Evict();
+		if (analyzed_columns.size() >= PandasAnalyzerCache::MAX_ENTRIES) {
+			analyzed_columns.erase_at(0);
+		}
+		analyzed_columns.push_back(std::move(entry));
+	}
+	return can_convert;
+}
+
+//! Returns whether the result only depends on the sampled rows
+bool PandasAnalyzer::AnalyzeInternal(py::object column, bool &can_convert, LogicalType &type,
+                                     vector<std::pair<idx_t, py::object>> *samples) {
 	idx_t increment = GetSampleIncrement(py::len(column));
-	LogicalType type = InnerAnalyze(column, can_convert, increment);
+	type = InnerAnalyze(column, can_convert, increment, samples);
 
 	if (type == LogicalType::SQLNULL && increment > 1) {
 		// We did not see the whole dataset, hence we are not sure if nulls are really nulls
@@ -516,12 +668,10 @@ bool PandasAnalyzer::Analyze(py::object column) {
 			auto row = column.attr("__getitem__");
 			auto obj = row(first_valid_index);
 			type = GetItemType(obj, can_convert);
+			return false;
 		}
 	}
-	if (can_convert) {
-		analyzed_type = type;
-	}
-	return can_convert;
+	return true;
 }
 
 } // namespace duckdb
@@ -1,6 +1,8 @@
 #include "duckdb_python/pandas/pandas_bind.hpp"
 #include "duckdb_python/pandas/pandas_analyzer.hpp"
 #include "duckdb_python/pandas/column/pandas_numpy_column.hpp"
+#include "duckdb_python/pandas/column/pandas_arrow_column.hpp"
+#include "duckdb_python/pyconnection/pyconnection.hpp"
 
 namespace duckdb {
 
@@ -43,6 +45,45 @@ private:
 
 }; // namespace
 
+//! Export the Arrow string array that backs a pandas array (i.e. string[pyarrow]), so it can be scanned directly
+static unique_ptr<PandasArrowColumn> TryBindArrowStrings(const py::object &pandas_array) {
+	if (!ModuleIsLoaded<PyarrowCacheItem>()) {
+		return nullptr;
+	}
+	py::object chunked_array;
+	if (py::hasattr(pandas_array, "_pa_array")) {
+		chunked_array = pandas_array.attr("_pa_array");
+	} else if (py::hasattr(pandas_array, "_data")) {
+		// Before pandas 2.1 the ChunkedArray was stored in '_data'
+		chunked_array = pandas_array.attr("_data");
+	} else {
+		return nullptr;
+	}
+	auto &import_cache = *DuckDBPyConnection::ImportCache();
+	if (!py::isinstance(chunked_array, import_cache.pyarrow.ChunkedArray())) {
+		return nullptr;
+	}
+	auto result = make_uniq<PandasArrowColumn>();
+	idx_t row_offset = 0;
+	for (auto &chunk : chunked_array.attr("chunks")) {
+		auto array = make_uniq<ArrowArrayWrapper>();
+		ArrowSchemaWrapper schema;
+		chunk.attr("_export_to_c")(reinterpret_cast<uint64_t>(&array->arrow_array),
+		                           reinterpret_cast<uint64_t>(&schema.arrow_schema));
+		string format(schema.arrow_schema.format);
+		if (format == "U") {
+			result->large_offsets = true;
+		} else if (format != "u") {
+			// Not a (large) utf8 array, fall back to converting it to NumPy
+			return nullptr;
+		}
+		result->chunk_offsets.push_back(row_offset);
+		row_offset += NumericCast<idx_t>(array->arrow_array.length);
+		result->chunks.push_back(std::move(array));
+	}
+	return result;
+}
+
 static LogicalType BindColumn(PandasBindColumn &column_p, PandasColumnBindData &bind_data,
                               const ClientContext &context) {
 	LogicalType column_type;
@@ -92,7 +133,12 @@ static LogicalType BindColumn(PandasBindColumn &column_p, PandasColumnBindData &
 		column_type = NumpyToLogicalType(bind_data.numpy_type);
 	} else {
 		auto pandas_array = column.attr("array");
-		if (py::hasattr(pandas_array, "_data")) {
+		unique_ptr<PandasArrowColumn> arrow_column;
+		if (bind_data.numpy_type.type == NumpyNullableType::STRING &&
+		    (arrow_column = TryBindArrowStrings(pandas_array))) {
+			// The strings are read from the Arrow buffers, instead of from Python objects
+			bind_data.pandas_col = std::move(arrow_column);
+		} else if (py::hasattr(pandas_array, "_data")) {
 			// This means we can access the numpy array directly
 			bind_data.pandas_col = make_uniq<PandasNumpyColumn>(column.attr("array").attr("_data"));
 		} else if (py::hasattr(pandas_array, "asi8")) {
@@ -7,6 +7,7 @@
 #include "duckdb_python/numpy/numpy_bind.hpp"
 #include "duckdb/main/client_context.hpp"
 #include "duckdb_python/pandas/column/pandas_numpy_column.hpp"
+#include "duckdb_python/pandas/column/pandas_arrow_column.hpp"
 #include "duckdb/parser/tableref/table_function_ref.hpp"
 
 #include "duckdb/common/atomic.hpp"
@@ -36,13 +37,17 @@ struct PandasScanFunctionData : public TableFunctionData {
 };
 
 struct PandasScanLocalState : public LocalTableFunctionState {
-	PandasScanLocalState(idx_t start, idx_t end) : start(start), end(end), batch_index(0) {
+	PandasScanLocalState(idx_t start, idx_t end) : start(start), end(end), batch_index(0), partition_start(0) {
 	}
 
 	idx_t start;
 	idx_t end;
 	idx_t batch_index;
 	vector<column_t> column_ids;
+	//! The row at which the current partition starts
+	idx_t partition_start;
+	//! The object columns that have been converted for the current partition
+	vector<unique_ptr<Vector>> object_batches;
 };
 
 struct PandasScanGlobalState : public GlobalTableFunctionState {
@@ -121,6 +126,7 @@ unique_ptr<LocalTableFunctionState> PandasScanFunction::PandasScanInitLocal(Exec
                                                                             GlobalTableFunctionState *gstate) {
 	auto result = make_uniq<PandasScanLocalState>(0, 0);
 	result->column_ids = input.column_ids;
+	result->object_batches.resize(input.column_ids.size());
 	PandasScanParallelStateNext(context.client, input.bind_data.get(), result.get(), gstate);
 	return std::move(result);
 }
@@ -151,6 +157,10 @@ bool PandasScanFunction::PandasScanParallelStateNext(ClientContext &context, con
 	}
 	state.end = parallel_state.position;
 	state.batch_index = parallel_state.batch_index++;
+	state.partition_start = state.start;
+	for (auto &object_batch : state.object_batches) {
+		object_batch.reset();
+	}
 	return true;
 }
 
@@ -164,6 +174,47 @@ double PandasScanFunction::PandasProgress(ClientContext &context, const Function
 	return percentage;
 }
 
+template <class OFFSET_TYPE>
+static void ScanArrowStringArray(const ArrowArray &array, idx_t source_offset, idx_t count, Vector &out,
+                                 idx_t target_offset) {
+	auto validity = reinterpret_cast<const uint8_t *>(array.buffers[0]);
+	auto offsets = reinterpret_cast<const OFFSET_TYPE *>(array.buffers[1]);
+	auto data = reinterpret_cast<const char *>(array.buffers[2]);
+	auto tgt_ptr = FlatVector::GetData<string_t>(out);
+	auto &mask = FlatVector::Validity(out);
+	for (idx_t i = 0; i < count; i++) {
+		auto row = NumericCast<idx_t>(array.offset) + source_offset + i;
+		if (validity && !(validity[row / 8] & (1 << (row % 8)))) {
+			mask.SetInvalid(target_offset + i);
+			continue;
+		}
+		auto length = UnsafeNumericCast<uint32_t>(offsets[row + 1] - offsets[row]);
+		// The Arrow buffers are kept alive by the bind data, so the strings don't have to be copied
+		tgt_ptr[target_offset + i] = string_t(data + offsets[row], length);
+	}
+}
+
+static void ScanArrowStrings(PandasArrowColumn &column, idx_t count, idx_t offset, Vector &out) {
+	auto &chunk_offsets = column.chunk_offsets;
+	auto entry = std::upper_bound(chunk_offsets.begin(), chunk_offsets.end(), offset);
+	D_ASSERT(entry != chunk_offsets.begin());
+	idx_t chunk_idx = NumericCast<idx_t>(entry - chunk_offsets.begin()) - 1;
+	idx_t scanned = 0;
+	while (scanned < count) {
+		D_ASSERT(chunk_idx < column.chunks.size());
+		auto &array = column.chunks[chunk_idx]->arrow_array;
+		auto source_offset = offset + scanned - chunk_offsets[chunk_idx];
+		auto to_scan = MinValue<idx_t>(count - scanned, NumericCast<idx_t>(array.length) - source_offset);
+		if (column.large_offsets) {
+			ScanArrowStringArray<int64_t>(array, source_offset, to_scan, out, scanned);
+		} else {
+			ScanArrowStringArray<int32_t>(array, source_offset, to_scan, out, scanned);
+		}
+		scanned += to_scan;
+		chunk_idx++;
+	}
+}
+
 void PandasScanFunction::PandasBackendScanSwitch(PandasColumnBindData &bind_data, idx_t count, idx_t offset,
                                                  Vector &out) {
 	auto backend = bind_data.pandas_col->Backend();
@@ -172,12 +223,38 @@ void PandasScanFunction::PandasBackendScanSwitch(PandasColumnBindData &bind_data
 		NumpyScan::Scan(bind_data, count, offset, out);
 		break;
 	}
+	case PandasColumnBackend::ARROW: {
+		ScanArrowStrings(reinterpret_cast<PandasArrowColumn &>(*bind_data.pandas_col), count, offset, out);
+		break;
+	}
 	default: {
 		throw NotImplementedException("Type not implemented for PandasColumnBackend");
 	}
 	}
 }
 
+//! Whether scanning the column creates Python objects, see NumpyScan::ScanObjectColumn
+static bool ScanRequiresGIL(const PandasColumnBindData &bind_data, const LogicalType &type) {
+	return bind_data.pandas_col->Backend() == PandasColumnBackend::NUMPY &&
+	       bind_data.numpy_type.type == NumpyNullableType::OBJECT && type.id() != LogicalTypeId::VARCHAR;
+}
+
+//! Object columns are converted for the whole partition at once, so the GIL is acquired once per partition instead of
+//! once per vector, the vectors are slices of the converted partition
+static void ScanObjectPartition(PandasColumnBindData &bind_data, PandasScanLocalState &state, idx_t idx, idx_t count,
+                                Vector &out) {
+	auto &object_batch = state.object_batches[idx];
+	if (!object_batch) {
+		auto &numpy_col = reinterpret_cast<PandasNumpyColumn &>(*bind_data.pandas_col);
+		auto partition_size = state.end - state.partition_start;
+		object_batch = make_uniq<Vector>(out.GetType(), partition_size);
+		auto src_ptr = (PyObject **)numpy_col.array.data(); // NOLINT
+		NumpyScan::ScanObjectColumn(src_ptr, numpy_col.stride, partition_size, state.partition_start, *object_batch);
+	}
+	auto batch_offset = state.start - state.partition_start;
+	out.Slice(*object_batch, batch_offset, batch_offset + count);
+}
+
 //! The main pandas scan function: note that this can be called in parallel without the GIL
 //! hence this needs to be GIL-safe, i.e. no methods that create Python objects are allowed
 void PandasScanFunction::PandasScanFunc(ClientContext &context, TableFunctionInput &data_p, DataChunk &output) {
@@ -196,6 +273,8 @@ void PandasScanFunction::PandasScanFunc(ClientContext &context, TableFunctionInp
 		auto col_idx = state.column_ids[idx];
 		if (col_idx == COLUMN_IDENTIFIER_ROW_ID) {
 			output.data[idx].Sequence(state.start, 1, this_count);
+		} else if (ScanRequiresGIL(data.pandas_bind_data[col_idx], output.data[idx].GetType())) {
+			ScanObjectPartition(data.pandas_bind_data[col_idx], state, idx, this_count, output.data[idx]);
 		} else {
 			PandasBackendScanSwitch(data.pandas_bind_data[col_idx], this_count, state.start, output.data[idx]);
 		}
@@ -9,6 +9,8 @@
 #include "duckdb/function/table/read_csv.hpp"
 #include "duckdb/main/client_config.hpp"
 #include "duckdb/main/client_context.hpp"
+#include "duckdb/main/client_data.hpp"
+#include "duckdb/catalog/catalog_search_path.hpp"
 #include "duckdb/main/config.hpp"
 #include "duckdb/main/db_instance_cache.hpp"
 #include "duckdb/main/extension_helper.hpp"
@@ -29,6 +31,8 @@
 #include "duckdb_python/pandas/pandas_scan.hpp"
 #include "duckdb_python/pyrelation.hpp"
 #include "duckdb_python/pystatement.hpp"
+#include "duckdb_python/pyprepared_statement.hpp"
+#include "duckdb_python/pypending_query.hpp"
 #include "duckdb_python/pyresult.hpp"
 #include "duckdb_python/python_conversion.hpp"
 #include "duckdb_python/numpy/numpy_type.hpp"
@@ -58,6 +62,14 @@
 #include "duckdb/main/relation/materialized_relation.hpp"
 #include "duckdb/main/relation/query_relation.hpp"
 #include "duckdb/main/extension_util.hpp"
+#include "duckdb/parser/statement/insert_statement.hpp"
+#include "duckdb/parser/query_node/select_node.hpp"
+#include "duckdb/parser/tableref/expressionlistref.hpp"
+#include "duckdb/parser/tableref/column_data_ref.hpp"
+#include "duckdb/parser/expression/parameter_expression.hpp"
+#include "duckdb/parser/expression/columnref_expression.hpp"
+#include "duckdb/common/types/column/column_data_collection.hpp"
+#include "duckdb/main/prepared_statement_data.hpp"
 
 #include <random>
 
@@ -136,7 +148,8 @@ static void InitializeConnectionMethods(py::class_<DuckDBPyConnection, shared_pt
 	      py::arg("name"), py::arg("function"), py::arg("parameters") = py::none(), py::arg("return_type") = py::none(),
 	      py::kw_only(), py::arg("type") = PythonUDFType::NATIVE,
 	      py::arg("null_handling") = FunctionNullHandling::DEFAULT_NULL_HANDLING,
-	      py::arg("exception_handling") = PythonExceptionHandling::FORWARD_ERROR, py::arg("side_effects") = false);
+	      py::arg("exception_handling") = PythonExceptionHandling::FORWARD_ERROR, py::arg("side_effects") = false,
+	      py::arg("executor") = py::none());
 	m.def("remove_function", &DuckDBPyConnection::UnregisterUDF, "Remove a previously created function",
 	      py::arg("name"));
 	m.def("sqltype", &DuckDBPyConnection::Type, "Create a type object by parsing the 'type_str' string",
@@ -167,6 +180,8 @@ static void InitializeConnectionMethods(py::class_<DuckDBPyConnection, shared_pt
 	m.def("execute", &DuckDBPyConnection::Execute,
 	      "Execute the given SQL query, optionally using prepared statements with parameters set", py::arg("query"),
 	      py::arg("parameters") = py::none());
+	m.def("prepare", &DuckDBPyConnection::Prepare,
+	      "Prepare the given SQL query so it can be executed repeatedly with different parameters", py::arg("query"));
 	m.def("executemany", &DuckDBPyConnection::ExecuteMany,
 	      "Execute the given prepared statement multiple times using the list of parameter sets in parameters",
 	      py::arg("query"), py::arg("parameters") = py::none());
@@ -207,6 +222,10 @@ static void InitializeConnectionMethods(py::class_<DuckDBPyConnection, shared_pt
 	      "Register the passed Python Object value for querying with a view", py::arg("view_name"),
 	      py::arg("python_object"));
 	m.def("unregister", &DuckDBPyConnection::UnregisterPythonObject, "Unregister the view name", py::arg("view_name"));
+	m.def("replacement_cache_info", &DuckDBPyConnection::ReplacementCacheInfo,
+	      "Get the number of hits, misses and entries of the cache of replacement scans of Python objects");
+	m.def("statement_cache_info", &DuckDBPyConnection::StatementCacheInfo,
+	      "Get the number of hits, misses and entries and the size of the cache of prepared statements");
 	m.def("table", &DuckDBPyConnection::Table, "Create a relation object for the named table", py::arg("table_name"));
 	m.def("view", &DuckDBPyConnection::View, "Create a relation object for the named view", py::arg("view_name"));
 	m.def("values", &DuckDBPyConnection::Values, "Create a relation object from the passed values", py::arg("values"));
@@ -311,7 +330,9 @@ void DuckDBPyConnection::RegisterFilesystem(AbstractFileSystem filesystem) {
 		}
 	}
 
-	fs.RegisterSubSystem(make_uniq<PythonFilesystem>(std::move(protocols), std::move(filesystem)));
+	// the range reads of async filesystems are batched, so they are run concurrently instead of one at a time
+	bool batch_reads = py::isinstance<AsyncFileSystem>(filesystem);
+	fs.RegisterSubSystem(make_uniq<PythonFilesystem>(std::move(protocols), std::move(filesystem), batch_reads));
 }
 
 py::list DuckDBPyConnection::ListFilesystems() {
@@ -371,7 +392,7 @@ shared_ptr<DuckDBPyConnection>
 DuckDBPyConnection::RegisterScalarUDF(const string &name, const py::function &udf, const py::object &parameters_p,
                                       const shared_ptr<DuckDBPyType> &return_type_p, PythonUDFType type,
                                       FunctionNullHandling null_handling, PythonExceptionHandling exception_handling,
-                                      bool side_effects) {
+                                      bool side_effects, const py::object &executor) {
 	auto &connection = con.GetConnection();
 	auto &context = *connection.context;
 
@@ -383,14 +404,17 @@ DuckDBPyConnection::RegisterScalarUDF(const string &name, const py::function &ud
 		                              "functions with the same name is not supported yet, please remove it first",
 		                              name);
 	}
-	auto scalar_function = CreateScalarUDF(name, udf, parameters_p, return_type_p, type == PythonUDFType::ARROW,
-	                                       null_handling, exception_handling, side_effects);
+	auto scalar_function = CreateScalarUDF(name, udf, parameters_p, return_type_p, type, null_handling,
+	                                       exception_handling, side_effects, executor);
 	CreateScalarFunctionInfo info(scalar_function);
 
 	context.RegisterFunction(info);
 
 	auto dependency = make_uniq<ExternalDependency>();
 	dependency->AddDependency("function", PythonDependencyItem::Create(udf));
+	if (!py::none().is(executor)) {
+		dependency->AddDependency("executor", PythonDependencyItem::Create(executor));
+	}
 	registered_functions[name] = std::move(dependency);
 
 	return shared_from_this();
@@ -403,6 +427,15 @@ void DuckDBPyConnection::Initialize(py::handle &m) {
 	connection_module.def("__enter__", &DuckDBPyConnection::Enter)
 	    .def("__exit__", &DuckDBPyConnection::Exit, py::arg("exc_type"), py::arg("exc"), py::arg("traceback"));
 	connection_module.def("__del__", &DuckDBPyConnection::Close);
+	connection_module.def("__iter__", &DuckDBPyConnection::Iterate,
+	                      "Iterate over the rows of the result following execute, fetching them chunk by chunk");
+	connection_module.def("aexecute", &DuckDBPyConnection::ExecuteAsync,
+	                      "Execute the given SQL query without blocking the asyncio event loop, optionally using "
+	                      "prepared statements with parameters set",
+	                      py::arg("query"), py::arg("parameters") = py::none());
+	connection_module.def("_pending_query", &DuckDBPyConnection::PendingQuery,
+	                      "Start executing the given SQL query, the result is set once the pending query is finished",
+	                      py::arg("query"), py::arg("parameters") = py::none());
 
 	InitializeConnectionMethods(connection_module);
 	connection_module.def_property_readonly("description", &DuckDBPyConnection::GetDescription,
@@ -412,6 +445,210 @@ void DuckDBPyConnection::Initialize(py::handle &m) {
 	DuckDBPyConnection::ImportCache();
 }
 
+static string ParameterColumnName(idx_t param_idx) {
+	return "#" + std::to_string(param_idx);
+}
+
+static bool HasPositionalParameters(const case_insensitive_map_t<idx_t> &named_param_map) {
+	for (auto &entry : named_param_map) {
+		for (auto c : entry.first) {
+			if (!StringUtil::CharacterIsDigit(c)) {
+				return false;
+			}
+		}
+	}
+	return true;
+}
+
+static bool IsColumnarParameterSet(const py::object &params) {
+	if (DuckDBPyConnection::IsPandasDataframe(params)) {
+		return true;
+	}
+	if (DuckDBPyConnection::GetArrowType(params) == PyArrowObjectType::Table) {
+		return true;
+	}
+	return DuckDBPyConnection::IsAcceptedNumpyObject(params) == NumpyObjectType::DICT;
+}
+
+//! Rewrite 'INSERT INTO tbl VALUES (...)' into 'INSERT INTO tbl SELECT ...', where the parameters are replaced by
+//! references to the columns of the (not yet set) FROM clause. Only a row that consists of parameters is rewritten,
+//! other expressions (i.e. volatile functions or DEFAULT) could behave differently when they are evaluated as part of
+//! a single statement. Returns nullptr if the statement can not be rewritten
+static unique_ptr<InsertStatement> TryVectorizeInsert(const SQLStatement &statement,
+                                                      const case_insensitive_map_t<idx_t> &named_param_map) {
+	if (statement.type != StatementType::INSERT_STATEMENT || named_param_map.empty()) {
+		return nullptr;
+	}
+	auto &insert = statement.Cast<InsertStatement>();
+	if (!insert.returning_list.empty() || insert.on_conflict_info || !insert.cte_map.map.empty() ||
+	    insert.column_order != InsertColumnOrder::INSERT_BY_POSITION) {
+		return nullptr;
+	}
+	auto values_list = insert.GetValuesList();
+	if (!values_list || values_list->values.size() != 1) {
+		return nullptr;
+	}
+	auto result = unique_ptr_cast<SQLStatement, InsertStatement>(insert.Copy());
+	auto &node = result->select_statement->node->Cast<SelectNode>();
+	auto &row = node.from_table->Cast<ExpressionListRef>().values[0];
+	vector<unique_ptr<ParsedExpression>> select_list;
+	for (auto &expr : row) {
+		if (expr->GetExpressionClass() != ExpressionClass::PARAMETER) {
+			return nullptr;
+		}
+		auto entry = named_param_map.find(expr->Cast<ParameterExpression>().identifier);
+		if (entry == named_param_map.end()) {
+			return nullptr;
+		}
+		// the parameter is replaced by a reference to the column that holds its values
+		select_list.push_back(make_uniq<ColumnRefExpression>(ParameterColumnName(entry->second)));
+	}
+	node.select_list = std::move(select_list);
+	node.from_table = nullptr;
+	return result;
+}
+
+//! Get the names the columns of a DataFrame, Arrow Table or dictionary of NumPy arrays should be exposed as
+static vector<string> GetParameterColumnAliases(const py::object &params,
+                                                const case_insensitive_map_t<idx_t> &named_param_map) {
+	vector<string> column_names;
+	py::object names = params;
+	if (DuckDBPyConnection::IsPandasDataframe(params)) {
+		names = params.attr("columns");
+	} else if (DuckDBPyConnection::GetArrowType(params) == PyArrowObjectType::Table) {
+		names = params.attr("column_names");
+	}
+	for (auto name : names) {
+		column_names.push_back(std::string(py::str(name)));
+	}
+
+	vector<string> aliases;
+	if (HasPositionalParameters(named_param_map)) {
+		// Columns are matched to the parameters by their position
+		if (column_names.size() != named_param_map.size()) {
+			throw InvalidInputException("Prepared statement needs %d parameters, %d given", named_param_map.size(),
+			                            column_names.size());
+		}
+		for (idx_t i = 0; i < column_names.size(); i++) {
+			auto entry = named_param_map.find(std::to_string(i + 1));
+			if (entry == named_param_map.end()) {
+				throw InvalidInputException("Could not find parameter with identifier %d", i + 1);
+			}
+			aliases.push_back(ParameterColumnName(entry->second));
+		}
+		return aliases;
+	}
+	// Columns are matched to the parameters by their name
+	for (auto &name : column_names) {
+		auto entry = named_param_map.find(name);
+		if (entry == named_param_map.end()) {
+			throw InvalidInputException(
+			    "Named parameters could not be transformed, because query string is missing named parameter '%s'",
+			    name);
+		}
+		aliases.push_back(ParameterColumnName(entry->second));
+	}
+	if (column_names.size() != named_param_map.size()) {
+		vector<string> missing_params;
+		for (auto &entry : named_param_map) {
+			if (std::find(column_names.begin(), column_names.end(), entry.first) == column_names.end()) {
+				missing_params.push_back(entry.first);
+			}
+		}
+		auto message = StringUtil::Join(missing_params, ", ");
+		throw InvalidInputException("Not all named parameters have been located, missing: %s", message);
+	}
+	return aliases;
+}
+
+//! Transpose a list of positional parameter sets into a ColumnDataCollection with one column per parameter.
+//! Returns nullptr if the parameter sets can not be bound all at once
+static shared_ptr<ColumnDataCollection> TransformParameterRows(ClientContext &context, PreparedStatement &prep,
+                                                               const py::list &rows) {
+	auto &named_param_map = prep.named_param_map;
+	if (!HasPositionalParameters(named_param_map)) {
+		return nullptr;
+	}
+	for (auto &row : rows) {
+		if (!py::is_list_like(row)) {
+			return nullptr;
+		}
+	}
+	auto param_count = named_param_map.size();
+	vector<LogicalType> types;
+	for (idx_t i = 0; i < param_count; i++) {
+		LogicalType type;
+		if (!prep.data->TryGetType(std::to_string(i + 1), type)) {
+			return nullptr;
+		}
+		switch (type.id()) {
+		case LogicalTypeId::INVALID:
+		case LogicalTypeId::UNKNOWN:
+		case LogicalTypeId::ANY:
+		case LogicalTypeId::SQLNULL:
+			// The type of the parameter could not be resolved, it has to be bound one set at a time
+			return nullptr;
+		default:
+			break;
+		}
+		types.push_back(std::move(type));
+	}
+
+	auto collection = make_shared_ptr<ColumnDataCollection>(context, types);
+	ColumnDataAppendState append_state;
+	collection->InitializeAppend(append_state);
+	DataChunk chunk;
+	chunk.Initialize(context, types);
+	for (auto &row : rows) {
+		auto row_size = py::len(row);
+		if (row_size != param_count) {
+			throw InvalidInputException("Prepared statement needs %d parameters, %d given", param_count, row_size);
+		}
+		auto row_idx = chunk.size();
+		idx_t col_idx = 0;
+		for (auto value : row) {
+			chunk.SetValue(col_idx++, row_idx, TransformPythonValue(value, LogicalType::UNKNOWN, false));
+		}
+		chunk.SetCardinality(row_idx + 1);
+		if (chunk.size() == STANDARD_VECTOR_SIZE) {
+			collection->Append(append_state, chunk);
+			chunk.Reset();
+		}
+	}
+	if (chunk.size() != 0) {
+		collection->Append(append_state, chunk);
+	}
+	return collection;
+}
+
+unique_ptr<QueryResult> DuckDBPyConnection::ExecuteManyVectorized(const SQLStatement &statement,
+                                                                  PreparedStatement &prep, const py::object &params) {
+	auto insert = TryVectorizeInsert(statement, prep.named_param_map);
+	if (!insert) {
+		return nullptr;
+	}
+	auto &connection = con.GetConnection();
+	auto &node = insert->select_statement->node->Cast<SelectNode>();
+	// The scan of a ColumnDataRef does not take ownership of the collection, keep it alive until we're done
+	shared_ptr<ColumnDataCollection> collection;
+	if (IsColumnarParameterSet(params)) {
+		node.from_table = PythonReplacementScan::ReplacementObject(params, "parameters", *connection.context);
+		node.from_table->column_name_alias = GetParameterColumnAliases(params, prep.named_param_map);
+	} else {
+		collection = TransformParameterRows(*connection.context, prep, py::list(params));
+		if (!collection) {
+			return nullptr;
+		}
+		vector<string> names;
+		for (idx_t i = 0; i < collection->ColumnCount(); i++) {
+			names.push_back(ParameterColumnName(prep.named_param_map[std::to_string(i + 1)]));
+		}
+		node.from_table = make_uniq<ColumnDataRef>(collection, std::move(names));
+	}
+	auto vectorized_prep = PrepareQuery(std::move(insert));
+	return ExecuteInternal(*vectorized_prep);
+}
+
 shared_ptr<DuckDBPyConnection> DuckDBPyConnection::ExecuteMany(const py::object &query, py::object params_p) {
 	con.SetResult(nullptr);
 	if (params_p.is_none()) {
@@ -430,25 +667,47 @@ shared_ptr<DuckDBPyConnection> DuckDBPyConnection::ExecuteMany(const py::object
 	// FIXME: DBAPI says to not accept an 'executemany' call with multiple statements
 	ExecuteImmediately(std::move(statements));
 
+	auto statement = last_statement->Copy();
 	auto prep = PrepareQuery(std::move(last_statement));
 
-	if (!py::is_list_like(params_p)) {
-		throw InvalidInputException("executemany requires a list of parameter sets to be provided");
-	}
-	auto outer_list = py::list(params_p);
-	if (outer_list.empty()) {
-		throw InvalidInputException("executemany requires a non-empty list of parameter sets to be provided");
-	}
-
 	unique_ptr<QueryResult> query_result;
-	// Execute once for every set of parameters that are provided
-	for (auto &parameters : outer_list) {
-		auto params = py::reinterpret_borrow<py::object>(parameters);
-		query_result = ExecuteInternal(*prep, std::move(params));
+	if (IsColumnarParameterSet(params_p)) {
+		// The columns provide the values of the parameters, these are bound all at once
+		query_result = ExecuteManyVectorized(*statement, *prep, params_p);
+		if (!query_result) {
+			throw InvalidInputException(
+			    "executemany can only bind a DataFrame, Arrow Table or dictionary of NumPy "
+			    "arrays to a single row 'INSERT INTO ... VALUES' statement whose values are parameters");
+		}
+	} else {
+		if (!py::is_list_like(params_p)) {
+			throw InvalidInputException("executemany requires a list of parameter sets to be provided");
+		}
+		auto outer_list = py::list(params_p);
+		if (outer_list.empty()) {
+			throw InvalidInputException("executemany requires a non-empty list of parameter sets to be provided");
+		}
+		// Try to insert all but the last parameter set in one go, the last set is executed on its own so the result
+		// is the same as that of executing the sets one at a time
+		auto set_count = outer_list.size();
+		if (set_count > 1) {
+			py::list leading_sets = outer_list[py::slice(0, static_cast<py::ssize_t>(set_count - 1), 1)];
+			query_result = ExecuteManyVectorized(*statement, *prep, leading_sets);
+		}
+		if (query_result) {
+			auto params = py::reinterpret_borrow<py::object>(outer_list[set_count - 1]);
+			query_result = ExecuteInternal(*prep, std::move(params));
+		} else {
+			// Execute once for every set of parameters that are provided
+			for (auto &parameters : outer_list) {
+				auto params = py::reinterpret_borrow<py::object>(parameters);
+				query_result = ExecuteInternal(*prep, std::move(params));
+			}
+		}
 	}
 	// Set the internal 'result' object
 	if (query_result) {
-		auto py_result = make_uniq<DuckDBPyResult>(std::move(query_result));
+		auto py_result = make_uniq<DuckDBPyResult>(std::move(query_result), con.GetConnection().context);
 		con.SetResult(make_uniq<DuckDBPyRelation>(std::move(py_result)));
 	}
 
@@ -556,6 +815,7 @@ unique_ptr<QueryResult> DuckDBPyConnection::ExecuteInternal(PreparedStatement &p
 
 	// Execute the prepared statement with the prepared parameters
 	auto named_values = TransformPreparedParameters(prep, params);
+	PythonCatalogVersion::StatementExecuted(*prep.context, prep.GetStatementType());
 	unique_ptr<QueryResult> res;
 	{
 		py::gil_scoped_release release;
@@ -594,32 +854,208 @@ shared_ptr<DuckDBPyConnection> DuckDBPyConnection::ExecuteFromString(const strin
 	return Execute(py::str(query));
 }
 
-shared_ptr<DuckDBPyConnection> DuckDBPyConnection::Execute(const py::object &query, py::object params) {
-	con.SetResult(nullptr);
+shared_ptr<PythonCatalogVersion> PythonCatalogVersion::Get(ClientContext &context) {
+	return context.registered_state->GetOrCreate<PythonCatalogVersion>(NAME);
+}
+
+void PythonCatalogVersion::StatementExecuted(ClientContext &context, StatementType type) {
+	switch (type) {
+	case StatementType::CREATE_STATEMENT:
+	case StatementType::DROP_STATEMENT:
+	case StatementType::ALTER_STATEMENT:
+	case StatementType::ATTACH_STATEMENT:
+	case StatementType::DETACH_STATEMENT:
+	case StatementType::SET_STATEMENT:
+	case StatementType::VARIABLE_SET_STATEMENT:
+	case StatementType::LOAD_STATEMENT:
+		Get(context)->version++;
+		break;
+	default:
+		break;
+	}
+}
+
+void DuckDBPyConnection::StatementCache::CheckCatalogVersion(idx_t catalog_version_p) {
+	if (catalog_version_p != catalog_version) {
+		entries.clear();
+		catalog_version = catalog_version_p;
+	}
+}
+
+shared_ptr<PreparedStatement> DuckDBPyConnection::StatementCache::Lookup(const string &key, idx_t catalog_version_p) {
+	lock_guard<mutex> guard(lock);
+	CheckCatalogVersion(catalog_version_p);
+	auto entry = entries.find(key);
+	if (entry == entries.end()) {
+		misses++;
+		return nullptr;
+	}
+	hits++;
+	entry->second.last_used = ++clock;
+	return entry->second.statement;
+}
 
+void DuckDBPyConnection::StatementCache::Insert(const string &key, shared_ptr<PreparedStatement> statement,
+                                                idx_t capacity, idx_t catalog_version_p) {
+	lock_guard<mutex> guard(lock);
+	CheckCatalogVersion(catalog_version_p);
+	while (!entries.empty() && entries.size() >= capacity && entries.find(key) == entries.end()) {
+		auto evict = entries.begin();
+		for (auto it = entries.begin(); it != entries.end(); it++) {
+			if (it->second.last_used < evict->second.last_used) {
+				evict = it;
+			}
+		}
+		entries.erase(evict);
+	}
+	Entry entry;
+	entry.statement = std::move(statement);
+	entry.last_used = ++clock;
+	entries[key] = std::move(entry);
+}
+
+void DuckDBPyConnection::StatementCache::Clear() {
+	lock_guard<mutex> guard(lock);
+	entries.clear();
+}
+
+idx_t DuckDBPyConnection::StatementCache::Size() {
+	lock_guard<mutex> guard(lock);
+	return entries.size();
+}
+
+idx_t DuckDBPyConnection::StatementCacheCapacity() {
+	auto &connection = con.GetConnection();
+	Value result;
+	if (!connection.context->TryGetCurrentSetting("python_statement_cache_size", result)) {
+		return 0;
+	}
+	return result.GetValue<uint64_t>();
+}
+
+static bool IsCacheableStatement(StatementType type) {
+	switch (type) {
+	case StatementType::SELECT_STATEMENT:
+	case StatementType::INSERT_STATEMENT:
+	case StatementType::UPDATE_STATEMENT:
+	case StatementType::DELETE_STATEMENT:
+		return true;
+	default:
+		return false;
+	}
+}
+
+//! The same query text can refer to different catalog entries when the search path changed (i.e. after USE)
+static string StatementCacheKey(ClientContext &context, const string &query) {
+	auto search_path = CatalogSearchEntry::ListToString(ClientData::Get(context).catalog_search_path->Get());
+	return std::to_string(search_path.size()) + ":" + search_path + query;
+}
+
+shared_ptr<PreparedStatement> DuckDBPyConnection::PrepareStatement(const py::object &query) {
+	auto &context = *con.GetConnection().context;
+	shared_ptr<PreparedStatement> prep;
+	string cache_key;
+	idx_t catalog_version = 0;
+	auto cache_capacity = StatementCacheCapacity();
+	if (cache_capacity > 0 && py::isinstance<py::str>(query)) {
+		cache_key = StatementCacheKey(context, std::string(py::str(query)));
+		catalog_version = PythonCatalogVersion::Get(context)->version;
+		prep = statement_cache.Lookup(cache_key, catalog_version);
+	}
+	if (prep) {
+		return prep;
+	}
 	auto statements = GetStatements(query);
 	if (statements.empty()) {
-		// TODO: should we throw?
 		return nullptr;
 	}
 
 	auto last_statement = std::move(statements.back());
 	statements.pop_back();
+	bool cacheable = !cache_key.empty() && statements.empty() && IsCacheableStatement(last_statement->type);
 	// First immediately execute any preceding statements (if any)
 	// FIXME: SQLites implementation says to not accept an 'execute' call with multiple statements
 	ExecuteImmediately(std::move(statements));
 
-	auto prep = PrepareQuery(std::move(last_statement));
-	auto res = ExecuteInternal(*prep, std::move(params));
+	// statements that scan Python objects are not cached, the name could refer to another object next time
+	auto replacement_state = PythonReplacementCache::Get(context);
+	auto replacement_count = replacement_state->replacements.load();
+	prep = PrepareQuery(std::move(last_statement));
+	if (cacheable && replacement_state->replacements.load() == replacement_count) {
+		statement_cache.Insert(cache_key, prep, cache_capacity, catalog_version);
+	}
+	return prep;
+}
+
+shared_ptr<DuckDBPyConnection> DuckDBPyConnection::Execute(const py::object &query, py::object params) {
+	con.SetResult(nullptr);
+
+	auto prep = PrepareStatement(query);
+	if (!prep) {
+		// TODO: should we throw?
+		return nullptr;
+	}
+	return ExecutePrepared(*prep, std::move(params));
+}
+
+void DuckDBPyConnection::SetQueryResult(unique_ptr<QueryResult> result) {
+	auto py_result = make_uniq<DuckDBPyResult>(std::move(result), con.GetConnection().context);
+	con.SetResult(make_uniq<DuckDBPyRelation>(std::move(py_result)));
+}
+
+shared_ptr<DuckDBPyConnection> DuckDBPyConnection::ExecutePrepared(PreparedStatement &prep, py::object params) {
+	con.SetResult(nullptr);
+	auto res = ExecuteInternal(prep, std::move(params));
 
 	// Set the internal 'result' object
 	if (res) {
-		auto py_result = make_uniq<DuckDBPyResult>(std::move(res));
-		con.SetResult(make_uniq<DuckDBPyRelation>(std::move(py_result)));
+		SetQueryResult(std::move(res));
 	}
 	return shared_from_this();
 }
 
+unique_ptr<DuckDBPyPendingQuery> DuckDBPyConnection::PendingQuery(const py::object &query, py::object params) {
+	con.SetResult(nullptr);
+
+	auto prep = PrepareStatement(query);
+	if (!prep) {
+		return nullptr;
+	}
+	if (params.is_none()) {
+		params = py::list();
+	}
+	auto named_values = TransformPreparedParameters(*prep, params);
+	PythonCatalogVersion::StatementExecuted(*prep->context, prep->GetStatementType());
+	unique_ptr<PendingQueryResult> pending_query;
+	{
+		py::gil_scoped_release release;
+		unique_lock<std::mutex> lock(py_connection_lock);
+
+		pending_query = prep->PendingQuery(named_values);
+		if (pending_query->HasError()) {
+			pending_query->ThrowError();
+		}
+	}
+	auto self = shared_from_this();
+	auto finish = [self, prep](unique_ptr<QueryResult> result) -> py::object {
+		self->SetQueryResult(std::move(result));
+		return py::cast(self);
+	};
+	return make_uniq<DuckDBPyPendingQuery>(con.GetConnection().context, std::move(pending_query), py::cast(self),
+	                                       &py_connection_lock, std::move(finish));
+}
+
+unique_ptr<DuckDBPyPreparedStatement> DuckDBPyConnection::Prepare(const py::object &query) {
+	auto statements = GetStatements(query);
+	if (statements.size() != 1) {
+		throw InvalidInputException("prepare requires exactly one statement, %d were provided", statements.size());
+	}
+	auto &statement = *statements[0];
+	auto query_text = statement.query.substr(statement.stmt_location, statement.stmt_length);
+	shared_ptr<PreparedStatement> prep = PrepareQuery(std::move(statements[0]));
+	return make_uniq<DuckDBPyPreparedStatement>(shared_from_this(), std::move(prep), std::move(query_text));
+}
+
 shared_ptr<DuckDBPyConnection> DuckDBPyConnection::Append(const string &name, const PandasDataFrame &value,
                                                           bool by_name) {
 	RegisterPythonObject("__append_df", value);
@@ -652,6 +1088,7 @@ shared_ptr<DuckDBPyConnection> DuckDBPyConnection::RegisterPythonObject(const st
 	auto object = PythonReplacementScan::ReplacementObject(python_object, name, client);
 	auto view_rel = make_shared_ptr<ViewRelation>(connection.context, std::move(object), name);
 	bool replace = registered_objects.count(name);
+	PythonCatalogVersion::Get(client)->version++;
 	view_rel->CreateView(name, replace, true);
 	registered_objects.insert(name);
 	return shared_from_this();
@@ -1403,6 +1840,7 @@ void DuckDBPyConnection::ExecuteImmediately(vector<unique_ptr<SQLStatement>> sta
 			    "Prepared parameters are only supported for the last statement, please split your query up into "
 			    "separate 'execute' calls if you want to use prepared parameters");
 		}
+		PythonCatalogVersion::StatementExecuted(*connection.context, stmt->type);
 		auto pending_query = connection.PendingQuery(std::move(stmt), false);
 		if (pending_query->HasError()) {
 			pending_query->ThrowError();
@@ -1636,6 +2074,7 @@ shared_ptr<DuckDBPyConnection> DuckDBPyConnection::UnregisterPythonObject(const
 	if (!registered_objects.count(name)) {
 		return shared_from_this();
 	}
+	PythonCatalogVersion::Get(*connection.context)->version++;
 	py::gil_scoped_release release;
 	// FIXME: DROP TEMPORARY VIEW? doesn't exist?
 	connection.Query("DROP VIEW \"" + name + "\"");
@@ -1643,6 +2082,25 @@ shared_ptr<DuckDBPyConnection> DuckDBPyConnection::UnregisterPythonObject(const
 	return shared_from_this();
 }
 
+py::dict DuckDBPyConnection::StatementCacheInfo() {
+	py::dict result;
+	result["hits"] = statement_cache.hits.load();
+	result["misses"] = statement_cache.misses.load();
+	result["entries"] = statement_cache.Size();
+	result["size"] = StatementCacheCapacity();
+	return result;
+}
+
+py::dict DuckDBPyConnection::ReplacementCacheInfo() {
+	auto &connection = con.GetConnection();
+	auto cache = PythonReplacementCache::Get(*connection.context);
+	py::dict result;
+	result["hits"] = cache->hits.load();
+	result["misses"] = cache->misses.load();
+	result["entries"] = cache->Size();
+	return result;
+}
+
 shared_ptr<DuckDBPyConnection> DuckDBPyConnection::Begin() {
 	ExecuteFromString("BEGIN TRANSACTION");
 	return shared_from_this();
@@ -1681,6 +2139,7 @@ int DuckDBPyConnection::GetRowcount() {
 
 void DuckDBPyConnection::Close() {
 	con.SetResult(nullptr);
+	statement_cache.Clear();
 	con.SetConnection(nullptr);
 	con.SetDatabase(nullptr);
 	// https://peps.python.org/pep-0249/#Connection.close
@@ -1747,6 +2206,11 @@ shared_ptr<DuckDBPyConnection> DuckDBPyConnection::Cursor() {
 	return res;
 }
 
+py::object DuckDBPyConnection::ExecuteAsync(const py::object &query, py::object params) {
+	auto aio = py::module::import("duckdb.aio");
+	return aio.attr("execute")(py::cast(shared_from_this()), query, params);
+}
+
 // these should be functions on the result but well
 Optional<py::tuple> DuckDBPyConnection::FetchOne() {
 	if (!con.HasResult()) {
@@ -1756,6 +2220,16 @@ Optional<py::tuple> DuckDBPyConnection::FetchOne() {
 	return result.FetchOne();
 }
 
+py::object DuckDBPyConnection::Iterate() {
+	if (!con.HasResult()) {
+		throw InvalidInputException("No open result set");
+	}
+	auto &result = con.GetResult();
+	result.EnablePrefetch();
+	auto fetchone = py::cast(shared_from_this()).attr("fetchone");
+	return py::module::import("builtins").attr("iter")(fetchone, py::none());
+}
+
 py::list DuckDBPyConnection::FetchMany(idx_t size) {
 	if (!con.HasResult()) {
 		throw InvalidInputException("No open result set");
@@ -1933,9 +2407,45 @@ shared_ptr<DuckDBPyConnection> DuckDBPyConnection::Connect(const py::object &dat
 	config.AddExtensionOption("pandas_analyze_sample",
 	                          "The maximum number of rows to sample when analyzing a pandas object column.",
 	                          LogicalType::UBIGINT, Value::UBIGINT(1000));
+	config.AddExtensionOption("pandas_analyze_early_exit",
+	                          "Stop analyzing a pandas object column once this many consecutive sampled values did not "
+	                          "change its type, 0 to always analyze the full sample.",
+	                          LogicalType::UBIGINT, Value::UBIGINT(0));
+	config.AddExtensionOption("pandas_analyze_cache",
+	                          "Whether the analyzed type of a pandas object column is reused when the same column is "
+	                          "scanned again.",
+	                          LogicalType::BOOLEAN, Value::BOOLEAN(true));
 	config.AddExtensionOption("python_enable_replacements",
 	                          "Whether variables visible to the current stack should be used for replacement scans.",
 	                          LogicalType::BOOLEAN, Value::BOOLEAN(true));
+	config.AddExtensionOption("python_replacement_cache",
+	                          "Whether the replacement scans of unchanged Python objects are cached and reused.",
+	                          LogicalType::BOOLEAN, Value::BOOLEAN(true));
+	config.AddExtensionOption(
+	    "python_statement_cache_size",
+	    "The number of prepared statements that are cached per connection and reused when the same "
+	    "query text is executed again, 0 to disable the statement cache.",
+	    LogicalType::UBIGINT, Value::UBIGINT(0));
+	config.AddExtensionOption("python_filesystem_block_size",
+	                          "The size of the blocks that files on a registered fsspec filesystem are read and cached "
+	                          "in, 0 to disable the block cache.",
+	                          LogicalType::UBIGINT, Value::UBIGINT(1048576));
+	config.AddExtensionOption("python_filesystem_readahead",
+	                          "The number of blocks that are read ahead when reading a file on a registered fsspec "
+	                          "filesystem.",
+	                          LogicalType::UBIGINT, Value::UBIGINT(4));
+	config.AddExtensionOption("python_numpy_zero_copy",
+	                          "Whether fixed-width columns without NULLs of small materialized results are returned as "
+	                          "NumPy arrays that are views over the result instead of copies.",
+	                          LogicalType::BOOLEAN, Value::BOOLEAN(false));
+	config.AddExtensionOption(
+	    "python_arrow_capsule_streaming",
+	    "Whether __arrow_c_stream__ of a relation streams its result. A streamed result is closed "
+	    "when another query runs on the connection before the stream is consumed.",
+	    LogicalType::BOOLEAN, Value::BOOLEAN(true));
+	config.AddExtensionOption("python_parallel_numpy_conversion",
+	                          "Whether the columns of a materialized result are converted to NumPy arrays in parallel.",
+	                          LogicalType::BOOLEAN, Value::BOOLEAN(true));
 	if (!DuckDBPyConnection::IsJupyter()) {
 		config_dict["duckdb_api"] = Value("python");
 	} else {
@@ -1,13 +1,19 @@
 #include "duckdb_python/pyfilesystem.hpp"
 
 #include "duckdb/common/string_util.hpp"
+#include "duckdb/common/file_opener.hpp"
 #include "duckdb_python/pybind11/pybind_wrapper.hpp"
 #include "duckdb_python/pybind11/gil_wrapper.hpp"
 
 namespace duckdb {
 
-PythonFileHandle::PythonFileHandle(FileSystem &file_system, const string &path, const py::object &handle)
-    : FileHandle(file_system, path), handle(handle) {
+//! The number of blocks that are kept in the cache of a handle on top of the readahead
+static constexpr idx_t PYTHON_FILE_CACHED_BLOCKS = 16;
+
+PythonFileHandle::PythonFileHandle(FileSystem &file_system, const string &path, const py::object &handle,
+                                   bool read_only, idx_t block_size, idx_t readahead)
+    : FileHandle(file_system, path), read_only(read_only), block_size(block_size), readahead(readahead),
+      handle(handle) {
 }
 PythonFileHandle::~PythonFileHandle() {
 	try {
@@ -22,6 +28,10 @@ const py::object &PythonFileHandle::GetHandle(const FileHandle &handle) {
 	return handle.Cast<PythonFileHandle>().handle;
 }
 
+idx_t PythonFileHandle::MaxCachedBlocks() const {
+	return PYTHON_FILE_CACHED_BLOCKS + readahead;
+}
+
 void PythonFileHandle::Close() {
 	PythonGILWrapper gil;
 	handle.attr("close")();
@@ -83,8 +93,22 @@ unique_ptr<FileHandle> PythonFilesystem::OpenFile(const string &path, FileOpenFl
 
 	string flags_s = DecodeFlags(flags);
 
+	// only files that are not written to can be read through the block cache
+	bool read_only = !flags.OpenForWriting() && !flags.OpenForAppending();
+	idx_t block_size = 0;
+	idx_t readahead = 0;
+	if (read_only) {
+		Value result;
+		if (FileOpener::TryGetCurrentSetting(opener, "python_filesystem_block_size", result)) {
+			block_size = result.GetValue<idx_t>();
+		}
+		if (FileOpener::TryGetCurrentSetting(opener, "python_filesystem_readahead", result)) {
+			readahead = result.GetValue<idx_t>();
+		}
+	}
+
 	const auto &handle = filesystem.attr("open")(path, py::str(flags_s));
-	return make_uniq<PythonFileHandle>(*this, path, handle);
+	return make_uniq<PythonFileHandle>(*this, path, handle, read_only, block_size, readahead);
 }
 
 int64_t PythonFilesystem::Write(FileHandle &handle, void *buffer, int64_t nr_bytes) {
@@ -102,7 +126,226 @@ void PythonFilesystem::Write(FileHandle &handle, void *buffer, int64_t nr_bytes,
 	Write(handle, buffer, nr_bytes);
 }
 
+idx_t PythonFilesystem::ReadRange(PythonFileHandle &handle, data_ptr_t buffer, idx_t nr_bytes, idx_t location) {
+	if (batch_reads) {
+		return ReadRangeBatched(handle.path, buffer, nr_bytes, location);
+	}
+	PythonGILWrapper gil;
+
+	const auto &file = PythonFileHandle::GetHandle(handle);
+	file.attr("seek")(location);
+	string data = py::bytes(file.attr("read")(nr_bytes));
+
+	auto read = MinValue<idx_t>(data.size(), nr_bytes);
+	memcpy(buffer, data.c_str(), read);
+	return read;
+}
+
+idx_t PythonFilesystem::ReadRangeBatched(const string &path, data_ptr_t buffer, idx_t nr_bytes, idx_t location) {
+	PythonRangeRequest request;
+	request.path = path;
+	request.start = location;
+	request.nr_bytes = nr_bytes;
+	request.buffer = buffer;
+
+	unique_lock<mutex> guard(batch_lock);
+	pending_requests.push_back(&request);
+	while (!request.done) {
+		if (batch_in_flight) {
+			// another thread is reading a batch, our request is picked up by the next batch
+			batch_cv.wait(guard);
+			continue;
+		}
+		// read every request that is pending with a single call
+		batch_in_flight = true;
+		auto batch = std::move(pending_requests);
+		pending_requests.clear();
+		guard.unlock();
+		ReadBatch(batch);
+		guard.lock();
+		for (auto &entry : batch) {
+			entry->done = true;
+		}
+		batch_in_flight = false;
+		batch_cv.notify_all();
+	}
+	if (!request.error.empty()) {
+		throw IOException("Could not read from file \"%s\": %s", path, request.error);
+	}
+	return request.read;
+}
+
+void PythonFilesystem::ReadBatch(const vector<PythonRangeRequest *> &batch) {
+	PythonGILWrapper gil;
+
+	try {
+		py::list paths;
+		py::list starts;
+		py::list ends;
+		for (auto &request : batch) {
+			paths.append(py::str(request->path));
+			starts.append(py::int_(request->start));
+			ends.append(py::int_(request->start + request->nr_bytes));
+		}
+		// async filesystems run the reads concurrently on the event loop thread of fsspec
+		auto results = py::list(filesystem.attr("cat_ranges")(paths, starts, ends, py::arg("on_error") = "raise"));
+		if (results.size() != batch.size()) {
+			throw IOException("cat_ranges returned %llu results for %llu ranges", results.size(), batch.size());
+		}
+		for (idx_t i = 0; i < batch.size(); i++) {
+			auto &request = *batch[i];
+			string data = py::bytes(results[i]);
+			request.read = MinValue<idx_t>(data.size(), request.nr_bytes);
+			memcpy(request.buffer, data.c_str(), request.read);
+		}
+	} catch (std::exception &ex) {
+		ErrorData error(ex);
+		for (auto &request : batch) {
+			request->error = error.RawMessage();
+		}
+	}
+}
+
+void PythonFilesystem::AddBlocks(PythonFileHandle &handle, idx_t start_block, idx_t end_block, const_data_ptr_t data,
+                                 idx_t size) {
+	for (idx_t block_idx = start_block; block_idx < end_block && size > 0; block_idx++) {
+		PythonFileBlock block;
+		block.size = MinValue<idx_t>(size, handle.block_size);
+		block.data = make_unsafe_uniq_array<data_t>(block.size);
+		block.last_used = handle.block_clock;
+		memcpy(block.data.get(), data, block.size);
+		data += block.size;
+		size -= block.size;
+		handle.blocks[block_idx] = std::move(block);
+	}
+}
+
+void PythonFilesystem::ReadCached(PythonFileHandle &handle, data_ptr_t buffer, idx_t nr_bytes, idx_t location) {
+	if (nr_bytes == 0) {
+		return;
+	}
+	auto file_size = NumericCast<idx_t>(GetFileSize(handle));
+
+	if (location + nr_bytes > file_size) {
+		throw IOException("Could not read all bytes from file \"%s\": wanted=%llu read=%llu", handle.path, nr_bytes,
+		                  file_size > location ? file_size - location : 0);
+	}
+
+	auto block_size = handle.block_size;
+	auto first_block = location / block_size;
+	auto last_block = (location + nr_bytes - 1) / block_size;
+	if (last_block - first_block + 1 > handle.MaxCachedBlocks()) {
+		// the read does not fit in the cache, read it directly
+		unique_lock<mutex> guard(handle.lock, std::defer_lock);
+		if (!batch_reads) {
+			guard.lock();
+		}
+		auto read = ReadRange(handle, buffer, nr_bytes, location);
+		if (read != nr_bytes) {
+			throw IOException("Could not read all bytes from file \"%s\": wanted=%llu read=%llu", handle.path, nr_bytes,
+			                  read);
+		}
+		return;
+	}
+
+	// find every run of adjacent blocks that is not cached yet
+	unique_lock<mutex> guard(handle.lock);
+	auto block_count = (file_size + block_size - 1) / block_size;
+	handle.block_clock++;
+	vector<pair<idx_t, idx_t>> runs;
+	idx_t block_idx = first_block;
+	while (block_idx <= last_block) {
+		if (handle.blocks.find(block_idx) != handle.blocks.end()) {
+			block_idx++;
+			continue;
+		}
+		auto run_start = block_idx;
+		while (block_idx <= last_block && handle.blocks.find(block_idx) == handle.blocks.end()) {
+			block_idx++;
+		}
+		auto run_end = block_idx;
+		if (run_end > last_block) {
+			// the read continues up to the end of the requested range, read ahead past it
+			auto readahead_end = MinValue<idx_t>(run_end + handle.readahead, block_count);
+			while (run_end < readahead_end && handle.blocks.find(run_end) == handle.blocks.end()) {
+				run_end++;
+			}
+		}
+		runs.emplace_back(run_start, run_end);
+	}
+
+	// fetch every run with a single call, so adjacent reads only cross into Python once
+	// batched reads don't use the Python file, so the lock is released to batch them with reads of other threads
+	if (!runs.empty()) {
+		if (batch_reads) {
+			guard.unlock();
+		}
+		vector<pair<unsafe_unique_array<data_t>, idx_t>> run_data;
+		for (auto &run : runs) {
+			auto run_location = run.first * block_size;
+			auto run_bytes = MinValue<idx_t>(run.second * block_size, file_size) - run_location;
+			auto data = make_unsafe_uniq_array<data_t>(run_bytes);
+			auto read = ReadRange(handle, data.get(), run_bytes, run_location);
+			run_data.emplace_back(std::move(data), read);
+		}
+		if (batch_reads) {
+			guard.lock();
+		}
+		for (idx_t i = 0; i < runs.size(); i++) {
+			AddBlocks(handle, runs[i].first, runs[i].second, run_data[i].first.get(), run_data[i].second);
+		}
+	}
+
+	// copy the requested range out of the cached blocks
+	idx_t offset = 0;
+	for (block_idx = first_block; block_idx <= last_block; block_idx++) {
+		auto block_start = block_idx * block_size;
+		auto start_in_block = MaxValue<idx_t>(location, block_start) - block_start;
+		auto end_in_block = MinValue<idx_t>(location + nr_bytes - block_start, block_size);
+		auto entry = handle.blocks.find(block_idx);
+		if (entry == handle.blocks.end()) {
+			// the block was evicted by another thread while it was fetched
+			auto block_bytes = MinValue<idx_t>(block_size, file_size - block_start);
+			auto data = make_unsafe_uniq_array<data_t>(block_bytes);
+			auto read = ReadRange(handle, data.get(), block_bytes, block_start);
+			AddBlocks(handle, block_idx, block_idx + 1, data.get(), read);
+			entry = handle.blocks.find(block_idx);
+		}
+		if (entry == handle.blocks.end() || entry->second.size < end_in_block) {
+			auto read = offset + (entry == handle.blocks.end() ? 0 : entry->second.size - start_in_block);
+			throw IOException("Could not read all bytes from file \"%s\": wanted=%llu read=%llu", handle.path, nr_bytes,
+			                  read);
+		}
+		auto &block = entry->second;
+		block.last_used = handle.block_clock;
+		memcpy(buffer + offset, block.data.get() + start_in_block, end_in_block - start_in_block);
+		offset += end_in_block - start_in_block;
+	}
+
+	// evict the least recently used blocks
+	while (handle.blocks.size() > handle.MaxCachedBlocks()) {
+		auto evict = handle.blocks.begin();
+		for (auto it = handle.blocks.begin(); it != handle.blocks.end(); it++) {
+			if (it->second.last_used < evict->second.last_used) {
+				evict = it;
+			}
+		}
+		handle.blocks.erase(evict);
+	}
+}
+
 int64_t PythonFilesystem::Read(FileHandle &handle, void *buffer, int64_t nr_bytes) {
+	auto &py_handle = handle.Cast<PythonFileHandle>();
+	if (py_handle.block_size > 0) {
+		auto file_size = NumericCast<idx_t>(GetFileSize(handle));
+		auto location = py_handle.position;
+		auto remaining = file_size > location ? file_size - location : 0;
+		auto read = MinValue<idx_t>(NumericCast<idx_t>(nr_bytes), remaining);
+		ReadCached(py_handle, data_ptr_cast(buffer), read, location);
+		py_handle.position = location + read;
+		return NumericCast<int64_t>(read);
+	}
+
 	PythonGILWrapper gil;
 
 	const auto &read = PythonFileHandle::GetHandle(handle).attr("read");
@@ -115,6 +358,12 @@ int64_t PythonFilesystem::Read(FileHandle &handle, void *buffer, int64_t nr_byte
 }
 
 void PythonFilesystem::Read(duckdb::FileHandle &handle, void *buffer, int64_t nr_bytes, uint64_t location) {
+	auto &py_handle = handle.Cast<PythonFileHandle>();
+	if (py_handle.block_size > 0) {
+		ReadCached(py_handle, data_ptr_cast(buffer), NumericCast<idx_t>(nr_bytes), location);
+		py_handle.position = location + NumericCast<idx_t>(nr_bytes);
+		return;
+	}
 	Seek(handle, location);
 
 	Read(handle, buffer, nr_bytes);
@@ -146,12 +395,25 @@ string PythonFilesystem::PathSeparator(const string &path) {
 	return "/";
 }
 int64_t PythonFilesystem::GetFileSize(FileHandle &handle) {
-	// TODO: this value should be cached on the PythonFileHandle
-	PythonGILWrapper gil;
-
-	return py::int_(filesystem.attr("size")(handle.path));
+	auto &py_handle = handle.Cast<PythonFileHandle>();
+	if (!py_handle.read_only) {
+		PythonGILWrapper gil;
+		return py::int_(filesystem.attr("size")(handle.path));
+	}
+	lock_guard<mutex> guard(py_handle.lock);
+	if (!py_handle.file_size.IsValid()) {
+		PythonGILWrapper gil;
+		py_handle.file_size = py::int_(filesystem.attr("size")(handle.path)).cast<idx_t>();
+	}
+	return NumericCast<int64_t>(py_handle.file_size.GetIndex());
 }
 void PythonFilesystem::Seek(duckdb::FileHandle &handle, uint64_t location) {
+	auto &py_handle = handle.Cast<PythonFileHandle>();
+	if (py_handle.block_size > 0) {
+		// reads through the block cache position the Python file themselves
+		py_handle.position = location;
+		return;
+	}
 	PythonGILWrapper gil;
 
 	auto seek = PythonFileHandle::GetHandle(handle).attr("seek");
@@ -182,12 +444,20 @@ void PythonFilesystem::RemoveFile(const string &filename, optional_ptr<FileOpene
 	remove(py::str(filename));
 }
 time_t PythonFilesystem::GetLastModifiedTime(FileHandle &handle) {
-	// TODO: this value should be cached on the PythonFileHandle
-	PythonGILWrapper gil;
-
-	auto last_mod = filesystem.attr("modified")(handle.path);
-
-	return py::int_(last_mod.attr("timestamp")());
+	auto &py_handle = handle.Cast<PythonFileHandle>();
+	if (!py_handle.read_only) {
+		PythonGILWrapper gil;
+		auto last_mod = filesystem.attr("modified")(handle.path);
+		return py::int_(last_mod.attr("timestamp")());
+	}
+	lock_guard<mutex> guard(py_handle.lock);
+	if (!py_handle.has_last_modified) {
+		PythonGILWrapper gil;
+		auto last_mod = filesystem.attr("modified")(handle.path);
+		py_handle.last_modified = py::int_(last_mod.attr("timestamp")());
+		py_handle.has_last_modified = true;
+	}
+	return py_handle.last_modified;
 }
 void PythonFilesystem::FileSync(FileHandle &handle) {
 	PythonGILWrapper gil;
@@ -231,6 +501,10 @@ bool PythonFilesystem::IsPipe(const string &filename, optional_ptr<FileOpener> o
 	return false;
 }
 idx_t PythonFilesystem::SeekPosition(FileHandle &handle) {
+	auto &py_handle = handle.Cast<PythonFileHandle>();
+	if (py_handle.block_size > 0) {
+		return py_handle.position;
+	}
 	PythonGILWrapper gil;
 
 	return py::int_(PythonFileHandle::GetHandle(handle).attr("tell")());
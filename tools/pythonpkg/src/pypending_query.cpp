@@ -0,0 +1,87 @@
+#include "duckdb_python/pypending_query.hpp"
+
+#include <chrono>
+
+namespace duckdb {
+
+void DuckDBPyPendingQuery::Initialize(py::handle &m) {
+	auto pending_module = py::class_<DuckDBPyPendingQuery, unique_ptr<DuckDBPyPendingQuery>>(m, "DuckDBPyPendingQuery",
+	                                                                                         py::module_local());
+	pending_module.def(
+	    "execute_task", &DuckDBPyPendingQuery::ExecuteTask,
+	    "Execute tasks of the query for a few milliseconds, returns 'ready' once the result is available, "
+	    "'pending' if tasks were executed and 'waiting' if the query is waiting for tasks that run on "
+	    "other threads");
+	pending_module.def("finish", &DuckDBPyPendingQuery::Finish,
+	                   "Fetch the result of the query, blocking until it is available");
+	pending_module.def("interrupt", &DuckDBPyPendingQuery::Interrupt, "Interrupt the query");
+}
+
+DuckDBPyPendingQuery::DuckDBPyPendingQuery(shared_ptr<ClientContext> context_p,
+                                           unique_ptr<PendingQueryResult> pending_p, py::object owner_p,
+                                           optional_ptr<mutex> lock_p, finish_function_t finish_p)
+    : context(std::move(context_p)), pending(std::move(pending_p)), owner(std::move(owner_p)), lock(lock_p),
+      finish(std::move(finish_p)) {
+}
+
+string DuckDBPyPendingQuery::ExecuteTask() {
+	if (!pending) {
+		throw InvalidInputException("The result of the pending query has already been fetched");
+	}
+	if (ready) {
+		return "ready";
+	}
+	PendingExecutionResult execution_result;
+	{
+		py::gil_scoped_release release;
+		unique_lock<mutex> connection_lock;
+		if (lock) {
+			connection_lock = unique_lock<mutex>(*lock);
+		}
+		auto deadline = std::chrono::steady_clock::now() + std::chrono::milliseconds(idx_t(TASK_SLICE_MS));
+		do {
+			execution_result = pending->ExecuteTask();
+		} while (execution_result == PendingExecutionResult::RESULT_NOT_READY &&
+		         std::chrono::steady_clock::now() < deadline);
+	}
+	switch (execution_result) {
+	case PendingExecutionResult::RESULT_NOT_READY:
+		return "pending";
+	case PendingExecutionResult::BLOCKED:
+	case PendingExecutionResult::NO_TASKS_AVAILABLE:
+		return "waiting";
+	default:
+		D_ASSERT(PendingQueryResult::IsResultReady(execution_result));
+		ready = true;
+		return "ready";
+	}
+}
+
+py::object DuckDBPyPendingQuery::Finish() {
+	if (!pending) {
+		throw InvalidInputException("The result of the pending query has already been fetched");
+	}
+	unique_ptr<QueryResult> result;
+	{
+		py::gil_scoped_release release;
+		unique_lock<mutex> connection_lock;
+		if (lock) {
+			connection_lock = unique_lock<mutex>(*lock);
+		}
+		auto pending_query = std::move(pending);
+		if (pending_query->HasError()) {
+			pending_query->ThrowError();
+		}
+		result = pending_query->Execute();
+		if (result->HasError()) {
+			result->ThrowError();
+		}
+	}
+	return finish(std::move(result));
+}
+
+void DuckDBPyPendingQuery::Interrupt() {
+	context->Interrupt();
+}
+
+} // namespace duckdb
@@ -0,0 +1,54 @@
+#include "duckdb_python/pyprepared_statement.hpp"
+#include "duckdb_python/pyconnection/pyconnection.hpp"
+
+namespace duckdb {
+
+static void
+InitializeReadOnlyProperties(py::class_<DuckDBPyPreparedStatement, unique_ptr<DuckDBPyPreparedStatement>> &m) {
+	m.def_property_readonly("query", &DuckDBPyPreparedStatement::Query, "Get the query that was prepared.")
+	    .def_property_readonly("type", &DuckDBPyPreparedStatement::Type, "Get the type of the prepared statement.")
+	    .def_property_readonly("parameter_count", &DuckDBPyPreparedStatement::ParameterCount,
+	                           "Get the number of parameters of the prepared statement.")
+	    .def_property_readonly("named_parameters", &DuckDBPyPreparedStatement::NamedParameters,
+	                           "Get the names of the parameters of the prepared statement.");
+}
+
+void DuckDBPyPreparedStatement::Initialize(py::handle &m) {
+	auto prepared_module = py::class_<DuckDBPyPreparedStatement, unique_ptr<DuckDBPyPreparedStatement>>(
+	    m, "DuckDBPyPreparedStatement", py::module_local());
+	prepared_module.def("execute", &DuckDBPyPreparedStatement::Execute,
+	                    "Execute the prepared statement with the given parameters, returns the connection",
+	                    py::arg("parameters") = py::none());
+	InitializeReadOnlyProperties(prepared_module);
+}
+
+DuckDBPyPreparedStatement::DuckDBPyPreparedStatement(shared_ptr<DuckDBPyConnection> connection_p,
+                                                     shared_ptr<PreparedStatement> prepared_p, string query_p)
+    : connection(std::move(connection_p)), prepared(std::move(prepared_p)), query(std::move(query_p)) {
+}
+
+shared_ptr<DuckDBPyConnection> DuckDBPyPreparedStatement::Execute(py::object params) {
+	return connection->ExecutePrepared(*prepared, std::move(params));
+}
+
+const string &DuckDBPyPreparedStatement::Query() const {
+	return query;
+}
+
+idx_t DuckDBPyPreparedStatement::ParameterCount() const {
+	return prepared->named_param_map.size();
+}
+
+py::set DuckDBPyPreparedStatement::NamedParameters() const {
+	py::set result;
+	for (auto &param : prepared->named_param_map) {
+		result.add(param.first);
+	}
+	return result;
+}
+
+StatementType DuckDBPyPreparedStatement::Type() const {
+	return prepared->GetStatementType();
+}
+
+} // namespace duckdb
@@ -19,6 +19,9 @@
 #include "duckdb/main/relation/value_relation.hpp"
 #include "duckdb/main/relation/filter_relation.hpp"
 #include "duckdb_python/expression/pyexpression.hpp"
+#include "duckdb/function/table/arrow.hpp"
+#include "duckdb/parser/expression/cast_expression.hpp"
+#include "duckdb/parser/expression/columnref_expression.hpp"
 
 namespace duckdb {
 
@@ -799,7 +802,7 @@ void DuckDBPyRelation::ExecuteOrThrow(bool stream_result) {
 	if (query_result->HasError()) {
 		query_result->ThrowError();
 	}
-	result = make_uniq<DuckDBPyResult>(std::move(query_result));
+	result = make_uniq<DuckDBPyResult>(std::move(query_result), rel->context.TryGetContext());
 }
 
 PandasDataFrame DuckDBPyRelation::FetchDF(bool date_as_object) {
@@ -830,6 +833,22 @@ Optional<py::tuple> DuckDBPyRelation::FetchOne() {
 	return result->Fetchone();
 }
 
+py::object DuckDBPyRelation::Iterate() {
+	if (rel) {
+		// Every iteration over a relation executes it again
+		ExecuteOrThrow(true);
+	}
+	EnablePrefetch();
+	auto fetchone = py::cast(this, py::return_value_policy::reference).attr("fetchone");
+	return py::module::import("builtins").attr("iter")(fetchone, py::none());
+}
+
+void DuckDBPyRelation::EnablePrefetch() {
+	if (result) {
+		result->EnablePrefetch();
+	}
+}
+
 py::list DuckDBPyRelation::FetchMany(idx_t size) {
 	if (!result) {
 		if (!rel) {
@@ -844,6 +863,29 @@ py::list DuckDBPyRelation::FetchMany(idx_t size) {
 	return result->Fetchmany(size);
 }
 
+py::list DuckDBPyRelation::FetchRowChunk(const py::object &row_type, const py::object &fields, bool stream,
+                                         bool prefetch) {
+	if (!result) {
+		if (!rel) {
+			return py::list();
+		}
+		ExecuteOrThrow(stream);
+		D_ASSERT(result);
+		if (prefetch) {
+			EnablePrefetch();
+		}
+	}
+	if (result->IsClosed()) {
+		return py::list();
+	}
+	auto rows = result->FetchRowChunk(row_type, fields);
+	if (rows.empty()) {
+		// like fetchall, the next fetch executes the relation again
+		result = nullptr;
+	}
+	return rows;
+}
+
 py::list DuckDBPyRelation::FetchAll() {
 	if (!result) {
 		if (!rel) {
@@ -946,22 +988,108 @@ duckdb::pyarrow::Table DuckDBPyRelation::ToArrowTable(idx_t batch_size) {
 	return ToArrowTableInternal(batch_size, false);
 }
 
-py::object DuckDBPyRelation::ToArrowCapsule() {
+static bool StreamArrowCapsule(ClientContext &context) {
+	Value setting;
+	if (context.TryGetCurrentSetting("python_arrow_capsule_streaming", setting)) {
+		return setting.GetValue<bool>();
+	}
+	return true;
+}
+
+//! Cast the columns of the relation to the types and names of the ArrowSchema that the consumer requested
+static shared_ptr<Relation> CastToRequestedSchema(Relation &rel, const py::object &requested_schema) {
+	if (!PyCapsule_IsValid(requested_schema.ptr(), "arrow_schema")) {
+		throw InvalidInputException("'requested_schema' has to be a PyCapsule that holds an ArrowSchema");
+	}
+	auto &schema = *reinterpret_cast<ArrowSchema *>(PyCapsule_GetPointer(requested_schema.ptr(), "arrow_schema"));
+	auto &columns = rel.Columns();
+	if (string(schema.format) != "+s" || idx_t(schema.n_children) != columns.size()) {
+		throw InvalidInputException("The requested schema has %d fields, but the relation has %d columns",
+		                            schema.n_children, columns.size());
+	}
+	vector<unique_ptr<ParsedExpression>> expressions;
+	vector<string> aliases;
+	for (idx_t i = 0; i < columns.size(); i++) {
+		auto &child = *schema.children[i];
+		auto type = ArrowTableFunction::GetArrowLogicalType(child)->GetDuckType();
+		expressions.push_back(make_uniq<CastExpression>(type, make_uniq<ColumnRefExpression>(columns[i].Name())));
+		aliases.push_back(child.name ? string(child.name) : columns[i].Name());
+	}
+	return rel.Project(std::move(expressions), aliases);
+}
+
+py::object DuckDBPyRelation::ToArrowCapsule(const py::object &requested_schema) {
+	if (!py::none().is(requested_schema)) {
+		if (result || !rel) {
+			throw InvalidInputException("A requested schema can only be applied to a relation that was not executed");
+		}
+		DuckDBPyRelation cast_relation(CastToRequestedSchema(*rel, requested_schema));
+		return cast_relation.ToArrowCapsule(py::none());
+	}
 	if (!result) {
 		if (!rel) {
 			return py::none();
 		}
-		ExecuteOrThrow();
+		// stream the result, every batch the consumer pulls executes the query a bit further.
+		// The stream is closed when another query runs on the connection, that can be turned off with
+		// 'python_arrow_capsule_streaming' for consumers that use the same connection
+		ExecuteOrThrow(StreamArrowCapsule(*rel->context.GetContext()));
 	}
 	AssertResultOpen();
 	return result->FetchArrowCapsule();
 }
 
-PolarsDataFrame DuckDBPyRelation::ToPolars(idx_t batch_size) {
+py::object DuckDBPyRelation::ToPolars(idx_t batch_size, bool lazy) {
+	if (lazy && rel) {
+		// the LazyFrame executes the relation when it is collected, streaming the result in batches
+		auto relation = py::cast(make_uniq<DuckDBPyRelation>(rel));
+		return py::module_::import("duckdb.polars_io").attr("duckdb_source")(relation, batch_size);
+	}
 	auto arrow = ToArrowTableInternal(batch_size, true);
+	if (lazy) {
+		return pybind11::module_::import("polars").attr("DataFrame")(arrow).attr("lazy")();
+	}
 	return py::cast<PolarsDataFrame>(pybind11::module_::import("polars").attr("DataFrame")(arrow));
 }
 
+py::object DuckDBPyRelation::FetchRecordBatchesAsync(idx_t batch_size) {
+	auto aio = py::module_::import("duckdb.aio");
+	return aio.attr("fetch_record_batches")(py::cast(this, py::return_value_policy::reference), batch_size);
+}
+
+unique_ptr<DuckDBPyPendingQuery> DuckDBPyRelation::PendingQuery() {
+	if (!rel) {
+		throw InvalidInputException("This relation does not contain a query to execute");
+	}
+	result.reset();
+	auto context = rel->context.GetContext();
+	unique_ptr<PendingQueryResult> pending_query;
+	{
+		py::gil_scoped_release release;
+		pending_query = context->PendingQuery(rel, true);
+		if (pending_query->HasError()) {
+			pending_query->ThrowError();
+		}
+	}
+	this->executed = true;
+	auto owner = py::cast(this, py::return_value_policy::reference);
+	auto finish = [this, owner](unique_ptr<QueryResult> query_result) -> py::object {
+		result = make_uniq<DuckDBPyResult>(std::move(query_result), rel->context.TryGetContext());
+		return owner;
+	};
+	return make_uniq<DuckDBPyPendingQuery>(context, std::move(pending_query), owner, nullptr, std::move(finish));
+}
+
+string DuckDBPyRelation::ExecuteStreamTask() {
+	AssertResult();
+	return result->ExecuteStreamTask();
+}
+
+py::object DuckDBPyRelation::FetchRecordBatch(idx_t batch_size) {
+	AssertResult();
+	return result->FetchRecordBatch(batch_size);
+}
+
 duckdb::pyarrow::RecordBatchReader DuckDBPyRelation::ToRecordBatch(idx_t batch_size) {
 	if (!result) {
 		if (!rel) {
@@ -1131,8 +1259,71 @@ static Value NestedDictToStruct(const py::object &dictionary) {
 	return Value::STRUCT(std::move(children));
 }
 
+//! Parse the options of COPY that decide how the output is split into files and what happens to existing files
+static void ParseFileOutputOptions(case_insensitive_map_t<vector<Value>> &options, const string &function_name,
+                                   const py::object &overwrite, const py::object &per_thread_output,
+                                   const py::object &use_tmp_file, const py::object &partition_by,
+                                   const py::object &write_partition_columns, const py::object &append) {
+	if (!py::none().is(overwrite)) {
+		if (!py::isinstance<py::bool_>(overwrite)) {
+			throw InvalidInputException(function_name + " only accepts 'overwrite' as a boolean");
+		}
+		options["overwrite_or_ignore"] = {Value::BOOLEAN(py::bool_(overwrite))};
+	}
+
+	if (!py::none().is(per_thread_output)) {
+		if (!py::isinstance<py::bool_>(per_thread_output)) {
+			throw InvalidInputException(function_name + " only accepts 'per_thread_output' as a boolean");
+		}
+		options["per_thread_output"] = {Value::BOOLEAN(py::bool_(per_thread_output))};
+	}
+
+	if (!py::none().is(use_tmp_file)) {
+		if (!py::isinstance<py::bool_>(use_tmp_file)) {
+			throw InvalidInputException(function_name + " only accepts 'use_tmp_file' as a boolean");
+		}
+		options["use_tmp_file"] = {Value::BOOLEAN(py::bool_(use_tmp_file))};
+	}
+
+	if (!py::none().is(partition_by)) {
+		if (!py::isinstance<py::list>(partition_by)) {
+			throw InvalidInputException(function_name + " only accepts 'partition_by' as a list of strings");
+		}
+		vector<Value> partition_by_values;
+		const py::list &partition_fields = partition_by;
+		for (auto &field : partition_fields) {
+			if (!py::isinstance<py::str>(field)) {
+				throw InvalidInputException(function_name + " only accepts 'partition_by' as a list of strings");
+			}
+			partition_by_values.emplace_back(Value(py::str(field)));
+		}
+		options["partition_by"] = {partition_by_values};
+	}
+
+	if (!py::none().is(write_partition_columns)) {
+		if (!py::isinstance<py::bool_>(write_partition_columns)) {
+			throw InvalidInputException(function_name + " only accepts 'write_partition_columns' as a boolean");
+		}
+		// the option is only passed on when it is set, the COPY of the file formats that do not know it stays the same
+		if (py::bool_(write_partition_columns)) {
+			options["write_partition_columns"] = {Value::BOOLEAN(true)};
+		}
+	}
+
+	if (!py::none().is(append)) {
+		if (!py::isinstance<py::bool_>(append)) {
+			throw InvalidInputException(function_name + " only accepts 'append' as a boolean");
+		}
+		options["append"] = {Value::BOOLEAN(py::bool_(append))};
+	}
+}
+
 void DuckDBPyRelation::ToParquet(const string &filename, const py::object &compression, const py::object &field_ids,
-                                 const py::object &row_group_size_bytes, const py::object &row_group_size) {
+                                 const py::object &row_group_size_bytes, const py::object &row_group_size,
+                                 const py::object &overwrite, const py::object &per_thread_output,
+                                 const py::object &use_tmp_file, const py::object &partition_by,
+                                 const py::object &write_partition_columns, const py::object &append,
+                                 const py::object &row_groups_per_file, const py::object &file_size_bytes) {
 	case_insensitive_map_t<vector<Value>> options;
 
 	if (!py::none().is(compression)) {
@@ -1173,6 +1364,28 @@ void DuckDBPyRelation::ToParquet(const string &filename, const py::object &compr
 		options["row_group_size"] = {Value(row_group_size_int)};
 	}
 
+	if (!py::none().is(row_groups_per_file)) {
+		if (!py::isinstance<py::int_>(row_groups_per_file)) {
+			throw InvalidInputException("to_parquet only accepts 'row_groups_per_file' as an integer");
+		}
+		int64_t row_groups_per_file_int = py::int_(row_groups_per_file);
+		options["row_groups_per_file"] = {Value(row_groups_per_file_int)};
+	}
+
+	if (!py::none().is(file_size_bytes)) {
+		if (py::isinstance<py::int_>(file_size_bytes)) {
+			int64_t file_size_bytes_int = py::int_(file_size_bytes);
+			options["file_size_bytes"] = {Value(file_size_bytes_int)};
+		} else if (py::isinstance<py::str>(file_size_bytes)) {
+			options["file_size_bytes"] = {Value(py::str(file_size_bytes))};
+		} else {
+			throw InvalidInputException("to_parquet only accepts 'file_size_bytes' as an integer or a string");
+		}
+	}
+
+	ParseFileOutputOptions(options, "to_parquet", overwrite, per_thread_output, use_tmp_file, partition_by,
+	                       write_partition_columns, append);
+
 	auto write_parquet = rel->WriteParquetRel(filename, std::move(options));
 	PyExecuteRelation(write_parquet);
 }
@@ -1183,7 +1396,7 @@ void DuckDBPyRelation::ToCSV(const string &filename, const py::object &sep, cons
                              const py::object &quoting, const py::object &encoding, const py::object &compression,
                              const py::object &overwrite, const py::object &per_thread_output,
                              const py::object &use_tmp_file, const py::object &partition_by,
-                             const py::object &write_partition_columns) {
+                             const py::object &write_partition_columns, const py::object &append) {
 	case_insensitive_map_t<vector<Value>> options;
 
 	if (!py::none().is(sep)) {
@@ -1274,56 +1487,18 @@ void DuckDBPyRelation::ToCSV(const string &filename, const py::object &sep, cons
 		options["compression"] = {Value(py::str(compression))};
 	}
 
-	if (!py::none().is(overwrite)) {
-		if (!py::isinstance<py::bool_>(overwrite)) {
-			throw InvalidInputException("to_csv only accepts 'overwrite' as a boolean");
-		}
-		options["overwrite_or_ignore"] = {Value::BOOLEAN(py::bool_(overwrite))};
-	}
-
-	if (!py::none().is(per_thread_output)) {
-		if (!py::isinstance<py::bool_>(per_thread_output)) {
-			throw InvalidInputException("to_csv only accepts 'per_thread_output' as a boolean");
-		}
-		options["per_thread_output"] = {Value::BOOLEAN(py::bool_(per_thread_output))};
-	}
-
-	if (!py::none().is(use_tmp_file)) {
-		if (!py::isinstance<py::bool_>(use_tmp_file)) {
-			throw InvalidInputException("to_csv only accepts 'use_tmp_file' as a boolean");
-		}
-		options["use_tmp_file"] = {Value::BOOLEAN(py::bool_(use_tmp_file))};
-	}
-
-	if (!py::none().is(partition_by)) {
-		if (!py::isinstance<py::list>(partition_by)) {
-			throw InvalidInputException("to_csv only accepts 'partition_by' as a list of strings");
-		}
-		vector<Value> partition_by_values;
-		const py::list &partition_fields = partition_by;
-		for (auto &field : partition_fields) {
-			if (!py::isinstance<py::str>(field)) {
-				throw InvalidInputException("to_csv only accepts 'partition_by' as a list of strings");
-			}
-			partition_by_values.emplace_back(Value(py::str(field)));
-		}
-		options["partition_by"] = {partition_by_values};
-	}
-
-	if (!py::none().is(write_partition_columns)) {
-		if (!py::isinstance<py::bool_>(write_partition_columns)) {
-			throw InvalidInputException("to_csv only accepts 'write_partition_columns' as a boolean");
-		}
-		options["write_partition_columns"] = {Value::BOOLEAN(py::bool_(write_partition_columns))};
-	}
+	ParseFileOutputOptions(options, "to_csv", overwrite, per_thread_output, use_tmp_file, partition_by,
+	                       write_partition_columns, append);
 
 	auto write_csv = rel->WriteCSVRel(filename, std::move(options));
 	PyExecuteRelation(write_csv);
 }
 
 // should this return a rel with the new view?
-unique_ptr<DuckDBPyRelation> DuckDBPyRelation::CreateView(const string &view_name, bool replace) {
-	rel->CreateView(view_name, replace);
+unique_ptr<DuckDBPyRelation> DuckDBPyRelation::CreateView(const string &view_name, bool replace, bool temporary) {
+	// the temporary view can shadow a table that is referred to by a cached statement
+	PythonCatalogVersion::Get(*rel->context.GetContext())->version++;
+	rel->CreateView(view_name, replace, temporary);
 	return make_uniq<DuckDBPyRelation>(rel);
 }
 
@@ -1402,18 +1577,30 @@ void DuckDBPyRelation::Create(const string &table) {
 	AssertRelation();
 	auto parsed_info = QualifiedName::Parse(table);
 	auto create = rel->CreateRel(parsed_info.schema, parsed_info.name, false);
+	PythonCatalogVersion::Get(*rel->context.GetContext())->version++;
 	PyExecuteRelation(create);
 }
 
-unique_ptr<DuckDBPyRelation> DuckDBPyRelation::Map(py::function fun, Optional<py::object> schema) {
+unique_ptr<DuckDBPyRelation> DuckDBPyRelation::Map(py::function fun, Optional<py::object> schema,
+                                                   const Optional<py::int_> &batch_size, py::object executor) {
 	AssertRelation();
+	idx_t rows_per_call = 0;
+	if (!py::none().is(batch_size)) {
+		rows_per_call = py::cast<idx_t>(batch_size);
+		if (rows_per_call == 0) {
+			throw InvalidInputException("'batch_size' should be a positive number of rows");
+		}
+	}
 	vector<Value> params;
 	params.emplace_back(Value::POINTER(CastPointerToValue(fun.ptr())));
 	params.emplace_back(Value::POINTER(CastPointerToValue(schema.ptr())));
+	params.emplace_back(Value::POINTER(CastPointerToValue(executor.ptr())));
+	params.emplace_back(Value::UBIGINT(rows_per_call));
 	auto relation = make_uniq<DuckDBPyRelation>(rel->TableFunction("python_map_function", params));
 	auto rel_dependency = make_uniq<ExternalDependency>();
 	rel_dependency->AddDependency("map", PythonDependencyItem::Create(std::move(fun)));
 	rel_dependency->AddDependency("schema", PythonDependencyItem::Create(std::move(schema)));
+	rel_dependency->AddDependency("executor", PythonDependencyItem::Create(std::move(executor)));
 	relation->rel->AddExternalDependency(std::move(rel_dependency));
 	return relation;
 }
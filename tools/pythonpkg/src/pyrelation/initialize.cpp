@@ -33,21 +33,30 @@ static void InitializeConsumers(py::class_<DuckDBPyRelation> &m) {
 	DefineMethod({"to_parquet", "write_parquet"}, m, &DuckDBPyRelation::ToParquet,
 	             "Write the relation object to a Parquet file in 'file_name'", py::arg("file_name"), py::kw_only(),
 	             py::arg("compression") = py::none(), py::arg("field_ids") = py::none(),
-	             py::arg("row_group_size_bytes") = py::none(), py::arg("row_group_size") = py::none());
+	             py::arg("row_group_size_bytes") = py::none(), py::arg("row_group_size") = py::none(),
+	             py::arg("overwrite") = py::none(), py::arg("per_thread_output") = py::none(),
+	             py::arg("use_tmp_file") = py::none(), py::arg("partition_by") = py::none(),
+	             py::arg("write_partition_columns") = py::none(), py::arg("append") = py::none(),
+	             py::arg("row_groups_per_file") = py::none(), py::arg("file_size_bytes") = py::none());
 
-	DefineMethod(
-	    {"to_csv", "write_csv"}, m, &DuckDBPyRelation::ToCSV, "Write the relation object to a CSV file in 'file_name'",
-	    py::arg("file_name"), py::kw_only(), py::arg("sep") = py::none(), py::arg("na_rep") = py::none(),
-	    py::arg("header") = py::none(), py::arg("quotechar") = py::none(), py::arg("escapechar") = py::none(),
-	    py::arg("date_format") = py::none(), py::arg("timestamp_format") = py::none(), py::arg("quoting") = py::none(),
-	    py::arg("encoding") = py::none(), py::arg("compression") = py::none(), py::arg("overwrite") = py::none(),
-	    py::arg("per_thread_output") = py::none(), py::arg("use_tmp_file") = py::none(),
-	    py::arg("partition_by") = py::none(), py::arg("write_partition_columns") = py::none());
+	DefineMethod({"to_csv", "write_csv"}, m, &DuckDBPyRelation::ToCSV,
+	             "Write the relation object to a CSV file in 'file_name'", py::arg("file_name"), py::kw_only(),
+	             py::arg("sep") = py::none(), py::arg("na_rep") = py::none(), py::arg("header") = py::none(),
+	             py::arg("quotechar") = py::none(), py::arg("escapechar") = py::none(),
+	             py::arg("date_format") = py::none(), py::arg("timestamp_format") = py::none(),
+	             py::arg("quoting") = py::none(), py::arg("encoding") = py::none(), py::arg("compression") = py::none(),
+	             py::arg("overwrite") = py::none(), py::arg("per_thread_output") = py::none(),
+	             py::arg("use_tmp_file") = py::none(), py::arg("partition_by") = py::none(),
+	             py::arg("write_partition_columns") = py::none(), py::arg("append") = py::none());
 
 	m.def("fetchone", &DuckDBPyRelation::FetchOne, "Execute and fetch a single row as a tuple")
+	    .def("__iter__", &DuckDBPyRelation::Iterate, "Execute and iterate over the rows, fetching them chunk by chunk")
 	    .def("fetchmany", &DuckDBPyRelation::FetchMany, "Execute and fetch the next set of rows as a list of tuples",
 	         py::arg("size") = 1)
 	    .def("fetchall", &DuckDBPyRelation::FetchAll, "Execute and fetch all rows as a list of tuples")
+	    .def("_fetch_row_chunk", &DuckDBPyRelation::FetchRowChunk,
+	         "Execute and fetch the rows of the next chunk as instances of a tuple subclass", py::arg("row_type"),
+	         py::arg("fields") = py::none(), py::kw_only(), py::arg("stream") = true, py::arg("prefetch") = false)
 	    .def("fetchnumpy", &DuckDBPyRelation::FetchNumpy,
 	         "Execute and fetch all rows as a Python dict mapping each column to one numpy arrays")
 	    .def("df", &DuckDBPyRelation::FetchDF, "Execute and fetch all rows as a pandas DataFrame", py::kw_only(),
@@ -65,19 +74,35 @@ static void InitializeConsumers(py::class_<DuckDBPyRelation> &m) {
 	    .def("to_arrow_table", &DuckDBPyRelation::ToArrowTable, "Execute and fetch all rows as an Arrow Table",
 	         py::arg("batch_size") = 1000000)
 	    .def("pl", &DuckDBPyRelation::ToPolars, "Execute and fetch all rows as a Polars DataFrame",
-	         py::arg("batch_size") = 1000000)
+	         py::arg("batch_size") = 1000000, py::kw_only(), py::arg("lazy") = false)
 	    .def("torch", &DuckDBPyRelation::FetchPyTorch, "Fetch a result as dict of PyTorch Tensors")
 	    .def("tf", &DuckDBPyRelation::FetchTF, "Fetch a result as dict of TensorFlow Tensors");
 	const char *capsule_docs = R"(
 			Execute and return an ArrowArrayStream through the Arrow PyCapsule Interface.
 
+			The result is streamed, so it has to be consumed before another query runs on the connection of the
+			relation. Set 'python_arrow_capsule_streaming' to false to materialize the result instead, when the
+			consumer runs queries on the same connection, such as duckdb.sql over a reader of the relation.
+			The columns are cast to the types and names of the 'requested_schema', when it is given.
+
 			https://arrow.apache.org/docs/dev/format/CDataInterface/PyCapsuleInterface.html
 		)";
-	m.def("__arrow_c_stream__", &DuckDBPyRelation::ToArrowCapsule, capsule_docs);
+	m.def("__arrow_c_stream__", &DuckDBPyRelation::ToArrowCapsule, capsule_docs,
+	      py::arg("requested_schema") = py::none());
 	m.def("record_batch", &DuckDBPyRelation::ToRecordBatch,
 	      "Execute and return an Arrow Record Batch Reader that yields all rows", py::arg("batch_size") = 1000000)
 	    .def("fetch_arrow_reader", &DuckDBPyRelation::ToRecordBatch,
-	         "Execute and return an Arrow Record Batch Reader that yields all rows", py::arg("batch_size") = 1000000);
+	         "Execute and return an Arrow Record Batch Reader that yields all rows", py::arg("batch_size") = 1000000)
+	    .def("afetch_record_batches", &DuckDBPyRelation::FetchRecordBatchesAsync,
+	         "Execute without blocking the asyncio event loop and asynchronously iterate over the Arrow Record Batches",
+	         py::arg("batch_size") = 1000000);
+	m.def("_pending_query", &DuckDBPyRelation::PendingQuery,
+	      "Start executing the relation, the result is set once the pending query is finished");
+	m.def("_execute_stream_task", &DuckDBPyRelation::ExecuteStreamTask,
+	      "Execute tasks of the result for a few milliseconds, returns 'ready' once the next chunk can be fetched");
+	m.def("_fetch_record_batch", &DuckDBPyRelation::FetchRecordBatch,
+	      "Fetch the next Arrow Record Batch of the result, None is returned once all rows are fetched",
+	      py::arg("batch_size") = 1000000);
 }
 
 static void InitializeAggregates(py::class_<DuckDBPyRelation> &m) {
@@ -284,10 +309,11 @@ void DuckDBPyRelation::Initialize(py::handle &m) {
 
 	DefineMethod({"create_view", "to_view"}, relation_module, &DuckDBPyRelation::CreateView,
 	             "Creates a view named view_name that refers to the relation object", py::arg("view_name"),
-	             py::arg("replace") = true);
+	             py::arg("replace") = true, py::kw_only(), py::arg("temporary") = false);
 
 	relation_module
 	    .def("map", &DuckDBPyRelation::Map, py::arg("map_function"), py::kw_only(), py::arg("schema") = py::none(),
+	         py::arg("batch_size") = py::none(), py::arg("executor") = py::none(),
 	         "Calls the passed function on the relation")
 	    .def("show", &DuckDBPyRelation::Print, "Display a summary of the data", py::kw_only(),
 	         py::arg("max_width") = py::none(), py::arg("max_rows") = py::none(), py::arg("max_col_width") = py::none(),
@@ -8,6 +8,8 @@
 #include "duckdb/common/arrow/arrow_converter.hpp"
 #include "duckdb/common/arrow/arrow_wrapper.hpp"
 #include "duckdb/common/arrow/result_arrow_wrapper.hpp"
+#include "duckdb/main/stream_query_result.hpp"
+#include "duckdb/main/client_context.hpp"
 #include "duckdb/common/types/date.hpp"
 #include "duckdb/common/types/hugeint.hpp"
 #include "duckdb/common/types/uhugeint.hpp"
@@ -19,10 +21,101 @@
 #include "duckdb/common/enums/stream_execution_result.hpp"
 #include "duckdb_python/arrow/arrow_export_utils.hpp"
 #include "duckdb/main/chunk_scan_state/query_result.hpp"
+#include "duckdb/parallel/task_scheduler.hpp"
+#include "duckdb_python/pypending_query.hpp"
+
+#include <chrono>
+#include <condition_variable>
+#include <deque>
+#include <functional>
+#include <thread>
 
 namespace duckdb {
 
-DuckDBPyResult::DuckDBPyResult(unique_ptr<QueryResult> result_p) : result(std::move(result_p)) {
+//! A single background thread per connection that runs the chunk fetches of its results, one at a time.
+//! A connection only streams one result at a time, so its results share the thread instead of starting their own
+class PrefetchWorker : public ClientContextState {
+public:
+	static constexpr const char *NAME = "python_prefetch_worker";
+
+public:
+	PrefetchWorker() : worker([this]() { Run(); }) {
+	}
+	~PrefetchWorker() override {
+		{
+			std::lock_guard<std::mutex> guard(lock);
+			shutdown = true;
+		}
+		condition.notify_one();
+		worker.join();
+	}
+
+public:
+	static shared_ptr<PrefetchWorker> Get(ClientContext &context) {
+		return context.registered_state->GetOrCreate<PrefetchWorker>(NAME);
+	}
+
+	std::future<unique_ptr<DataChunk>> Schedule(std::function<unique_ptr<DataChunk>()> fetch) {
+		std::packaged_task<unique_ptr<DataChunk>()> task(std::move(fetch));
+		auto future = task.get_future();
+		{
+			// the fetch of a result that was closed by a newer query of the connection can still be queued
+			std::lock_guard<std::mutex> guard(lock);
+			pending.push_back(std::move(task));
+		}
+		condition.notify_one();
+		return future;
+	}
+
+private:
+	void Run() {
+		while (true) {
+			std::packaged_task<unique_ptr<DataChunk>()> task;
+			{
+				std::unique_lock<std::mutex> guard(lock);
+				condition.wait(guard, [this]() { return shutdown || !pending.empty(); });
+				if (pending.empty()) {
+					return;
+				}
+				task = std::move(pending.front());
+				pending.pop_front();
+			}
+			task();
+		}
+	}
+
+private:
+	std::mutex lock;
+	std::condition_variable condition;
+	std::deque<std::packaged_task<unique_ptr<DataChunk>()>> pending;
+	bool shutdown = false;
+	//! Declared last, the thread starts once the other members are initialized
+	std::thread worker;
+};
+
+//! Scans a query result, starting with the chunk that was prefetched from it
+class PrefetchedChunkScanState : public QueryResultChunkScanState {
+public:
+	PrefetchedChunkScanState(QueryResult &result, unique_ptr<DataChunk> prefetched_p)
+	    : QueryResultChunkScanState(result), prefetched(std::move(prefetched_p)) {
+	}
+
+public:
+	bool LoadNextChunk(ErrorData &error) override {
+		if (prefetched) {
+			current_chunk = std::move(prefetched);
+			offset = 0;
+			return true;
+		}
+		return QueryResultChunkScanState::LoadNextChunk(error);
+	}
+
+private:
+	unique_ptr<DataChunk> prefetched;
+};
+
+DuckDBPyResult::DuckDBPyResult(unique_ptr<QueryResult> result_p, const shared_ptr<ClientContext> &context_p)
+    : result(std::move(result_p)), context(context_p) {
 	if (!result) {
 		throw InternalException("PyResult created without a result object");
 	}
@@ -31,8 +124,12 @@ DuckDBPyResult::DuckDBPyResult(unique_ptr<QueryResult> result_p) : result(std::m
 DuckDBPyResult::~DuckDBPyResult() {
 	try {
 		py::gil_scoped_release gil;
+		if (prefetched_chunk.valid()) {
+			prefetched_chunk.wait();
+		}
+		prefetch_worker.reset();
+		record_batch_scan_state.reset();
 		result.reset();
-		current_chunk.reset();
 	} catch (...) { // NOLINT
 	}
 }
@@ -59,6 +156,12 @@ unique_ptr<DataChunk> DuckDBPyResult::FetchChunk() {
 }
 
 unique_ptr<DataChunk> DuckDBPyResult::FetchNext(QueryResult &query_result) {
+	if (prefetched_chunk.valid()) {
+		auto chunk = WaitForPrefetch();
+		if (chunk) {
+			return chunk;
+		}
+	}
 	if (!result_closed && query_result.type == QueryResultType::STREAM_RESULT &&
 	    !query_result.Cast<StreamQueryResult>().IsOpen()) {
 		result_closed = true;
@@ -94,6 +197,12 @@ unique_ptr<DataChunk> DuckDBPyResult::FetchNext(QueryResult &query_result) {
 }
 
 unique_ptr<DataChunk> DuckDBPyResult::FetchNextRaw(QueryResult &query_result) {
+	if (prefetched_chunk.valid()) {
+		auto chunk = WaitForPrefetch();
+		if (chunk) {
+			return chunk;
+		}
+	}
 	if (!result_closed && query_result.type == QueryResultType::STREAM_RESULT &&
 	    !query_result.Cast<StreamQueryResult>().IsOpen()) {
 		result_closed = true;
@@ -106,34 +215,340 @@ unique_ptr<DataChunk> DuckDBPyResult::FetchNextRaw(QueryResult &query_result) {
 	return chunk;
 }
 
-Optional<py::tuple> DuckDBPyResult::Fetchone() {
+//! Fetch the next chunk of a stream result, without checking for interrupts as this runs in a background thread
+static unique_ptr<DataChunk> FetchStreamChunk(StreamQueryResult &stream_result) {
+	if (!stream_result.IsOpen()) {
+		return nullptr;
+	}
+	StreamExecutionResult execution_result;
+	while (!StreamQueryResult::IsChunkReady(execution_result = stream_result.ExecuteTask())) {
+		if (execution_result == StreamExecutionResult::BLOCKED) {
+			stream_result.WaitForTask();
+		}
+	}
+	if (execution_result == StreamExecutionResult::EXECUTION_CANCELLED) {
+		throw InvalidInputException("The execution of the query was cancelled before it could finish, likely "
+		                            "caused by executing a different query");
+	}
+	if (execution_result == StreamExecutionResult::EXECUTION_ERROR) {
+		stream_result.ThrowError();
+	}
+	auto chunk = stream_result.Fetch();
+	if (stream_result.HasError()) {
+		stream_result.ThrowError();
+	}
+	return chunk;
+}
+
+void DuckDBPyResult::EnablePrefetch() {
+	prefetch = true;
+}
+
+string DuckDBPyResult::ExecuteStreamTask() {
+	if (!result || result->type != QueryResultType::STREAM_RESULT || prefetched_chunk.valid()) {
+		return "ready";
+	}
+	auto &stream_result = result->Cast<StreamQueryResult>();
+	if (!stream_result.IsOpen()) {
+		return "ready";
+	}
+	StreamExecutionResult execution_result;
+	{
+		py::gil_scoped_release release;
+		auto deadline =
+		    std::chrono::steady_clock::now() + std::chrono::milliseconds(idx_t(DuckDBPyPendingQuery::TASK_SLICE_MS));
+		do {
+			execution_result = stream_result.ExecuteTask();
+		} while (execution_result == StreamExecutionResult::CHUNK_NOT_READY &&
+		         std::chrono::steady_clock::now() < deadline);
+	}
+	switch (execution_result) {
+	case StreamExecutionResult::CHUNK_NOT_READY:
+		return "pending";
+	case StreamExecutionResult::BLOCKED:
+	case StreamExecutionResult::NO_TASKS_AVAILABLE:
+		return "waiting";
+	default:
+		// errors are thrown when the chunk is fetched
+		return "ready";
+	}
+}
+
+void DuckDBPyResult::StartPrefetch() {
+	if (!prefetch || result->type != QueryResultType::STREAM_RESULT) {
+		return;
+	}
+	auto &stream_result = result->Cast<StreamQueryResult>();
+	if (!prefetch_worker) {
+		prefetch_worker = PrefetchWorker::Get(*stream_result.context);
+	}
+	prefetched_chunk = prefetch_worker->Schedule([&stream_result]() { return FetchStreamChunk(stream_result); });
+}
+
+unique_ptr<DataChunk> DuckDBPyResult::WaitForPrefetch() {
+	D_ASSERT(prefetched_chunk.valid());
+	D_ASSERT(result->type == QueryResultType::STREAM_RESULT);
+	// The GIL should not be held here, producing the chunk might require it (i.e. when scanning a DataFrame)
+	bool interrupted = false;
+	while (prefetched_chunk.wait_for(std::chrono::milliseconds(10)) != std::future_status::ready) {
+		py::gil_scoped_acquire gil;
+		if (!interrupted && PyErr_CheckSignals() != 0) {
+			interrupted = true;
+			result->Cast<StreamQueryResult>().context->Interrupt();
+		}
+	}
+	if (interrupted) {
+		try {
+			prefetched_chunk.get();
+		} catch (...) { // NOLINT
+		}
+		throw std::runtime_error("Query interrupted");
+	}
+	return prefetched_chunk.get();
+}
+
+unique_ptr<DataChunk> DuckDBPyResult::TakePrefetch() {
+	if (!prefetched_chunk.valid()) {
+		return nullptr;
+	}
+	unique_ptr<py::gil_scoped_release> release;
+	if (PyGILState_Check()) {
+		release = make_uniq<py::gil_scoped_release>();
+	}
+	auto chunk = WaitForPrefetch();
+	if (chunk && chunk->size() == 0) {
+		return nullptr;
+	}
+	return chunk;
+}
+
+template <class T>
+struct RowConversionOperator {
+	static PyObject *Convert(T value) {
+		return PyLong_FromLongLong(value);
+	}
+};
+
+template <>
+struct RowConversionOperator<bool> {
+	static PyObject *Convert(bool value) {
+		return PyBool_FromLong(value);
+	}
+};
+
+template <>
+struct RowConversionOperator<uint32_t> {
+	static PyObject *Convert(uint32_t value) {
+		return PyLong_FromUnsignedLongLong(value);
+	}
+};
+
+template <>
+struct RowConversionOperator<uint64_t> {
+	static PyObject *Convert(uint64_t value) {
+		return PyLong_FromUnsignedLongLong(value);
+	}
+};
+
+template <>
+struct RowConversionOperator<float> {
+	static PyObject *Convert(float value) {
+		return PyFloat_FromDouble(value);
+	}
+};
+
+template <>
+struct RowConversionOperator<double> {
+	static PyObject *Convert(double value) {
+		return PyFloat_FromDouble(value);
+	}
+};
+
+template <>
+struct RowConversionOperator<string_t> {
+	static PyObject *Convert(string_t value) {
+		return PyUnicode_FromStringAndSize(value.GetData(), static_cast<Py_ssize_t>(value.GetSize()));
+	}
+};
+
+struct BlobConversionOperator {
+	static PyObject *Convert(string_t value) {
+		return PyBytes_FromStringAndSize(value.GetData(), static_cast<Py_ssize_t>(value.GetSize()));
+	}
+};
+
+template <class T, class OP = RowConversionOperator<T>>
+static void ConvertColumnToRows(Vector &vector, idx_t count, idx_t col_idx, PyObject *rows) {
+	auto data = FlatVector::GetData<T>(vector);
+	auto &mask = FlatVector::Validity(vector);
+	for (idx_t row_idx = 0; row_idx < count; row_idx++) {
+		PyObject *item;
+		if (!mask.RowIsValid(row_idx)) {
+			item = Py_None;
+			Py_INCREF(item);
+		} else {
+			item = OP::Convert(data[row_idx]);
+			if (!item) {
+				throw py::error_already_set();
+			}
+		}
+		PyTuple_SET_ITEM(PyList_GET_ITEM(rows, row_idx), col_idx, item);
+	}
+}
+
+static void ConvertValuesToRows(Vector &vector, idx_t count, idx_t col_idx, PyObject *rows, const LogicalType &type,
+                                const ClientProperties &client_properties) {
+	auto &mask = FlatVector::Validity(vector);
+	for (idx_t row_idx = 0; row_idx < count; row_idx++) {
+		py::object item;
+		if (!mask.RowIsValid(row_idx)) {
+			item = py::none();
+		} else {
+			item = PythonObject::FromValue(vector.GetValue(row_idx), type, client_properties);
+		}
+		PyTuple_SET_ITEM(PyList_GET_ITEM(rows, row_idx), col_idx, item.release().ptr());
+	}
+}
+
+//! Convert all the rows of the chunk to Python tuples at once
+static py::list ConvertChunkToRows(DataChunk &chunk, const vector<LogicalType> &types,
+                                   const ClientProperties &client_properties) {
+	auto count = chunk.size();
+	auto column_count = types.size();
+	py::list rows(count);
+	for (idx_t row_idx = 0; row_idx < count; row_idx++) {
+		auto row = PyTuple_New(static_cast<Py_ssize_t>(column_count));
+		if (!row) {
+			throw py::error_already_set();
+		}
+		PyList_SET_ITEM(rows.ptr(), row_idx, row);
+	}
+	for (idx_t col_idx = 0; col_idx < column_count; col_idx++) {
+		auto &vector = chunk.data[col_idx];
+		switch (types[col_idx].id()) {
+		case LogicalTypeId::BOOLEAN:
+			ConvertColumnToRows<bool>(vector, count, col_idx, rows.ptr());
+			break;
+		case LogicalTypeId::TINYINT:
+			ConvertColumnToRows<int8_t>(vector, count, col_idx, rows.ptr());
+			break;
+		case LogicalTypeId::SMALLINT:
+			ConvertColumnToRows<int16_t>(vector, count, col_idx, rows.ptr());
+			break;
+		case LogicalTypeId::INTEGER:
+			ConvertColumnToRows<int32_t>(vector, count, col_idx, rows.ptr());
+			break;
+		case LogicalTypeId::BIGINT:
+			ConvertColumnToRows<int64_t>(vector, count, col_idx, rows.ptr());
+			break;
+		case LogicalTypeId::UTINYINT:
+			ConvertColumnToRows<uint8_t>(vector, count, col_idx, rows.ptr());
+			break;
+		case LogicalTypeId::USMALLINT:
+			ConvertColumnToRows<uint16_t>(vector, count, col_idx, rows.ptr());
+			break;
+		case LogicalTypeId::UINTEGER:
+			ConvertColumnToRows<uint32_t>(vector, count, col_idx, rows.ptr());
+			break;
+		case LogicalTypeId::UBIGINT:
+			ConvertColumnToRows<uint64_t>(vector, count, col_idx, rows.ptr());
+			break;
+		case LogicalTypeId::FLOAT:
+			ConvertColumnToRows<float>(vector, count, col_idx, rows.ptr());
+			break;
+		case LogicalTypeId::DOUBLE:
+			ConvertColumnToRows<double>(vector, count, col_idx, rows.ptr());
+			break;
+		case LogicalTypeId::VARCHAR:
+			ConvertColumnToRows<string_t>(vector, count, col_idx, rows.ptr());
+			break;
+		case LogicalTypeId::BLOB:
+			ConvertColumnToRows<string_t, BlobConversionOperator>(vector, count, col_idx, rows.ptr());
+			break;
+		default:
+			ConvertValuesToRows(vector, count, col_idx, rows.ptr(), types[col_idx], client_properties);
+			break;
+		}
+	}
+	return rows;
+}
+
+//! Turn the converted tuples into instances of a tuple subclass, all rows share the same 'fields' attribute
+static void ConvertRowsToType(py::list &rows, const py::handle &row_type, const py::handle &fields) {
+	auto tuple_new = py::reinterpret_borrow<py::object>(reinterpret_cast<PyObject *>(&PyTuple_Type)).attr("__new__");
+	py::str fields_name("__fields__");
+	auto count = rows.size();
+	for (idx_t row_idx = 0; row_idx < count; row_idx++) {
+		auto row = py::reinterpret_steal<py::object>(PyObject_CallFunctionObjArgs(
+		    tuple_new.ptr(), row_type.ptr(), PyList_GET_ITEM(rows.ptr(), row_idx), nullptr));
+		if (!row) {
+			throw py::error_already_set();
+		}
+		// bypasses a __setattr__ override, as rows are usually read-only
+		if (fields.ptr() != Py_None && PyObject_GenericSetAttr(row.ptr(), fields_name.ptr(), fields.ptr()) < 0) {
+			throw py::error_already_set();
+		}
+		PyList_SetItem(rows.ptr(), static_cast<Py_ssize_t>(row_idx), row.release().ptr());
+	}
+}
+
+py::list DuckDBPyResult::FetchRowChunk(const py::object &row_type, const py::object &fields) {
+	if (!PyType_Check(row_type.ptr()) ||
+	    !PyType_IsSubtype(reinterpret_cast<PyTypeObject *>(row_type.ptr()), &PyTuple_Type)) {
+		throw InvalidInputException("'row_type' should be a subclass of tuple");
+	}
+	// The rows of the current chunk that were not consumed by fetchone are dropped
+	current_rows = py::list();
+	row_offset = 0;
+	unique_ptr<DataChunk> chunk;
 	{
 		py::gil_scoped_release release;
 		if (!result) {
 			throw InvalidInputException("result closed");
 		}
-		if (!current_chunk || chunk_offset >= current_chunk->size()) {
-			current_chunk = FetchNext(*result);
-			chunk_offset = 0;
+		chunk = FetchNext(*result);
+		if (chunk && chunk->size() != 0) {
+			StartPrefetch();
+		} else if (result->type == QueryResultType::STREAM_RESULT && result->Cast<StreamQueryResult>().context) {
+			// a stream that was fetched completely is closed, this one was invalidated by another query
+			throw InvalidInputException("The result was closed before all of its rows were fetched, likely caused by "
+			                            "executing a different query on the same connection");
 		}
 	}
-
-	if (!current_chunk || current_chunk->size() == 0) {
-		return py::none();
+	if (!chunk || chunk->size() == 0) {
+		return py::list();
 	}
-	py::tuple res(result->types.size());
+	auto rows = ConvertChunkToRows(*chunk, result->types, result->client_properties);
+	ConvertRowsToType(rows, row_type, fields);
+	return rows;
+}
 
-	for (idx_t col_idx = 0; col_idx < result->types.size(); col_idx++) {
-		auto &mask = FlatVector::Validity(current_chunk->data[col_idx]);
-		if (!mask.RowIsValid(chunk_offset)) {
-			res[col_idx] = py::none();
-			continue;
+bool DuckDBPyResult::FetchRows() {
+	unique_ptr<DataChunk> chunk;
+	{
+		py::gil_scoped_release release;
+		if (!result) {
+			throw InvalidInputException("result closed");
+		}
+		chunk = FetchNext(*result);
+		if (chunk && chunk->size() != 0) {
+			StartPrefetch();
 		}
-		auto val = current_chunk->data[col_idx].GetValue(chunk_offset);
-		res[col_idx] = PythonObject::FromValue(val, result->types[col_idx], result->client_properties);
 	}
-	chunk_offset++;
-	return res;
+	row_offset = 0;
+	if (!chunk || chunk->size() == 0) {
+		current_rows = py::list();
+		return false;
+	}
+	current_rows = ConvertChunkToRows(*chunk, result->types, result->client_properties);
+	return true;
+}
+
+Optional<py::tuple> DuckDBPyResult::Fetchone() {
+	if (row_offset >= current_rows.size() && !FetchRows()) {
+		return py::none();
+	}
+	return py::reinterpret_borrow<py::tuple>(PyList_GET_ITEM(current_rows.ptr(), row_offset++));
 }
 
 py::list DuckDBPyResult::Fetchmany(idx_t size) {
@@ -199,6 +614,33 @@ void InsertCategory(QueryResult &result, unordered_map<idx_t, py::list> &categor
 	}
 }
 
+static bool UseParallelConversion(ClientContext &context, ColumnDataCollection &collection) {
+	// Small results are not worth scheduling tasks for
+	if (collection.ColumnCount() < 2 || collection.Count() < STANDARD_VECTOR_SIZE * 16) {
+		return false;
+	}
+	if (TaskScheduler::GetScheduler(context).NumberOfThreads() < 2) {
+		return false;
+	}
+	Value setting;
+	if (context.TryGetCurrentSetting("python_parallel_numpy_conversion", setting)) {
+		return setting.GetValue<bool>();
+	}
+	return true;
+}
+
+static bool UseZeroCopyConversion(const weak_ptr<ClientContext> &context) {
+	auto client_context = context.lock();
+	if (!client_context) {
+		return false;
+	}
+	Value setting;
+	if (client_context->TryGetCurrentSetting("python_numpy_zero_copy", setting)) {
+		return setting.GetValue<bool>();
+	}
+	return false;
+}
+
 unique_ptr<NumpyResultConversion> DuckDBPyResult::InitializeNumpyConversion(bool pandas) {
 	if (!result) {
 		throw InvalidInputException("result closed");
@@ -228,8 +670,17 @@ py::dict DuckDBPyResult::FetchNumpyInternal(bool stream, idx_t vectors_per_chunk
 
 	if (result->type == QueryResultType::MATERIALIZED_RESULT) {
 		auto &materialized = result->Cast<MaterializedQueryResult>();
-		for (auto &chunk : materialized.Collection().Chunks()) {
-			conversion.Append(chunk);
+		auto &collection = materialized.Collection();
+		auto client_context = context.lock();
+		// a result that fits in a single chunk is too small for the parallel conversion, so zero-copy is tried first
+		if (UseZeroCopyConversion(context) && conversion.AppendZeroCopy(collection)) {
+			// the fixed-width columns are views over the result, the collection has been moved into them
+		} else if (client_context && UseParallelConversion(*client_context, collection)) {
+			conversion.Append(collection, *client_context);
+		} else {
+			for (auto &chunk : collection.Chunks()) {
+				conversion.Append(chunk);
+			}
 		}
 		InsertCategory(materialized, categories);
 		materialized.Collection().Reset();
@@ -295,7 +746,10 @@ void DuckDBPyResult::ChangeDateToDatetime(PandasDataFrame &df) {
 }
 
 PandasDataFrame DuckDBPyResult::FrameFromNumpy(bool date_as_object, const py::handle &o) {
-	PandasDataFrame df = py::cast<PandasDataFrame>(py::module::import("pandas").attr("DataFrame").attr("from_dict")(o));
+	auto data_frame = py::module::import("pandas").attr("DataFrame");
+	// When the arrays are views over the result, avoid copying them into the DataFrame
+	auto df = UseZeroCopyConversion(context) ? py::cast<PandasDataFrame>(data_frame(o, py::arg("copy") = false))
+	                                         : py::cast<PandasDataFrame>(data_frame.attr("from_dict")(o));
 	// Unfortunately we have to do a type change here for timezones since these types are not supported by numpy
 	ChangeToTZType(df);
 	if (date_as_object) {
@@ -358,10 +812,11 @@ py::list DuckDBPyResult::FetchAllArrowChunks(idx_t rows_per_batch, bool to_polar
 	if (!result) {
 		throw InvalidInputException("result closed");
 	}
+	auto prefetched = TakePrefetch();
 	auto pyarrow_lib_module = py::module::import("pyarrow").attr("lib");
 
 	py::list batches;
-	QueryResultChunkScanState scan_state(*result.get());
+	PrefetchedChunkScanState scan_state(*result.get(), std::move(prefetched));
 	while (FetchArrowChunk(scan_state, batches, rows_per_batch, to_polars)) {
 	}
 	return batches;
@@ -379,11 +834,29 @@ duckdb::pyarrow::Table DuckDBPyResult::FetchArrowTable(idx_t rows_per_batch, boo
 	                             result->client_properties);
 }
 
+py::object DuckDBPyResult::FetchRecordBatch(idx_t rows_per_batch) {
+	if (!result) {
+		throw InvalidInputException("There is no query result");
+	}
+	if (!record_batch_scan_state) {
+		auto prefetched = TakePrefetch();
+		record_batch_scan_state = make_uniq<PrefetchedChunkScanState>(*result.get(), std::move(prefetched));
+	}
+	py::list batches;
+	if (!FetchArrowChunk(*record_batch_scan_state, batches, rows_per_batch, false)) {
+		return py::none();
+	}
+	return batches[0];
+}
+
 ArrowArrayStream DuckDBPyResult::FetchArrowArrayStream(idx_t rows_per_batch) {
 	if (!result) {
 		throw InvalidInputException("There is no query result");
 	}
+	auto prefetched = TakePrefetch();
+	prefetch_worker.reset();
 	ResultArrowArrayStreamWrapper *result_stream = new ResultArrowArrayStreamWrapper(std::move(result), rows_per_batch);
+	result_stream->scan_state = make_uniq<PrefetchedChunkScanState>(*result_stream->result, std::move(prefetched));
 	// The 'result_stream' is part of the 'private_data' of the ArrowArrayStream and its lifetime is bound to that of
 	// the ArrowArrayStream.
 	return result_stream->stream;
@@ -413,10 +886,83 @@ static void ArrowArrayStreamPyCapsuleDestructor(PyObject *object) {
 	delete stream;
 }
 
+//! Wraps the stream of a query result that is handed to another library. The consumer can call get_next while holding
+//! the GIL, which is released while the query produces the next batch, as the query itself can need the GIL.
+struct PythonResultArrowArrayStream {
+public:
+	explicit PythonResultArrowArrayStream(ArrowArrayStream inner_p) : inner(inner_p) {
+		stream.get_schema = GetSchema;
+		stream.get_next = GetNext;
+		stream.get_last_error = GetLastError;
+		stream.release = Release;
+		stream.private_data = this;
+	}
+
+public:
+	ArrowArrayStream stream;
+	ArrowArrayStream inner;
+	string last_error;
+
+private:
+	static PythonResultArrowArrayStream &Get(struct ArrowArrayStream *stream) {
+		return *reinterpret_cast<PythonResultArrowArrayStream *>(stream->private_data);
+	}
+
+	static int GetSchema(struct ArrowArrayStream *stream, struct ArrowSchema *out) {
+		auto &wrapper = Get(stream);
+		return wrapper.inner.get_schema(&wrapper.inner, out);
+	}
+
+	static int GetNextInternal(PythonResultArrowArrayStream &wrapper, struct ArrowArray *out) {
+		auto &result_stream = *reinterpret_cast<ResultArrowArrayStreamWrapper *>(wrapper.inner.private_data);
+		auto &result = *result_stream.result;
+		if (result.type == QueryResultType::STREAM_RESULT) {
+			auto &stream_result = result.Cast<StreamQueryResult>();
+			// an exhausted result releases its context, an open one that is no longer active was invalidated
+			if (stream_result.context && !stream_result.IsOpen()) {
+				wrapper.last_error = "The query result was closed before it was fully consumed, this happens when "
+				                     "another query is executed on the connection that produces the result";
+				return -1;
+			}
+		}
+		return wrapper.inner.get_next(&wrapper.inner, out);
+	}
+
+	static int GetNext(struct ArrowArrayStream *stream, struct ArrowArray *out) {
+		auto &wrapper = Get(stream);
+		wrapper.last_error.clear();
+		if (PyGILState_Check()) {
+			py::gil_scoped_release release;
+			return GetNextInternal(wrapper, out);
+		}
+		return GetNextInternal(wrapper, out);
+	}
+
+	static const char *GetLastError(struct ArrowArrayStream *stream) {
+		auto &wrapper = Get(stream);
+		if (!wrapper.last_error.empty()) {
+			return wrapper.last_error.c_str();
+		}
+		return wrapper.inner.get_last_error(&wrapper.inner);
+	}
+
+	static void Release(struct ArrowArrayStream *stream) {
+		if (!stream || !stream->release) {
+			return;
+		}
+		stream->release = nullptr;
+		auto &wrapper = Get(stream);
+		if (wrapper.inner.release) {
+			wrapper.inner.release(&wrapper.inner);
+		}
+		delete &wrapper;
+	}
+};
+
 py::object DuckDBPyResult::FetchArrowCapsule(idx_t rows_per_batch) {
-	auto stream_p = FetchArrowArrayStream(rows_per_batch);
+	auto wrapper = new PythonResultArrowArrayStream(FetchArrowArrayStream(rows_per_batch));
 	auto stream = new ArrowArrayStream();
-	*stream = stream_p;
+	*stream = wrapper->stream;
 	return py::capsule(stream, "arrow_array_stream", ArrowArrayStreamPyCapsuleDestructor);
 }
 
@@ -492,6 +1038,12 @@ py::list DuckDBPyResult::GetDescription(const vector<string> &names, const vecto
 }
 
 void DuckDBPyResult::Close() {
+	try {
+		TakePrefetch();
+	} catch (...) { // NOLINT
+	}
+	prefetch_worker.reset();
+	record_batch_scan_state.reset();
 	result = nullptr;
 }
 
@@ -39,8 +39,10 @@ static void CreateArrowScan(const string &name, py::object entry, TableFunctionR
 	}
 
 	auto dependency = make_uniq<ExternalDependency>();
-	auto dependency_item = PythonDependencyItem::Create(make_uniq<RegisteredArrow>(std::move(stream_factory), entry));
-	dependency->AddDependency("replacement_cache", std::move(dependency_item));
+	// the scanned object is a separate dependency, so the replacement cache can keep the factory without the object
+	dependency->AddDependency("replacement_cache", PythonDependencyItem::Create(entry));
+	auto factory_item = PythonDependencyItem::Create(make_uniq<RegisteredArrow>(std::move(stream_factory), py::none()));
+	dependency->AddDependency("arrow_factory", std::move(factory_item));
 	table_function.external_dependency = std::move(dependency);
 }
 
@@ -111,9 +113,8 @@ unique_ptr<TableRef> PythonReplacementScan::TryReplacementObject(const py::objec
 		auto arrow_dataset = entry.attr("to_arrow")();
 		CreateArrowScan(name, arrow_dataset, *table_function, children, client_properties, PyArrowObjectType::Table);
 	} else if (PolarsDataFrame::IsLazyFrame(entry)) {
-		auto materialized = entry.attr("collect")();
-		auto arrow_dataset = materialized.attr("to_arrow")();
-		CreateArrowScan(name, arrow_dataset, *table_function, children, client_properties, PyArrowObjectType::Table);
+		// the LazyFrame is only collected when it is scanned, with the projection and filters pushed into its plan
+		CreateArrowScan(name, entry, *table_function, children, client_properties, PyArrowObjectType::Invalid);
 	} else if ((numpytype = DuckDBPyConnection::IsAcceptedNumpyObject(entry)) != NumpyObjectType::INVALID) {
 		string name = "np_" + StringUtil::GenerateRandomName();
 		py::dict data; // we will convert all the supported format to dict{"key": np.array(value)}.
@@ -156,13 +157,187 @@ unique_ptr<TableRef> PythonReplacementScan::TryReplacementObject(const py::objec
 	return std::move(table_function);
 }
 
+//! Returns the objects that identify the current version of the object, or nullptr if it can not be cached
+static py::object GetReplacementVersion(const py::object &entry) {
+	if (DuckDBPyConnection::IsPandasDataframe(entry)) {
+		// adding, replacing or removing columns of a DataFrame replaces its columns, manager or blocks
+		if (!py::hasattr(entry, "_mgr")) {
+			return py::object();
+		}
+		auto manager = entry.attr("_mgr");
+		if (!py::hasattr(manager, "blocks")) {
+			return py::object();
+		}
+		py::list version;
+		version.append(entry.attr("columns"));
+		version.append(manager);
+		for (auto block : manager.attr("blocks")) {
+			version.append(block);
+		}
+		return py::tuple(version);
+	}
+	if (DuckDBPyRelation::IsRelation(entry) || PolarsDataFrame::IsLazyFrame(entry)) {
+		return py::tuple();
+	}
+	auto arrow_type = DuckDBPyConnection::GetArrowType(entry);
+	if (arrow_type == PyArrowObjectType::Table || arrow_type == PyArrowObjectType::Dataset) {
+		// arrow tables and datasets are immutable
+		return py::tuple();
+	}
+	return py::object();
+}
+
+//! Returns a weak reference to the object, or nullptr if the object does not support weak references
+static py::object CreateWeakReference(const py::handle &object, const py::object &callback = py::object()) {
+	auto reference = PyWeakref_NewRef(object.ptr(), callback ? callback.ptr() : nullptr);
+	if (!reference) {
+		PyErr_Clear();
+		return py::object();
+	}
+	return py::reinterpret_steal<py::object>(reference);
+}
+
+static bool VersionMatches(const py::object &version, const py::object &current) {
+	if (!current) {
+		return false;
+	}
+	auto version_tuple = py::reinterpret_borrow<py::tuple>(version);
+	auto current_tuple = py::reinterpret_borrow<py::tuple>(current);
+	if (version_tuple.size() != current_tuple.size()) {
+		return false;
+	}
+	for (idx_t i = 0; i < version_tuple.size(); i++) {
+		if (!version_tuple[i]().is(current_tuple[i])) {
+			return false;
+		}
+	}
+	return true;
+}
+
+shared_ptr<PythonReplacementCache> PythonReplacementCache::Get(ClientContext &context) {
+	return context.registered_state->GetOrCreate<PythonReplacementCache>(NAME);
+}
+
+// The entries are only destroyed once the lock is released, destroying them can delete other replaced objects,
+// whose weak reference callbacks evict their entries
+PythonReplacementCache::~PythonReplacementCache() {
+	unordered_map<string, PythonReplacementCacheEntry> remaining;
+	{
+		lock_guard<mutex> guard(lock);
+		remaining = std::move(entries);
+		entries.clear();
+	}
+}
+
+void PythonReplacementCache::Evict(const string &name, const py::handle &reference) {
+	PythonReplacementCacheEntry evicted;
+	lock_guard<mutex> guard(lock);
+	auto lookup = entries.find(name);
+	if (lookup == entries.end() || !lookup->second.object->obj.is(reference)) {
+		// the entry was already replaced by the entry of another object
+		return;
+	}
+	evicted = std::move(lookup->second);
+	entries.erase(lookup);
+}
+
+unique_ptr<TableRef> PythonReplacementCache::Lookup(const string &name, const py::object &entry) {
+	// the version is determined before taking the lock, it can run Python code
+	auto current_version = GetReplacementVersion(entry);
+	PythonReplacementCacheEntry evicted;
+	lock_guard<mutex> guard(lock);
+	auto lookup = entries.find(name);
+	if (lookup == entries.end()) {
+		misses++;
+		return nullptr;
+	}
+	auto &cached = lookup->second;
+	if (!cached.object->obj().is(entry) || !VersionMatches(cached.version->obj, current_version)) {
+		// the name refers to another object now, or the object was modified
+		evicted = std::move(cached);
+		entries.erase(lookup);
+		misses++;
+		return nullptr;
+	}
+	hits++;
+	cached.last_used = ++clock;
+	auto result = cached.replacement->Copy();
+	// the cached replacement does not keep the object alive, the returned replacement does
+	auto dependency = make_shared_ptr<ExternalDependency>();
+	cached.replacement->external_dependency->ScanDependencies(
+	    [&](const string &name, shared_ptr<DependencyItem> item) { dependency->AddDependency(name, std::move(item)); });
+	dependency->AddDependency("replacement_cache", PythonDependencyItem::Create(entry));
+	result->external_dependency = std::move(dependency);
+	return result;
+}
+
+void PythonReplacementCache::Insert(const string &name, const py::object &entry, TableRef &replacement) {
+	auto version = GetReplacementVersion(entry);
+	if (!version) {
+		return;
+	}
+	// only weak references are kept, so the cache does not keep deleted objects alive
+	auto evict = py::cpp_function([this, name](py::handle reference) { Evict(name, reference); });
+	auto object_reference = CreateWeakReference(entry, evict);
+	if (!object_reference) {
+		return;
+	}
+	py::list version_references;
+	for (auto object : version) {
+		auto reference = CreateWeakReference(object);
+		if (!reference) {
+			return;
+		}
+		version_references.append(reference);
+	}
+	auto dependency = make_shared_ptr<ExternalDependency>();
+	if (replacement.external_dependency) {
+		replacement.external_dependency->ScanDependencies([&](const string &name, shared_ptr<DependencyItem> item) {
+			if (item->Cast<PythonDependencyItem>().object->obj.is(entry)) {
+				return;
+			}
+			dependency->AddDependency(name, std::move(item));
+		});
+	}
+
+	PythonReplacementCacheEntry cached;
+	cached.object = make_uniq<RegisteredObject>(std::move(object_reference));
+	cached.version = make_uniq<RegisteredObject>(py::tuple(version_references));
+	cached.replacement = replacement.Copy();
+	cached.replacement->external_dependency = std::move(dependency);
+
+	PythonReplacementCacheEntry evicted;
+	lock_guard<mutex> guard(lock);
+	auto existing = entries.find(name);
+	if (existing == entries.end() && entries.size() >= MAX_ENTRIES) {
+		auto least_recently_used = entries.begin();
+		for (auto it = entries.begin(); it != entries.end(); it++) {
+			if (it->second.last_used < least_recently_used->second.last_used) {
+				least_recently_used = it;
+			}
+		}
+		existing = least_recently_used;
+	}
+	if (existing != entries.end()) {
+		evicted = std::move(existing->second);
+		entries.erase(existing);
+	}
+	cached.last_used = ++clock;
+	entries[name] = std::move(cached);
+}
+
+idx_t PythonReplacementCache::Size() {
+	lock_guard<mutex> guard(lock);
+	return entries.size();
+}
+
 static bool IsBuiltinFunction(const py::object &object) {
 	auto &import_cache_py = *DuckDBPyConnection::ImportCache();
 	return py::isinstance(object, import_cache_py.types.BuiltinFunctionType());
 }
 
 static unique_ptr<TableRef> TryReplacement(py::dict &dict, const string &name, ClientContext &context,
-                                           py::object &current_frame) {
+                                           py::object &current_frame, optional_ptr<PythonReplacementCache> cache) {
 	auto table_name = py::str(name);
 	if (!dict.contains(table_name)) {
 		// not present in the globals
@@ -174,6 +349,12 @@ static unique_ptr<TableRef> TryReplacement(py::dict &dict, const string &name, C
 		return nullptr;
 	}
 
+	if (cache) {
+		auto cached = cache->Lookup(name, entry);
+		if (cached) {
+			return cached;
+		}
+	}
 	auto result = PythonReplacementScan::TryReplacementObject(entry, name, context);
 	if (!result) {
 		std::string location = py::cast<py::str>(current_frame.attr("f_code").attr("co_filename"));
@@ -181,6 +362,9 @@ static unique_ptr<TableRef> TryReplacement(py::dict &dict, const string &name, C
 		location += py::cast<py::str>(current_frame.attr("f_lineno"));
 		ThrowScanFailureError(entry, name, location);
 	}
+	if (cache) {
+		cache->Insert(name, entry, *result);
+	}
 	return result;
 }
 
@@ -194,13 +378,18 @@ static unique_ptr<TableRef> ReplaceInternal(ClientContext &context, const string
 		return nullptr;
 	}
 
+	shared_ptr<PythonReplacementCache> cache;
+	if (context.TryGetCurrentSetting("python_replacement_cache", result) && result.GetValue<bool>()) {
+		cache = PythonReplacementCache::Get(context);
+	}
+
 	py::gil_scoped_acquire acquire;
 	auto current_frame = py::module::import("inspect").attr("currentframe")();
 
 	auto local_dict = py::reinterpret_borrow<py::dict>(current_frame.attr("f_locals"));
 	// search local dictionary
 	if (local_dict) {
-		auto result = TryReplacement(local_dict, table_name, context, current_frame);
+		auto result = TryReplacement(local_dict, table_name, context, current_frame, cache.get());
 		if (result) {
 			return result;
 		}
@@ -208,7 +397,7 @@ static unique_ptr<TableRef> ReplaceInternal(ClientContext &context, const string
 	// search global dictionary
 	auto global_dict = py::reinterpret_borrow<py::dict>(current_frame.attr("f_globals"));
 	if (global_dict) {
-		auto result = TryReplacement(global_dict, table_name, context, current_frame);
+		auto result = TryReplacement(global_dict, table_name, context, current_frame, cache.get());
 		if (result) {
 			return result;
 		}
@@ -226,6 +415,9 @@ unique_ptr<TableRef> PythonReplacementScan::Replace(ClientContext &context, Repl
 
 	unique_ptr<TableRef> result;
 	result = ReplaceInternal(context, table_name);
+	if (result) {
+		PythonReplacementCache::Get(context)->replacements++;
+	}
 	return result;
 }
 
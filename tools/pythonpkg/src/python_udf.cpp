@@ -13,34 +13,71 @@
 #include "duckdb/function/table/arrow.hpp"
 #include "duckdb/function/function.hpp"
 #include "duckdb_python/numpy/numpy_scan.hpp"
+#include "duckdb_python/numpy/numpy_bind.hpp"
+#include "duckdb_python/numpy/array_wrapper.hpp"
+#include "duckdb_python/pandas/pandas_bind.hpp"
 #include "duckdb_python/arrow/arrow_export_utils.hpp"
 #include "duckdb/common/types/arrow_aux_data.hpp"
 #include "duckdb/parser/tableref/table_function_ref.hpp"
+#include "duckdb/execution/expression_executor_state.hpp"
+#include "duckdb/planner/expression/bound_function_expression.hpp"
+#include "duckdb_python/pybind11/registered_py_object.hpp"
+#include "duckdb_python/pyutil.hpp"
 
 namespace duckdb {
 
-static py::list ConvertToSingleBatch(vector<LogicalType> &types, vector<string> &names, DataChunk &input,
-                                     const ClientProperties &options) {
-	ArrowSchema schema;
-	ArrowConverter::ToArrowSchema(&schema, types, names, options);
+struct PythonUDFLocalState : public FunctionLocalState {
+public:
+	PythonUDFLocalState(vector<LogicalType> types_p, const ClientProperties &options_p)
+	    : types(std::move(types_p)), options(options_p) {
+		names.reserve(types.size());
+		for (idx_t i = 0; i < types.size(); i++) {
+			names.push_back(StringUtil::Format("c%d", i));
+		}
+	}
 
-	py::list single_batch;
-	ArrowAppender appender(types, STANDARD_VECTOR_SIZE, options);
-	appender.Append(input, 0, input.size(), input.size());
-	auto array = appender.Finalize();
-	TransformDuckToArrowChunk(schema, array, single_batch);
-	return single_batch;
+public:
+	//! The types and names of the input columns, these are the same for every chunk
+	vector<LogicalType> types;
+	vector<string> names;
+	ClientProperties options;
+	//! The pyarrow Schema of the input, imported once on the first chunk
+	unique_ptr<RegisteredObject> arrow_schema;
+};
+
+static unique_ptr<FunctionLocalState>
+InitPythonUDFLocalState(ExpressionState &state, const BoundFunctionExpression &expr, FunctionData *bind_data) {
+	vector<LogicalType> types;
+	types.reserve(expr.children.size());
+	for (auto &child : expr.children) {
+		types.push_back(child->return_type);
+	}
+	ClientProperties options;
+	if (state.HasContext()) {
+		options = state.GetContext().GetClientProperties();
+	}
+	return make_uniq<PythonUDFLocalState>(std::move(types), options);
 }
 
-static py::object ConvertDataChunkToPyArrowTable(DataChunk &input, const ClientProperties &options) {
-	auto types = input.GetTypes();
-	vector<string> names;
-	names.reserve(types.size());
-	for (idx_t i = 0; i < types.size(); i++) {
-		names.push_back(StringUtil::Format("c%d", i));
+static py::object ConvertDataChunkToPyArrowTable(DataChunk &input, PythonUDFLocalState &local_state) {
+	auto pyarrow_lib_module = py::module::import("pyarrow").attr("lib");
+	if (!local_state.arrow_schema) {
+		ArrowSchema schema;
+		ArrowConverter::ToArrowSchema(&schema, local_state.types, local_state.names, local_state.options);
+		auto schema_import_func = pyarrow_lib_module.attr("Schema").attr("_import_from_c");
+		local_state.arrow_schema = make_uniq<RegisteredObject>(schema_import_func(reinterpret_cast<uint64_t>(&schema)));
 	}
+	auto &schema_obj = local_state.arrow_schema->obj;
 
-	return pyarrow::ToArrowTable(types, names, ConvertToSingleBatch(types, names, input, options), options);
+	ArrowAppender appender(local_state.types, STANDARD_VECTOR_SIZE, local_state.options);
+	appender.Append(input, 0, input.size(), input.size());
+	auto array = appender.Finalize();
+
+	// Import the batch against the cached schema, instead of exporting and importing the schema for every chunk
+	auto batch_import_func = pyarrow_lib_module.attr("RecordBatch").attr("_import_from_c");
+	py::list single_batch;
+	single_batch.append(batch_import_func(reinterpret_cast<uint64_t>(&array), schema_obj));
+	return pyarrow_lib_module.attr("Table").attr("from_batches")(single_batch, schema_obj);
 }
 
 // If these types are arrow canonical extensions, we must check if they are registered.
@@ -127,6 +164,70 @@ static void ConvertArrowTableToVector(const py::object &table, Vector &out, Clie
 	out.Flatten(count);
 }
 
+static py::tuple ConvertDataChunkToNumpyArrays(DataChunk &input, const ClientProperties &options) {
+	py::tuple arrays(input.ColumnCount());
+	for (idx_t col_idx = 0; col_idx < input.ColumnCount(); col_idx++) {
+		auto &column = input.data[col_idx];
+		ArrayWrapper wrapper(column.GetType(), options);
+		wrapper.Initialize(input.size());
+		wrapper.Append(0, column, input.size());
+		arrays[col_idx] = wrapper.ToArray();
+	}
+	return arrays;
+}
+
+static void ConvertNumpyArrayToVector(const py::object &array, Vector &out, ClientContext &context, idx_t count) {
+	auto numpy = py::module_::import("numpy");
+	auto numpy_ma = numpy.attr("ma");
+
+	// Separate the mask from the data, NumpyScan does not know about masked arrays
+	py::object data = array;
+	py::object mask;
+	if (py::isinstance(array, numpy_ma.attr("MaskedArray"))) {
+		mask = numpy_ma.attr("getmaskarray")(array);
+		data = numpy_ma.attr("getdata")(array);
+	}
+	auto result_array = py::array(numpy.attr("asarray")(data));
+	if (result_array.ndim() != 1) {
+		throw InvalidInputException("The returned array from a numpy scalar udf should be one-dimensional, found %d "
+		                            "dimensions",
+		                            result_array.ndim());
+	}
+	if (idx_t(result_array.shape(0)) != count) {
+		throw InvalidInputException("Returned numpy array should have %d elements, found %d", count,
+		                            result_array.shape(0));
+	}
+
+	py::dict columns;
+	columns["c0"] = result_array;
+	vector<PandasColumnBindData> bind_columns;
+	vector<LogicalType> return_types;
+	vector<string> return_names;
+	NumpyBind::Bind(context, columns, bind_columns, return_types, return_names);
+	D_ASSERT(bind_columns.size() == 1);
+
+	Vector scanned(return_types[0], count);
+	NumpyScan::Scan(bind_columns[0], count, 0, scanned);
+	if (mask) {
+		auto mask_array = py::array(mask);
+		auto mask_data = reinterpret_cast<const bool *>(mask_array.data());
+		for (idx_t i = 0; i < count; i++) {
+			if (mask_data[i]) {
+				FlatVector::SetNull(scanned, i, true);
+			}
+		}
+	}
+
+	// The scanned vector can point directly into the numpy array (or the Python objects it contains)
+	// so we have to copy the data into the result before the array is released
+	if (scanned.GetType() == out.GetType()) {
+		VectorOperations::Copy(scanned, out, count, 0, 0);
+	} else {
+		VectorOperations::Cast(context, scanned, out, count);
+	}
+	out.Flatten(count);
+}
+
 static string NullHandlingError() {
 	return R"(
 The returned result contained NULL values, but the 'null_handling' was set to DEFAULT.
@@ -160,8 +261,10 @@ static void VerifyVectorizedNullHandling(Vector &result, idx_t count) {
 	throw InvalidInputException(NullHandlingError());
 }
 
-static scalar_function_t CreateVectorizedFunction(PyObject *function, PythonExceptionHandling exception_handling,
+static scalar_function_t CreateVectorizedFunction(PyObject *function, PyObject *executor, PythonUDFType udf_type,
+                                                  PythonExceptionHandling exception_handling,
                                                   FunctionNullHandling null_handling) {
+	D_ASSERT(udf_type == PythonUDFType::ARROW || udf_type == PythonUDFType::NUMPY);
 	// Through the capture of the lambda, we have access to the function pointer
 	// We just need to make sure that it doesn't get garbage collected
 	scalar_function_t func = [=](DataChunk &input, ExpressionState &state, Vector &result) -> void {
@@ -171,13 +274,7 @@ static scalar_function_t CreateVectorizedFunction(PyObject *function, PythonExce
 
 		// owning references
 		py::object python_object;
-		// Convert the input datachunk to pyarrow
-		ClientProperties options;
-
-		if (state.HasContext()) {
-			auto &context = state.GetContext();
-			options = context.GetClientProperties();
-		}
+		auto &local_state = ExecuteFunctionState::GetFunctionState(state)->Cast<PythonUDFLocalState>();
 
 		auto result_validity = FlatVector::Validity(result);
 		SelectionVector selvec(input.size());
@@ -209,13 +306,19 @@ static scalar_function_t CreateVectorizedFunction(PyObject *function, PythonExce
 			}
 		}
 
-		auto pyarrow_table = ConvertDataChunkToPyArrowTable(input, options);
-		py::tuple column_list = pyarrow_table.attr("columns");
+		// Convert the input datachunk to either pyarrow arrays or numpy arrays
+		py::tuple column_list;
+		if (udf_type == PythonUDFType::ARROW) {
+			auto pyarrow_table = ConvertDataChunkToPyArrowTable(input, local_state);
+			column_list = pyarrow_table.attr("columns");
+		} else {
+			column_list = ConvertDataChunkToNumpyArrays(input, local_state.options);
+		}
 
 		auto count = input.size();
 
 		// Call the function
-		auto ret = PyObject_CallObject(function, column_list.ptr());
+		auto ret = PyUtil::CallFunction(function, executor, column_list);
 		bool exception_occurred = false;
 		if (ret == nullptr && PyErr_Occurred()) {
 			exception_occurred = true;
@@ -224,14 +327,20 @@ static scalar_function_t CreateVectorizedFunction(PyObject *function, PythonExce
 				throw InvalidInputException("Python exception occurred while executing the UDF: %s", exception.what());
 			} else if (exception_handling == PythonExceptionHandling::RETURN_NULL) {
 				PyErr_Clear();
-				python_object = py::module_::import("pyarrow").attr("nulls")(count);
+				if (udf_type == PythonUDFType::ARROW) {
+					python_object = py::module_::import("pyarrow").attr("nulls")(count);
+				} else {
+					python_object =
+					    py::module_::import("numpy").attr("full")(count, py::none(), py::arg("dtype") = "object");
+				}
 			} else {
 				throw NotImplementedException("Exception handling type not implemented");
 			}
 		} else {
 			python_object = py::reinterpret_steal<py::object>(ret);
 		}
-		if (!py::isinstance(python_object, py::module_::import("pyarrow").attr("lib").attr("Table"))) {
+		if (udf_type == PythonUDFType::ARROW &&
+		    !py::isinstance(python_object, py::module_::import("pyarrow").attr("lib").attr("Table"))) {
 			// Try to convert into a table
 			py::list single_array(1);
 			py::list single_name(1);
@@ -245,13 +354,20 @@ static scalar_function_t CreateVectorizedFunction(PyObject *function, PythonExce
 				throw InvalidInputException("Could not convert the result into an Arrow Table");
 			}
 		}
-		// Convert the pyarrow result back to a DuckDB datachunk
+		auto convert_result = [&](Vector &out) {
+			if (udf_type == PythonUDFType::ARROW) {
+				ConvertArrowTableToVector(python_object, out, state.GetContext(), count);
+			} else {
+				ConvertNumpyArrayToVector(python_object, out, state.GetContext(), count);
+			}
+		};
+		// Convert the result back to a DuckDB datachunk
 		if (count != input_size) {
 			D_ASSERT(default_null_handling);
 			// We filtered out some NULLs, now we need to reconstruct the final result by adding the nulls back
 			Vector temp(result.GetType(), count);
-			// Convert the table into a temporary Vector
-			ConvertArrowTableToVector(python_object, temp, state.GetContext(), count);
+			// Convert the result into a temporary Vector
+			convert_result(temp);
 			if (!exception_occurred) {
 				VerifyVectorizedNullHandling(temp, count);
 			}
@@ -276,7 +392,7 @@ static scalar_function_t CreateVectorizedFunction(PyObject *function, PythonExce
 			}
 			result.Verify(input_size);
 		} else {
-			ConvertArrowTableToVector(python_object, result, state.GetContext(), count);
+			convert_result(result);
 			if (default_null_handling && !exception_occurred) {
 				VerifyVectorizedNullHandling(result, count);
 			}
@@ -375,8 +491,8 @@ struct ParameterKind {
 
 struct PythonUDFData {
 public:
-	PythonUDFData(const string &name, bool vectorized, FunctionNullHandling null_handling)
-	    : name(name), null_handling(null_handling), vectorized(vectorized) {
+	PythonUDFData(const string &name, PythonUDFType udf_type, FunctionNullHandling null_handling)
+	    : name(name), null_handling(null_handling), udf_type(udf_type) {
 		return_type = LogicalType::INVALID;
 		param_count = DConstants::INVALID_INDEX;
 	}
@@ -388,7 +504,7 @@ public:
 	LogicalType varargs = LogicalTypeId::INVALID;
 	FunctionNullHandling null_handling;
 	idx_t param_count;
-	bool vectorized;
+	PythonUDFType udf_type;
 
 public:
 	void Verify() {
@@ -473,22 +589,39 @@ public:
 	}
 
 	ScalarFunction GetFunction(const py::function &udf, PythonExceptionHandling exception_handling, bool side_effects,
-	                           const ClientProperties &client_properties) {
+	                           const ClientProperties &client_properties, const py::object &executor) {
 
 		auto &import_cache = *DuckDBPyConnection::ImportCache();
 		// Import this module, because importing this from a non-main thread causes a segfault
 		(void)import_cache.numpy.core.multiarray();
 
 		scalar_function_t func;
-		if (vectorized) {
-			func = CreateVectorizedFunction(udf.ptr(), exception_handling, null_handling);
+		PyObject *executor_ptr = nullptr;
+		if (!py::none().is(executor)) {
+			if (udf_type == PythonUDFType::NATIVE) {
+				throw InvalidInputException(
+				    "An 'executor' can only be used with a vectorized ('arrow' or 'numpy') UDF");
+			}
+			if (!py::hasattr(executor, "submit")) {
+				throw InvalidInputException("The 'executor' should be a concurrent.futures.Executor, i.e. provide a "
+				                            "'submit' method returning a Future");
+			}
+			executor_ptr = executor.ptr();
+		}
+
+		if (udf_type != PythonUDFType::NATIVE) {
+			func = CreateVectorizedFunction(udf.ptr(), executor_ptr, udf_type, exception_handling, null_handling);
 		} else {
 			func = CreateNativeFunction(udf.ptr(), exception_handling, client_properties, null_handling);
 		}
 		FunctionStability function_side_effects =
 		    side_effects ? FunctionStability::VOLATILE : FunctionStability::CONSISTENT;
+		init_local_state_t init_local_state = nullptr;
+		if (udf_type != PythonUDFType::NATIVE) {
+			init_local_state = InitPythonUDFLocalState;
+		}
 		ScalarFunction scalar_function(name, std::move(parameters), return_type, func, nullptr, nullptr, nullptr,
-		                               nullptr, varargs, function_side_effects, null_handling);
+		                               init_local_state, varargs, function_side_effects, null_handling);
 		return scalar_function;
 	}
 };
@@ -497,17 +630,18 @@ public:
 
 ScalarFunction DuckDBPyConnection::CreateScalarUDF(const string &name, const py::function &udf,
                                                    const py::object &parameters,
-                                                   const shared_ptr<DuckDBPyType> &return_type, bool vectorized,
+                                                   const shared_ptr<DuckDBPyType> &return_type, PythonUDFType type,
                                                    FunctionNullHandling null_handling,
-                                                   PythonExceptionHandling exception_handling, bool side_effects) {
-	PythonUDFData data(name, vectorized, null_handling);
+                                                   PythonExceptionHandling exception_handling, bool side_effects,
+                                                   const py::object &executor) {
+	PythonUDFData data(name, type, null_handling);
 	auto &connection = con.GetConnection();
 
 	data.AnalyzeSignature(udf);
 	data.OverrideParameters(parameters);
 	data.OverrideReturnType(return_type);
 	data.Verify();
-	return data.GetFunction(udf, exception_handling, side_effects, connection.context->GetClientProperties());
+	return data.GetFunction(udf, exception_handling, side_effects, connection.context->GetClientProperties(), executor);
 }
 
 } // namespace duckdb
@@ -74,3 +74,52 @@ class TestDuckDBExecute(object):
         duckdb_cursor.execute("CREATE TABLE unittest_generator (a INTEGER);")
         duckdb_cursor.executemany("INSERT into unittest_generator (a) VALUES (?)", gen)
         assert duckdb_cursor.table('unittest_generator').fetchall() == [(1,), (2,), (3,)]
+
+    def test_execute_many_vectorized(self, duckdb_cursor):
+        duckdb_cursor.execute("CREATE TABLE tbl (i INTEGER, j VARCHAR);")
+        rows = [(i, None if i % 3 == 0 else str(i)) for i in range(5000)]
+        # the result is that of the last parameter set, like it is when the sets are executed one at a time
+        assert duckdb_cursor.executemany("INSERT INTO tbl VALUES (?, ?)", rows).fetchall() == [(1,)]
+        assert duckdb_cursor.table('tbl').fetchall() == rows
+
+        # values that are not just parameters are evaluated once per parameter set
+        duckdb_cursor.execute("DELETE FROM tbl")
+        duckdb_cursor.executemany("INSERT INTO tbl VALUES (?, ? || '!')", rows)
+        expected = [(i, None if i % 3 == 0 else f'{i}!') for i in range(5000)]
+        assert duckdb_cursor.table('tbl').fetchall() == expected
+
+        with pytest.raises(duckdb.InvalidInputException, match='Prepared statement needs 2 parameters, 1 given'):
+            duckdb_cursor.executemany("INSERT INTO tbl VALUES (?, ?)", [(1, 'a'), (2,)])
+
+    def test_execute_many_numpy(self, duckdb_cursor):
+        np = pytest.importorskip("numpy")
+
+        duckdb_cursor.execute("CREATE TABLE tbl (i BIGINT, j DOUBLE);")
+        params = {'i': np.arange(10000), 'j': np.arange(10000) / 2}
+        duckdb_cursor.executemany("INSERT INTO tbl VALUES (?, ?)", params)
+        res = duckdb_cursor.execute("SELECT count(*), sum(i), sum(j) FROM tbl").fetchall()
+        assert res == [(10000, 49995000, 24997500.0)]
+
+    def test_execute_many_named_columns(self, duckdb_cursor):
+        pd = pytest.importorskip("pandas")
+
+        duckdb_cursor.execute("CREATE TABLE tbl (a INTEGER, b VARCHAR);")
+        df = pd.DataFrame({'b': ['x', 'y', 'z'], 'a': [1, 2, 3]})
+        duckdb_cursor.executemany("INSERT INTO tbl VALUES ($a, $b)", df)
+        assert duckdb_cursor.table('tbl').fetchall() == [(1, 'x'), (2, 'y'), (3, 'z')]
+
+        with pytest.raises(duckdb.InvalidInputException, match='missing named parameter'):
+            duckdb_cursor.executemany("INSERT INTO tbl VALUES ($a, $c)", df)
+
+    def test_execute_many_arrow(self, duckdb_cursor):
+        pa = pytest.importorskip("pyarrow")
+
+        duckdb_cursor.execute("CREATE TABLE tbl (a INTEGER, b VARCHAR);")
+        table = pa.table({'a': [1, 2, None], 'b': ['x', None, 'z']})
+        duckdb_cursor.executemany("INSERT INTO tbl VALUES (?, ?)", table)
+        assert duckdb_cursor.table('tbl').fetchall() == [(1, 'x'), (2, None), (None, 'z')]
+
+        with pytest.raises(duckdb.InvalidInputException, match="single row 'INSERT INTO ... VALUES' statement"):
+            duckdb_cursor.executemany("SELECT ?, ?", table)
+        with pytest.raises(duckdb.InvalidInputException, match="whose values are parameters"):
+            duckdb_cursor.executemany("INSERT INTO tbl VALUES (?, ? || '!')", table)
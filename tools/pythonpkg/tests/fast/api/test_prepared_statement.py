@@ -0,0 +1,81 @@
+import duckdb
+import pytest
+
+
+class TestPreparedStatement(object):
+    def test_prepare(self):
+        con = duckdb.connect()
+        con.execute("CREATE TABLE tbl AS SELECT i, i::VARCHAR s FROM range(100) t(i)")
+        prepared = con.prepare("SELECT s FROM tbl WHERE i = ?")
+        assert prepared.query == "SELECT s FROM tbl WHERE i = ?"
+        assert prepared.type == duckdb.StatementType.SELECT
+        assert prepared.parameter_count == 1
+        for i in [0, 42, 99]:
+            assert prepared.execute([i]).fetchall() == [(str(i),)]
+
+        named = con.prepare("SELECT $name::VARCHAR")
+        assert named.named_parameters == set(['name'])
+        assert named.execute({'name': 'duck'}).fetchall() == [('duck',)]
+
+    def test_prepare_rebind(self):
+        con = duckdb.connect()
+        con.execute("CREATE TABLE tbl AS SELECT 42 i")
+        prepared = con.prepare("SELECT * FROM tbl")
+        assert prepared.execute().fetchall() == [(42,)]
+        con.execute("DROP TABLE tbl")
+        con.execute("CREATE TABLE tbl AS SELECT 'hello' i, 84 j")
+        assert prepared.execute().fetchall() == [('hello', 84)]
+
+    def test_prepare_errors(self):
+        con = duckdb.connect()
+        with pytest.raises(duckdb.InvalidInputException, match='exactly one statement'):
+            con.prepare("SELECT 1; SELECT 2")
+        prepared = con.prepare("SELECT 42")
+        con.close()
+        with pytest.raises(duckdb.ConnectionException, match='Connection already closed'):
+            prepared.execute()
+
+    def test_statement_cache(self):
+        con = duckdb.connect()
+        assert con.statement_cache_info() == {'hits': 0, 'misses': 0, 'entries': 0, 'size': 0}
+        con.execute("SET python_statement_cache_size=2")
+        con.execute("CREATE TABLE tbl AS SELECT i FROM range(10) t(i)")
+        for i in range(5):
+            assert con.execute("SELECT i FROM tbl WHERE i = ?", [i]).fetchall() == [(i,)]
+        info = con.statement_cache_info()
+        assert info['hits'] == 4
+        assert info['entries'] == 1
+        assert info['size'] == 2
+
+        con.execute("SELECT 1")
+        con.execute("SELECT 2")
+        assert con.statement_cache_info()['entries'] == 2
+
+        # statements that scan Python objects are not cached
+        df = {'a': [1, 2, 3]}
+        con.execute("SELECT sum(a) FROM df")
+        df = {'a': [4, 5, 6]}
+        assert con.execute("SELECT sum(a) FROM df").fetchall() == [(15,)]
+
+    def test_statement_cache_name_resolution(self):
+        con = duckdb.connect()
+        con.execute("SET python_statement_cache_size=10")
+        con.execute("CREATE SCHEMA s")
+        con.execute("CREATE TABLE main.tbl AS SELECT 'main' AS origin")
+        con.execute("CREATE TABLE s.tbl AS SELECT 's' AS origin")
+        assert con.execute("SELECT origin FROM tbl").fetchall() == [('main',)]
+        assert con.execute("SELECT origin FROM tbl").fetchall() == [('main',)]
+
+        # the same query text refers to another table after the search path changed
+        con.execute("USE s")
+        assert con.execute("SELECT origin FROM tbl").fetchall() == [('s',)]
+        con.execute("SET search_path = 'main'")
+        assert con.execute("SELECT origin FROM tbl").fetchall() == [('main',)]
+
+        # a temporary view shadows the table
+        con.execute("CREATE TEMP VIEW tbl AS SELECT 'temp' AS origin")
+        assert con.execute("SELECT origin FROM tbl").fetchall() == [('temp',)]
+        con.execute("DROP VIEW temp.tbl")
+        assert con.execute("SELECT origin FROM tbl").fetchall() == [('main',)]
+        con.sql("SELECT 'relation' AS origin").create_view('tbl')
+        assert con.execute("SELECT origin FROM tbl").fetchall() == [('relation',)]
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 import duckdb
 
@@ -41,6 +43,67 @@ class TestStreamingResult(object):
                 if tpl is None:
                     break
 
+    def test_iterate(self, duckdb_cursor):
+        rel = duckdb_cursor.sql('SELECT i, i::VARCHAR, i % 3 = 0, i / 2 FROM range(100000) t(i)')
+        count = 0
+        for row in rel:
+            assert row == (count, str(count), count % 3 == 0, count / 2)
+            count += 1
+        assert count == 100000
+
+        # every iteration executes the relation again
+        assert sum(1 for _ in rel) == 100000
+
+        # iterate over the result of the connection
+        duckdb_cursor.execute('SELECT i FROM range(5000) t(i)')
+        assert [row[0] for row in duckdb_cursor] == list(range(5000))
+
+        # iterate with error
+        rel = duckdb_cursor.sql(
+            "SELECT CASE WHEN i < 10000 THEN i ELSE concat('hello', i::VARCHAR)::INT END FROM range(100000) t(i)"
+        )
+        with pytest.raises(duckdb.ConversionException):
+            for row in rel:
+                pass
+
+    @pytest.mark.skipif(not os.path.isdir('/proc/self/task'), reason='Counts the threads of the process through /proc')
+    def test_iterate_shares_prefetch_thread(self, duckdb_cursor):
+        def thread_count():
+            return len(os.listdir('/proc/self/task'))
+
+        duckdb_cursor.execute('SELECT i FROM range(100000) t(i)')
+        assert sum(1 for _ in duckdb_cursor) == 100000
+        count = thread_count()
+        # the results of a connection fetch their chunks in the background on the same thread
+        rel = duckdb_cursor.sql('SELECT i FROM range(100000) t(i)')
+        for _ in range(3):
+            iterator = iter(rel)
+            assert next(iterator) == (0,)
+        assert sum(1 for _ in rel) == 100000
+        assert thread_count() == count
+
+    def test_iterate_then_fetch(self, duckdb_cursor):
+        duckdb_cursor.execute('SELECT i FROM range(100000) t(i)')
+        iterator = iter(duckdb_cursor)
+        assert next(iterator) == (0,)
+        # the rows buffered by the iterator are skipped
+        rest = duckdb_cursor.fetchnumpy()['i']
+        assert len(rest) < 100000 - 1
+        assert list(rest) == list(range(100000 - len(rest), 100000))
+
+    @pytest.mark.parametrize('fetch', ['fetch_arrow_table', 'fetch_record_batch'])
+    def test_iterate_then_fetch_arrow(self, duckdb_cursor, fetch):
+        pytest.importorskip("pyarrow")
+        vector_size = duckdb.__standard_vector_size__
+        duckdb_cursor.execute('SELECT i FROM range(100000) t(i)')
+        iterator = iter(duckdb_cursor)
+        assert next(iterator) == (0,)
+        # only the rest of the current chunk is skipped, the chunk that was fetched in the background is not lost
+        rest = getattr(duckdb_cursor, fetch)()
+        if fetch == 'fetch_record_batch':
+            rest = rest.read_all()
+        assert rest['i'].to_pylist() == list(range(vector_size, 100000))
+
     def test_record_batch_reader(self, duckdb_cursor):
         pytest.importorskip("pyarrow")
         pytest.importorskip("pyarrow.dataset")
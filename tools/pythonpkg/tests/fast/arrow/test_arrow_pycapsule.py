@@ -68,3 +68,59 @@ class TestArrowPyCapsule(object):
         tbl = create_table()
         rel2 = duckdb_cursor.sql("select * from tbl")
         assert rel2.fetchall() == [(i, i + 1, -i) for i in range(100)]
+
+    def test_capsule_streaming(self, duckdb_cursor):
+        conn = duckdb.connect()
+        rel = conn.sql("select i, i::VARCHAR as s from range(1000000) t(i)")
+
+        capsule = rel.__arrow_c_stream__(None)
+        res = duckdb_cursor.sql("select count(*), sum(i), max(s) from capsule").fetchall()
+        assert res == [(1000000, 499999500000, '999999')]
+
+    def test_capsule_requested_schema(self, duckdb_cursor):
+        conn = duckdb.connect()
+        rel = conn.sql("select 42 as a")
+
+        capsule = rel.__arrow_c_stream__(requested_schema=None)
+        assert duckdb_cursor.sql("select * from capsule").fetchall() == [(42,)]
+
+    def test_capsule_requested_schema_cast(self, duckdb_cursor):
+        pa = pytest.importorskip("pyarrow")
+        conn = duckdb.connect()
+        rel = conn.sql("select 42 as a, 21 as b")
+
+        schema = pa.schema([('x', pa.string()), ('y', pa.float64())])
+        capsule = rel.__arrow_c_stream__(requested_schema=schema.__arrow_c_schema__())
+        res = duckdb_cursor.sql("select * from capsule")
+        assert res.columns == ['x', 'y']
+        assert res.types == ['VARCHAR', 'DOUBLE']
+        assert res.fetchall() == [('42', 21.0)]
+
+        schema = pa.schema([('x', pa.string())])
+        with pytest.raises(duckdb.InvalidInputException, match="requested schema has 1 fields"):
+            rel.__arrow_c_stream__(requested_schema=schema.__arrow_c_schema__())
+
+    def test_capsule_invalidated(self, duckdb_cursor):
+        conn = duckdb.connect()
+        rel = conn.sql("select i from range(1000000) t(i)")
+
+        capsule = rel.__arrow_c_stream__()
+        # running another query on the connection closes the streaming result the capsule reads from
+        conn.execute("select 42")
+        with pytest.raises(duckdb.Error, match="closed"):
+            duckdb_cursor.sql("select * from capsule").fetchall()
+
+    def test_capsule_same_connection(self):
+        conn = duckdb.connect()
+        rel = conn.sql("select i from range(1000000) t(i)")
+
+        # the scan of the capsule is a query on the connection the capsule streams from
+        capsule = rel.__arrow_c_stream__()
+        with pytest.raises(duckdb.Error):
+            conn.sql("select count(*) from capsule").fetchall()
+
+        conn.execute("SET python_arrow_capsule_streaming=false")
+        rel = conn.sql("select i from range(1000000) t(i)")
+        capsule = rel.__arrow_c_stream__()
+        conn.execute("select 42")
+        assert conn.sql("select count(*) from capsule").fetchall() == [(1000000,)]
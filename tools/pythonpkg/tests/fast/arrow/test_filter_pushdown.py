@@ -880,6 +880,52 @@ class TestArrowFilterPushdown(object):
             'd': {'e': 4, 'f': 'bar'},
         }
 
+    @pytest.mark.parametrize('create_table', [create_pyarrow_table, create_pyarrow_dataset])
+    def test_expression_filter_pushdown(self, duckdb_cursor, create_table):
+        duckdb_cursor.execute(
+            """
+            CREATE TABLE expressions AS SELECT
+                i a,
+                i % 7 b,
+                i::VARCHAR c,
+                {'x': i % 5, 'y': i::VARCHAR} s
+            FROM range(1000) t(i)
+        """
+        )
+        arrow_table = create_table(duckdb_cursor.table("expressions"))
+
+        filters = [
+            "a IN (1, 5, 500, 999)",
+            "a NOT IN (1, 5, 500, 999)",
+            "c IN ('3', '42', 'foo')",
+            "a IN (1, 5, NULL)",
+            "a NOT IN (1, 5, NULL)",
+            "a <> 5",
+            "a < 10 OR b = 3",
+            "s.x IN (1, 3)",
+            "NOT (a > 10 AND b = 3)",
+            "a > b * 100",
+        ]
+        for filter in filters:
+            expected = duckdb_cursor.execute(f"SELECT * FROM expressions WHERE {filter} ORDER BY a").fetchall()
+            result = duckdb_cursor.execute(f"SELECT * FROM arrow_table WHERE {filter} ORDER BY a").fetchall()
+            assert result == expected, filter
+
+    def test_expression_filter_pushdown_partitioned_dataset(self, duckdb_cursor, tmp_path):
+        duckdb_cursor.execute("CREATE TABLE partitioned AS SELECT i a, i % 4 part FROM range(100) t(i)")
+        ds.write_dataset(
+            duckdb_cursor.table("partitioned").arrow(),
+            tmp_path,
+            format='parquet',
+            partitioning=['part'],
+            partitioning_flavor='hive',
+        )
+        dataset = ds.dataset(tmp_path, format='parquet', partitioning='hive')
+
+        query = "SELECT count(*), sum(a) FROM {} WHERE part IN (0, 3)"
+        expected = duckdb_cursor.execute(query.format('partitioned')).fetchall()
+        assert duckdb_cursor.execute(query.format('dataset')).fetchall() == expected
+
     def test_filter_pushdown_not_supported(self):
         pa.register_extension_type(UHugeIntType())
 
@@ -57,3 +57,51 @@ class TestPolars(object):
             duckdb.InvalidInputException, match='Provided table/dataframe must have at least one column'
         ):
             duckdb_cursor.sql("from polars_empty_df")
+
+    def test_polars_lazy_frame_pushdown(self, duckdb_cursor):
+        df = pl.DataFrame(
+            {
+                "a": list(range(100)),
+                "b": [i % 7 for i in range(100)],
+                "c": [str(i) for i in range(100)],
+                "s": [{"x": i % 3, "y": str(i)} for i in range(100)],
+                "d": [i / 2 for i in range(100)],
+            }
+        )
+        lazy_df = df.lazy()
+        queries = [
+            "SELECT a, c FROM lazy_df WHERE b = 3 ORDER BY a",
+            "SELECT count(*) FROM lazy_df WHERE a >= 10 AND a < 20",
+            "SELECT a FROM lazy_df WHERE c = '42' OR c = '43' ORDER BY a",
+            "SELECT a FROM lazy_df WHERE s.x = 1 AND a > 90 ORDER BY a",
+            "SELECT a FROM lazy_df WHERE d > 40.5 ORDER BY a",
+            "SELECT count(*) FROM lazy_df",
+        ]
+        for query in queries:
+            expected = duckdb_cursor.sql(query.replace('lazy_df', 'df')).fetchall()
+            assert duckdb_cursor.sql(query).fetchall() == expected, query
+
+    def test_polars_lazy_result(self, duckdb_cursor):
+        rel = duckdb_cursor.sql("SELECT i a, i % 5 b, i::VARCHAR c FROM range(10000) t(i)")
+        lazy_df = rel.pl(lazy=True)
+        assert isinstance(lazy_df, pl.LazyFrame)
+        pl_testing.assert_frame_equal(lazy_df.collect(), rel.pl())
+
+        result = lazy_df.filter(pl.col("b") == 3).select("a").limit(5).collect()
+        assert result["a"].to_list() == [3, 8, 13, 18, 23]
+        # the LazyFrame can be collected more than once
+        assert lazy_df.select(pl.len()).collect().item() == 10000
+
+    def test_polars_lazy_frame_record_batches(self, duckdb_cursor):
+        from duckdb.polars_io import record_batch_reader
+
+        lazy_df = pl.DataFrame({"a": list(range(10000))}).lazy()
+        reader = record_batch_reader(lazy_df, batch_size=1000)
+        assert reader.read_all().column("a").to_pylist() == list(range(10000))
+
+        # an empty result still has the schema of the LazyFrame
+        reader = record_batch_reader(lazy_df.filter(pl.col("a") < 0))
+        assert reader.schema.names == ["a"]
+        assert reader.read_all().num_rows == 0
+        assert duckdb_cursor.sql("SELECT a FROM lazy_df WHERE a < 0").fetchall() == []
+        assert duckdb_cursor.sql("SELECT sum(a) FROM lazy_df").fetchall() == [(sum(range(10000)),)]
@@ -0,0 +1,53 @@
+import duckdb
+import pytest
+
+np = pytest.importorskip("numpy")
+
+
+class TestNumpyZeroCopy(object):
+    def test_views(self):
+        con = duckdb.connect()
+        con.execute('SET python_numpy_zero_copy=true')
+        res = con.execute(
+            'SELECT i::INTEGER AS a, i::DOUBLE AS b, i::VARCHAR AS c, CASE WHEN i % 2 = 0 THEN i END AS d '
+            'FROM range(1000) t(i)'
+        ).fetchnumpy()
+        # fixed-width columns without NULLs are views over the result
+        assert res['a'].base is not None
+        assert res['b'].base is not None
+        assert res['a'].dtype == np.int32
+        assert np.array_equal(res['a'], np.arange(1000, dtype=np.int32))
+        assert np.array_equal(res['b'], np.arange(1000, dtype=np.float64))
+        # the views point into DuckDB's memory, they are read-only
+        assert not res['a'].flags.writeable
+        with pytest.raises(ValueError):
+            res['a'][0] = 1
+        # other columns are converted
+        assert res['c'][999] == '999'
+        assert isinstance(res['d'], np.ma.MaskedArray)
+        assert res['d'].mask[1]
+
+    def test_outlives_connection(self):
+        con = duckdb.connect()
+        con.execute('SET python_numpy_zero_copy=true')
+        res = con.execute('SELECT i AS a FROM range(100) t(i)').fetchnumpy()
+        con.close()
+        del con
+        assert res['a'].sum() == sum(range(100))
+
+    def test_multiple_chunks(self):
+        con = duckdb.connect()
+        con.execute('SET python_numpy_zero_copy=true')
+        rows = duckdb.__standard_vector_size__ * 3
+        res = con.execute(f'SELECT i AS a FROM range({rows}) t(i)').fetchnumpy()
+        assert np.array_equal(res['a'], np.arange(rows, dtype=np.int64))
+        # the chunks are not contiguous, the column is copied
+        assert res['a'].flags.writeable
+
+    def test_df(self):
+        pd = pytest.importorskip("pandas")
+        con = duckdb.connect()
+        con.execute('SET python_numpy_zero_copy=true')
+        df = con.sql('SELECT i AS a, i::VARCHAR AS b FROM range(10) t(i)').df()
+        expected = pd.DataFrame({'a': np.arange(10, dtype=np.int64), 'b': [str(i) for i in range(10)]})
+        pd.testing.assert_frame_equal(df, expected)
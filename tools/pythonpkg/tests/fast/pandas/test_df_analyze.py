@@ -75,3 +75,44 @@ class TestResolveObjectColumns(object):
         res = duckdb_cursor.query("select id from content").fetchall()
         expected = [(i,) for i in range(2001)]
         assert res == expected
+
+    def test_analyze_cached(self, duckdb_cursor):
+        pd = pytest.importorskip('pandas')
+        df = pd.DataFrame({'col0': pd.Series([1, 2, 3, 4], dtype='object')})
+        for _ in range(3):
+            rel = duckdb_cursor.sql('select * from df')
+            assert rel.types == ['BIGINT']
+            assert rel.fetchall() == [(1,), (2,), (3,), (4,)]
+
+        # Modifying a sampled row invalidates the cached type
+        df.at[0, 'col0'] = 'a'
+        rel = duckdb_cursor.sql('select * from df')
+        assert rel.types == ['VARCHAR']
+
+        duckdb_cursor.execute("SET pandas_analyze_cache=false")
+        rel = duckdb_cursor.sql('select * from df')
+        assert rel.types == ['VARCHAR']
+
+    def test_analyze_cached_mutable(self, duckdb_cursor):
+        pd = pytest.importorskip('pandas')
+        df = pd.DataFrame({'col0': pd.Series([{'a': 1}, {'a': 2}], dtype='object')})
+        rel = duckdb_cursor.sql('select * from df')
+        assert rel.types == ['STRUCT(a BIGINT)']
+
+        # Modifying a sampled container in place is not visible from its identity, containers are not cached
+        df['col0'][0]['a'] = 'x'
+        df['col0'][1]['a'] = 'y'
+        rel = duckdb_cursor.sql('select * from df')
+        assert rel.types == ['STRUCT(a VARCHAR)']
+
+    def test_analyze_early_exit(self, duckdb_cursor):
+        pd = pytest.importorskip('pandas')
+        duckdb_cursor.execute("SET pandas_analyze_early_exit=3")
+        df = pd.DataFrame({'col0': pd.Series([1, 2, 3, 4, 'a'], dtype='object')})
+        # The type did not change for three values, so the string is never analyzed
+        rel = duckdb_cursor.sql('select col0 from df')
+        assert rel.types == ['BIGINT']
+
+        duckdb_cursor.execute("SET pandas_analyze_early_exit=0")
+        rel = duckdb_cursor.sql('select col0 from df')
+        assert rel.types == ['VARCHAR']
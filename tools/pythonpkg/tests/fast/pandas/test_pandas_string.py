@@ -1,4 +1,5 @@
 import duckdb
+import pytest
 import pandas as pd
 import numpy
 
@@ -43,3 +44,27 @@ class TestPandasString(object):
             ).fetchall()
             == [(3000000,)]
         )
+
+    def test_pyarrow_string(self, duckdb_cursor):
+        pytest.importorskip('pyarrow')
+        values = ['foo', None, 'a much longer string that is not inlined', 'ünïcödé', ''] * 1000
+        df = pd.DataFrame({'s': pd.Series(values, dtype='string[pyarrow]')})
+        res = duckdb_cursor.sql("SELECT s FROM df").fetchall()
+        assert res == [(v,) for v in values]
+        # a filter over a slice of the column
+        res = duckdb_cursor.sql("SELECT count(*) FROM df WHERE s LIKE '%longer%'").fetchone()
+        assert res == (1000,)
+
+    def test_pyarrow_string_chunks(self, duckdb_cursor):
+        pa = pytest.importorskip('pyarrow')
+        chunked = pa.chunked_array([['a', 'b'], [], ['c', None, 'd'], pa.array(['e', 'f', 'g']).slice(1)])
+        df = pd.DataFrame({'s': pd.arrays.ArrowStringArray(chunked)})
+        res = duckdb_cursor.sql("SELECT s FROM df").fetchall()
+        assert res == [('a',), ('b',), ('c',), (None,), ('d',), ('f',), ('g',)]
+
+    def test_object_column_partitions(self, duckdb_cursor):
+        duckdb_cursor.execute('SET threads=4')
+        N = 200_000
+        df = pd.DataFrame({'o': pd.Series([{'a': i} for i in range(N)], dtype=object)})
+        res = duckdb_cursor.sql("SELECT sum(o.a), count(*) FROM df").fetchone()
+        assert res == (sum(range(N)), N)
@@ -0,0 +1,40 @@
+import duckdb
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+
+class TestParallelDFConversion(object):
+    @pytest.mark.parametrize('parallel', [True, False])
+    def test_wide_result(self, parallel):
+        con = duckdb.connect()
+        con.execute('SET threads=4')
+        con.execute(f'SET python_parallel_numpy_conversion={parallel}')
+        columns = ', '.join(
+            [
+                'i::BIGINT AS a',
+                'i::DOUBLE AS b',
+                "CASE WHEN i % 7 = 0 THEN NULL ELSE i::INTEGER END AS c",
+                "'str_' || i::VARCHAR AS d",
+                "DATE '2000-01-01' + (i % 1000)::INTEGER AS e",
+                '[i] AS f',
+            ]
+        )
+        rows = duckdb.__standard_vector_size__ * 20 + 17
+        df = con.execute(f'SELECT {columns} FROM range({rows}) t(i)').df()
+        assert len(df) == rows
+        assert df['a'].sum() == sum(range(rows))
+        assert df['b'].iloc[-1] == rows - 1
+        assert df['c'].isna().sum() == len(range(0, rows, 7))
+        assert df['d'].iloc[1234] == 'str_1234'
+        assert df['e'].iloc[1001] == pd.Timestamp('2000-01-02')
+        assert list(df['f'].iloc[rows - 1]) == [rows - 1]
+
+    def test_matches_serial(self):
+        con = duckdb.connect()
+        con.execute('SET threads=4')
+        query = 'SELECT i, i * 2 AS j, i::VARCHAR AS k FROM range(100000) t(i)'
+        parallel = con.execute(query).df()
+        con.execute('SET python_parallel_numpy_conversion=false')
+        serial = con.execute(query).df()
+        pd.testing.assert_frame_equal(parallel, serial)
@@ -0,0 +1,104 @@
+import pytest
+
+_ = pytest.importorskip("duckdb.experimental.spark")
+
+from duckdb.experimental.spark import StorageLevel
+from duckdb.experimental.spark.sql.types import Row
+
+
+def cached_tables(spark):
+    return spark.sql(
+        "select database_name from duckdb_tables() where table_name like 'spark_cache_%' order by all"
+    ).collect()
+
+
+def cache_views(spark):
+    return spark.sql("select temporary from duckdb_views() where view_name like 'spark_cache_%' order by all").collect()
+
+
+class TestSparkCache(object):
+    def test_cache(self, spark):
+        df = spark.sql("select i as id, i % 3 as m from range(1000) t(i)")
+        assert not df.is_cached
+        assert df.storageLevel == StorageLevel.NONE
+
+        assert df.cache() is df
+        assert df.is_cached
+        assert df.storageLevel == StorageLevel.MEMORY_AND_DISK_DESER
+        assert cached_tables(spark) == [Row(database_name='temp')]
+        # the view of the DataFrame and the view it reads when it is evicted
+        assert cache_views(spark) == [Row(temporary=True), Row(temporary=True)]
+
+        assert df.count() == 1000
+        derived = df.filter(df.m == 0)
+        assert derived.count() == 334
+
+        df.unpersist()
+        assert not df.is_cached
+        assert df.storageLevel == StorageLevel.NONE
+        assert cached_tables(spark) == []
+        # the views are kept, the DataFrame and the ones derived from it are computed again
+        assert cache_views(spark) == [Row(temporary=True), Row(temporary=True)]
+        assert df.count() == 1000
+        assert derived.count() == 334
+
+    def test_persist_storage_levels(self, spark):
+        memory = spark.sql("select 1 as a").persist(StorageLevel.MEMORY_ONLY)
+        disk = spark.sql("select 2 as a").persist(StorageLevel.DISK_ONLY)
+        assert memory.storageLevel == StorageLevel.MEMORY_ONLY
+        assert disk.storageLevel == StorageLevel.DISK_ONLY
+        databases = [row.database_name for row in cached_tables(spark)]
+        assert len(databases) == 2
+        assert 'temp' in databases
+        assert memory.collect() == [Row(a=1)]
+        assert disk.collect() == [Row(a=2)]
+
+        # persisting again keeps the first storage level
+        memory.persist(StorageLevel.DISK_ONLY)
+        assert memory.storageLevel == StorageLevel.MEMORY_ONLY
+
+    def test_derived_dataframes_use_cache(self, spark):
+        first = spark.sql("select 1 as a").cache()
+        second = spark.sql("select 2 as a").cache()
+        manager = spark._cache_manager
+        assert list(manager._entries) == [first._cache_view, second._cache_view]
+
+        # an action on a DataFrame derived from a persisted one marks its result as recently used
+        derived = first.select((first.a + 1).alias('b'))
+        assert derived.collect() == [Row(b=2)]
+        assert list(manager._entries) == [second._cache_view, first._cache_view]
+
+    def test_clear_cache(self, spark):
+        first = spark.sql("select 1 as a").cache()
+        second = spark.sql("select 2 as a").persist(StorageLevel.DISK_ONLY)
+        spark.catalog.clearCache()
+        assert not first.is_cached
+        assert not second.is_cached
+        assert cached_tables(spark) == []
+        assert first.collect() == [Row(a=1)]
+        assert second.collect() == [Row(a=2)]
+
+    @pytest.mark.parametrize(
+        'level, database',
+        [(StorageLevel.MEMORY_ONLY, None), (StorageLevel.MEMORY_AND_DISK, 'spark_cache')],
+    )
+    def test_eviction(self, spark, level, database):
+        spark.sql("SET memory_limit='1GB'")
+        # leave room for a few hundred bytes
+        spark.conf.set('spark.memory.storageFraction', '0.0000001')
+        df = spark.sql("select i as id from range(100000) t(i)").persist(level)
+        assert df.is_cached
+        tables = [row.database_name for row in cached_tables(spark)]
+        if database is None:
+            # the DataFrame does not fit, it is computed again when it is used
+            assert tables == []
+        else:
+            assert len(tables) == 1 and tables[0].startswith(database)
+        assert df.count() == 100000
+
+    def test_runtime_config(self, spark):
+        assert spark.conf.get('spark.memory.storageFraction') == '0.5'
+        spark.conf.set('spark.memory.storageFraction', '0.25')
+        assert spark.conf.get('spark.memory.storageFraction') == '0.25'
+        spark.conf.unset('spark.memory.storageFraction')
+        assert spark.conf.get('spark.memory.storageFraction') == '0.5'
@@ -9,16 +9,22 @@ from duckdb.experimental.spark.sql.types import (
     StructField,
     StringType,
     IntegerType,
+    DateType,
+    DoubleType,
     LongType,
     Row,
     ArrayType,
     MapType,
+    DecimalType,
+    TimestampNTZType,
 )
 from duckdb.experimental.spark.sql.functions import col, struct, when
 import duckdb
+import math
 import re
 
 from duckdb.experimental.spark.errors import PySparkValueError, PySparkTypeError
+from duckdb.experimental.spark.exception import ContributionsAcceptedError
 
 
 class TestDataFrame(object):
@@ -382,3 +388,114 @@ class TestDataFrame(object):
         rows = df.head(2)
         take = df.take(2)
         assert rows == take == expected
+
+    def test_collect_large(self, spark):
+        df = spark.sql("select i as id, i::VARCHAR as name from range(10000) t(i)")
+        rows = df.collect()
+        assert len(rows) == 10000
+        assert rows[5000] == Row(id=5000, name='5000')
+        assert rows[5000].name == '5000'
+        assert rows[9999].asDict() == {'id': 9999, 'name': '9999'}
+        # the rows share their field names
+        assert rows[0].__fields__ is rows[9999].__fields__
+        # collecting again executes the DataFrame again
+        assert df.collect() == rows
+
+    def test_to_local_iterator(self, spark):
+        df = spark.sql("select i as id, i::VARCHAR as name from range(10000) t(i)")
+        with pytest.raises(ContributionsAcceptedError):
+            df.toLocalIterator(prefetchPartitions=True)
+        iterator = df.toLocalIterator()
+        assert next(iterator) == Row(id=0, name='0')
+        # other queries don't end the iteration early, the iterated result is materialized
+        assert df.count() == 10000
+        assert spark.sql("select 42 as answer").collect() == [Row(answer=42)]
+        rest = list(iterator)
+        assert len(rest) == 9999
+        assert rest[-1] == Row(id=9999, name='9999')
+
+    def test_fetch_row_chunk_invalidated_stream(self, spark):
+        rel = spark.conn.sql("select i as id from range(10000) t(i)")
+        assert len(rel._fetch_row_chunk(Row, ['id'], stream=True)) > 0
+        # the stream is closed by the next query on the connection
+        spark.conn.execute("select 42")
+        with pytest.raises(duckdb.InvalidInputException, match='closed before all of its rows were fetched'):
+            rel._fetch_row_chunk(Row, ['id'], stream=True)
+
+    def test_dataframe_from_many_tuples(self, spark):
+        data = [(i, str(i), i % 2 == 0, i / 2) for i in range(100000)]
+        df = spark.createDataFrame(data, ["id", "name", "even", "half"])
+        assert df.count() == 100000
+        res = df.filter(df.id == 4243).collect()
+        assert res == [Row(id=4243, name='4243', even=False, half=2121.5)]
+
+    def test_dataframe_from_tuples_with_schema(self, spark):
+        import datetime
+
+        schema = StructType(
+            [
+                StructField('id', IntegerType()),
+                StructField('name', StringType()),
+                StructField('day', DateType()),
+                StructField('value', DoubleType()),
+            ]
+        )
+        data = [
+            (1, 'a', datetime.date(2024, 1, 1), 1.5),
+            (2, None, datetime.date(2024, 1, 2), None),
+            (3, 'c', None, 3),
+        ]
+        df = spark.createDataFrame(data, schema)
+        assert df.schema == schema
+        assert df.collect() == [
+            Row(id=1, name='a', day=datetime.date(2024, 1, 1), value=1.5),
+            Row(id=2, name=None, day=datetime.date(2024, 1, 2), value=None),
+            Row(id=3, name='c', day=None, value=3.0),
+        ]
+
+    def test_dataframe_from_tuples_with_nan(self, spark):
+        df = spark.createDataFrame([(1, float('nan')), (2, None)], ["id", "value"])
+        res = df.collect()
+        assert math.isnan(res[0].value)
+        assert res[1].value is None
+
+    def test_dataframe_from_tuples_infers_all_rows(self, spark):
+        pytest.importorskip("pandas")
+        # the values that decide the type are not in the first rows
+        data = [(i, None, i) for i in range(5000)] + [(5000, 'text', 0.5)]
+        df = spark.createDataFrame(data, ["id", "name", "value"])
+        assert df.schema == StructType(
+            [
+                StructField('id', LongType()),
+                StructField('name', StringType()),
+                StructField('value', DoubleType()),
+            ]
+        )
+        assert df.filter(df.id == 5000).collect() == [Row(id=5000, name='text', value=0.5)]
+        assert df.filter(df.id == 10).collect() == [Row(id=10, name=None, value=10.0)]
+
+        # the scanned rows are not registered on the connection
+        views = spark.conn.sql("select view_name from duckdb_views() where view_name like 'pyspark_%'").fetchall()
+        assert views == []
+
+    def test_dataframe_from_tuples_with_decimal_schema(self, spark):
+        pytest.importorskip("pyarrow")
+        import datetime
+        from decimal import Decimal
+
+        schema = StructType(
+            [
+                StructField('id', LongType()),
+                StructField('amount', DecimalType(12, 4)),
+                StructField('ts', TimestampNTZType()),
+            ]
+        )
+        # the values that need the full width of the decimal are not in the first rows
+        data = [(i, Decimal('1.5'), datetime.datetime(2024, 1, 1)) for i in range(5000)]
+        data.append((5000, Decimal('12345678.1234'), None))
+        df = spark.createDataFrame(data, schema)
+        assert df.schema == schema
+        assert df.filter(df.id == 5000).collect() == [Row(id=5000, amount=Decimal('12345678.1234'), ts=None)]
+        assert df.filter(df.id == 10).collect() == [
+            Row(id=10, amount=Decimal('1.5000'), ts=datetime.datetime(2024, 1, 1))
+        ]
@@ -23,3 +23,24 @@ class TestSparkReadCSV(object):
         df = spark.read.csv(file_path)
         res = df.collect()
         assert res == [Row(column0=1, column1=2), Row(column0=3, column1=4), Row(column0=5, column1=6)]
+
+    def test_read_csv_options(self, spark, tmp_path):
+        for name, value in [('a.csv', 1), ('b.csv', 2), ('c.txt', 3)]:
+            with open(tmp_path / name, 'w') as f:
+                f.write(f'x,y\n{value},{value * 2}\n')
+
+        df = spark.read.option('header', True).csv([(tmp_path / 'a.csv').as_posix(), (tmp_path / 'b.csv').as_posix()])
+        assert sorted(df.collect()) == [Row(x=1, y=2), Row(x=2, y=4)]
+
+        df = (
+            spark.read.format('csv')
+            .option('header', 'true')
+            .option('pathGlobFilter', '*.txt')
+            .load(tmp_path.as_posix())
+        )
+        assert df.collect() == [Row(x=3, y=6)]
+
+        df = spark.read.csv(
+            tmp_path.as_posix(), header=True, recursiveFileLookup=True, modifiedAfter='2000-01-01T00:00:00'
+        )
+        assert df.count() == 3
@@ -2,7 +2,7 @@ import pytest
 
 _ = pytest.importorskip("duckdb.experimental.spark")
 
-from duckdb.experimental.spark.sql.types import Row
+from duckdb.experimental.spark.sql.types import LongType, Row, StringType, StructField, StructType
 import textwrap
 import duckdb
 
@@ -15,3 +15,14 @@ class TestSparkReadJson(object):
         df = spark.read.json(file_path)
         res = df.collect()
         assert res == [Row(a=42, b=True, c='this is a long string')]
+
+    def test_read_json_schema(self, duckdb_cursor, spark, tmp_path):
+        file_path = (tmp_path / 'basic.json').as_posix()
+        duckdb_cursor.execute(f"COPY (select 42 a, 'this is a long string' c) to '{file_path}' (FORMAT JSON)")
+        schema = StructType([StructField('a', StringType()), StructField('b', LongType())])
+
+        # the fields are read with the types of the schema, the missing ones are NULL
+        df = spark.read.schema(schema).json(file_path)
+        assert df.schema == schema
+        assert df.collect() == [Row(a='42', b=None)]
+        assert spark.read.json(file_path, schema=schema).collect() == [Row(a='42', b=None)]
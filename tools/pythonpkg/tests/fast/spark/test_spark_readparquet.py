@@ -3,6 +3,7 @@ import pytest
 _ = pytest.importorskip("duckdb.experimental.spark")
 
 from duckdb.experimental.spark.sql.types import Row
+from duckdb.experimental.spark.errors import AnalysisException
 import textwrap
 import duckdb
 
@@ -17,3 +18,73 @@ class TestSparkReadParquet(object):
         df = spark.read.parquet(file_path)
         res = df.collect()
         assert res == [Row(a=42, b=True, c='this is a long string')]
+
+    def test_read_multiple_paths(self, duckdb_cursor, spark, tmp_path):
+        first = (tmp_path / 'first.parquet').as_posix()
+        second = (tmp_path / 'second.parquet').as_posix()
+        duckdb_cursor.execute(f"COPY (select 1 a) to '{first}' (FORMAT PARQUET)")
+        duckdb_cursor.execute(f"COPY (select 2 a) to '{second}' (FORMAT PARQUET)")
+
+        df = spark.read.parquet(first, second)
+        assert sorted(df.collect()) == [Row(a=1), Row(a=2)]
+
+        df = spark.read.parquet((tmp_path / '*.parquet').as_posix())
+        assert sorted(df.collect()) == [Row(a=1), Row(a=2)]
+
+        df = spark.read.format('parquet').load([first, second])
+        assert sorted(df.collect()) == [Row(a=1), Row(a=2)]
+
+    def test_read_partitioned_directory(self, duckdb_cursor, spark, tmp_path):
+        path = (tmp_path / 'partitioned').as_posix()
+        duckdb_cursor.execute(
+            f"COPY (select i, i % 3 AS part from range(30) t(i)) to '{path}' (FORMAT PARQUET, PARTITION_BY (part))"
+        )
+
+        df = spark.read.parquet(path)
+        assert sorted(df.columns) == ['i', 'part']
+        assert df.count() == 30
+
+        res = df.filter(df.part == 1).select('i').collect()
+        assert sorted(row.i for row in res) == list(range(1, 30, 3))
+
+        # the partition column is discovered below the base path
+        df = spark.read.option('basePath', path).parquet(f'{path}/part=2')
+        assert set(row.part for row in df.collect()) == {2}
+        assert df.count() == 10
+
+        df = spark.read.option('recursiveFileLookup', True).parquet(path)
+        assert df.columns == ['i']
+
+    def test_read_directory_skips_hidden(self, duckdb_cursor, spark, tmp_path):
+        path = tmp_path / 'output'
+        for directory in ['', '_temporary/0', '.staging']:
+            (path / directory).mkdir(parents=True, exist_ok=True)
+        duckdb_cursor.execute(f"COPY (select 1 a) to '{(path / 'part-0.parquet').as_posix()}' (FORMAT PARQUET)")
+        # the files that are still being written, and the ones in hidden directories are not read
+        for hidden in ['_temporary/0/part-1.parquet', '.staging/part-2.parquet', '_SUCCESS']:
+            duckdb_cursor.execute(f"COPY (select 2 a) to '{(path / hidden).as_posix()}' (FORMAT PARQUET)")
+
+        df = spark.read.parquet(path.as_posix())
+        assert df.collect() == [Row(a=1)]
+
+    def test_read_merge_schema(self, duckdb_cursor, spark, tmp_path):
+        first = (tmp_path / 'first.parquet').as_posix()
+        second = (tmp_path / 'second.parquet').as_posix()
+        duckdb_cursor.execute(f"COPY (select 1 a) to '{first}' (FORMAT PARQUET)")
+        duckdb_cursor.execute(f"COPY (select 2 b) to '{second}' (FORMAT PARQUET)")
+
+        df = spark.read.option('mergeSchema', 'true').parquet(first, second)
+        assert sorted(df.columns) == ['a', 'b']
+        assert df.count() == 2
+
+    def test_read_path_glob_filter(self, duckdb_cursor, spark, tmp_path):
+        duckdb_cursor.execute(f"COPY (select 1 a) to '{(tmp_path / 'keep.parquet').as_posix()}' (FORMAT PARQUET)")
+        duckdb_cursor.execute(f"COPY (select 2 a) to '{(tmp_path / 'skip.parquet').as_posix()}' (FORMAT PARQUET)")
+
+        df = spark.read.parquet(tmp_path.as_posix(), pathGlobFilter='keep*')
+        assert df.collect() == [Row(a=1)]
+
+        df = spark.read.parquet(tmp_path.as_posix(), modifiedAfter='2000-01-01T00:00:00')
+        assert df.count() == 2
+        with pytest.raises(AnalysisException):
+            spark.read.parquet(tmp_path.as_posix(), modifiedBefore='2000-01-01T00:00:00')
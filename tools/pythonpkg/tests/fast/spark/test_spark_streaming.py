@@ -0,0 +1,138 @@
+import pytest
+
+_ = pytest.importorskip("duckdb.experimental.spark")
+
+import os
+
+from duckdb.experimental.spark.errors import AnalysisException
+from duckdb.experimental.spark.sql.streaming import _has_aggregate
+from duckdb.experimental.spark.sql.types import LongType, Row, StructField, StructType
+
+
+def write_batch(spark, directory, name, start, end):
+    path = os.path.join(directory, name)
+    spark.conn.execute(f"COPY (select range AS id from range({start}, {end})) to '{path}' (FORMAT PARQUET)")
+
+
+@pytest.fixture
+def source(tmp_path):
+    directory = os.path.join(tmp_path, 'source')
+    os.makedirs(directory)
+    yield directory
+
+
+class TestSparkStreaming(object):
+    def test_stream_to_table(self, spark, source, tmp_path):
+        checkpoint = os.path.join(tmp_path, 'checkpoint')
+        write_batch(spark, source, 'a.parquet', 0, 10)
+
+        df = spark.readStream.format('parquet').load(source)
+        assert df.isStreaming
+        assert df.collect() == []
+
+        stream = df.filter(df.id % 2 == 0).writeStream.option('checkpointLocation', checkpoint)
+        query = stream.trigger(availableNow=True).toTable('evens')
+        assert query.lastProgress['batchId'] == 0
+        assert spark.table('evens').count() == 5
+
+        # only the new file is processed by the next run
+        write_batch(spark, source, 'b.parquet', 10, 20)
+        query = stream.trigger(availableNow=True).toTable('evens')
+        assert query.lastProgress['batchId'] == 1
+        res = spark.table('evens').orderBy('id').collect()
+        assert res == [Row(id=i) for i in range(0, 20, 2)]
+
+        # nothing is new
+        query = stream.trigger(availableNow=True).toTable('evens')
+        assert query.lastProgress is None
+        assert spark.table('evens').count() == 10
+
+    def test_stream_recovery(self, spark, source, tmp_path):
+        checkpoint = os.path.join(tmp_path, 'checkpoint')
+        write_batch(spark, source, 'a.parquet', 0, 10)
+        df = spark.readStream.parquet(source)
+        df.writeStream.option('checkpointLocation', checkpoint).trigger(once=True).toTable('numbers')
+
+        # a batch that was committed to the table, but not to the checkpoint, is not added again
+        os.remove(os.path.join(checkpoint, 'commits', '0'))
+        query = df.writeStream.option('checkpointLocation', checkpoint).trigger(once=True).toTable('numbers')
+        assert query.lastProgress['batchId'] == 0
+        assert spark.table('numbers').count() == 10
+        assert os.path.exists(os.path.join(checkpoint, 'commits', '0'))
+
+    def test_stream_to_parquet(self, spark, source, tmp_path):
+        checkpoint = os.path.join(tmp_path, 'checkpoint')
+        output = os.path.join(tmp_path, 'output')
+        schema = StructType([StructField('id', LongType())])
+        write_batch(spark, source, 'a.parquet', 0, 5)
+        write_batch(spark, source, 'b.parquet', 5, 10)
+
+        df = spark.readStream.schema(schema).option('maxFilesPerTrigger', 1).parquet(source)
+        query = (
+            df.select((df.id * 2).alias('doubled'))
+            .writeStream.format('parquet')
+            .option('checkpointLocation', checkpoint)
+            .trigger(availableNow=True)
+            .start(output)
+        )
+        assert len(query.recentProgress) == 2
+        assert len(os.listdir(output)) == 2
+        res = spark.read.parquet(output).orderBy('doubled').collect()
+        assert res == [Row(doubled=i * 2) for i in range(10)]
+
+    def test_stream_processing_time(self, spark, source, tmp_path):
+        checkpoint = os.path.join(tmp_path, 'checkpoint')
+        write_batch(spark, source, 'a.parquet', 0, 10)
+        df = spark.readStream.parquet(source)
+
+        query = (
+            df.writeStream.option('checkpointLocation', checkpoint)
+            .trigger(processingTime='10 milliseconds')
+            .toTable('t')
+        )
+        try:
+            query.processAllAvailable()
+            # the background batches point the view of the source to their files on their own connection
+            assert df.collect() == []
+        finally:
+            query.stop()
+        assert not query.isActive
+        assert spark.table('t').count() == 10
+
+        # the query can be started again from the same DataFrame and checkpoint
+        assert df.isStreaming
+        write_batch(spark, source, 'b.parquet', 10, 20)
+        query = df.writeStream.option('checkpointLocation', checkpoint).trigger(processingTime='10 milliseconds')
+        query = query.toTable('t')
+        try:
+            query.processAllAvailable()
+        finally:
+            query.stop()
+        assert spark.table('t').count() == 20
+
+    def test_stream_errors(self, spark, source, tmp_path):
+        with pytest.raises(AnalysisException, match='Schema must be specified'):
+            spark.readStream.parquet(source)
+
+        write_batch(spark, source, 'a.parquet', 0, 10)
+        df = spark.readStream.parquet(source)
+        with pytest.raises(AnalysisException, match='checkpointLocation'):
+            df.writeStream.toTable('t')
+        with pytest.raises(AnalysisException, match='streaming aggregations'):
+            df.groupBy('id').count().writeStream.option('checkpointLocation', str(tmp_path)).toTable('t')
+        with pytest.raises(AnalysisException, match='streaming aggregations'):
+            df.distinct().writeStream.option('checkpointLocation', str(tmp_path)).toTable('t')
+        with pytest.raises(AnalysisException, match='streaming'):
+            spark.range(10).writeStream.option('checkpointLocation', str(tmp_path)).toTable('t')
+
+    def test_stream_aggregate_detection(self, spark):
+        streams = {'stream'}
+        assert _has_aggregate(spark.conn, 'select id, count(*) from stream group by id', streams)
+        assert _has_aggregate(spark.conn, 'select sum(id) from (select id from stream where id > 1)', streams)
+        assert _has_aggregate(spark.conn, 'with s as (select * from stream) select distinct id from s', streams)
+        # the SELECTs that only read static tables may aggregate
+        assert not _has_aggregate(spark.conn, 'select * from stream where id > (select avg(v) from dim)', streams)
+        assert not _has_aggregate(spark.conn, 'select id, sum(id) over () from stream', streams)
+        assert not _has_aggregate(spark.conn, 'select * from (select max(v) from dim), stream', streams)
+        with pytest.raises(AnalysisException, match='can not be analyzed'):
+            _has_aggregate(spark.conn, 'select * from', streams)
@@ -196,3 +196,13 @@ class TestSparkToCSV(object):
         print(df.collect())
         print(csv_rel.collect())
         assert df.collect() == csv_rel.collect()
+
+    def test_partitioned_to_csv(self, df, spark, tmp_path):
+        output = os.path.join(tmp_path, "partitioned")
+
+        df.write.partitionBy("discount").csv(output, header=True)
+        df.write.mode("append").partitionBy("discount").csv(output, header=True)
+
+        assert sorted(os.listdir(output)) == ["discount=10", "discount=15", "discount=20", "discount=5"]
+        count = spark.conn.sql(f"select count(*) from read_csv('{output}/**/*.csv')").fetchone()[0]
+        assert count == 10
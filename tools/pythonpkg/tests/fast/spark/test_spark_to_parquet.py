@@ -38,3 +38,80 @@ class TestSparkToParquet(object):
         csv_rel = spark.read.parquet(temp_file_name)
 
         assert df.collect() == csv_rel.collect()
+
+    def test_partitioned_to_parquet(self, df, spark, tmp_path):
+        output = os.path.join(tmp_path, "partitioned")
+
+        df.write.partitionBy("CourseName").parquet(output)
+
+        assert sorted(os.listdir(output)) == [
+            "CourseName=Java",
+            "CourseName=PHP",
+            "CourseName=Python",
+            "CourseName=Scala",
+        ]
+        res = spark.conn.sql(
+            f"select CourseName, fee, discount from read_parquet('{output}/**/*.parquet', hive_partitioning=true) order by fee"
+        ).fetchall()
+        expected = sorted([tuple(row) for row in df.collect()], key=lambda row: row[1])
+        assert [tuple(row) for row in res] == expected
+
+    def test_save_modes(self, df, spark, tmp_path):
+        from duckdb.experimental.spark.errors import AnalysisException, PySparkValueError
+
+        temp_file_name = os.path.join(tmp_path, "temp_file.parquet")
+        df.write.parquet(temp_file_name)
+
+        # the default mode is 'errorifexists'
+        with pytest.raises(AnalysisException, match="already exists"):
+            df.write.parquet(temp_file_name)
+        with pytest.raises(PySparkValueError, match="Unknown save mode"):
+            df.write.mode("replace")
+
+        df.filter(df.fee > 4000).write.mode("ignore").parquet(temp_file_name)
+        assert len(spark.read.parquet(temp_file_name).collect()) == 5
+
+        df.filter(df.fee > 4000).write.mode("overwrite").parquet(temp_file_name)
+        assert len(spark.read.parquet(temp_file_name).collect()) == 3
+
+    def test_overwrite_source(self, df, spark, tmp_path):
+        output = os.path.join(tmp_path, "overwritten")
+        df.write.partitionBy("CourseName").parquet(output)
+
+        # the files that are read are only replaced once the new output is written
+        source = spark.read.parquet(output)
+        source.filter(source.fee > 4000).write.mode("overwrite").parquet(output)
+        assert spark.read.parquet(output).count() == 3
+        assert [name for name in os.listdir(tmp_path) if name != "overwritten"] == []
+
+    def test_append_mode(self, df, spark, tmp_path):
+        output = os.path.join(tmp_path, "appended")
+
+        df.write.mode("append").partitionBy(["CourseName"]).parquet(output)
+        df.write.save(output, format="parquet", mode="append", partitionBy="CourseName")
+
+        count = spark.conn.sql(f"select count(*) from read_parquet('{output}/**/*.parquet')").fetchone()[0]
+        assert count == 10
+
+    def test_write_then_append(self, df, spark, tmp_path):
+        output = os.path.join(tmp_path, "appended.parquet")
+
+        df.write.parquet(output)
+        assert os.path.isfile(output)
+        df.write.mode("append").parquet(output)
+
+        # the file that was written first is moved into the directory that the new files are added to
+        assert os.path.isdir(output)
+        assert len(os.listdir(output)) >= 2
+        assert spark.read.parquet(output).count() == 10
+        count = spark.conn.sql(f"select count(*) from read_parquet('{output}/*.parquet')").fetchone()[0]
+        assert count == 10
+
+    def test_max_records_per_file(self, spark, tmp_path):
+        output = os.path.join(tmp_path, "rotated")
+
+        spark.range(10000).write.option("maxRecordsPerFile", 4096).parquet(output)
+
+        assert len(os.listdir(output)) >= 3
+        count = spark.conn.sql(f"select count(*) from read_parquet('{output}/*.parquet')").fetchone()[0]
+        assert count == 10000
@@ -0,0 +1,133 @@
+import asyncio
+import platform
+import threading
+
+import duckdb
+import pytest
+
+pytestmark = pytest.mark.xfail(
+    condition=platform.system() == "Emscripten",
+    reason="Emscripten builds cannot use threads",
+)
+
+
+class TestAsync(object):
+    def test_aexecute(self, duckdb_cursor):
+        async def run():
+            con = await duckdb_cursor.aexecute("SELECT ?::INTEGER + 1", [41])
+            return con.fetchall()
+
+        assert asyncio.run(run()) == [(42,)]
+
+    def test_aexecute_concurrent(self):
+        con = duckdb.connect()
+
+        async def query(cursor, i):
+            await cursor.aexecute("SELECT sum(i) + ? FROM range(100000) t(i)", [i])
+            return cursor.fetchone()[0]
+
+        async def run():
+            return await asyncio.gather(*[query(con.cursor(), i) for i in range(16)])
+
+        assert asyncio.run(run()) == [4999950000 + i for i in range(16)]
+
+    def test_aexecute_many_concurrent(self):
+        con = duckdb.connect()
+        thread_count = threading.active_count()
+
+        async def query(cursor, i):
+            await cursor.aexecute("SELECT sum(i) + ? FROM range(100000) t(i)", [i])
+            return cursor.fetchone()[0]
+
+        async def run():
+            return await asyncio.gather(*[query(con.cursor(), i) for i in range(64)])
+
+        assert asyncio.run(run()) == [4999950000 + i for i in range(64)]
+        # all queries are driven by a single thread
+        assert threading.active_count() <= thread_count + 1
+
+    def test_aexecute_same_connection(self, duckdb_cursor):
+        async def run():
+            first = asyncio.ensure_future(duckdb_cursor.aexecute("SELECT sum(i) FROM range(100000000) t(i)"))
+            await asyncio.sleep(0)
+            # the second query would replace the result of the first one
+            with pytest.raises(duckdb.InvalidInputException, match="already executing"):
+                await duckdb_cursor.aexecute("SELECT 42")
+            con = await first
+            return con.fetchall()
+
+        assert asyncio.run(run()) == [(4999999950000000,)]
+        # the connection can execute another query once the first one is done
+        assert asyncio.run(duckdb_cursor.aexecute("SELECT 42")).fetchall() == [(42,)]
+
+    def test_aexecute_error(self, duckdb_cursor):
+        with pytest.raises(duckdb.CatalogException):
+            asyncio.run(duckdb_cursor.aexecute("SELECT * FROM nonexistent_table"))
+
+    def test_aexecute_cancel(self, duckdb_cursor):
+        async def run():
+            task = asyncio.ensure_future(
+                duckdb_cursor.aexecute("SELECT count(*) FROM range(10000000000) t1, range(1000000) t2")
+            )
+            await asyncio.sleep(0.1)
+            task.cancel()
+            # the interrupted query stops quickly, it is not run to completion
+            done, _ = await asyncio.wait([task], timeout=10)
+            assert task in done
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        # the connection can still be used after the query was interrupted
+        assert duckdb_cursor.execute("SELECT 42").fetchall() == [(42,)]
+
+    def test_aexecute_cancel_queued(self, duckdb_cursor):
+        async def run():
+            task = asyncio.ensure_future(duckdb_cursor.aexecute("CREATE TABLE t AS SELECT 42 AS i"))
+            # the task is cancelled before it is submitted, the query is never started
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return await duckdb_cursor.aexecute("SELECT 1")
+
+        asyncio.run(run())
+        with pytest.raises(duckdb.CatalogException):
+            duckdb_cursor.execute("SELECT * FROM t")
+
+    def test_afetch_record_batches_cancel(self, duckdb_cursor):
+        pytest.importorskip("pyarrow")
+        rel = duckdb_cursor.sql("SELECT count(*) FROM range(10000000000) t1, range(1000000) t2")
+
+        async def run():
+            async for batch in rel.afetch_record_batches():
+                pass
+
+        async def cancel():
+            task = asyncio.ensure_future(run())
+            await asyncio.sleep(0.1)
+            task.cancel()
+            # the interrupted query stops quickly, it is not run to completion
+            done, _ = await asyncio.wait([task], timeout=10)
+            assert task in done
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel())
+        # the query was interrupted, the connection can still be used
+        assert duckdb_cursor.execute("SELECT 42").fetchall() == [(42,)]
+
+    def test_afetch_record_batches(self, duckdb_cursor):
+        pytest.importorskip("pyarrow")
+        rel = duckdb_cursor.sql("SELECT i FROM range(10000) t(i)")
+
+        async def run():
+            row_count = 0
+            batch_count = 0
+            async for batch in rel.afetch_record_batches(batch_size=1000):
+                row_count += batch.num_rows
+                batch_count += 1
+            return row_count, batch_count
+
+        row_count, batch_count = asyncio.run(run())
+        assert row_count == 10000
+        assert batch_count >= 10
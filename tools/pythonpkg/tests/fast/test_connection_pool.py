@@ -0,0 +1,65 @@
+import platform
+import threading
+
+import duckdb
+import pytest
+
+
+class TestConnectionPool(object):
+    def test_connection_pool_shared_database(self):
+        with duckdb.ConnectionPool(max_size=2) as pool:
+            with pool.connection() as con:
+                con.execute("CREATE TABLE tbl AS SELECT 42 i")
+            with pool.connection() as con:
+                assert con.execute("SELECT i FROM tbl").fetchall() == [(42,)]
+            stats = pool.stats()
+            assert stats['acquired'] == 2
+            assert stats['in_use'] == 0
+            assert stats['idle'] == 1
+
+    def test_connection_pool_timeout(self):
+        with duckdb.ConnectionPool(max_size=1) as pool:
+            con = pool.acquire()
+            with pytest.raises(duckdb.PoolTimeoutError):
+                pool.acquire(timeout=0.01)
+            assert pool.stats()['timeouts'] == 1
+            pool.release(con)
+            with pytest.raises(duckdb.InvalidInputException, match='not acquired from this ConnectionPool'):
+                pool.release(con)
+
+    def test_connection_pool_rollback_on_release(self):
+        with duckdb.ConnectionPool(max_size=1) as pool:
+            with pool.connection() as con:
+                con.execute("CREATE TABLE tbl (i INTEGER)")
+                con.begin()
+                con.execute("INSERT INTO tbl VALUES (1)")
+            with pool.connection() as con:
+                assert con.execute("SELECT count(*) FROM tbl").fetchall() == [(0,)]
+
+    def test_connection_pool_closed(self):
+        pool = duckdb.ConnectionPool()
+        con = pool.acquire()
+        pool.close()
+        with pytest.raises(duckdb.ConnectionException, match='ConnectionPool is closed'):
+            pool.acquire()
+        pool.release(con)
+
+    @pytest.mark.xfail(condition=platform.system() == "Emscripten", reason="Emscripten builds cannot use threads")
+    def test_connection_pool_threads(self):
+        thread_count = 8
+        results = []
+        with duckdb.ConnectionPool(max_size=4) as pool:
+
+            def run_query():
+                with pool.connection(timeout=60) as con:
+                    results.append(con.execute("SELECT sum(i) FROM range(100000) t(i)").fetchone()[0])
+
+            threads = [threading.Thread(target=run_query) for _ in range(thread_count)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            stats = pool.stats()
+        assert results == [4999950000] * thread_count
+        assert stats['acquired'] == thread_count
+        assert stats['idle'] <= 4
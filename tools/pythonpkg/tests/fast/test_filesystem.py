@@ -1,5 +1,6 @@
 import logging
 import sys
+import time
 from pathlib import Path
 from shutil import copyfileobj
 from typing import Callable, List
@@ -14,6 +15,7 @@ importorskip('fsspec', '2022.11.0')
 from fsspec import filesystem, AbstractFileSystem
 from fsspec.implementations.memory import MemoryFileSystem
 from fsspec.implementations.local import LocalFileOpener
+from fsspec.asyn import AsyncFileSystem
 
 FILENAME = 'integers.csv'
 
@@ -54,6 +56,38 @@ def memory():
     return fs
 
 
+class AsyncMemoryFileSystem(AsyncFileSystem):
+    """Asynchronous filesystem over a memory filesystem that records the sizes of the cat_ranges batches"""
+
+    protocol = 'amemory'
+
+    def __init__(self, memory: AbstractFileSystem, **kwargs):
+        super().__init__(**kwargs)
+        self.memory = memory
+        self.batches = []
+
+    async def _cat_file(self, path, start=None, end=None, **kwargs):
+        return self.memory.cat_file(self._strip_protocol(path), start=start, end=end)
+
+    async def _info(self, path, **kwargs):
+        return self.memory.info(self._strip_protocol(path))
+
+    async def _ls(self, path, detail=True, **kwargs):
+        return self.memory.ls(self._strip_protocol(path), detail=detail)
+
+    def _open(self, path, mode='rb', **kwargs):
+        return self.memory._open(self._strip_protocol(path), mode=mode, **kwargs)
+
+    def modified(self, path):
+        return self.memory.modified(self._strip_protocol(path))
+
+    def cat_ranges(self, paths, starts, ends, **kwargs):
+        self.batches.append(len(paths))
+        # a slow batch lets the reads of the other threads queue up for the next one
+        time.sleep(0.01)
+        return super().cat_ranges(paths, starts, ends, **kwargs)
+
+
 def add_file(fs, filename=FILENAME):
     with (Path(__file__).parent / 'data' / filename).open('rb') as source, fs.open(filename, 'wb') as dest:
         copyfileobj(source, dest)
@@ -125,6 +159,41 @@ class TestPythonFilesystem:
 
         assert duckdb_cursor.fetchall() == [(b'foo',), (b'bar',), (b'baz',)]
 
+    @mark.parametrize('block_size, readahead', [(0, 0), (4096, 0), (4096, 2), (1000, 8)])
+    def test_read_parquet_block_cache(
+        self, duckdb_cursor: DuckDBPyConnection, memory: AbstractFileSystem, block_size: int, readahead: int
+    ):
+        duckdb_cursor.register_filesystem(memory)
+        duckdb_cursor.execute(
+            "COPY (SELECT i, i::VARCHAR AS s FROM range(100000) t(i)) TO 'memory://blocks.parquet' "
+            "(FORMAT PARQUET, ROW_GROUP_SIZE 10000)"
+        )
+        duckdb_cursor.execute(f"SET python_filesystem_block_size = {block_size}")
+        duckdb_cursor.execute(f"SET python_filesystem_readahead = {readahead}")
+
+        duckdb_cursor.execute("SELECT count(*), sum(i), max(s) FROM read_parquet('memory://blocks.parquet')")
+        assert duckdb_cursor.fetchall() == [(100000, 4999950000, '99999')]
+
+        duckdb_cursor.execute("SELECT * FROM read_csv('memory://integers.csv')")
+        assert duckdb_cursor.fetchall() == [(1, 10, 0), (2, 50, 30)]
+
+    def test_read_parquet_async_filesystem(self, duckdb_cursor: DuckDBPyConnection, memory: AbstractFileSystem):
+        duckdb_cursor.register_filesystem(memory)
+        duckdb_cursor.execute(
+            "COPY (SELECT i, i::VARCHAR AS s FROM range(100000) t(i)) TO 'memory://batched.parquet' "
+            "(FORMAT PARQUET, ROW_GROUP_SIZE 10000)"
+        )
+        async_memory = AsyncMemoryFileSystem(memory, skip_instance_cache=True)
+        duckdb_cursor.register_filesystem(async_memory)
+        duckdb_cursor.execute("SET python_filesystem_block_size = 4096")
+        duckdb_cursor.execute("SET threads = 4")
+
+        duckdb_cursor.execute("SELECT count(*), sum(i), max(s) FROM read_parquet('amemory://batched.parquet')")
+        assert duckdb_cursor.fetchall() == [(100000, 4999950000, '99999')]
+        # every range read went through cat_ranges, and the reads of concurrent threads were batched together
+        assert len(async_memory.batches) > 0
+        assert max(async_memory.batches) > 1
+
     def test_write_parquet(self, duckdb_cursor: DuckDBPyConnection, memory: AbstractFileSystem):
         duckdb_cursor.register_filesystem(memory)
         filename = 'output.parquet'
@@ -236,3 +236,79 @@ class TestMap(object):
         con = duckdb.connect()
         with pytest.raises(duckdb.InvalidInputException):
             rel = con.sql('select 42').map(basic_function)
+
+    def test_batch_size(self):
+        batch_sizes = []
+
+        def record_batch_size(df):
+            batch_sizes.append(len(df))
+            return df
+
+        con = duckdb.connect()
+        con.execute('set threads=1')
+        rel = con.sql('select i from range(10000) tbl(i)')
+        res = rel.map(record_batch_size, schema={'i': int}, batch_size=5000).fetchall()
+        assert sorted(res) == [(i,) for i in range(10000)]
+        # Every call receives at least 'batch_size' rows, except for the remainder at the end
+        assert sum(batch_sizes) == 10000
+        assert len(batch_sizes) == 2
+        assert all(size >= 5000 for size in batch_sizes[:-1])
+
+    def test_batch_size_large_output(self):
+        def explode(df):
+            return df.loc[df.index.repeat(3)].reset_index(drop=True)
+
+        con = duckdb.connect()
+        rel = con.sql('select i from range(3000) tbl(i)')
+        res = rel.map(explode, schema={'i': int}, batch_size=3000).fetchall()
+        assert len(res) == 9000
+        assert sorted(res) == sorted([(i,) for i in range(3000)] * 3)
+
+    def test_batch_size_remainder(self):
+        def plus_one(df):
+            df['i'] += 1
+            return df
+
+        con = duckdb.connect()
+        rel = con.sql('select i from range(10) tbl(i)')
+        res = rel.map(plus_one, batch_size=1000000).fetchall()
+        assert sorted(res) == [(i + 1,) for i in range(10)]
+
+        # the buffer is sized to the input, not to the batch size
+        res = rel.map(plus_one, batch_size=2**40).fetchall()
+        assert sorted(res) == [(i + 1,) for i in range(10)]
+
+    def test_invalid_batch_size(self):
+        con = duckdb.connect()
+        with pytest.raises(duckdb.InvalidInputException, match="'batch_size' should be a positive number of rows"):
+            con.sql('select 42').map(lambda df: df, batch_size=0)
+
+    def test_executor(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def times_two(df):
+            df['i'] *= 2
+            return df
+
+        con = duckdb.connect()
+        rel = con.sql('select i from range(10000) tbl(i)')
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            res = rel.map(times_two, schema={'i': int}, batch_size=4096, executor=executor).fetchall()
+        assert sorted(res) == [(i * 2,) for i in range(10000)]
+
+    def test_executor_exception(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def raises(df):
+            raise ValueError("raised in the executor")
+
+        con = duckdb.connect()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            rel = con.sql('select 42 as i').map(raises, schema={'i': int}, executor=executor)
+            with pytest.raises(duckdb.InvalidInputException, match='Python error'):
+                rel.fetchall()
+
+    def test_invalid_executor(self):
+        con = duckdb.connect()
+        with pytest.raises(duckdb.InvalidInputException, match='should be a concurrent.futures.Executor'):
+            con.sql('select 42 as i').map(lambda df: df, schema={'i': int}, executor=42).fetchall()
@@ -189,6 +189,49 @@ class TestReplacementScan(object):
         res = rel.fetchall()
         assert res == [(1,), (2,), (3,)]
 
+    def test_replacement_scan_cache(self, duckdb_cursor):
+        df = pd.DataFrame({'a': [1, 2, 3]})
+        assert duckdb_cursor.execute("select sum(a) from df").fetchall() == [(6,)]
+        info = duckdb_cursor.replacement_cache_info()
+        assert info['entries'] == 1
+        assert duckdb_cursor.execute("select sum(a) from df").fetchall() == [(6,)]
+        hits = duckdb_cursor.replacement_cache_info()['hits']
+        assert hits > info['hits']
+
+        # modifying the DataFrame invalidates the cached replacement
+        df['b'] = df['a'] * 2
+        assert duckdb_cursor.execute("select sum(b) from df").fetchall() == [(12,)]
+        # as does binding the name to another object
+        df = pd.DataFrame({'c': [4]})
+        assert duckdb_cursor.execute("select * from df").fetchall() == [(4,)]
+        assert duckdb_cursor.replacement_cache_info()['entries'] == 1
+
+        duckdb_cursor.execute("set python_replacement_cache = false")
+        hits = duckdb_cursor.replacement_cache_info()['hits']
+        assert duckdb_cursor.execute("select * from df").fetchall() == [(4,)]
+        assert duckdb_cursor.replacement_cache_info()['hits'] == hits
+
+    def test_replacement_scan_cache_releases_objects(self, duckdb_cursor):
+        import gc
+        import weakref
+
+        df = pd.DataFrame({'a': [1, 2, 3]})
+        assert duckdb_cursor.execute("select sum(a) from df").fetchall() == [(6,)]
+        assert duckdb_cursor.replacement_cache_info()['entries'] == 1
+
+        # the cache does not keep a deleted DataFrame alive, and drops its entry
+        values = df._mgr.blocks[0].values
+        while values.base is not None:
+            values = values.base
+        reference = weakref.ref(df)
+        values_reference = weakref.ref(values)
+        del df, values
+        gc.collect()
+        assert reference() is None
+        # the entry is dropped as soon as the DataFrame is deleted, which releases the data of the cached copy
+        assert values_reference() is None
+        assert duckdb_cursor.replacement_cache_info()['entries'] == 0
+
     def test_replacement_scan_fail(self):
         random_object = "I love salmiak rondos"
         con = duckdb.connect()
@@ -0,0 +1,92 @@
+import duckdb
+import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+np = pytest.importorskip("numpy")
+
+from duckdb.typing import *
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.submitted = 0
+        self.lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        with self.lock:
+            self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+class TestUDFExecutor(object):
+    def test_numpy_executor(self):
+        def plus_one(x):
+            return x + 1
+
+        con = duckdb.connect()
+        with RecordingExecutor(max_workers=4) as executor:
+            con.create_function('plus_one', plus_one, [BIGINT], BIGINT, type='numpy', executor=executor)
+            res = con.sql('select sum(plus_one(i)) from range(10000) tbl(i)').fetchall()
+            assert res == [(sum(range(1, 10001)),)]
+            assert executor.submitted >= 1
+
+    def test_arrow_executor(self):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.compute as pc
+
+        def plus_one(x):
+            return pc.add(x, 1)
+
+        con = duckdb.connect()
+        with RecordingExecutor(max_workers=2) as executor:
+            con.create_function('plus_one', plus_one, [BIGINT], BIGINT, type='arrow', executor=executor)
+            res = con.sql('select plus_one(i) from range(5) tbl(i)').fetchall()
+            assert res == [(1,), (2,), (3,), (4,), (5,)]
+            assert executor.submitted == 1
+
+    def test_parallel_query(self):
+        def plus_one(x):
+            return x + 1
+
+        con = duckdb.connect()
+        con.execute('set threads=4')
+        con.execute('create table tbl as select i from range(100000) t(i)')
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            con.create_function('plus_one', plus_one, [BIGINT], BIGINT, type='numpy', executor=executor)
+            res = con.sql('select sum(plus_one(i)) from tbl').fetchall()
+        assert res == [(sum(range(1, 100001)),)]
+
+    def test_exception_forwarded(self):
+        def raises(x):
+            raise ValueError("raised in the executor")
+
+        con = duckdb.connect()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            con.create_function('raises', raises, [BIGINT], BIGINT, type='numpy', executor=executor)
+            with pytest.raises(duckdb.InvalidInputException, match='raised in the executor'):
+                con.sql('select raises(42)').fetchall()
+
+            con.remove_function('raises')
+            con.create_function(
+                'raises', raises, [BIGINT], BIGINT, type='numpy', executor=executor, exception_handling='return_null'
+            )
+            assert con.sql('select raises(42)').fetchall() == [(None,)]
+
+    def test_native_rejected(self):
+        def plus_one(x):
+            return x + 1
+
+        con = duckdb.connect()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with pytest.raises(duckdb.InvalidInputException, match='can only be used with a vectorized'):
+                con.create_function('plus_one', plus_one, [BIGINT], BIGINT, executor=executor)
+
+    def test_invalid_executor(self):
+        def plus_one(x):
+            return x + 1
+
+        con = duckdb.connect()
+        with pytest.raises(duckdb.InvalidInputException, match='should be a concurrent.futures.Executor'):
+            con.create_function('plus_one', plus_one, [BIGINT], BIGINT, type='numpy', executor=42)
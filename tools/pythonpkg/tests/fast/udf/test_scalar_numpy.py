@@ -0,0 +1,146 @@
+import duckdb
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from duckdb.typing import *
+
+
+class TestNumpyUDF(object):
+    def test_basic_use(self):
+        def plus_one(x):
+            assert isinstance(x, np.ndarray)
+            return x + 1
+
+        con = duckdb.connect()
+        con.create_function('plus_one', plus_one, [BIGINT], BIGINT, type='numpy')
+        assert [(6,)] == con.sql('select plus_one(5)').fetchall()
+
+        range_table = con.table_function('range', [5000])
+        res = con.sql('select plus_one(i) from range_table tbl(i)').fetchall()
+        assert res == [(i + 1,) for i in range(5000)]
+
+        vector_size = duckdb.__standard_vector_size__
+        res = con.sql(f'select i, plus_one(i) from test_vector_types(NULL::BIGINT, false) t(i), range({vector_size})')
+        assert len(res) == (vector_size * 11)
+
+    def test_enum_value(self):
+        from duckdb.functional import NUMPY
+
+        def times_two(x):
+            return x * 2
+
+        con = duckdb.connect()
+        con.create_function('times_two', times_two, [DOUBLE], DOUBLE, type=NUMPY)
+        assert con.sql('select times_two(1.5)').fetchall() == [(3.0,)]
+
+    def test_one_call_per_chunk(self):
+        def count_calls(x):
+            count_calls.calls += 1
+            return x
+
+        count_calls.calls = 0
+        con = duckdb.connect()
+        con.create_function('count_calls', count_calls, [BIGINT], BIGINT, type='numpy')
+        res = con.sql('select count_calls(i) from range(5000) tbl(i)').fetchall()
+        assert len(res) == 5000
+        vector_size = duckdb.__standard_vector_size__
+        assert count_calls.calls == (5000 + vector_size - 1) // vector_size
+
+    def test_multiple_arguments(self):
+        def hypot(x, y):
+            return np.sqrt(x**2 + y**2)
+
+        con = duckdb.connect()
+        con.create_function('hypot', hypot, [DOUBLE, DOUBLE], DOUBLE, type='numpy')
+        res = con.sql('select hypot(3, 4), hypot(5, 12)').fetchall()
+        assert res == [(5.0, 13.0)]
+
+    def test_strings(self):
+        def upper(x):
+            return np.char.upper(x.astype(str))
+
+        con = duckdb.connect()
+        con.create_function('np_upper', upper, [VARCHAR], VARCHAR, type='numpy')
+        res = con.sql("select np_upper(x) from (values ('duck'), ('db'), ('quack')) t(x)").fetchall()
+        assert res == [('DUCK',), ('DB',), ('QUACK',)]
+
+    def test_cast_result(self):
+        def to_float(x):
+            return x.astype(np.float64) / 2
+
+        con = duckdb.connect()
+        # The function returns floats, but the declared return type is VARCHAR
+        con.create_function('to_float', to_float, [INTEGER], VARCHAR, type='numpy')
+        res = con.sql('select to_float(5)').fetchall()
+        assert res == [('2.5',)]
+
+    def test_nulls_default(self):
+        def plus_one(x):
+            assert not isinstance(x, np.ma.MaskedArray)
+            return x + 1
+
+        con = duckdb.connect()
+        con.create_function('plus_one', plus_one, [BIGINT], BIGINT, type='numpy')
+        res = con.sql('select plus_one(x) from (values (1), (NULL), (3), (NULL)) t(x)').fetchall()
+        assert res == [(2,), (None,), (4,), (None,)]
+
+    def test_nulls_special(self):
+        def fill_nulls(x):
+            assert isinstance(x, np.ma.MaskedArray)
+            return x.filled(42)
+
+        con = duckdb.connect()
+        con.create_function('fill_nulls', fill_nulls, [BIGINT], BIGINT, type='numpy', null_handling='special')
+        res = con.sql('select fill_nulls(x) from (values (1), (NULL), (3)) t(x)').fetchall()
+        assert res == [(1,), (42,), (3,)]
+
+    def test_return_masked_array(self):
+        def mask_even(x):
+            return np.ma.masked_array(x, mask=(x % 2 == 0))
+
+        con = duckdb.connect()
+        con.create_function('mask_even', mask_even, [BIGINT], BIGINT, type='numpy', null_handling='special')
+        res = con.sql('select mask_even(i) from range(4) tbl(i)').fetchall()
+        assert res == [(None,), (1,), (None,), (3,)]
+
+    def test_return_list(self):
+        def as_list(x):
+            return [int(v) * 3 for v in x]
+
+        con = duckdb.connect()
+        con.create_function('as_list', as_list, [BIGINT], BIGINT, type='numpy')
+        res = con.sql('select as_list(i) from range(3) tbl(i)').fetchall()
+        assert res == [(0,), (3,), (6,)]
+
+    def test_wrong_length(self):
+        def return_too_many(x):
+            return np.arange(len(x) + 5)
+
+        con = duckdb.connect()
+        con.create_function('too_many', return_too_many, [BIGINT], BIGINT, type='numpy')
+        with pytest.raises(duckdb.InvalidInputException, match='Returned numpy array should have 1 elements, found 6'):
+            con.sql('select too_many(5)').fetchall()
+
+    def test_wrong_dimensions(self):
+        def return_2d(x):
+            return np.zeros((len(x), 2))
+
+        con = duckdb.connect()
+        con.create_function('return_2d', return_2d, [BIGINT], BIGINT, type='numpy')
+        with pytest.raises(duckdb.InvalidInputException, match='should be one-dimensional'):
+            con.sql('select return_2d(5)').fetchall()
+
+    def test_exception_handling(self):
+        def raises(x):
+            raise ValueError("this is an error")
+
+        con = duckdb.connect()
+        con.create_function('raises', raises, [BIGINT], BIGINT, type='numpy')
+        with pytest.raises(duckdb.InvalidInputException, match='this is an error'):
+            con.sql('select raises(5)').fetchall()
+
+        con.remove_function('raises')
+        con.create_function('raises', raises, [BIGINT], BIGINT, type='numpy', exception_handling='return_null')
+        res = con.sql('select raises(i) from range(3) tbl(i)').fetchall()
+        assert res == [(None,), (None,), (None,)]